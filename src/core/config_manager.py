@@ -267,6 +267,14 @@ class EmailConfig(BaseModel):
         return account
 
 
+class ModelRateLimitConfig(BaseModel):
+    """Provider rate limits of one model tier (0 = not enforced)"""
+
+    requests_per_minute: int = Field(0, ge=0, description="Requests per minute")
+    input_tokens_per_minute: int = Field(0, ge=0, description="Input tokens per minute (ITPM)")
+    output_tokens_per_minute: int = Field(0, ge=0, description="Output tokens per minute (OTPM)")
+
+
 class AIConfig(BaseModel):
     """Configuration AI providers"""
 
@@ -278,6 +286,16 @@ class AIConfig(BaseModel):
         90, ge=0, le=100, description="Confidence threshold for auto-processing"
     )
     rate_limit_per_minute: int = Field(40, ge=1, le=100, description="API rate limit")
+    request_timeout_seconds: float = Field(
+        120.0, gt=0, le=600, description="Per-call timeout for async API requests"
+    )
+    max_concurrent_requests: int = Field(
+        16, ge=1, le=100, description="Maximum async API requests in flight per event loop"
+    )
+    model_rate_limits: dict[str, ModelRateLimitConfig] = Field(
+        default_factory=dict,
+        description="Provider limits per model tier (haiku, sonnet, opus) of the API account",
+    )
 
     @field_validator("anthropic_api_key")
     @classmethod
@@ -299,6 +317,9 @@ class StorageConfig(BaseModel):
     github_repo_url: Optional[str] = Field(None, description="GitHub remote repository URL")
     backup_enabled: bool = Field(True, description="Enable automatic backups")
     backup_retention_days: int = Field(30, ge=1, le=365, description="Backup retention")
+    notes_watch_enabled: bool = Field(
+        True, description="Watch the notes directory and sync external edits incrementally"
+    )
 
     @property
     def notes_dir(self) -> Path:
@@ -584,6 +605,28 @@ class BriefingConfig(BaseModel):
     include_calendar: bool = Field(True, description="Include calendar events in briefings")
     include_teams: bool = Field(True, description="Include Teams messages in briefings")
 
+    # Source fan-out
+    source_timeout_seconds: float = Field(
+        8.0,
+        gt=0,
+        le=120,
+        description="Deadline per source fetch (late sources are left out, briefing degraded)",
+    )
+
+    # Pre-computation (API server)
+    precompute_enabled: bool = Field(
+        True, description="Pre-compute the morning and upcoming pre-meeting briefings"
+    )
+    precompute_interval_seconds: int = Field(
+        60, ge=10, le=3600, description="Seconds between checks for briefings to pre-compute"
+    )
+    precompute_meetings: int = Field(
+        3, ge=0, le=20, description="Upcoming meetings whose briefing is pre-computed"
+    )
+    cache_max_age_minutes: int = Field(
+        30, ge=1, le=720, description="Maximum age of a cached briefing"
+    )
+
 
 class WorkflowV2Config(BaseModel):
     """
@@ -670,6 +713,17 @@ class WorkflowV2Config(BaseModel):
         description="Enable multi-pass analysis with transparency metadata (v2.2/v2.3)",
     )
 
+    # Batch processing
+    batch_concurrency: int = Field(
+        4, ge=1, le=32, description="Maximum events analyzed concurrently in process_batch"
+    )
+    batch_token_budget: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum AI tokens spent per batch (None = unlimited); "
+        "remaining events are skipped once exhausted",
+    )
+
 
 class APIConfig(BaseModel):
     """
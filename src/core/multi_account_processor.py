@@ -1,7 +1,10 @@
 """
 Multi-Account Email Processor
 
-Processes multiple email accounts sequentially with event-driven progress tracking.
+Processes multiple email accounts with event-driven progress tracking,
+sequentially by default or concurrently with ``parallel=True`` (one worker
+thread, IMAP connection and AI rate share per account, so a slow server only
+delays its own account).
 
 Architecture:
     For each account:
@@ -27,21 +30,26 @@ Usage:
     print(f"Processed {results['total_emails']} emails across {results['total_accounts']} accounts")
 """
 
-from typing import Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Optional
 
-from src.core.config_manager import EmailAccountConfig
+from src.core.config_manager import EmailAccountConfig, get_config
 from src.core.events import ProcessingEvent, ProcessingEventType, get_event_bus
-from src.core.state_manager import get_state_manager
+from src.core.state_manager import StateManager, get_state_manager
 from src.monitoring.logger import get_logger
 from src.trivelin.processor import EmailProcessor
 from src.utils import now_utc
 
+if TYPE_CHECKING:
+    from src.sancho.rate_limiter import RateLimiter
+
 logger = get_logger("multi_account_processor")
 
 
 class MultiAccountProcessor:
     """
-    Process multiple email accounts sequentially
+    Process multiple email accounts sequentially or in parallel
 
     Orchestrates email processing across multiple accounts with
     unified event tracking and result aggregation.
@@ -64,6 +72,7 @@ class MultiAccountProcessor:
         # Results storage
         self.results_by_account: dict[str, Any] = {}
         self.errors_by_account: dict[str, list[Exception]] = {}
+        self._errors_lock = threading.Lock()
 
         logger.info(
             f"MultiAccountProcessor initialized with {len(accounts)} accounts",
@@ -76,15 +85,20 @@ class MultiAccountProcessor:
         auto_execute: bool = False,
         confidence_threshold: Optional[int] = None,
         unread_only: bool = True,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ) -> dict[str, Any]:
         """
-        Process all configured accounts sequentially
+        Process all configured accounts
 
         Args:
             limit: Maximum emails per account (None = unlimited)
             auto_execute: Auto-execute high-confidence decisions
             confidence_threshold: Minimum confidence for auto-execution
             unread_only: Only process unread emails
+            parallel: Process accounts concurrently, one worker per account
+            max_workers: Maximum concurrent accounts in parallel mode
+                (default: one per enabled account)
 
         Returns:
             Dictionary with aggregated results:
@@ -103,92 +117,54 @@ class MultiAccountProcessor:
                 "account_count": len(self.accounts),
                 "limit_per_account": limit,
                 "auto_execute": auto_execute,
+                "parallel": parallel,
             },
         )
 
-        # Track overall stats
-        total_emails = 0
-        total_auto_executed = 0
-        total_queued = 0
-        total_errors = 0
-        total_accounts_processed = 0
-
-        # Process each account sequentially
+        accounts = []
         for account in self.accounts:
             if not account.enabled:
                 logger.info(f"Skipping disabled account: {account.account_id}")
                 continue
+            accounts.append(account)
 
-            try:
-                # Emit account started event
-                self.event_bus.emit(
-                    ProcessingEvent(
-                        event_type=ProcessingEventType.ACCOUNT_STARTED,
-                        account_id=account.account_id,
-                        account_name=account.account_name,
-                        metadata={
-                            "host": account.imap_host,
-                            "username": account.imap_username,
-                        },
-                    )
-                )
-
-                # Process account
-                account_results = self._process_single_account(
-                    account=account,
-                    limit=limit,
-                    auto_execute=auto_execute,
-                    confidence_threshold=confidence_threshold,
-                    unread_only=unread_only,
-                )
-
-                # Store results
-                self.results_by_account[account.account_id] = account_results
-
-                # Aggregate stats
-                account_stats = account_results.get("stats", {})
-                total_emails += account_stats.get("emails_processed", 0)
-                total_auto_executed += account_stats.get("emails_auto_executed", 0)
-                total_queued += account_stats.get("emails_queued", 0)
-                total_accounts_processed += 1
-
-                # Emit account completed event
-                self.event_bus.emit(
-                    ProcessingEvent(
-                        event_type=ProcessingEventType.ACCOUNT_COMPLETED,
-                        account_id=account.account_id,
-                        account_name=account.account_name,
-                        metadata={
-                            "stats": account_stats,
-                            "processed": account_stats.get("emails_processed", 0),
-                        },
-                    )
-                )
+        options: dict[str, Any] = {
+            "limit": limit,
+            "auto_execute": auto_execute,
+            "confidence_threshold": confidence_threshold,
+            "unread_only": unread_only,
+        }
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to process account {account.account_id}: {e}",
-                    exc_info=True,
-                    extra={"account_id": account.account_id},
-                )
+        if parallel and len(accounts) > 1:
+            outcomes = self._process_accounts_parallel(accounts, options, max_workers)
+        else:
+            outcomes = {
+                account.account_id: self._process_account_safely(account, **options)
+                for account in accounts
+            }
 
-                # Store error
-                if account.account_id not in self.errors_by_account:
-                    self.errors_by_account[account.account_id] = []
-                self.errors_by_account[account.account_id].append(e)
+        # Aggregate in configuration order, whichever order the accounts finished in.
+        # Sequential accounts share the global counters, so their "stats" are running
+        # totals; parallel accounts report their own counts only.
+        total_emails = 0
+        total_auto_executed = 0
+        total_queued = 0
+        total_errors = 0
+        total_accounts_processed = 0
 
+        for account in accounts:
+            account_results = outcomes.get(account.account_id)
+            if account_results is None:
                 total_errors += 1
+                continue
 
-                # Emit account error event
-                self.event_bus.emit(
-                    ProcessingEvent(
-                        event_type=ProcessingEventType.ACCOUNT_ERROR,
-                        account_id=account.account_id,
-                        account_name=account.account_name,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-                )
+            self.results_by_account[account.account_id] = account_results
+
+            account_stats = account_results.get("stats", {})
+            total_emails += account_stats.get("emails_processed", 0)
+            total_auto_executed += account_stats.get("emails_auto_executed", 0)
+            total_queued += account_stats.get("emails_queued", 0)
+            total_accounts_processed += 1
 
         # Build aggregated results
         results = {
@@ -215,6 +191,174 @@ class MultiAccountProcessor:
 
         return results
 
+    def _process_accounts_parallel(
+        self,
+        accounts: list[EmailAccountConfig],
+        options: dict[str, Any],
+        max_workers: Optional[int],
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """
+        Process accounts concurrently, one worker thread per account
+
+        Each worker gets its own EmailProcessor (hence its own IMAP
+        connection), its own StateManager so per-account stats do not mix,
+        and an equal share of the global AI rate limit. Worker states start
+        from the global processed IDs and entity cache, so already processed
+        emails are still skipped.
+
+        Args:
+            accounts: Enabled accounts to process
+            options: Keyword arguments forwarded to _process_single_account
+            max_workers: Maximum concurrent accounts (None = one per account)
+
+        Returns:
+            Mapping account_id -> account results (None if the account failed)
+        """
+        # Imported here: importing src.sancho before src.trivelin is circular
+        from src.sancho.rate_limiter import RateLimiter
+
+        workers = min(max_workers or len(accounts), len(accounts))
+        rate_share = max(1, get_config().ai.rate_limit_per_minute // workers)
+
+        logger.info(
+            f"Processing {len(accounts)} accounts in parallel",
+            extra={"workers": workers, "rate_share_per_minute": rate_share},
+        )
+
+        outcomes: dict[str, Optional[dict[str, Any]]] = {}
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="account"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._process_account_safely,
+                    account,
+                    state=self._seed_account_state(),
+                    rate_limiter=RateLimiter(max_requests=rate_share),
+                    **options,
+                ): account.account_id
+                for account in accounts
+            }
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+
+        return outcomes
+
+    def _process_account_safely(
+        self,
+        account: EmailAccountConfig,
+        state: Optional[StateManager] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        **options: Any,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Process one account with lifecycle events and error isolation
+
+        Args:
+            account: EmailAccountConfig to process
+            state: Private StateManager (parallel mode), merged into the
+                global state once the account is done
+            rate_limiter: Per-account share of the AI rate limit
+            **options: Keyword arguments forwarded to _process_single_account
+
+        Returns:
+            Account results, or None if processing failed
+        """
+        try:
+            # Emit account started event
+            self.event_bus.emit(
+                ProcessingEvent(
+                    event_type=ProcessingEventType.ACCOUNT_STARTED,
+                    account_id=account.account_id,
+                    account_name=account.account_name,
+                    metadata={
+                        "host": account.imap_host,
+                        "username": account.imap_username,
+                    },
+                )
+            )
+
+            # Process account
+            account_results = self._process_single_account(
+                account=account, state=state, rate_limiter=rate_limiter, **options
+            )
+            account_stats = account_results.get("stats", {})
+
+            # Emit account completed event
+            self.event_bus.emit(
+                ProcessingEvent(
+                    event_type=ProcessingEventType.ACCOUNT_COMPLETED,
+                    account_id=account.account_id,
+                    account_name=account.account_name,
+                    metadata={
+                        "stats": account_stats,
+                        "processed": account_stats.get("emails_processed", 0),
+                    },
+                )
+            )
+
+            return account_results
+
+        except Exception as e:
+            logger.error(
+                f"Failed to process account {account.account_id}: {e}",
+                exc_info=True,
+                extra={"account_id": account.account_id},
+            )
+
+            # Store error
+            with self._errors_lock:
+                self.errors_by_account.setdefault(account.account_id, []).append(e)
+
+            # Emit account error event
+            self.event_bus.emit(
+                ProcessingEvent(
+                    event_type=ProcessingEventType.ACCOUNT_ERROR,
+                    account_id=account.account_id,
+                    account_name=account.account_name,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+            )
+
+            return None
+
+        finally:
+            if state is not None:
+                self._merge_account_state(state)
+
+    def _seed_account_state(self) -> StateManager:
+        """
+        Create a worker's private StateManager
+
+        Returns:
+            StateManager holding the global processed IDs and entity cache
+        """
+        account_state = StateManager()
+        for message_id in self.state.get_processed_ids():
+            account_state.mark_processed(message_id)
+        for entity_id, entity_data in self.state.get_cached_entities().items():
+            account_state.cache_entity(entity_id, entity_data)
+        return account_state
+
+    def _merge_account_state(self, account_state: StateManager) -> None:
+        """
+        Fold a worker's counters, confidence scores, processed IDs and
+        cached entities into the global state
+
+        Args:
+            account_state: Private StateManager used by one account worker
+        """
+        for key, value in account_state.to_dict()["state"].items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                self.state.increment(key, value)
+        for score in list(account_state.stats.confidence_scores):
+            self.state.add_confidence_score(score)
+        for message_id in account_state.get_processed_ids():
+            self.state.mark_processed(message_id)
+        for entity_id, entity_data in account_state.get_cached_entities().items():
+            self.state.cache_entity(entity_id, entity_data)
+
     def _process_single_account(
         self,
         account: EmailAccountConfig,
@@ -222,6 +366,8 @@ class MultiAccountProcessor:
         auto_execute: bool,
         confidence_threshold: Optional[int],
         unread_only: bool,
+        state: Optional[StateManager] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
     ) -> dict[str, Any]:
         """
         Process a single email account
@@ -232,6 +378,8 @@ class MultiAccountProcessor:
             auto_execute: Auto-execute high-confidence decisions
             confidence_threshold: Minimum confidence for auto-execution
             unread_only: Only process unread emails
+            state: StateManager to use instead of the global one
+            rate_limiter: Per-account AI rate limit share
 
         Returns:
             Dictionary with account processing results
@@ -252,6 +400,10 @@ class MultiAccountProcessor:
         from src.integrations.email.imap_client import IMAPClient
         processor.imap_client = IMAPClient(account)
 
+        if state is not None:
+            processor.state = state
+        processor.account_rate_limiter = rate_limiter
+
         # Process emails
         processed_emails = processor.process_inbox(
             limit=limit,
@@ -41,6 +41,9 @@ class ProcessingEventType(str, Enum):
     BATCH_COMPLETED = "batch_completed"
     BATCH_PROGRESS = "batch_progress"
 
+    # Source events (metadata: "source", "item_ids")
+    SOURCE_UPDATED = "source_updated"
+
     # System events
     SYSTEM_READY = "system_ready"
     SYSTEM_ERROR = "system_error"
@@ -281,6 +281,16 @@ class StateManager:
         with self._lock:
             self._processed_message_ids.add(message_id)
 
+    def get_processed_ids(self) -> builtins.set[str]:
+        """
+        Get a snapshot of processed message IDs
+
+        Returns:
+            Copy of the processed message ID set
+        """
+        with self._lock:
+            return set(self._processed_message_ids)
+
     def cache_entity(self, entity_id: str, entity_data: Any) -> None:
         """
         Cache entity data
@@ -305,6 +315,16 @@ class StateManager:
         with self._lock:
             return self._entity_cache.get(entity_id)
 
+    def get_cached_entities(self) -> dict[str, Any]:
+        """
+        Get a snapshot of the entity cache
+
+        Returns:
+            Copy of the entity cache (entity_id -> entity data)
+        """
+        with self._lock:
+            return dict(self._entity_cache)
+
     def clear_caches(self) -> None:
         """Clear all caches"""
         with self._lock:
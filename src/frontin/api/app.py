@@ -17,6 +17,7 @@ from fastapi.responses import FileResponse
 
 from src.core.config_manager import get_config
 from src.frontin.api.middleware.error_handler import register_exception_handlers
+from src.frontin.api.middleware.metrics import RequestMetricsMiddleware
 from src.frontin.api.routers import (
     auth_router,
     briefing_router,
@@ -42,15 +43,22 @@ from src.frontin.api.routers import (
 from src.frontin.api.services.notification_service import get_notification_service
 from src.frontin.api.websocket import ws_router
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import get_metrics_store
 
 logger = get_logger("frontin.api")
 
 # Flag to track if notes service is initialized
 _notes_service_ready = False
 
+# Watcher syncing external note edits (started once NotesService is ready)
+_note_watcher = None
+
 # Cleanup interval in seconds (1 hour)
 NOTIFICATION_CLEANUP_INTERVAL = 3600
 
+# Delay before the first briefing pre-computation (let services start)
+BRIEFING_PRECOMPUTE_STARTUP_DELAY = 5.0
+
 
 async def init_autofetch_background() -> None:
     """
@@ -107,6 +115,13 @@ async def init_notes_service_background() -> None:
         logger.info(f"NotesService initialized in {elapsed:.1f}s")
     except Exception as e:
         logger.warning(f"Background NotesService init failed: {e}")
+        return
+
+    if get_config().storage.notes_watch_enabled:
+        try:
+            _start_note_watcher(asyncio.get_running_loop())
+        except Exception as e:
+            logger.warning(f"Note watcher not started: {e}")
 
 
 def _init_notes_service_sync() -> None:
@@ -120,6 +135,28 @@ def _init_notes_service_sync() -> None:
     _ = service._get_manager()
 
 
+def _start_note_watcher(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Watch the notes directory of the NotesService manager
+
+    External edits are synced into the indexes and broadcast to
+    WebSocket clients as notes_changed events.
+    """
+    global _note_watcher
+    from src.frontin.api.deps import get_notes_service
+    from src.frontin.api.websocket.queue_events import get_queue_event_emitter
+    from src.passepartout.note_watcher import NoteWatcher
+
+    service = next(get_notes_service())
+    watcher = NoteWatcher(service._get_manager())
+    emitter = get_queue_event_emitter()
+    watcher.subscribe(
+        lambda changes: emitter.emit_notes_changed_sync([c.to_dict() for c in changes], loop)
+    )
+    watcher.start()
+    _note_watcher = watcher
+
+
 async def notification_cleanup_task() -> None:
     """
     Background task to periodically clean up expired notifications.
@@ -140,6 +177,35 @@ async def notification_cleanup_task() -> None:
             logger.warning(f"Notification cleanup error: {e}")
 
 
+async def briefing_precompute_task() -> None:
+    """
+    Background task keeping pre-computed briefings ready.
+
+    Every briefing.precompute_interval_seconds, generates the morning
+    briefing and the next meetings' briefings that are missing from the
+    cache (expired, or invalidated by new events).
+    """
+    config = get_config()
+    if not (config.briefing.enabled and config.briefing.precompute_enabled):
+        logger.debug("Briefing pre-computation disabled")
+        return
+
+    from src.frontin.api.services.briefing_service import BriefingService
+
+    service = BriefingService(config=config)
+    delay = BRIEFING_PRECOMPUTE_STARTUP_DELAY
+    while True:
+        try:
+            await asyncio.sleep(delay)
+            delay = config.briefing.precompute_interval_seconds
+            await service.precompute()
+        except asyncio.CancelledError:
+            logger.debug("Briefing pre-computation task cancelled")
+            break
+        except Exception as e:
+            logger.warning(f"Briefing pre-computation error: {e}")
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler"""
@@ -168,6 +234,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # Fetches emails if queue is below startup_threshold
     autofetch_task = asyncio.create_task(init_autofetch_background())
 
+    # Keep the morning and upcoming pre-meeting briefings pre-computed
+    briefing_task = asyncio.create_task(briefing_precompute_task())
+
     yield
 
     # Cancel notes init task if still running
@@ -176,17 +245,29 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         with contextlib.suppress(asyncio.CancelledError):
             await notes_init_task
 
+    # Stop watching notes
+    if _note_watcher is not None:
+        await asyncio.to_thread(_note_watcher.stop)
+
     # Cancel autofetch task if still running
     if not autofetch_task.done():
         autofetch_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await autofetch_task
 
+    # Stop briefing pre-computation
+    briefing_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await briefing_task
+
     # Cancel cleanup task on shutdown
     cleanup_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await cleanup_task
 
+    # Write pending metrics buckets
+    await asyncio.to_thread(get_metrics_store().flush)
+
     logger.info("Shutting down Scapin API server")
 
 
@@ -225,6 +306,9 @@ def create_app() -> FastAPI:
     # Reduces payload size for JSON responses (notes, analyses, queue)
     app.add_middleware(GZipMiddleware, minimum_size=500)
 
+    # Request durations per route, for the stats endpoints
+    app.add_middleware(RequestMetricsMiddleware)
+
     # Register centralized exception handlers
     register_exception_handlers(app)
 
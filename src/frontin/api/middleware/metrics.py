@@ -0,0 +1,45 @@
+"""
+Request Metrics Middleware
+
+Records the duration of every HTTP request in the metrics store, labelled
+by method and route template (e.g. "GET /api/queue/{item_id}"), so that
+paths with IDs do not create one series per item.
+"""
+
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.monitoring.metrics_store import API_REQUEST_SECONDS, MetricsStore, get_metrics_store
+
+# Label of requests that matched no route (404s, probes)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware timing HTTP requests
+
+    Recording only updates in-memory buckets: nothing is written on the
+    request path. WebSocket and lifespan scopes pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Optional[MetricsStore] = None) -> None:
+        self.app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None)
+            label = f"{scope['method']} {path}" if path else UNMATCHED_ROUTE
+            metrics = self._metrics or get_metrics_store()
+            metrics.observe(API_REQUEST_SECONDS, time.monotonic() - started, label=label)
@@ -52,7 +52,10 @@ class ProcessedEmailResponse(BaseModel):
 class EmailStatsResponse(BaseModel):
     """Email processing statistics"""
 
-    emails_processed: int = Field(0, description="Total processed")
+    emails_processed: int = Field(0, description="Processed this session")
+    emails_processed_total: int | None = Field(
+        None, description="Processed over the whole history (metrics store)"
+    )
     emails_auto_executed: int = Field(0, description="Auto-executed actions")
     emails_archived: int = Field(0, description="Archived count")
     emails_deleted: int = Field(0, description="Deleted count")
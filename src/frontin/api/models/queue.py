@@ -435,6 +435,20 @@ class QueueItemResponse(BaseModel):
     tab: str | None = Field(None, description="v2.4 UI tab: to_process, in_progress, snoozed, history, errors")
 
 
+class QueueChangesResponse(BaseModel):
+    """Queue items changed since a sync token"""
+
+    items: list[QueueItemResponse] = Field(
+        default_factory=list, description="Changed items matching the listing's filters"
+    )
+    removed_ids: list[str] = Field(
+        default_factory=list,
+        description="Changed items no longer in the listing (deleted or moved)",
+    )
+    sync_token: int = Field(..., description="Token to poll the next changes from")
+    has_more: bool = Field(False, description="Whether more changes are pending")
+
+
 class QueueStatsResponse(BaseModel):
     """Queue statistics response (v2.4 enhanced)"""
 
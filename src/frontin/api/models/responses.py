@@ -38,6 +38,17 @@ class PaginatedResponse(APIResponse[T], Generic[T]):
     has_more: bool = Field(..., description="Whether more pages exist")
 
 
+class CursorPaginatedResponse(PaginatedResponse[T], Generic[T]):
+    """Paginated response that can also be followed with a cursor"""
+
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page (None on the last page)"
+    )
+    sync_token: int | None = Field(
+        None, description="Token to poll changes made after this page was read"
+    )
+
+
 class HealthCheckResult(BaseModel):
     """Individual health check result"""
 
@@ -133,6 +144,10 @@ class BriefingResponse(BaseModel):
         default_factory=list,
         description="Key decisions for today",
     )
+    degraded_sources: list[str] = Field(
+        default_factory=list,
+        description="Sources that failed or timed out (their sections may be incomplete)",
+    )
 
 
 class AttendeeResponse(BaseModel):
@@ -168,6 +183,10 @@ class PreMeetingBriefingResponse(BaseModel):
         default_factory=list,
         description="Open action items",
     )
+    degraded_sources: list[str] = Field(
+        default_factory=list,
+        description="Sources that failed or timed out (their sections may be incomplete)",
+    )
 
 
 class IntegrationStatus(BaseModel):
@@ -47,7 +47,9 @@ class StatsOverviewResponse(BaseModel):
     """Aggregated overview statistics"""
 
     # Totals across all sources
-    total_processed: int = Field(0, description="Total items processed across all sources")
+    total_processed: int = Field(
+        0, description="Total items processed across all sources (all time)"
+    )
     total_pending: int = Field(0, description="Total items pending across all sources")
     sources_active: int = Field(0, description="Number of active/enabled sources")
 
@@ -56,9 +58,9 @@ class StatsOverviewResponse(BaseModel):
     last_activity: datetime | None = Field(None, description="Most recent activity timestamp")
 
     # Quick summary per source
-    email_processed: int = Field(0, description="Emails processed")
+    email_processed: int = Field(0, description="Emails processed (all time)")
     email_queued: int = Field(0, description="Emails in queue")
-    teams_messages: int = Field(0, description="Teams messages processed")
+    teams_messages: int = Field(0, description="Teams messages processed (all time)")
     teams_unread: int = Field(0, description="Teams chats with unread messages")
     calendar_events_today: int = Field(0, description="Calendar events today")
     calendar_events_week: int = Field(0, description="Calendar events this week")
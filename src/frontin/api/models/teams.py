@@ -49,7 +49,10 @@ class TeamsStatsResponse(BaseModel):
 
     total_chats: int = Field(0, description="Total chats")
     unread_chats: int = Field(0, description="Chats with unread messages")
-    messages_processed: int = Field(0, description="Messages processed")
+    messages_processed: int = Field(0, description="Messages processed this session")
+    messages_processed_total: int | None = Field(
+        None, description="Messages processed over the whole history (metrics store)"
+    )
     messages_flagged: int = Field(0, description="Messages flagged")
     last_poll: datetime | None = Field(None, description="Last poll timestamp")
 
@@ -78,6 +78,8 @@ async def get_morning_briefing(
     Aggregates urgent items, calendar events, pending emails,
     and unread Teams messages into a unified briefing.
     Includes calendar conflict detection for 7 days ahead.
+    Served from the pre-computed cache when fresh; sources that failed
+    or timed out are listed in degraded_sources.
     """
     try:
         briefing = await service.generate_morning_briefing(hours_ahead=hours_ahead)
@@ -141,6 +143,7 @@ async def get_morning_briefing(
                 teams_unread=teams_unread,
                 ai_summary=briefing_dict.get("ai_summary"),
                 key_decisions=briefing_dict.get("key_decisions", []),
+                degraded_sources=briefing_dict.get("degraded_sources", []),
             ),
             timestamp=datetime.now(timezone.utc),
         )
@@ -158,6 +161,7 @@ async def get_pre_meeting_briefing(
 
     Provides attendee context, recent communications,
     and suggested talking points.
+    Served from the pre-computed cache when fresh.
     """
     try:
         briefing = await service.generate_pre_meeting_briefing(event_id)
@@ -189,6 +193,7 @@ async def get_pre_meeting_briefing(
                 location=briefing_dict.get("location"),
                 talking_points=briefing_dict.get("talking_points", []),
                 open_items=briefing_dict.get("open_items", []),
+                degraded_sources=briefing_dict.get("degraded_sources", []),
             ),
             timestamp=datetime.now(timezone.utc),
         )
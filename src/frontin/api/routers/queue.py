@@ -34,6 +34,7 @@ from src.frontin.api.models.queue import (
     PeripetieTimestampsResponse,
     ProposedNoteResponse,
     ProposedTaskResponse,
+    QueueChangesResponse,
     QueueItemAnalysis,
     QueueItemContent,
     QueueItemMetadata,
@@ -47,7 +48,7 @@ from src.frontin.api.models.queue import (
     SnoozeResponse,
     StrategicQuestionResponse,
 )
-from src.frontin.api.models.responses import APIResponse, PaginatedResponse
+from src.frontin.api.models.responses import APIResponse, CursorPaginatedResponse
 from src.frontin.api.services.queue_service import EnrichmentFailedError, QueueService
 from src.frontin.api.utils import parse_datetime
 
@@ -321,7 +322,7 @@ def _convert_item_to_response(item: dict) -> QueueItemResponse:
     )
 
 
-@router.get("", response_model=PaginatedResponse[list[QueueItemResponse]])
+@router.get("", response_model=CursorPaginatedResponse[list[QueueItemResponse]])
 async def list_queue_items(
     account_id: str | None = Query(None, description="Filter by account"),
     status: str = Query("pending", description="Filter by legacy status"),
@@ -330,17 +331,23 @@ async def list_queue_items(
     include_snoozed: bool = Query(True, description="v2.4: Include snoozed items"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page (overrides page)"),
+    sort: str | None = Query(None, description="Sort order: queued, resolved, error, snooze (default: by filter)"),
     service: QueueService = Depends(get_queue_service),
-) -> PaginatedResponse[list[QueueItemResponse]]:
+) -> CursorPaginatedResponse[list[QueueItemResponse]]:
     """
     List queue items with pagination
 
     Returns pending items awaiting review by default.
 
     v2.4: Supports filtering by state or tab in addition to legacy status.
+
+    Sorting and paging happen in the queue index: pass next_cursor back as
+    cursor to fetch the next page at constant cost, and sync_token to
+    /queue/changes to keep the listing up to date.
     """
     try:
-        items, total = await service.list_items(
+        result = await service.list_page(
             account_id=account_id,
             status=status,
             state=state,
@@ -348,15 +355,63 @@ async def list_queue_items(
             include_snoozed=include_snoozed,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            sort=sort,
         )
 
-        return PaginatedResponse(
+        return CursorPaginatedResponse(
             success=True,
-            data=[_convert_item_to_response(item) for item in items],
-            total=total,
+            data=[_convert_item_to_response(item) for item in result.items],
+            total=result.total,
             page=page,
             page_size=page_size,
-            has_more=(page * page_size) < total,
+            has_more=result.next_cursor is not None,
+            next_cursor=result.next_cursor,
+            sync_token=result.sync_token,
+            timestamp=datetime.now(timezone.utc),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/changes", response_model=APIResponse[QueueChangesResponse])
+async def list_queue_changes(
+    since: int = Query(..., ge=0, description="sync_token of a listing or of previous changes"),
+    account_id: str | None = Query(None, description="Filter by account"),
+    status: str = Query("pending", description="Filter by legacy status"),
+    state: str | None = Query(None, description="Filter by state"),
+    tab: str | None = Query(None, description="Filter by UI tab"),
+    include_snoozed: bool = Query(True, description="Include snoozed items"),
+    limit: int = Query(200, ge=1, le=500, description="Maximum changes returned"),
+    service: QueueService = Depends(get_queue_service),
+) -> APIResponse[QueueChangesResponse]:
+    """
+    Get queue items changed since a sync token
+
+    Use the same filters as the listing being refreshed: changed items
+    still in it are returned in full, the others by ID.
+    """
+    try:
+        changes = await service.list_changes(
+            since,
+            account_id=account_id,
+            status=status,
+            state=state,
+            tab=tab,
+            include_snoozed=include_snoozed,
+            limit=limit,
+        )
+
+        return APIResponse(
+            success=True,
+            data=QueueChangesResponse(
+                items=[_convert_item_to_response(item) for item in changes.items],
+                removed_ids=changes.removed_ids,
+                sync_token=changes.seq,
+                has_more=changes.has_more,
+            ),
             timestamp=datetime.now(timezone.utc),
         )
     except Exception as e:
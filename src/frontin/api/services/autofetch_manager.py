@@ -18,6 +18,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from src.core.config_manager import get_config
+from src.core.processing_events import ProcessingEvent, ProcessingEventType, get_event_bus
 from src.monitoring.logger import get_logger
 
 if TYPE_CHECKING:
@@ -228,6 +229,19 @@ class AutoFetchManager:
                     if item_id:
                         items_to_analyze.append((item_id, metadata, content))
                         items_created += 1
+                        self._index_in_archive(metadata, content, item_id)
+
+            if items_created:
+                # Notify consumers of email data (e.g. cached briefings)
+                get_event_bus().emit(
+                    ProcessingEvent(
+                        event_type=ProcessingEventType.SOURCE_UPDATED,
+                        metadata={
+                            "source": "email",
+                            "item_ids": [item_id for item_id, _, _ in items_to_analyze],
+                        },
+                    )
+                )
 
             # Start background analysis if items were created
             if items_to_analyze:
@@ -256,6 +270,19 @@ class AutoFetchManager:
         finally:
             self._fetch_in_progress[FetchSource.EMAIL] = False
 
+    def _index_in_archive(
+        self, metadata: EmailMetadata, content: EmailContent, item_id: str
+    ) -> None:
+        """Add a fetched email to the local search archive (never fails the fetch)"""
+        try:
+            from src.integrations.storage.archive_index import get_archive_index
+
+            get_archive_index().add_email(
+                metadata, content, account_id="default", queue_item_id=item_id, status="pending"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index email {metadata.id} in archive: {e}")
+
     async def _analyze_items_background(
         self,
         items: list[tuple[str, EmailMetadata, EmailContent]],
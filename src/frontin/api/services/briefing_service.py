@@ -2,12 +2,20 @@
 Briefing Service
 
 Async wrapper around BriefingGenerator for API use.
+
+Briefings are served from the shared BriefingCache when possible;
+precompute() materializes the morning briefing and the next meetings'
+briefings ahead of time (run periodically by the API server).
 """
 
 from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
 
 from src.core.config_manager import ScapinConfig
-from src.frontin.briefing.generator import BriefingGenerator
+from src.core.events import EventSource, PerceivedEvent
+from src.frontin.briefing.cache import BriefingCache, get_briefing_cache
+from src.frontin.briefing.generator import BriefingGenerator, minutes_until_start
 from src.frontin.briefing.models import MorningBriefing, PreMeetingBriefing
 from src.monitoring.logger import get_logger
 
@@ -23,20 +31,38 @@ class BriefingService:
     """
 
     config: ScapinConfig
+    cache: Optional[BriefingCache] = None
+
+    def __post_init__(self) -> None:
+        """Use the shared briefing cache by default"""
+        if self.cache is None:
+            self.cache = get_briefing_cache(
+                max_age=timedelta(minutes=self.config.briefing.cache_max_age_minutes)
+            )
 
     async def generate_morning_briefing(
         self,
         hours_ahead: int = 24,
+        use_cache: bool = True,
     ) -> MorningBriefing:
         """
         Generate morning briefing
 
         Args:
             hours_ahead: Hours ahead to look for calendar events
+            use_cache: Return the cached briefing if there is a fresh one
 
         Returns:
             MorningBriefing with all aggregated data
         """
+        assert self.cache is not None
+        target_date = date.today()
+        if use_cache:
+            cached = self.cache.get_morning(target_date, hours_ahead)
+            if cached is not None:
+                logger.debug(f"Morning briefing served from cache (hours_ahead={hours_ahead})")
+                return cached
+
         logger.info(f"Generating morning briefing (hours_ahead={hours_ahead})")
 
         # Create generator with updated config
@@ -45,7 +71,9 @@ class BriefingService:
         )
         generator = BriefingGenerator(config=briefing_config)
 
-        briefing = await generator.generate_morning_briefing()
+        generation = self.cache.generation
+        briefing = await generator.generate_morning_briefing(target_date)
+        self.cache.put_morning(target_date, hours_ahead, briefing, generation)
         logger.info(
             f"Morning briefing generated: {briefing.urgent_count} urgent, "
             f"{briefing.total_items} total"
@@ -55,21 +83,31 @@ class BriefingService:
     async def generate_pre_meeting_briefing(
         self,
         event_id: str,
+        use_cache: bool = True,
     ) -> PreMeetingBriefing:
         """
         Generate pre-meeting briefing for a calendar event
 
         Args:
             event_id: Calendar event ID
+            use_cache: Return the cached briefing if there is a fresh one
 
         Returns:
             PreMeetingBriefing with attendee context
         """
+        assert self.cache is not None
+        if use_cache:
+            cached = self.cache.get_pre_meeting(event_id)
+            if cached is not None:
+                logger.debug(f"Pre-meeting briefing for event {event_id} served from cache")
+                return cached
+
         logger.info(f"Generating pre-meeting briefing for event {event_id}")
 
         # Get the calendar event (already normalized to PerceivedEvent)
         from src.trivelin.calendar_processor import CalendarProcessor
 
+        generation = self.cache.generation
         processor = CalendarProcessor()
         perceived_event = await processor.get_event(event_id)
 
@@ -79,8 +117,67 @@ class BriefingService:
         # Generate briefing
         generator = BriefingGenerator(config=self.config.briefing)
         briefing = await generator.generate_pre_meeting_briefing(perceived_event)
+        self.cache.put_pre_meeting(event_id, briefing, generation)
 
         logger.info(
             f"Pre-meeting briefing generated: {len(briefing.attendees)} attendees"
         )
         return briefing
+
+    async def precompute(self) -> dict[str, int]:
+        """
+        Materialize the morning briefing and the next meetings' briefings
+
+        Only briefings missing from the cache (never generated, expired or
+        invalidated) are generated.
+
+        Returns:
+            Number of briefings generated, by kind
+        """
+        assert self.cache is not None
+        computed = {"morning": 0, "pre_meeting": 0}
+        hours_ahead = self.config.briefing.morning_hours_ahead
+
+        morning = self.cache.get_morning(date.today(), hours_ahead)
+        if morning is None:
+            morning = await self.generate_morning_briefing(hours_ahead, use_cache=False)
+            computed["morning"] = 1
+
+        generator = BriefingGenerator(config=self.config.briefing)
+        for event in self._upcoming_meetings(morning):
+            event_id = event.source_id
+            if self.cache.get_pre_meeting(event_id) is not None:
+                continue
+            generation = self.cache.generation
+            try:
+                briefing = await generator.generate_pre_meeting_briefing(event)
+            except Exception as e:
+                logger.warning(f"Failed to pre-compute briefing for event {event_id}: {e}")
+                continue
+            self.cache.put_pre_meeting(event_id, briefing, generation)
+            computed["pre_meeting"] += 1
+
+        if any(computed.values()):
+            logger.info(
+                f"Briefings pre-computed: {computed['morning']} morning, "
+                f"{computed['pre_meeting']} pre-meeting"
+            )
+        return computed
+
+    def _upcoming_meetings(self, morning: MorningBriefing) -> list[PerceivedEvent]:
+        """Next meetings (events with other attendees) of a morning briefing"""
+        limit = self.config.briefing.precompute_meetings
+        if limit <= 0:
+            return []
+
+        meetings: dict[str, PerceivedEvent] = {}
+        for item in morning.calendar_today + morning.urgent_items:
+            event = item.event
+            if (
+                event.source == EventSource.CALENDAR
+                and event.metadata.get("attendee_count", 0) > 1
+                and minutes_until_start(event) >= 0
+            ):
+                meetings.setdefault(event.source_id, event)
+
+        return sorted(meetings.values(), key=minutes_until_start)[:limit]
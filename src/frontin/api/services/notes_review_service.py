@@ -19,6 +19,7 @@ from src.frontin.api.models.notes import (
     TriggerReviewResponse,
 )
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import NOTES_REVIEWED, get_metrics_store
 from src.passepartout.note_metadata import NoteMetadata, NoteMetadataStore
 from src.passepartout.note_scheduler import NoteScheduler
 from src.passepartout.note_types import NOTE_TYPE_CONFIGS, NoteType
@@ -153,6 +154,7 @@ class NotesReviewService:
         updated = scheduler.record_review(note_id, quality)
         if updated is None:
             return None
+        get_metrics_store().increment(NOTES_REVIEWED)
 
         return RecordReviewResponse(
             note_id=note_id,
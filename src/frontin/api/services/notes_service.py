@@ -694,16 +694,13 @@ class NotesService:
             wikilink_pattern = re.compile(r"\[\[([^\]]+)\]\]")
             linked_titles = wikilink_pattern.findall(note.content)
 
-            # Try to find notes by title (limit to 10)
+            # Resolve links by title/alias through the link graph (limit to 10)
             for title in linked_titles[:10]:
-                # Search for note by title
-                search_results = await asyncio.to_thread(
-                    manager.search_notes, title, top_k=1, return_scores=True
+                linked_note = await asyncio.to_thread(
+                    manager.resolve_wikilink, title.split("|")[0].strip()
                 )
-                if search_results:
-                    linked_note, _ = search_results[0]
-                    if linked_note.note_id != note_id:  # Don't include self
-                        linked_notes.append(linked_note)
+                if linked_note and linked_note.note_id != note_id:  # Don't include self
+                    linked_notes.append(linked_note)
 
         # Create enricher
         enricher = NoteEnricher(
@@ -1137,52 +1134,35 @@ class NotesService:
         if note is None:
             return None
 
-        # Optimization: Use metadata summaries and aliases index instead of reading all files
-        # Run in thread pool for iCloud I/O
-        summaries = await asyncio.to_thread(manager.get_notes_summary)
-        aliases = await asyncio.to_thread(manager.get_aliases_index)
-
-        # Build ID-to-summary map for fast lookup
-        id_to_meta = {s["note_id"]: s for s in summaries}
+        # The link graph resolves titles/aliases and knows backlinks: no need
+        # to read every note summary. Run in thread pool (first use builds it)
+        graph = await asyncio.to_thread(manager.get_link_graph)
 
         # Resolve outgoing wikilinks
         outgoing: list[WikilinkResponse] = []
         for text in note.outgoing_links:
-            # Match title or alias
-            target_id = aliases.get(text.lower())
-            target_meta = id_to_meta.get(target_id) if target_id else None
-
+            target_id = graph.resolve(text)
             outgoing.append(
                 WikilinkResponse(
                     text=text,
                     target_id=target_id,
-                    target_title=target_meta["title"] if target_meta else None,
+                    target_title=graph.title(target_id) if target_id else None,
                     exists=target_id is not None,
                 )
             )
 
-        # Find incoming links (notes that link to this one)
-        note_title_lower = note.title.lower()
+        # Incoming links (notes that link to this one by title or alias)
         incoming: list[WikilinkResponse] = []
-
-        for s in summaries:
-            # Skip self
-            if s["note_id"] == note_id:
-                continue
-
-            # Check links if available in summary (new field)
-            # Fallback to empty list if not yet indexed
-            other_links = s.get("links", [])
-
-            if any(link.lower() == note_title_lower for link in other_links):
-                incoming.append(
-                    WikilinkResponse(
-                        text=s["title"],
-                        target_id=s["note_id"],
-                        target_title=s["title"],
-                        exists=True,
-                    )
+        for source_id in graph.backlinks(note_id):
+            source_title = graph.title(source_id) or source_id
+            incoming.append(
+                WikilinkResponse(
+                    text=source_title,
+                    target_id=source_id,
+                    target_title=source_title,
+                    exists=True,
                 )
+            )
 
         return NoteLinksResponse(
             note_id=note_id,
@@ -1400,28 +1380,12 @@ class NotesService:
         if not success:
             return None
 
-        # Clear cache and reload note
-        if note_id in manager._note_cache:
-            del manager._note_cache[note_id]
-
-        # Re-index in vector store (content changed) - run in thread pool for iCloud I/O
-        updated_note = await asyncio.to_thread(manager.get_note, note_id)
-        if updated_note:
-            # Update vector store - run in thread pool for FAISS I/O
-            await asyncio.to_thread(manager.vector_store.remove, note_id)
-            search_text = f"{updated_note.title}\n\n{updated_note.content}"
-            await asyncio.to_thread(
-                manager.vector_store.add,
-                doc_id=note_id,
-                text=search_text,
-                metadata={
-                    "title": updated_note.title,
-                    "tags": updated_note.tags,
-                    "updated_at": updated_note.updated_at.isoformat(),
-                    "entities": [e.value for e in updated_note.entities],
-                },
-            )
-            return _note_to_response(updated_note)
+        # Reload note and re-index it (content changed) - run in thread pool
+        # for iCloud and FAISS I/O
+        if await asyncio.to_thread(manager.reindex_note, note_id):
+            updated_note = await asyncio.to_thread(manager.get_note, note_id)
+            if updated_note:
+                return _note_to_response(updated_note)
 
         return None
 
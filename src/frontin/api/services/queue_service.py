@@ -5,6 +5,7 @@ Async service wrapper for QueueStorage operations.
 """
 
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -16,6 +17,7 @@ from src.integrations.storage.action_history import (
     ActionType,
     get_action_history,
 )
+from src.integrations.storage.queue_index import QueueChanges
 from src.integrations.storage.queue_storage import QueueStorage, get_queue_storage
 from src.integrations.storage.snooze_storage import (
     SnoozeReason,
@@ -42,6 +44,17 @@ class EnrichmentFailedError(Exception):
         )
 
 
+@dataclass
+class QueuePage:
+    """One page of a queue listing"""
+
+    items: list[dict[str, Any]]
+    total: int
+    next_cursor: str | None = None
+    # Change sequence number to poll list_changes() from
+    sync_token: int = 0
+
+
 class QueueService:
     """Async service for queue operations"""
 
@@ -134,67 +147,121 @@ class QueueService:
         Returns:
             Tuple of (items, total_count)
         """
-        # v2.4: Use new filtering if state or tab is provided
-        # Run in thread to avoid blocking event loop during I/O
-        if state or tab:
-            all_items = await asyncio.to_thread(
-                self._storage.load_queue_by_state,
-                state=state,
-                tab=tab,
-                account_id=account_id,
-                include_snoozed=include_snoozed,
-            )
-        else:
-            # Legacy filtering by status
-            all_items = await asyncio.to_thread(
-                self._storage.load_queue,
+        result = await self.list_page(
+            account_id=account_id,
+            status=status,
+            state=state,
+            tab=tab,
+            include_snoozed=include_snoozed,
+            page=page,
+            page_size=page_size,
+        )
+        return result.items, result.total
+
+    async def list_page(
+        self,
+        account_id: str | None = None,
+        status: str = "pending",
+        state: str | None = None,
+        tab: str | None = None,
+        include_snoozed: bool = True,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        sort: str | None = None,
+    ) -> QueuePage:
+        """
+        List one page of queue items, sorted and paginated by the queue index
+
+        Only the requested page is loaded; the total is an index-only count.
+
+        Sort orders (Bug #56), unless sort is given:
+        - pending/awaiting_review/to_process: oldest first (by queued_at)
+        - approved/rejected/processed/history: newest first (by review date)
+        - errors: newest first (by error date)
+        - snoozed: soonest wake-up first
+
+        Args:
+            account_id: Filter by account
+            status: Filter by legacy status (ignored when state or tab is given)
+            state: Filter by state
+            tab: Filter by UI tab
+            include_snoozed: Include snoozed items in results (state/tab filters only)
+            page: Page number (1-based), used when no cursor is given
+            page_size: Items per page
+            cursor: next_cursor of the previous page (takes precedence over page)
+            sort: Sort order ('queued', 'resolved', 'error', 'snooze')
+
+        Returns:
+            QueuePage
+
+        Raises:
+            ValueError: If the cursor, sort order or page is invalid
+        """
+        filters = self._listing_filters(status, state, tab, include_snoozed)
+        if page < 1:
+            raise ValueError(f"page must be positive, got {page}")
+
+        # Read the change sequence first: changes racing with the listing are
+        # returned again by list_changes() rather than missed
+        sync_token = await asyncio.to_thread(self._storage.change_seq)
+        (items, next_cursor), total = await asyncio.gather(
+            asyncio.to_thread(
+                self._storage.list_page,
                 account_id=account_id,
-                status=status,
-            )
+                limit=page_size,
+                cursor=cursor,
+                sort=sort,
+                offset=0 if cursor else (page - 1) * page_size,
+                **filters,
+            ),
+            asyncio.to_thread(self._storage.count_items, account_id=account_id, **filters),
+        )
+        return QueuePage(
+            items=items, total=total, next_cursor=next_cursor, sync_token=sync_token
+        )
 
-        total = len(all_items)
-
-        # Bug #56 fix: Sort by appropriate field based on status/state/tab
-        # - pending/awaiting_review/to_process: oldest first (by queued_at) - process oldest first
-        # - approved/rejected/processed/history: newest first (by reviewed_at) - show most recent
-        # - errors: newest first (by error timestamp)
-        if status in ("approved", "rejected") or state == "processed" or tab == "history":
-            # Sort by reviewed_at, newest first (reverse chronological)
-            all_items.sort(
-                key=lambda x: (
-                    x.get("resolution", {}).get("resolved_at")
-                    if x.get("resolution")
-                    else x.get("reviewed_at")
-                ) or x.get("queued_at", ""),
-                reverse=True,
-            )
-        elif state == "error" or tab == "errors":
-            # Sort errors by error timestamp, newest first
-            all_items.sort(
-                key=lambda x: (
-                    x.get("error", {}).get("occurred_at")
-                    if x.get("error")
-                    else x.get("queued_at", "")
-                ),
-                reverse=True,
-            )
-        elif tab == "snoozed":
-            # Sort snoozed by wake_at, soonest first
-            all_items.sort(
-                key=lambda x: (
-                    x.get("snooze", {}).get("wake_at")
-                    if x.get("snooze")
-                    else ""
-                ),
-            )
-        # else: pending/awaiting_review items keep the default sort (oldest first by queued_at)
+    @staticmethod
+    def _listing_filters(
+        status: str, state: str | None, tab: str | None, include_snoozed: bool
+    ) -> dict[str, Any]:
+        """Storage filters of a listing"""
+        # v2.4: state/tab filtering replaces the legacy status filter
+        if state or tab:
+            return {"state": state, "tab": tab, "include_snoozed": include_snoozed}
+        return {"status": status}
 
-        # Apply pagination
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = all_items[start:end]
+    async def list_changes(
+        self,
+        since: int,
+        account_id: str | None = None,
+        status: str = "pending",
+        state: str | None = None,
+        tab: str | None = None,
+        include_snoozed: bool = True,
+        limit: int = 200,
+    ) -> QueueChanges:
+        """
+        Queue items changed since a listing's sync token
+
+        Filters are those of the listing being kept up to date.
+
+        Args:
+            since: sync_token of a QueuePage, or seq of a previous call
+            account_id: Filter by account
+            status: Filter by legacy status (ignored when state or tab is given)
+            state: Filter by state
+            tab: Filter by UI tab
+            include_snoozed: Whether snoozed items match (state/tab filters only)
+            limit: Maximum changes returned
 
-        return items, total
+        Returns:
+            QueueChanges with matching items and IDs of items that left the listing
+        """
+        filters = self._listing_filters(status, state, tab, include_snoozed)
+        return await asyncio.to_thread(
+            self._storage.list_changes, since, account_id=account_id, limit=limit, **filters
+        )
 
     async def get_item(self, item_id: str) -> dict[str, Any] | None:
         """
@@ -25,6 +25,11 @@ from src.frontin.api.models.search import (
     SearchResultType,
     TeamsSearchResultItem,
 )
+from src.integrations.storage.archive_index import (
+    ArchiveIndex,
+    get_archive_index,
+    item_from_queue_item,
+)
 from src.integrations.storage.queue_storage import QueueStorage
 from src.monitoring.logger import get_logger
 from src.passepartout.note_manager import NoteManager
@@ -75,38 +80,14 @@ def _highlight_matches(text: str, query: str, context_chars: int = 50) -> str:
     return excerpt
 
 
-def _text_match_score(text: str, query: str) -> float:
-    """
-    Calculate simple text match score
-
-    Args:
-        text: Text to search in
-        query: Search query
-
-    Returns:
-        Score between 0 and 1
-    """
-    if not text or not query:
-        return 0.0
-
-    text_lower = text.lower()
-    query_lower = query.lower()
-    words = query_lower.split()
-
-    if not words:
-        return 0.0
-
-    # Count matching words
-    matches = sum(1 for word in words if word in text_lower)
-    word_score = matches / len(words)
-
-    # Bonus for exact phrase match
-    phrase_bonus = 0.2 if query_lower in text_lower else 0.0
-
-    # Bonus for match at beginning
-    start_bonus = 0.1 if text_lower.startswith(query_lower) else 0.0
-
-    return min(1.0, word_score + phrase_bonus + start_bonus)
+def _parse_iso(value: str | None) -> datetime | None:
+    """Parse an ISO datetime string (None if missing or invalid)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
 
 
 @dataclass
@@ -116,14 +97,15 @@ class SearchService:
 
     Searches:
     - Notes: Semantic search via vector store
-    - Emails: Text search in queue storage
-    - Calendar: Text search in cached events (when available)
-    - Teams: Text search in cached messages (when available)
+    - Emails, Calendar, Teams: Full-text search in the local archive index,
+      fed by Trivelin as items are processed (no IMAP or Graph calls)
     """
 
     config: ScapinConfig
     _note_manager: NoteManager | None = field(default=None, init=False)
     _queue_storage: QueueStorage | None = field(default=None, init=False)
+    _archive_index: ArchiveIndex | None = field(default=None, init=False)
+    _archive_backfilled: bool = field(default=False, init=False)
     _recent_searches: list[RecentSearchItem] = field(default_factory=list, init=False)
     _max_recent_searches: int = field(default=50, init=False)
 
@@ -142,6 +124,28 @@ class SearchService:
             self._queue_storage = QueueStorage()
         return self._queue_storage
 
+    def _get_archive_index(self) -> ArchiveIndex:
+        """Get the archive index (shared instance), backfilled from the queue once"""
+        if self._archive_index is None:
+            self._archive_index = get_archive_index()
+        if not self._archive_backfilled:
+            self._archive_backfilled = True
+            self._backfill_archive(self._archive_index)
+        return self._archive_index
+
+    def _backfill_archive(self, index: ArchiveIndex) -> None:
+        """Index queued emails if the archive has none (queues older than the archive)"""
+        try:
+            if index.count("email"):
+                return
+            queued = self._get_queue_storage().load_queue(status=None)
+            items = [item for item in map(item_from_queue_item, queued) if item is not None]
+            index.add_items(items)
+            if items:
+                logger.info(f"Archive index backfilled with {len(items)} queued emails")
+        except Exception as e:
+            logger.warning(f"Archive backfill from queue failed: {e}")
+
     def _add_recent_search(self, query: str, result_count: int) -> None:
         """Track recent search query"""
         item = RecentSearchItem(
@@ -288,71 +292,38 @@ class SearchService:
         date_from: datetime | None,
         date_to: datetime | None,
     ) -> list[EmailSearchResultItem]:
-        """Search emails in queue storage"""
+        """Search emails in the local archive index"""
         try:
-            storage = self._get_queue_storage()
-            # Load all queue items (we'll filter and score)
-            all_items = storage.load_queue(status=None)  # All statuses
-
-            scored_items = []
-            for item in all_items:
-                metadata = item.get("metadata", {})
-                content = item.get("content", {})
-
-                # Combine searchable text
-                subject = metadata.get("subject", "")
-                from_name = metadata.get("from_name", "")
-                from_address = metadata.get("from_address", "")
-                preview = content.get("preview", "")
-                searchable = f"{subject} {from_name} {from_address} {preview}"
-
-                # Calculate score
-                score = _text_match_score(searchable, query)
-                if score == 0:
-                    continue
-
-                # Parse date
-                date_str = metadata.get("date")
-                if date_str:
-                    try:
-                        item_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        item_date = datetime.now(timezone.utc)
-                else:
-                    item_date = datetime.now(timezone.utc)
-
-                # Apply date filters
-                if date_from and item_date < date_from:
-                    continue
-                if date_to and item_date > date_to:
-                    continue
-
-                scored_items.append((item, score, item_date))
-
-            # Sort by score descending
-            scored_items.sort(key=lambda x: x[1], reverse=True)
-            scored_items = scored_items[:limit]
+            hits = self._get_archive_index().search(
+                query, sources=["email"], date_from=date_from, date_to=date_to, limit=limit
+            )
 
-            # Build response
             items = []
-            for item, score, item_date in scored_items:
-                metadata = item.get("metadata", {})
-                content = item.get("content", {})
+            for hit in hits:
+                metadata = hit.metadata
+                queue_item_id = metadata.get("queue_item_id")
+                # Live queue status (the archive keeps the status at indexing time)
+                queue_item = (
+                    self._get_queue_storage().get_item(queue_item_id) if queue_item_id else None
+                )
+                status = (queue_item or {}).get("status") or metadata.get("status") or "pending"
 
                 items.append(
                     EmailSearchResultItem(
-                        id=item.get("id", ""),
-                        title=metadata.get("subject", "(No subject)"),
-                        excerpt=_highlight_matches(content.get("preview", ""), query),
-                        score=score,
-                        timestamp=item_date,
+                        id=queue_item_id or hit.item_id,
+                        title=hit.title or "(No subject)",
+                        excerpt=hit.snippet,
+                        score=hit.score,
+                        timestamp=hit.timestamp,
                         from_address=metadata.get("from_address", ""),
                         from_name=metadata.get("from_name", ""),
-                        status=item.get("status", "pending"),
+                        status=status,
                         metadata={
-                            "account_id": item.get("account_id"),
+                            "account_id": hit.account_id,
                             "has_attachments": metadata.get("has_attachments", False),
-                            "queued_at": item.get("queued_at"),
+                            "queued_at": (queue_item or {}).get("queued_at"),
+                            "folder": metadata.get("folder"),
+                            "message_id": metadata.get("message_id"),
                         },
                     )
                 )
@@ -365,45 +336,84 @@ class SearchService:
 
     async def _search_calendar(
         self,
-        _query: str,
-        _limit: int,
-        _date_from: datetime | None,
-        _date_to: datetime | None,
+        query: str,
+        limit: int,
+        date_from: datetime | None,
+        date_to: datetime | None,
     ) -> list[CalendarSearchResultItem]:
-        """
-        Search calendar events
+        """Search calendar events in the local archive index (dated by start)"""
+        try:
+            hits = self._get_archive_index().search(
+                query, sources=["calendar"], date_from=date_from, date_to=date_to, limit=limit
+            )
 
-        Note: Currently returns empty list as calendar events
-        are not persisted locally. Future implementation will
-        query the Microsoft Graph API or use cached events.
-        """
-        # TODO: Implement calendar search when event caching is added
-        # This would require:
-        # 1. Caching calendar events locally
-        # 2. Or querying Graph API directly (with rate limiting)
-        logger.debug("Calendar search not yet implemented")
-        return []
+            items = []
+            for hit in hits:
+                metadata = hit.metadata
+                start = _parse_iso(metadata.get("start")) or hit.timestamp
+                end = _parse_iso(metadata.get("end")) or start
+                items.append(
+                    CalendarSearchResultItem(
+                        id=metadata.get("event_id") or hit.item_id,
+                        title=hit.title,
+                        excerpt=hit.snippet,
+                        score=hit.score,
+                        timestamp=start,
+                        start=start,
+                        end=end,
+                        location=metadata.get("location") or "",
+                        organizer=hit.sender,
+                        metadata={
+                            "is_online": metadata.get("is_online", False),
+                            "online_url": metadata.get("online_url"),
+                            "web_link": metadata.get("web_link"),
+                        },
+                    )
+                )
+
+            return items
+
+        except Exception as e:
+            logger.error(f"Calendar search failed: {e}")
+            return []
 
     async def _search_teams(
         self,
-        _query: str,
-        _limit: int,
-        _date_from: datetime | None,
-        _date_to: datetime | None,
+        query: str,
+        limit: int,
+        date_from: datetime | None,
+        date_to: datetime | None,
     ) -> list[TeamsSearchResultItem]:
-        """
-        Search Teams messages
+        """Search Teams messages in the local archive index"""
+        try:
+            hits = self._get_archive_index().search(
+                query, sources=["teams"], date_from=date_from, date_to=date_to, limit=limit
+            )
 
-        Note: Currently returns empty list as Teams messages
-        are not persisted locally. Future implementation will
-        query the Microsoft Graph API or use cached messages.
-        """
-        # TODO: Implement Teams search when message caching is added
-        # This would require:
-        # 1. Caching Teams messages locally
-        # 2. Or querying Graph API directly (with rate limiting)
-        logger.debug("Teams search not yet implemented")
-        return []
+            items = []
+            for hit in hits:
+                metadata = hit.metadata
+                items.append(
+                    TeamsSearchResultItem(
+                        id=metadata.get("message_id") or hit.item_id,
+                        title=hit.title,
+                        excerpt=hit.snippet,
+                        score=hit.score,
+                        timestamp=hit.timestamp,
+                        chat_id=metadata.get("chat_id") or "",
+                        sender=metadata.get("sender_name") or hit.sender,
+                        metadata={
+                            "chat_topic": metadata.get("chat_topic"),
+                            "chat_type": metadata.get("chat_type"),
+                        },
+                    )
+                )
+
+            return items
+
+        except Exception as e:
+            logger.error(f"Teams search failed: {e}")
+            return []
 
     async def get_recent_searches(self, limit: int = 20) -> RecentSearchesResponse:
         """
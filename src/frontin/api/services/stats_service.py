@@ -2,12 +2,17 @@
 Stats Service
 
 Aggregates statistics from all sources (email, teams, calendar, queue, notes).
+
+All-time processed counts (the *_processed_total fields and the overview
+totals) and trends are read from the metrics store, fed by the processors,
+the queue and the notes review. The per-source breakdown otherwise reports
+the current session's counters. Sources are queried concurrently.
 """
 
-import random
+import asyncio
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
 from src.core.config_manager import get_config
 from src.core.state_manager import get_state_manager
@@ -28,20 +33,39 @@ from src.frontin.api.services.notes_review_service import NotesReviewService
 from src.frontin.api.services.queue_service import QueueService
 from src.frontin.api.services.teams_service import TeamsService
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import (
+    ITEMS_PROCESSED,
+    NOTES_REVIEWED,
+    MetricsStore,
+    get_metrics_store,
+)
 
 logger = get_logger("api.stats_service")
 
 # Track server start time (shared with system router)
 _start_time = time.time()
 
+# Trend series: (source, display label, chart color, metric name, metric label)
+TREND_SERIES: tuple[tuple[str, str, str, str, Optional[str]], ...] = (
+    ("email", "Emails", "#3b82f6", ITEMS_PROCESSED, "email"),  # blue
+    ("teams", "Teams", "#8b5cf6", ITEMS_PROCESSED, "teams"),  # purple
+    ("notes", "Notes révisées", "#10b981", NOTES_REVIEWED, None),  # green
+)
+
 
 class StatsService:
     """Service for aggregating statistics from all sources"""
 
-    def __init__(self) -> None:
-        """Initialize stats service"""
+    def __init__(self, metrics: Optional[MetricsStore] = None) -> None:
+        """
+        Initialize stats service
+
+        Args:
+            metrics: Metrics store (default: shared instance)
+        """
         self._config = get_config()
         self._state = get_state_manager()
+        self._metrics = metrics or get_metrics_store()
 
     async def get_overview(self) -> StatsOverviewResponse:
         """
@@ -52,17 +76,25 @@ class StatsService:
         """
         logger.info("Getting stats overview")
 
-        # Fetch stats from each service
-        email_stats = await self._get_email_stats()
-        teams_stats = await self._get_teams_stats()
-        calendar_stats = await self._get_calendar_stats()
-        queue_stats = await self._get_queue_stats()
-        notes_stats = await self._get_notes_stats()
+        # Fetch stats from each service concurrently
+        (
+            email_stats,
+            teams_stats,
+            calendar_stats,
+            queue_stats,
+            notes_stats,
+        ) = await asyncio.gather(
+            self._get_email_stats(),
+            self._get_teams_stats(),
+            self._get_calendar_stats(),
+            self._get_queue_stats(),
+            self._get_notes_stats(),
+        )
 
         # Calculate totals
         total_processed = (
-            email_stats.get("emails_processed", 0)
-            + teams_stats.get("messages_processed", 0)
+            email_stats.get("emails_processed_total", 0)
+            + teams_stats.get("messages_processed_total", 0)
         )
         total_pending = (
             queue_stats.get("total", 0)
@@ -91,9 +123,9 @@ class StatsService:
             sources_active=sources_active,
             uptime_seconds=uptime,
             last_activity=last_activity,
-            email_processed=email_stats.get("emails_processed", 0),
+            email_processed=email_stats.get("emails_processed_total", 0),
             email_queued=queue_stats.get("total", 0),
-            teams_messages=teams_stats.get("messages_processed", 0),
+            teams_messages=teams_stats.get("messages_processed_total", 0),
             teams_unread=teams_stats.get("unread_chats", 0),
             calendar_events_today=calendar_stats.get("events_today", 0),
             calendar_events_week=calendar_stats.get("events_week", 0),
@@ -110,12 +142,20 @@ class StatsService:
         """
         logger.info("Getting stats by source")
 
-        # Build response models for each source
-        email_response = await self._build_email_stats()
-        teams_response = await self._build_teams_stats()
-        calendar_response = await self._build_calendar_stats()
-        queue_response = await self._build_queue_stats()
-        notes_response = await self._build_notes_stats()
+        # Build response models for each source concurrently
+        (
+            email_response,
+            teams_response,
+            calendar_response,
+            queue_response,
+            notes_response,
+        ) = await asyncio.gather(
+            self._build_email_stats(),
+            self._build_teams_stats(),
+            self._build_calendar_stats(),
+            self._build_queue_stats(),
+            self._build_notes_stats(),
+        )
 
         return StatsBySourceResponse(
             email=email_response,
@@ -128,25 +168,36 @@ class StatsService:
     # --- Private helpers to fetch raw stats ---
 
     async def _get_email_stats(self) -> dict[str, Any]:
-        """Get email stats as dict"""
+        """Get email stats as dict (session counters, plus the all-time processed total)"""
         try:
             service = EmailService()
-            return await service.get_stats()
+            stats = await service.get_stats()
+            stats["emails_processed_total"] = await self._get_processed_total("email")
+            return stats
         except Exception as e:
             logger.warning(f"Failed to get email stats: {e}")
             return {}
 
     async def _get_teams_stats(self) -> dict[str, Any]:
-        """Get teams stats as dict"""
+        """Get teams stats as dict (session counters, plus the all-time processed total)"""
         try:
             if not self._config.teams.enabled:
                 return {}
             service = TeamsService()
-            return await service.get_stats()
+            stats = await service.get_stats()
+            stats["messages_processed_total"] = await self._get_processed_total("teams")
+            return stats
         except Exception as e:
             logger.warning(f"Failed to get teams stats: {e}")
             return {}
 
+    async def _get_processed_total(self, source: str) -> int:
+        """Items of a source processed over the whole history (sum of day buckets)"""
+        total = await asyncio.to_thread(
+            self._metrics.counter_total, ITEMS_PROCESSED, label=source
+        )
+        return int(total)
+
     async def _get_calendar_stats(self) -> dict[str, Any]:
         """Get calendar stats from state"""
         try:
@@ -199,6 +250,7 @@ class StatsService:
             return None
         return EmailStatsResponse(
             emails_processed=stats.get("emails_processed", 0),
+            emails_processed_total=stats.get("emails_processed_total"),
             emails_auto_executed=stats.get("emails_auto_executed", 0),
             emails_archived=stats.get("emails_archived", 0),
             emails_deleted=stats.get("emails_deleted", 0),
@@ -220,6 +272,7 @@ class StatsService:
             total_chats=stats.get("total_chats", 0),
             unread_chats=stats.get("unread_chats", 0),
             messages_processed=stats.get("messages_processed", 0),
+            messages_processed_total=stats.get("messages_processed_total"),
             messages_flagged=stats.get("messages_flagged", 0),
             last_poll=self._parse_datetime(stats.get("last_poll")),
         )
@@ -313,8 +366,7 @@ class StatsService:
         """
         Get historical trends data
 
-        Currently generates representative data based on current stats.
-        TODO: Implement actual historical tracking with daily snapshots.
+        Reads one day bucket per day and series from the metrics store.
 
         Args:
             period: Time period - "7d" or "30d"
@@ -325,111 +377,49 @@ class StatsService:
         logger.info(f"Getting stats trends for period: {period}")
 
         days = 7 if period == "7d" else 30
-        today = datetime.now(timezone.utc).date()
+        now = datetime.now(timezone.utc)
+        today = now.date()
         start_date = today - timedelta(days=days - 1)
-
-        # Get current stats as baseline
-        email_stats = await self._get_email_stats()
-        teams_stats = await self._get_teams_stats()
-        notes_stats = await self._get_notes_stats()
-
-        # Generate trend data for each source
-        trends: list[SourceTrend] = []
-
-        # Email trend
-        email_total = email_stats.get("emails_processed", 0)
-        email_trend = self._generate_trend_data(
-            source="email",
-            label="Emails",
-            color="#3b82f6",  # blue
-            days=days,
-            start_date=start_date,
-            _total_hint=email_total,
-            base_daily=max(5, email_total // max(1, days)),
-        )
-        trends.append(email_trend)
-
-        # Teams trend
-        teams_total = teams_stats.get("messages_processed", 0)
-        teams_trend = self._generate_trend_data(
-            source="teams",
-            label="Teams",
-            color="#8b5cf6",  # purple
-            days=days,
-            start_date=start_date,
-            _total_hint=teams_total,
-            base_daily=max(3, teams_total // max(1, days)),
+        start = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+
+        trends = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._build_trend, source, label, color, metric, metric_label, start, now
+                )
+                for source, label, color, metric, metric_label in TREND_SERIES
+            )
         )
-        trends.append(teams_trend)
-
-        # Notes trend
-        notes_total = notes_stats.get("reviewed_today", 0) * days // 2  # Estimate
-        notes_trend = self._generate_trend_data(
-            source="notes",
-            label="Notes révisées",
-            color="#10b981",  # green
-            days=days,
-            start_date=start_date,
-            _total_hint=max(notes_total, days * 2),
-            base_daily=max(2, notes_stats.get("reviewed_today", 2)),
-        )
-        trends.append(notes_trend)
-
-        # Calculate total
-        total_processed = sum(t.total for t in trends)
 
         return StatsTrendsResponse(
             period=period,
             start_date=start_date.isoformat(),
             end_date=today.isoformat(),
-            trends=trends,
-            total_processed=total_processed,
+            trends=list(trends),
+            total_processed=sum(t.total for t in trends),
         )
 
-    def _generate_trend_data(
+    def _build_trend(
         self,
         source: str,
         label: str,
         color: str,
-        days: int,
-        start_date: datetime,
-        _total_hint: int,
-        base_daily: int,
+        metric: str,
+        metric_label: Optional[str],
+        start: datetime,
+        end: datetime,
     ) -> SourceTrend:
-        """
-        Generate trend data points with realistic variation
-
-        Uses a seed based on source name for consistent generation.
-        """
-        # Use deterministic seed for consistent results
-        seed = hash(f"{source}-{start_date.isoformat()}")
-        rng = random.Random(seed)
-
-        data_points: list[TrendDataPoint] = []
-        total = 0
-
-        for i in range(days):
-            date = start_date + timedelta(days=i)
-            date_str = date.isoformat() if hasattr(date, "isoformat") else str(date)
-
-            # Weekday variation (lower on weekends)
-            day_of_week = (start_date + timedelta(days=i)).weekday() if hasattr(start_date, "weekday") else i % 7
-            weekend_factor = 0.3 if day_of_week >= 5 else 1.0
-
-            # Add some randomness
-            variation = rng.uniform(0.6, 1.4)
-            value = int(base_daily * weekend_factor * variation)
-
-            # Ensure minimum activity
-            value = max(0, value)
-
-            data_points.append(TrendDataPoint(date=date_str, value=value))
-            total += value
+        """Build a SourceTrend from the daily buckets of a counter"""
+        points = self._metrics.counter_series(metric, "day", start, end, label=metric_label)
+        data_points = [
+            TrendDataPoint(date=point.start.date().isoformat(), value=int(point.value))
+            for point in points
+        ]
 
         return SourceTrend(
             source=source,
             label=label,
             color=color,
             data=data_points,
-            total=total,
+            total=sum(point.value for point in data_points),
         )
@@ -223,6 +223,33 @@ class QueueEventEmitter:
 
         return sent_count
 
+    # === Notes Events ===
+
+    async def emit_notes_changed(self, changes: list[dict[str, Any]]) -> int:
+        """
+        Emit event when notes were changed outside Scapin (detected by the watcher).
+
+        Args:
+            changes: NoteChange.to_dict() entries (note_id, kind, path, timestamp)
+
+        Returns:
+            Number of clients that received the event
+        """
+        message = {
+            "type": "notes_changed",
+            "changes": changes,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        sent_count = await self.manager.broadcast_to_channel(ChannelType.QUEUE, message)
+
+        logger.debug(
+            f"Emitted notes_changed event to {sent_count} clients",
+            extra={"count": len(changes)},
+        )
+
+        return sent_count
+
     # === Memory Cycles v2 Events ===
 
     async def emit_retouche_done(
@@ -436,6 +463,21 @@ class QueueEventEmitter:
         _schedule_async(self.emit_fetch_completed(source, count))
 
 
+    def emit_notes_changed_sync(
+        self,
+        changes: list[dict[str, Any]],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Synchronous wrapper for emit_notes_changed.
+
+        Args:
+            changes: NoteChange.to_dict() entries
+            loop: Event loop to emit on when called from another thread
+        """
+        _schedule_async(self.emit_notes_changed(changes), loop)
+
+
 def _sanitize_item(item: dict[str, Any]) -> dict[str, Any]:
     """
     Sanitize a queue item for WebSocket transmission.
@@ -479,12 +521,20 @@ def _sanitize_item(item: dict[str, Any]) -> dict[str, Any]:
     return sanitized
 
 
-def _schedule_async(coro: Any) -> None:
+def _schedule_async(coro: Any, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
     """
     Schedule an async coroutine to run in the event loop.
 
-    Used by sync wrappers to emit events from sync code.
+    Used by sync wrappers to emit events from sync code. With an explicit
+    loop, the coroutine is submitted thread-safely (for worker threads).
     """
+    if loop is not None:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, loop)
+        else:
+            coro.close()
+            logger.debug("Event loop not running, skipping queue event emission")
+        return
     try:
         loop = asyncio.get_running_loop()
         loop.create_task(coro)
@@ -6,6 +6,7 @@ Intelligent briefing generation from multiple sources.
 Provides:
 - Morning briefings: Daily overview of calendar, emails, and Teams
 - Pre-meeting briefings: Context for upcoming meetings
+- BriefingCache: pre-computed briefings, invalidated on source updates
 
 Usage:
     from src.frontin.briefing import BriefingGenerator, BriefingDisplay
@@ -22,6 +23,7 @@ Usage:
     display.render_pre_meeting_briefing(pre_meeting)
 """
 
+from src.frontin.briefing.cache import BriefingCache, get_briefing_cache
 from src.frontin.briefing.display import BriefingDisplay
 from src.frontin.briefing.generator import (
     BriefingDataProvider,
@@ -40,6 +42,9 @@ __all__ = [
     "BriefingGenerator",
     "BriefingDataProvider",
     "DefaultBriefingDataProvider",
+    # Cache
+    "BriefingCache",
+    "get_briefing_cache",
     # Models
     "MorningBriefing",
     "PreMeetingBriefing",
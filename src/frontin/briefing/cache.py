@@ -0,0 +1,227 @@
+"""
+Briefing Cache
+
+Materialized briefings, so /briefing endpoints answer without touching
+the sources.
+
+The API server pre-computes the morning briefing and the briefings of the
+next meetings (see BriefingService.precompute). Entries expire after
+max_age and are dropped as soon as a source reports new or changed items
+(SOURCE_UPDATED on the processing event bus). Degraded briefings are never
+cached: the next read or pre-computation tries the missing sources again.
+"""
+
+import dataclasses
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.core.processing_events import (
+    EventBus,
+    ProcessingEvent,
+    ProcessingEventType,
+    get_event_bus,
+)
+from src.frontin.briefing.generator import minutes_until_start
+from src.frontin.briefing.models import MorningBriefing, PreMeetingBriefing
+from src.monitoring.logger import get_logger
+from src.utils import now_utc
+
+logger = get_logger("frontin.briefing.cache")
+
+DEFAULT_MAX_AGE = timedelta(minutes=30)
+
+
+@dataclass
+class BriefingCache:
+    """
+    Thread-safe cache of generated briefings
+
+    Morning briefings are keyed by (date, hours_ahead), pre-meeting
+    briefings by calendar event ID.
+
+    Every invalidation bumps a generation counter: a briefing whose
+    generation started before an invalidation is not stored, since it may
+    predate the change.
+
+    Usage:
+        cache = BriefingCache()
+        generation = cache.generation
+        briefing = await generator.generate_morning_briefing()
+        cache.put_morning(date.today(), 24, briefing, generation)
+
+        cached = cache.get_morning(date.today(), 24)
+    """
+
+    max_age: timedelta = DEFAULT_MAX_AGE
+
+    _morning: dict[tuple[date, int], MorningBriefing] = field(default_factory=dict, init=False)
+    _pre_meeting: dict[str, PreMeetingBriefing] = field(default_factory=dict, init=False)
+    _generation: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def generation(self) -> int:
+        """Current generation (take it before generating a briefing to cache)"""
+        with self._lock:
+            return self._generation
+
+    def get_morning(self, target_date: date, hours_ahead: int) -> Optional[MorningBriefing]:
+        """Cached morning briefing, or None if missing or expired"""
+        with self._lock:
+            briefing = self._morning.get((target_date, hours_ahead))
+            if briefing is None or self._is_expired(briefing.generated_at):
+                return None
+            return briefing
+
+    def put_morning(
+        self,
+        target_date: date,
+        hours_ahead: int,
+        briefing: MorningBriefing,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a morning briefing
+
+        Args:
+            target_date: Date of the briefing
+            hours_ahead: Calendar horizon it was generated with
+            briefing: The briefing
+            generation: Generation taken before generating it (None: current)
+
+        Returns:
+            True if stored (False if degraded or invalidated meanwhile)
+        """
+        if briefing.is_degraded:
+            return False
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            # Briefings of past days are of no use any more
+            self._morning = {k: v for k, v in self._morning.items() if k[0] >= target_date}
+            self._morning[(target_date, hours_ahead)] = briefing
+            return True
+
+    def get_pre_meeting(self, event_id: str) -> Optional[PreMeetingBriefing]:
+        """
+        Cached pre-meeting briefing, or None if missing or expired
+
+        minutes_until_start is recomputed for the current time.
+        """
+        with self._lock:
+            briefing = self._pre_meeting.get(event_id)
+            if briefing is None or self._is_expired(briefing.generated_at):
+                return None
+        return dataclasses.replace(
+            briefing, minutes_until_start=minutes_until_start(briefing.event)
+        )
+
+    def put_pre_meeting(
+        self,
+        event_id: str,
+        briefing: PreMeetingBriefing,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a pre-meeting briefing
+
+        Args:
+            event_id: Calendar event ID
+            briefing: The briefing
+            generation: Generation taken before generating it (None: current)
+
+        Returns:
+            True if stored (False if degraded or invalidated meanwhile)
+        """
+        if briefing.is_degraded:
+            return False
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._pre_meeting = {
+                k: v for k, v in self._pre_meeting.items() if not self._is_expired(v.generated_at)
+            }
+            self._pre_meeting[event_id] = briefing
+            return True
+
+    def invalidate(
+        self,
+        source: Optional[str] = None,
+        item_ids: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Drop briefings affected by new or changed items
+
+        Calendar changes drop the morning briefings and the pre-meeting
+        briefings of the changed events. Changes to other sources (emails,
+        Teams messages) may concern any meeting, so everything is dropped.
+
+        Args:
+            source: Source of the change (None: unknown, drop everything)
+            item_ids: Changed items of that source, if known
+        """
+        with self._lock:
+            self._generation += 1
+            self._morning.clear()
+            if source == "calendar" and item_ids is not None:
+                for event_id in item_ids:
+                    self._pre_meeting.pop(event_id, None)
+            else:
+                self._pre_meeting.clear()
+        logger.debug(f"Briefing cache invalidated (source={source or 'unknown'})")
+
+    def on_event(self, event: ProcessingEvent) -> None:
+        """EventBus callback: invalidate on SOURCE_UPDATED"""
+        self.invalidate(event.metadata.get("source"), event.metadata.get("item_ids"))
+
+    def subscribe(self, event_bus: Optional[EventBus] = None) -> None:
+        """Invalidate this cache on source updates of the event bus"""
+        (event_bus or get_event_bus()).subscribe(
+            ProcessingEventType.SOURCE_UPDATED, self.on_event
+        )
+
+    def clear(self) -> None:
+        """Drop all cached briefings"""
+        self.invalidate()
+
+    def get_stats(self) -> dict[str, int]:
+        """Number of cached briefings and current generation"""
+        with self._lock:
+            return {
+                "morning": len(self._morning),
+                "pre_meeting": len(self._pre_meeting),
+                "generation": self._generation,
+            }
+
+    def _is_expired(self, generated_at: datetime) -> bool:
+        """True if a briefing generated at this time is too old"""
+        return now_utc() - generated_at > self.max_age
+
+
+# Singleton instance
+_briefing_cache_instance: Optional[BriefingCache] = None
+_briefing_cache_lock = threading.Lock()
+
+
+def get_briefing_cache(max_age: Optional[timedelta] = None) -> BriefingCache:
+    """
+    Get the shared briefing cache (subscribed to the global event bus)
+
+    Args:
+        max_age: Maximum age of cached briefings (used on first call)
+
+    Returns:
+        BriefingCache singleton
+    """
+    global _briefing_cache_instance
+
+    if _briefing_cache_instance is None:
+        with _briefing_cache_lock:
+            if _briefing_cache_instance is None:
+                cache = BriefingCache(max_age=max_age or DEFAULT_MAX_AGE)
+                cache.subscribe()
+                _briefing_cache_instance = cache
+
+    return _briefing_cache_instance
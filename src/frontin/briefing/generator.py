@@ -6,13 +6,19 @@ Core briefing generation system that aggregates data from multiple sources
 
 Uses the existing processors to fetch normalized PerceivedEvents,
 then ranks and organizes them for display.
+
+Sources are fetched concurrently, each under its own deadline
+(BriefingConfig.source_timeout_seconds): a slow or failing source is left
+out and listed in the briefing's degraded_sources instead of delaying it.
 """
 
+import asyncio
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Optional, Protocol
 
-from src.core.config_manager import BriefingConfig
+from src.core.config_manager import BriefingConfig, get_config
 from src.core.events import EventSource, PerceivedEvent, UrgencyLevel
 from src.frontin.briefing.models import (
     AttendeeContext,
@@ -29,6 +35,24 @@ from src.utils import now_utc
 logger = get_logger("frontin.briefing.generator")
 
 
+def minutes_until_start(event: PerceivedEvent, now: Optional[datetime] = None) -> int:
+    """
+    Minutes until a calendar event starts (negative once it is in progress)
+
+    Uses the "start" metadata of the event; events without one start now.
+    """
+    now = now or now_utc()
+    start_str = event.metadata.get("start")
+    if not start_str:
+        return 0
+
+    start_time = datetime.fromisoformat(start_str)
+    # Ensure timezone aware
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return int((start_time - now).total_seconds() / 60)
+
+
 class BriefingDataProvider(Protocol):
     """
     Protocol for fetching briefing data from various sources
@@ -107,17 +131,24 @@ class DefaultBriefingDataProvider:
         hours_ahead: int,
         include_in_progress: bool = True,  # noqa: ARG002
     ) -> list[PerceivedEvent]:
-        """Get upcoming calendar events using CalendarProcessor"""
-        try:
-            from src.trivelin.calendar_processor import CalendarProcessor
+        """
+        Get upcoming calendar events using CalendarProcessor
 
-            if self._calendar_processor is None:
-                self._calendar_processor = CalendarProcessor()
+        Returns no events when the calendar integration is disabled or has
+        no Microsoft account. Fetch errors propagate, so that the generator
+        reports the calendar as a degraded source (and the briefing is not
+        cached).
+        """
+        from src.trivelin.calendar_processor import CalendarProcessor
 
-            return await self._calendar_processor.get_briefing(hours_ahead=hours_ahead)
-        except Exception as e:
-            logger.warning(f"Failed to get calendar events: {e}")
-            return []
+        if self._calendar_processor is None:
+            calendar_config = get_config().calendar
+            if not calendar_config.enabled or calendar_config.account is None:
+                logger.debug("Calendar integration not configured, skipping calendar events")
+                return []
+            self._calendar_processor = CalendarProcessor(config=calendar_config)
+
+        return await self._calendar_processor.get_briefing(hours_ahead=hours_ahead)
 
     async def get_teams_messages(
         self,
@@ -207,26 +238,29 @@ class BriefingGenerator:
 
         logger.info(f"Generating morning briefing for {target_date}")
 
-        # Fetch data from all enabled sources
-        calendar_events: list[PerceivedEvent] = []
-        email_events: list[PerceivedEvent] = []
-        teams_events: list[PerceivedEvent] = []
+        # Fetch data from all enabled sources concurrently
+        fetches: dict[str, Awaitable[list[PerceivedEvent]]] = {}
 
         if self.config.include_calendar:
-            calendar_events = await self._fetch_calendar(
+            fetches["calendar"] = self._fetch_calendar(
                 hours_ahead=self.config.morning_hours_ahead
             )
 
         if self.config.include_emails:
-            email_events = await self._fetch_emails(
+            fetches["email"] = self._fetch_emails(
                 hours_behind=self.config.morning_hours_behind
             )
 
         if self.config.include_teams:
-            teams_events = await self._fetch_teams(
+            fetches["teams"] = self._fetch_teams(
                 hours_behind=self.config.morning_hours_behind
             )
 
+        results, degraded_sources = await self._gather_sources(fetches)
+        calendar_events = results.get("calendar", [])
+        email_events = results.get("email", [])
+        teams_events = results.get("teams", [])
+
         # Combine all events and extract urgent ones
         all_events = calendar_events + email_events + teams_events
         urgent_items = self._extract_urgent(all_events)
@@ -269,6 +303,7 @@ class BriefingGenerator:
             orphan_questions_count=len(orphan_question_items),
             retouche_alerts_count=len(retouche_alert_items),
             pending_retouche_count=len(pending_action_items),
+            degraded_sources=degraded_sources,
         )
 
         # Generate AI summary if enabled
@@ -278,6 +313,7 @@ class BriefingGenerator:
         logger.info(
             f"Morning briefing generated: {briefing.urgent_count} urgent, "
             f"{briefing.total_items} total items, {briefing.retouche_alerts_count} retouche alerts"
+            + (f", degraded: {', '.join(degraded_sources)}" if degraded_sources else "")
         )
 
         return briefing
@@ -302,19 +338,7 @@ class BriefingGenerator:
             PreMeetingBriefing with context
         """
         now = now_utc()
-
-        # Parse start time from metadata
-        start_str = event.metadata.get("start")
-        if start_str:
-            start_time = datetime.fromisoformat(start_str)
-            # Ensure timezone aware
-            if start_time.tzinfo is None:
-                start_time = start_time.replace(tzinfo=timezone.utc)
-        else:
-            start_time = now
-
-        # Allow negative values to indicate meeting in progress
-        minutes_until = int((start_time - now).total_seconds() / 60)
+        minutes_until = minutes_until_start(event, now)
 
         logger.info(
             f"Generating pre-meeting briefing for '{event.title}' "
@@ -324,19 +348,25 @@ class BriefingGenerator:
         # Extract attendee emails
         attendee_emails = self._extract_attendee_emails(event)
 
-        # Fetch related communications
-        recent_emails: list[PerceivedEvent] = []
-        recent_teams: list[PerceivedEvent] = []
+        # Fetch related communications concurrently
+        results: dict[str, list[PerceivedEvent]] = {}
+        degraded_sources: list[str] = []
 
         if attendee_emails and self.data_provider:
-            recent_emails = await self.data_provider.get_emails_with_people(
-                attendee_emails,
-                days=self.config.pre_meeting_context_days,
-            )
-            recent_teams = await self.data_provider.get_teams_with_people(
-                attendee_emails,
-                days=self.config.pre_meeting_context_days,
+            results, degraded_sources = await self._gather_sources(
+                {
+                    "email": self.data_provider.get_emails_with_people(
+                        attendee_emails,
+                        days=self.config.pre_meeting_context_days,
+                    ),
+                    "teams": self.data_provider.get_teams_with_people(
+                        attendee_emails,
+                        days=self.config.pre_meeting_context_days,
+                    ),
+                }
             )
+        recent_emails = results.get("email", [])
+        recent_teams = results.get("teams", [])
 
         # Build attendee context
         attendees = self._build_attendee_context(
@@ -354,6 +384,7 @@ class BriefingGenerator:
             recent_teams=recent_teams[:5],
             meeting_url=event.metadata.get("online_url"),
             location=event.metadata.get("location"),
+            degraded_sources=degraded_sources,
         )
 
         # Generate talking points based on available context
@@ -366,6 +397,38 @@ class BriefingGenerator:
 
         return briefing
 
+    async def _gather_sources(
+        self,
+        fetches: dict[str, Awaitable[list[PerceivedEvent]]],
+    ) -> tuple[dict[str, list[PerceivedEvent]], list[str]]:
+        """
+        Run source fetches concurrently, each under the source deadline
+
+        Args:
+            fetches: Source name -> pending fetch
+
+        Returns:
+            Tuple of (events by source, degraded source names). Sources that
+            failed or missed the deadline get an empty list and are degraded.
+        """
+        timeout = self.config.source_timeout_seconds
+
+        async def run(source: str, fetch: Awaitable[list[PerceivedEvent]]) -> Optional[list]:
+            try:
+                return await asyncio.wait_for(fetch, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Briefing source {source} missed its {timeout:g}s deadline")
+            except Exception as e:
+                logger.warning(f"Failed to fetch briefing source {source}: {e}")
+            return None
+
+        names = list(fetches)
+        outcomes = await asyncio.gather(*(run(name, fetches[name]) for name in names))
+
+        results = {name: events or [] for name, events in zip(names, outcomes)}
+        degraded = [name for name, events in zip(names, outcomes) if events is None]
+        return results, degraded
+
     async def _fetch_calendar(
         self,
         hours_ahead: int,
@@ -374,16 +437,12 @@ class BriefingGenerator:
         if self.data_provider is None:
             return []
 
-        try:
-            events = await self.data_provider.get_calendar_events(
-                hours_ahead=hours_ahead,
-                include_in_progress=True,
-            )
-            logger.debug(f"Fetched {len(events)} calendar events")
-            return events
-        except Exception as e:
-            logger.warning(f"Failed to fetch calendar events: {e}")
-            return []
+        events = await self.data_provider.get_calendar_events(
+            hours_ahead=hours_ahead,
+            include_in_progress=True,
+        )
+        logger.debug(f"Fetched {len(events)} calendar events")
+        return events
 
     async def _fetch_emails(
         self,
@@ -393,17 +452,13 @@ class BriefingGenerator:
         if self.data_provider is None:
             return []
 
-        try:
-            since = now_utc() - timedelta(hours=hours_behind)
-            events = await self.data_provider.get_emails_since(
-                since=since,
-                limit=50,
-            )
-            logger.debug(f"Fetched {len(events)} emails")
-            return events
-        except Exception as e:
-            logger.warning(f"Failed to fetch emails: {e}")
-            return []
+        since = now_utc() - timedelta(hours=hours_behind)
+        events = await self.data_provider.get_emails_since(
+            since=since,
+            limit=50,
+        )
+        logger.debug(f"Fetched {len(events)} emails")
+        return events
 
     async def _fetch_teams(
         self,
@@ -413,17 +468,13 @@ class BriefingGenerator:
         if self.data_provider is None:
             return []
 
-        try:
-            since = now_utc() - timedelta(hours=hours_behind)
-            events = await self.data_provider.get_teams_messages(
-                since=since,
-                limit=50,
-            )
-            logger.debug(f"Fetched {len(events)} Teams messages")
-            return events
-        except Exception as e:
-            logger.warning(f"Failed to fetch Teams messages: {e}")
-            return []
+        since = now_utc() - timedelta(hours=hours_behind)
+        events = await self.data_provider.get_teams_messages(
+            since=since,
+            limit=50,
+        )
+        logger.debug(f"Fetched {len(events)} Teams messages")
+        return events
 
     def _load_orphan_questions(self) -> list[OrphanQuestionItem]:
         """
@@ -206,6 +206,8 @@ class MorningBriefing:
         orphan_questions_count: Count of orphan questions
         retouche_alerts_count: Count of retouche alerts
         pending_retouche_count: Count of pending retouche actions
+        degraded_sources: Sources that failed or missed their deadline
+            (their sections are empty or partial)
     """
 
     date: date
@@ -240,6 +242,14 @@ class MorningBriefing:
     retouche_alerts_count: int = 0
     pending_retouche_count: int = 0
 
+    # Sources left out of this briefing (failed or too slow)
+    degraded_sources: list[str] = field(default_factory=list)
+
+    @property
+    def is_degraded(self) -> bool:
+        """True if some sources are missing from this briefing"""
+        return bool(self.degraded_sources)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -260,6 +270,7 @@ class MorningBriefing:
             "orphan_questions_count": self.orphan_questions_count,
             "retouche_alerts_count": self.retouche_alerts_count,
             "pending_retouche_count": self.pending_retouche_count,
+            "degraded_sources": self.degraded_sources,
         }
 
     def to_markdown(self) -> str:
@@ -286,6 +297,12 @@ class MorningBriefing:
             "",
         ]
 
+        if self.degraded_sources:
+            lines.extend([
+                f"*Unavailable sources: {', '.join(self.degraded_sources)}*",
+                "",
+            ])
+
         # AI Summary
         if self.ai_summary:
             lines.extend([
@@ -488,6 +505,7 @@ class PreMeetingBriefing:
         location: Physical location if applicable
         talking_points: AI-generated suggested talking points
         open_items: Open action items related to attendees
+        degraded_sources: Sources that failed or missed their deadline
     """
 
     event: PerceivedEvent
@@ -509,6 +527,14 @@ class PreMeetingBriefing:
     talking_points: list[str] = field(default_factory=list)
     open_items: list[str] = field(default_factory=list)
 
+    # Sources left out of this briefing (failed or too slow)
+    degraded_sources: list[str] = field(default_factory=list)
+
+    @property
+    def is_degraded(self) -> bool:
+        """True if some sources are missing from this briefing"""
+        return bool(self.degraded_sources)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -523,6 +549,7 @@ class PreMeetingBriefing:
             "location": self.location,
             "talking_points": self.talking_points,
             "open_items": self.open_items,
+            "degraded_sources": self.degraded_sources,
         }
 
     def to_markdown(self) -> str:
@@ -17,6 +17,7 @@ from typing import Optional, Union
 from src.core.config_manager import EmailAccountConfig, EmailConfig
 from src.core.schemas import EmailContent, EmailMetadata
 from src.integrations.email.processed_tracker import get_processed_tracker
+from src.integrations.email.sync_state import PendingMessage, get_sync_state_store
 from src.monitoring.logger import get_logger
 from src.utils import now_utc
 
@@ -33,6 +34,9 @@ IMAP_SPECIAL_CHARS = r'[\s"\\(){}%*]'
 #   $MailFlagBit6 = Gray
 SCAPIN_PROCESSED_FLAG = "$MailFlagBit6"
 
+# UIDs whose headers are fetched per round-trip during incremental sync
+SYNC_HEADER_BATCH_SIZE = 100
+
 
 def encode_imap_folder_name(folder_name: str) -> str:
     """
@@ -197,6 +201,31 @@ def decode_imap_folder_name(folder_name: str) -> str:
     return "".join(result)
 
 
+def compact_uid_set(uids: list[int]) -> str:
+    """
+    Build a compact IMAP UID set from a list of UIDs
+
+    Consecutive UIDs are collapsed into ranges: [1, 2, 3, 7] -> "1:3,7".
+
+    Args:
+        uids: UIDs (any order, duplicates allowed)
+
+    Returns:
+        IMAP sequence set string
+    """
+    parts: list[str] = []
+    ordered = sorted(set(uids))
+    i = 0
+    while i < len(ordered):
+        start = end = ordered[i]
+        while i + 1 < len(ordered) and ordered[i + 1] == end + 1:
+            i += 1
+            end = ordered[i]
+        parts.append(str(start) if start == end else f"{start}:{end}")
+        i += 1
+    return ",".join(parts)
+
+
 def decode_mime_header(header_value: str) -> str:
     """
     Decode MIME-encoded email header (like Subject, From name, etc.)
@@ -279,6 +308,7 @@ class IMAPClient:
         self.account_name = account_config.account_name
         self._connection: Optional[imaplib.IMAP4_SSL] = None
         self._lock = threading.Lock()
+        self._condstore_enabled = False
 
         logger.info(
             "IMAP client initialized",
@@ -350,7 +380,20 @@ class IMAPClient:
                 # Login
                 self._connection.login(self.config.imap_username, self.config.imap_password)
 
-                logger.info("IMAP connection established")
+                # CONDSTORE (RFC 7162) exposes HIGHESTMODSEQ so incremental
+                # sync can fetch only flags changed since the last poll
+                self._condstore_enabled = False
+                if "CONDSTORE" in self._connection.capabilities:
+                    try:
+                        status, _ = self._connection.enable("CONDSTORE")
+                        self._condstore_enabled = status == "OK"
+                    except imaplib.IMAP4.error as e:
+                        logger.debug(f"CONDSTORE not enabled: {e}")
+
+                logger.info(
+                    "IMAP connection established",
+                    extra={"condstore": self._condstore_enabled},
+                )
 
             except socket.timeout as e:
                 logger.error("IMAP connection timeout")
@@ -378,6 +421,7 @@ class IMAPClient:
                     logger.warning(f"Error closing IMAP connection: {e}")
                 finally:
                     self._connection = None
+                    self._condstore_enabled = False
 
     def list_folders(self, pattern: str = "*") -> list[str]:
         """
@@ -459,6 +503,13 @@ class IMAPClient:
                 logger.error(f"Failed to select folder: {folder}")
                 return []
 
+            # Incremental sync: only new UIDs and changed flags are requested.
+            # Falls back to a full search if the server gives no UIDVALIDITY.
+            if unprocessed_only:
+                synced_ids = self._sync_unprocessed_uids(folder, unread_only, limit)
+                if synced_ids is not None:
+                    return self._fetch_synced_emails(synced_ids, folder)
+
             # Build search criteria
             # IMAP returns messages in ascending order by UID if requested via UID SEARCH
             criteria = []
@@ -701,6 +752,297 @@ class IMAPClient:
             logger.error(f"Error filtering unprocessed emails: {e}", exc_info=True)
             return msg_ids[:limit] if limit else msg_ids
 
+    def _require_connection(self) -> imaplib.IMAP4_SSL:
+        """
+        Get the open IMAP connection
+
+        Returns:
+            Connection opened by connect()
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if self._connection is None:
+            raise RuntimeError("Not connected to IMAP server. Use connect() context manager.")
+        return self._connection
+
+    def _select_response_int(self, code: str) -> Optional[int]:
+        """
+        Read a numeric response code (UIDVALIDITY, UIDNEXT, HIGHESTMODSEQ)
+        returned by the last SELECT.
+
+        Args:
+            code: Response code name
+
+        Returns:
+            Integer value, or None if the server did not send it
+        """
+        try:
+            _, data = self._require_connection().response(code)
+            return int(data[-1])
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    def _parse_flags_response(self, response: list) -> dict[int, bool]:
+        """
+        Parse IMAP FETCH response to extract UID -> \\Seen mapping.
+
+        FLAGS may appear before or after a literal, so flags found on an
+        item without a UID are attributed to the last UID seen.
+
+        Args:
+            response: Raw IMAP FETCH response
+
+        Returns:
+            Dictionary mapping UID to whether the message is seen
+        """
+        seen_by_uid: dict[int, bool] = {}
+        current_uid: Optional[int] = None
+
+        for item in response:
+            header = item[0] if isinstance(item, tuple) else item
+            if not isinstance(header, bytes):
+                continue
+
+            uid_match = re.search(b"UID\\s+(\\d+)", header, re.IGNORECASE)
+            if uid_match:
+                current_uid = int(uid_match.group(1))
+                seen_by_uid.setdefault(current_uid, False)
+
+            flags_match = re.search(b"FLAGS\\s+\\(([^)]*)\\)", header, re.IGNORECASE)
+            if flags_match and current_uid is not None:
+                seen_by_uid[current_uid] = b"\\seen" in flags_match.group(1).lower()
+
+        return seen_by_uid
+
+    def _fetch_uid_headers(self, uids: list[int]) -> Optional[dict[int, PendingMessage]]:
+        """
+        Fetch Message-ID and \\Seen flag for a batch of UIDs.
+
+        Args:
+            uids: UIDs to fetch
+
+        Returns:
+            Dictionary mapping UID to PendingMessage (expunged UIDs are
+            absent), or None if the FETCH failed
+        """
+        conn = self._require_connection()
+        status, response = conn.uid(
+            "FETCH", compact_uid_set(uids), "(FLAGS BODY.PEEK[HEADER.FIELDS (MESSAGE-ID)])"
+        )
+        if status != "OK":
+            logger.warning(f"Failed to fetch headers for {len(uids)} UIDs")
+            return None
+
+        message_ids = self._parse_fetch_response(response)
+        seen_by_uid = self._parse_flags_response(response)
+        return {
+            int(uid): PendingMessage(
+                uid=int(uid), message_id=message_id, seen=seen_by_uid.get(int(uid), False)
+            )
+            for uid, message_id in message_ids.items()
+        }
+
+    def _fetch_uid_flags(
+        self, uids: list[int], changed_since: Optional[int] = None
+    ) -> Optional[dict[int, bool]]:
+        """
+        Fetch the \\Seen flag for a set of UIDs.
+
+        Args:
+            uids: UIDs to fetch
+            changed_since: Only return messages whose MODSEQ is above this
+                           value (CONDSTORE CHANGEDSINCE modifier)
+
+        Returns:
+            Dictionary mapping UID to seen, or None if the FETCH failed
+        """
+        query = "(FLAGS)"
+        if changed_since is not None:
+            query = f"(FLAGS) (CHANGEDSINCE {changed_since})"
+
+        conn = self._require_connection()
+        status, response = conn.uid("FETCH", compact_uid_set(uids), query)
+        if status != "OK":
+            logger.warning(f"Failed to fetch flags for {len(uids)} UIDs")
+            return None
+        return self._parse_flags_response(response)
+
+    def _sync_unprocessed_uids(
+        self, folder: str, unread_only: bool, limit: Optional[int] = None
+    ) -> Optional[list[bytes]]:
+        """
+        Find unprocessed emails incrementally from the persisted folder state.
+
+        Each poll only:
+        - searches UIDs above the last examined UID (UID SEARCH UID n:*)
+        - fetches Message-ID headers for those new UIDs, stopping early once
+          enough unprocessed emails are known
+        - refreshes flags of known unprocessed UIDs if the folder's
+          HIGHESTMODSEQ moved (only changed messages with CONDSTORE)
+
+        A full rescan happens only on the first sync of a folder or when
+        its UIDVALIDITY changes. Must be called right after SELECT.
+
+        Args:
+            folder: Selected folder name
+            unread_only: Only return emails without the \\Seen flag
+            limit: Maximum number of UIDs to return
+
+        Returns:
+            Unprocessed UIDs (oldest first), or None if the server does not
+            report UIDVALIDITY and the caller must fall back to a full search
+        """
+        uidvalidity = self._select_response_int("UIDVALIDITY")
+        if uidvalidity is None:
+            return None
+        uidnext = self._select_response_int("UIDNEXT")
+        modseq = self._select_response_int("HIGHESTMODSEQ") if self._condstore_enabled else None
+
+        try:
+            store = get_sync_state_store()
+            tracker = get_processed_tracker()
+
+            state = store.get_state(self.account_id, folder)
+            if state is None or state.uidvalidity != uidvalidity:
+                logger.info(
+                    "Full IMAP resync",
+                    extra={
+                        "folder": folder,
+                        "uidvalidity": uidvalidity,
+                        "previous_uidvalidity": state.uidvalidity if state else None,
+                    },
+                )
+                state = store.reset_folder(self.account_id, folder, uidvalidity)
+
+            pending = store.get_pending(self.account_id, folder)
+
+            # Forget pending emails processed since the last poll
+            if pending:
+                unprocessed = set(
+                    tracker.get_unprocessed_message_ids(
+                        [p.message_id for p in pending.values()], self.account_id
+                    )
+                )
+                done = [uid for uid, p in pending.items() if p.message_id not in unprocessed]
+                store.remove_pending(self.account_id, folder, done)
+                for uid in done:
+                    del pending[uid]
+
+            # Refresh flags only if something changed in the folder
+            if pending and (modseq is None or modseq != state.highest_modseq):
+                changed_since = state.highest_modseq if modseq and state.highest_modseq else None
+                seen_by_uid = self._fetch_uid_flags(sorted(pending), changed_since)
+                if seen_by_uid is not None:
+                    if changed_since is None:
+                        # Full flag fetch: absent UIDs were expunged
+                        gone = [uid for uid in pending if uid not in seen_by_uid]
+                        store.remove_pending(self.account_id, folder, gone)
+                        for uid in gone:
+                            del pending[uid]
+                    changed = {
+                        uid: seen
+                        for uid, seen in seen_by_uid.items()
+                        if uid in pending and pending[uid].seen != seen
+                    }
+                    store.update_seen(self.account_id, folder, changed)
+                    for uid, seen in changed.items():
+                        pending[uid].seen = seen
+
+            def eligible() -> list[int]:
+                return [uid for uid in sorted(pending) if not (unread_only and pending[uid].seen)]
+
+            # Examine UIDs added since the last poll
+            new_uids: list[int] = []
+            has_new = uidnext is None or uidnext - 1 > state.last_uid
+            if has_new and not (limit and len(eligible()) >= limit):
+                conn = self._require_connection()
+                status, data = conn.uid("SEARCH", f"UID {state.last_uid + 1}:*")
+                if status == "OK" and data and data[0]:
+                    # "n:*" always matches the highest UID, even below n
+                    new_uids = sorted(u for u in map(int, data[0].split()) if u > state.last_uid)
+
+            checked = 0
+            for batch_start in range(0, len(new_uids), SYNC_HEADER_BATCH_SIZE):
+                batch = new_uids[batch_start : batch_start + SYNC_HEADER_BATCH_SIZE]
+                headers = self._fetch_uid_headers(batch)
+                if headers is None:
+                    break
+
+                unprocessed = set(
+                    tracker.get_unprocessed_message_ids(
+                        [p.message_id for p in headers.values()], self.account_id
+                    )
+                )
+                added = [p for p in headers.values() if p.message_id in unprocessed]
+                store.add_pending(self.account_id, folder, added)
+                pending.update((p.uid, p) for p in added)
+
+                state.last_uid = batch[-1]
+                checked += len(batch)
+                if limit and len(eligible()) >= limit:
+                    break
+
+            if modseq is not None:
+                state.highest_modseq = modseq
+            store.save_state(state)
+
+            result = eligible()
+            if limit:
+                result = result[:limit]
+
+            logger.info(
+                "Incremental IMAP sync",
+                extra={
+                    "folder": folder,
+                    "new_uids": len(new_uids),
+                    "checked": checked,
+                    "pending": len(pending),
+                    "returned": len(result),
+                    "last_uid": state.last_uid,
+                    "highest_modseq": state.highest_modseq,
+                },
+            )
+            return [str(uid).encode() for uid in result]
+
+        except Exception as e:
+            logger.warning(f"Incremental sync failed, falling back to full search: {e}")
+            return None
+
+    def _fetch_synced_emails(
+        self, msg_ids: list[bytes], folder: str
+    ) -> list[tuple[EmailMetadata, EmailContent]]:
+        """
+        Fetch emails found by incremental sync and prune expunged UIDs.
+
+        Args:
+            msg_ids: UIDs returned by _sync_unprocessed_uids
+            folder: Folder name
+
+        Returns:
+            List of (metadata, content) tuples
+        """
+        if not msg_ids:
+            logger.info(f"No emails to fetch from {folder}")
+            return []
+
+        emails = self._fetch_emails_batch(msg_ids, folder)
+
+        # A UID that returned nothing may have been expunged; only forget it
+        # once the server confirms it no longer exists
+        fetched = {metadata.id for metadata, _ in emails}
+        missing = [int(uid) for uid in msg_ids if int(uid) not in fetched]
+        if missing:
+            conn = self._require_connection()
+            status, data = conn.uid("SEARCH", f"UID {compact_uid_set(missing)}")
+            if status == "OK" and data:
+                existing = {int(u) for u in (data[0] or b"").split()}
+                gone = [uid for uid in missing if uid not in existing]
+                get_sync_state_store().remove_pending(self.account_id, folder, gone)
+
+        logger.info(f"Successfully fetched {len(emails)} emails from {folder}")
+        return emails
+
     def _flag_failed_email(self, msg_id: bytes, folder: str, error: str) -> None:
         """
         Flag an email that failed to parse to prevent infinite re-fetch loops.
@@ -853,15 +1195,10 @@ class IMAPClient:
                     msg_uid = None
                     try:
                         # Extract UID from header (format: b'123 (UID 456 BODY[] {size})')
-                        parts = header.split()
-                        for j, part in enumerate(parts):
-                            if part.upper() == b"UID":
-                                msg_uid = parts[j + 1]
-                                break
-
-                        if not msg_uid:
-                            # Fallback to sequence number if UID not found
-                            msg_uid = parts[0]
+                        # ("(UID" is one whitespace token, so match with a regex)
+                        # Falls back to the sequence number if UID is not found
+                        uid_match = re.search(b"UID\\s+(\\d+)", header, re.IGNORECASE)
+                        msg_uid = uid_match.group(1) if uid_match else header.split()[0]
 
                         # Parse the email
                         email_message = email.message_from_bytes(raw_email)
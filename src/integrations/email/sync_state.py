@@ -0,0 +1,345 @@
+"""
+Persistent IMAP folder sync state
+
+Stores, per (account, folder), the UIDVALIDITY seen at the last poll, the
+highest UID already examined and the folder's HIGHESTMODSEQ (CONDSTORE,
+RFC 7162). Together with the set of examined-but-unprocessed UIDs, this
+lets IMAPClient ask the server only for UIDs above last_uid and for flags
+changed since the last poll, instead of searching and header-fetching the
+whole folder every cycle.
+
+A UIDVALIDITY change means the server renumbered the folder: the state is
+reset and the folder is rescanned from UID 1.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from src.monitoring.logger import get_logger
+from src.utils import get_data_dir
+
+logger = get_logger("imap_sync_state")
+
+
+@dataclass
+class FolderSyncState:
+    """
+    Sync position of one IMAP folder
+
+    Attributes:
+        account_id: Account identifier
+        folder: IMAP folder name
+        uidvalidity: UIDVALIDITY of the folder when last_uid was recorded
+        last_uid: Highest UID already examined (0 = nothing examined yet)
+        highest_modseq: HIGHESTMODSEQ at the last poll (0 = unknown / no CONDSTORE)
+    """
+
+    account_id: str
+    folder: str
+    uidvalidity: int
+    last_uid: int = 0
+    highest_modseq: int = 0
+
+
+@dataclass
+class PendingMessage:
+    """
+    Examined message not yet processed
+
+    Attributes:
+        uid: IMAP UID
+        message_id: Message-ID header (tracker key)
+        seen: Whether the message had the \\Seen flag when last checked
+    """
+
+    uid: int
+    message_id: str
+    seen: bool = False
+
+
+class IMAPSyncStateStore:
+    """
+    SQLite store for IMAP folder sync state and pending UIDs.
+
+    Uses thread-local connections, like ProcessedEmailTracker.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/imap_sync_state.db
+        """
+        if db_path is None:
+            data_dir = get_data_dir()
+            data_dir.mkdir(exist_ok=True)
+            db_path = str(data_dir / "imap_sync_state.db")
+
+        self.db_path = db_path
+        self._local = threading.local()
+        self._init_db()
+
+        logger.info("IMAPSyncStateStore initialized", extra={"db_path": db_path})
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            self._local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS imap_sync_state (
+                    account_id TEXT NOT NULL,
+                    folder TEXT NOT NULL,
+                    uidvalidity INTEGER NOT NULL,
+                    last_uid INTEGER NOT NULL DEFAULT 0,
+                    highest_modseq INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (account_id, folder)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS imap_pending (
+                    account_id TEXT NOT NULL,
+                    folder TEXT NOT NULL,
+                    uid INTEGER NOT NULL,
+                    message_id TEXT NOT NULL,
+                    seen INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (account_id, folder, uid)
+                )
+            """)
+
+            logger.debug("Database schema initialized")
+
+    def get_state(self, account_id: str, folder: str) -> Optional[FolderSyncState]:
+        """
+        Load the sync state of a folder.
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+
+        Returns:
+            FolderSyncState, or None if the folder was never synced
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT uidvalidity, last_uid, highest_modseq FROM imap_sync_state
+                WHERE account_id = ? AND folder = ?
+                """,
+                (account_id, folder),
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        return FolderSyncState(
+            account_id=account_id,
+            folder=folder,
+            uidvalidity=row["uidvalidity"],
+            last_uid=row["last_uid"],
+            highest_modseq=row["highest_modseq"],
+        )
+
+    def save_state(self, state: FolderSyncState) -> None:
+        """
+        Persist the sync state of a folder.
+
+        Args:
+            state: State to save
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO imap_sync_state
+                    (account_id, folder, uidvalidity, last_uid, highest_modseq, updated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(account_id, folder) DO UPDATE SET
+                    uidvalidity = excluded.uidvalidity,
+                    last_uid = excluded.last_uid,
+                    highest_modseq = excluded.highest_modseq,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    state.account_id,
+                    state.folder,
+                    state.uidvalidity,
+                    state.last_uid,
+                    state.highest_modseq,
+                ),
+            )
+
+    def reset_folder(self, account_id: str, folder: str, uidvalidity: int) -> FolderSyncState:
+        """
+        Start a folder over (first sync or UIDVALIDITY change).
+
+        Drops the pending UIDs, which are meaningless under a new UIDVALIDITY.
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+            uidvalidity: Current UIDVALIDITY of the folder
+
+        Returns:
+            Fresh FolderSyncState (already saved)
+        """
+        state = FolderSyncState(account_id=account_id, folder=folder, uidvalidity=uidvalidity)
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM imap_pending WHERE account_id = ? AND folder = ?",
+                (account_id, folder),
+            )
+        self.save_state(state)
+        return state
+
+    def get_pending(self, account_id: str, folder: str) -> dict[int, PendingMessage]:
+        """
+        Load examined-but-unprocessed messages of a folder.
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+
+        Returns:
+            Dictionary mapping UID to PendingMessage
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT uid, message_id, seen FROM imap_pending
+                WHERE account_id = ? AND folder = ?
+                ORDER BY uid
+                """,
+                (account_id, folder),
+            )
+            rows = cursor.fetchall()
+
+        return {
+            row["uid"]: PendingMessage(
+                uid=row["uid"], message_id=row["message_id"], seen=bool(row["seen"])
+            )
+            for row in rows
+        }
+
+    def add_pending(self, account_id: str, folder: str, messages: list[PendingMessage]) -> None:
+        """
+        Record examined messages that still need processing.
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+            messages: Messages to record
+        """
+        if not messages:
+            return
+        with self._get_cursor() as cursor:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO imap_pending (account_id, folder, uid, message_id, seen)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(account_id, folder, m.uid, m.message_id, int(m.seen)) for m in messages],
+            )
+
+    def update_seen(self, account_id: str, folder: str, seen_by_uid: dict[int, bool]) -> None:
+        """
+        Update the \\Seen flag of pending messages.
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+            seen_by_uid: UID -> seen
+        """
+        if not seen_by_uid:
+            return
+        with self._get_cursor() as cursor:
+            cursor.executemany(
+                """
+                UPDATE imap_pending SET seen = ?
+                WHERE account_id = ? AND folder = ? AND uid = ?
+                """,
+                [(int(seen), account_id, folder, uid) for uid, seen in seen_by_uid.items()],
+            )
+
+    def remove_pending(self, account_id: str, folder: str, uids: list[int]) -> None:
+        """
+        Forget pending messages (processed or expunged).
+
+        Args:
+            account_id: Account identifier
+            folder: IMAP folder name
+            uids: UIDs to remove
+        """
+        if not uids:
+            return
+        with self._get_cursor() as cursor:
+            cursor.executemany(
+                "DELETE FROM imap_pending WHERE account_id = ? AND folder = ? AND uid = ?",
+                [(account_id, folder, uid) for uid in uids],
+            )
+
+    def clear(self, account_id: Optional[str] = None) -> None:
+        """
+        Delete sync state, forcing a full resync on the next poll.
+
+        Args:
+            account_id: Only clear this account (None = all accounts)
+        """
+        with self._get_cursor() as cursor:
+            for table in ("imap_sync_state", "imap_pending"):
+                if account_id is None:
+                    cursor.execute(f"DELETE FROM {table}")  # noqa: S608 - fixed table names
+                else:
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE account_id = ?",  # noqa: S608
+                        (account_id,),
+                    )
+
+        logger.info("IMAP sync state cleared", extra={"account_id": account_id})
+
+    def close(self) -> None:
+        """Close thread-local connection."""
+        if hasattr(self._local, "conn") and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+# Singleton instance
+_store: Optional[IMAPSyncStateStore] = None
+_lock = threading.Lock()
+
+
+def get_sync_state_store() -> IMAPSyncStateStore:
+    """Get the singleton IMAPSyncStateStore instance."""
+    global _store
+
+    if _store is None:
+        with _lock:
+            if _store is None:
+                _store = IMAPSyncStateStore()
+
+    return _store
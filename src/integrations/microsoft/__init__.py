@@ -30,7 +30,12 @@ from src.integrations.microsoft.calendar_models import (
     CalendarResponseStatus,
 )
 from src.integrations.microsoft.calendar_normalizer import CalendarNormalizer
-from src.integrations.microsoft.graph_client import GraphAPIError, GraphClient
+from src.integrations.microsoft.graph_client import (
+    BatchResult,
+    DeltaResult,
+    GraphAPIError,
+    GraphClient,
+)
 from src.integrations.microsoft.models import (
     TeamsChat,
     TeamsChatType,
@@ -48,6 +53,8 @@ __all__ = [
     # Graph
     "GraphClient",
     "GraphAPIError",
+    "DeltaResult",
+    "BatchResult",
     # Teams Models
     "TeamsMessage",
     "TeamsChat",
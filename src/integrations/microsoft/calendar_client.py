@@ -3,18 +3,51 @@ Microsoft Calendar Client
 
 High-level client for Calendar operations using Microsoft Graph API.
 Provides methods for fetching, creating, and managing calendar events.
+
+With a GraphSyncStore, the default calendar is mirrored locally: a
+calendarView delta query over a fixed window pulls only the changes, and
+reads inside that window are answered from the mirror.
 """
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from src.integrations.microsoft.calendar_models import CalendarEvent
 from src.integrations.microsoft.graph_client import GraphClient
+from src.integrations.storage.graph_sync_store import GraphSyncStore, MirrorChanges
 from src.monitoring.logger import get_logger
 
 logger = get_logger("integrations.microsoft.calendar_client")
 
+# Mirrored resource name and delta state key prefix
+MIRROR_RESOURCE = "calendarView"
+DELTA_STATE_PREFIX = "/me/calendarView?"
+
+# Mirrored window, anchored on the first day of the current month so the
+# delta link stays valid for the whole month
+MIRROR_DAYS_BEHIND = 31
+MIRROR_DAYS_AHEAD = 92
+
+# Reads within this delay of the last sync do not query Graph
+MIN_SYNC_INTERVAL_SECONDS = 60.0
+
+
+def _parse_graph_datetime(value: Optional[dict[str, Any]]) -> Optional[datetime]:
+    """Parse a Graph dateTimeTimeZone (as CalendarEvent.from_api does)"""
+    date_str = (value or {}).get("dateTime", "")
+    if not date_str:
+        return None
+    if "Z" in date_str or "+" in date_str:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    return datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
+
+
+def event_times(data: dict[str, Any]) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Start and end of a Graph event (mirror time key)"""
+    return _parse_graph_datetime(data.get("start")), _parse_graph_datetime(data.get("end"))
+
 
 @dataclass
 class CalendarClient:
@@ -42,9 +75,147 @@ class CalendarClient:
             start=now + timedelta(hours=1),
             end=now + timedelta(hours=2),
         )
+
+    With sync_store set, get_events/get_calendar_view/get_event read the
+    local mirror (synced at most every min_sync_interval_seconds), and
+    created, updated or deleted events are written through to it.
     """
 
     graph: GraphClient
+    sync_store: Optional[GraphSyncStore] = None
+    mirror_days_behind: int = MIRROR_DAYS_BEHIND
+    mirror_days_ahead: int = MIRROR_DAYS_AHEAD
+    min_sync_interval_seconds: float = MIN_SYNC_INTERVAL_SECONDS
+
+    _last_sync: Optional[float] = field(default=None, init=False, repr=False)
+
+    def mirror_window(self, now: Optional[datetime] = None) -> tuple[datetime, datetime]:
+        """
+        Time range covered by the local mirror
+
+        Args:
+            now: Reference time (default: current time)
+
+        Returns:
+            (start, end) of the mirrored window
+        """
+        now = now or datetime.now(timezone.utc)
+        anchor = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return (
+            anchor - timedelta(days=self.mirror_days_behind),
+            anchor + timedelta(days=self.mirror_days_ahead),
+        )
+
+    def _delta_state_key(self) -> str:
+        """Key of the delta link of the current window"""
+        start, end = self.mirror_window()
+        return f"{DELTA_STATE_PREFIX}{start:%Y-%m-%d}/{end:%Y-%m-%d}"
+
+    def _mirror_covers(
+        self, start: datetime, end: datetime, calendar_id: Optional[str] = None
+    ) -> bool:
+        """Whether a read of the default calendar can be answered by the mirror"""
+        if self.sync_store is None or calendar_id:
+            return False
+        window_start, window_end = self.mirror_window()
+        # Naive datetimes are UTC, as in the sync store
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        return window_start <= start and end <= window_end
+
+    async def sync(self, force: bool = False) -> MirrorChanges:
+        """
+        Pull calendar changes into the local mirror
+
+        Uses a calendarView delta query over the mirrored window: after the
+        first enumeration (and across restarts), only changed and deleted
+        events are transferred. A new window (new month) starts a new
+        enumeration; events outside it are tombstoned.
+
+        Args:
+            force: Sync even if the last sync is recent
+
+        Returns:
+            MirrorChanges (empty if no store or skipped)
+        """
+        if self.sync_store is None:
+            return MirrorChanges()
+        if (
+            not force
+            and self._last_sync is not None
+            and time.monotonic() - self._last_sync < self.min_sync_interval_seconds
+        ):
+            return MirrorChanges()
+
+        account_id = self.graph.account_id
+        start, end = self.mirror_window()
+        state_key = self._delta_state_key()
+
+        result = await self.graph.get_delta_changes(
+            "/me/calendarView",
+            params={
+                "startDateTime": start.strftime("%Y-%m-%dT%H:%M:%S"),
+                "endDateTime": end.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            state_key=state_key,
+        )
+
+        if result.full_sync:
+            # Delta links of previous windows will not be used again
+            self.sync_store.clear_state(account_id, DELTA_STATE_PREFIX, prefix=True)
+            if result.delta_link:
+                self.sync_store.set_state(account_id, state_key, result.delta_link)
+
+        changes = self.sync_store.apply_changes(
+            account_id,
+            MIRROR_RESOURCE,
+            result.items,
+            time_key=event_times,
+            full=result.full_sync,
+        )
+        self.sync_store.purge_tombstones(account_id, MIRROR_RESOURCE)
+        self._last_sync = time.monotonic()
+
+        logger.info(
+            f"Calendar mirror synced: {len(changes.upserted)} changed, "
+            f"{len(changes.deleted)} deleted"
+            f"{' (full enumeration)' if result.full_sync else ''}"
+        )
+        return changes
+
+    async def _refresh_mirror(self) -> None:
+        """Sync before a mirror read; serve the last synced state if Graph is unreachable"""
+        try:
+            await self.sync()
+        except Exception as e:
+            if self.sync_store is None or not self.sync_store.get_state(
+                self.graph.account_id, self._delta_state_key()
+            ):
+                raise
+            logger.warning(f"Calendar sync failed, reading local mirror: {e}")
+
+    async def _mirrored_events(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Mirrored events overlapping [start, end), sorted by start"""
+        if self.sync_store is None:
+            return []
+        await self._refresh_mirror()
+        data = self.sync_store.list_items(
+            self.graph.account_id, MIRROR_RESOURCE, since=start, until=end
+        )
+        return [CalendarEvent.from_api(e, "primary") for e in data]
+
+    def _write_through(self, items: list[dict[str, Any]]) -> None:
+        """Apply a change made through this client to the mirror"""
+        if self.sync_store is None:
+            return
+        try:
+            self.sync_store.apply_changes(
+                self.graph.account_id, MIRROR_RESOURCE, items, time_key=event_times
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update calendar mirror: {e}")
 
     async def get_calendars(self) -> list[dict[str, Any]]:
         """
@@ -97,6 +268,16 @@ class CalendarClient:
             f"Fetching events from {start_date.isoformat()} to {end_date.isoformat()}"
         )
 
+        if self._mirror_covers(start_date, end_date, calendar_id):
+            events = [
+                e
+                for e in await self._mirrored_events(start_date, end_date)
+                if e.start >= start_date and e.end <= end_date
+                and (include_cancelled or not e.is_cancelled)
+            ][:limit]
+            logger.info(f"Read {len(events)} events from local mirror")
+            return events
+
         # Build endpoint
         endpoint = f"/me/calendars/{calendar_id}/events" if calendar_id else "/me/calendar/events"
 
@@ -162,6 +343,11 @@ class CalendarClient:
             f"Fetching calendar view from {start.isoformat()} to {end.isoformat()}"
         )
 
+        if self._mirror_covers(start, end, calendar_id):
+            events = (await self._mirrored_events(start, end))[:limit]
+            logger.info(f"Read {len(events)} events from local mirror")
+            return events
+
         # Build endpoint
         if calendar_id:
             endpoint = f"/me/calendars/{calendar_id}/calendarView"
@@ -245,6 +431,13 @@ class CalendarClient:
         """
         logger.debug(f"Fetching event {event_id}")
 
+        if self.sync_store is not None:
+            mirrored = self.sync_store.get_item(
+                self.graph.account_id, MIRROR_RESOURCE, event_id
+            )
+            if mirrored is not None:
+                return CalendarEvent.from_api(mirrored, "primary")
+
         data = await self.graph.get(f"/me/events/{event_id}")
         return CalendarEvent.from_api(data, "primary")
 
@@ -329,6 +522,8 @@ class CalendarClient:
 
         cal_id = calendar_id or "primary"
         event = CalendarEvent.from_api(data, cal_id)
+        if not calendar_id:
+            self._write_through([data])
 
         logger.info(f"Created event {event.event_id}: {subject}")
         return event
@@ -394,6 +589,7 @@ class CalendarClient:
         # PATCH the event
         data = await self.graph.patch(f"/me/events/{event_id}", json_data=update_data)
         event = CalendarEvent.from_api(data, "primary")
+        self._write_through([data])
 
         logger.info(f"Updated event {event_id}")
         return event
@@ -449,6 +645,7 @@ class CalendarClient:
         logger.info(f"Deleting event {event_id}")
 
         await self.graph.delete(f"/me/events/{event_id}")
+        self._write_through([{"id": event_id, "@removed": {"reason": "deleted"}}])
 
         logger.info(f"Deleted event {event_id}")
         return True
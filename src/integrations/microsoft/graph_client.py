@@ -5,20 +5,36 @@ Provides async HTTP client for Microsoft Graph API with:
 - Automatic authentication
 - Rate limiting and retry logic
 - Pagination support
-- Delta queries for efficient polling
+- Delta queries for efficient polling (delta links persisted per account
+  when a GraphSyncStore is attached)
+- JSON batching: GETs packed into $batch calls of 20, sent concurrently
 """
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import quote, urlencode
 
 import httpx
 
 from src.integrations.microsoft.auth import MicrosoftAuthenticator
 from src.monitoring.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.integrations.storage.graph_sync_store import GraphSyncStore
+
 logger = get_logger("integrations.microsoft.graph_client")
 
+# Error codes telling that a delta link expired and a full resync is needed
+DELTA_RESYNC_ERROR_CODES = frozenset({"syncStateNotFound", "resyncRequired", "SyncStateNotFound"})
+
+# JSON batching: Graph accepts at most 20 requests per $batch call
+MAX_BATCH_REQUESTS = 20
+MAX_CONCURRENT_BATCHES = 4
+
+# Statuses of batched requests that are retried (after their Retry-After)
+BATCH_RETRY_STATUS_CODES = frozenset({429, 503, 504})
+
 
 class GraphAPIError(Exception):
     """Raised when Graph API returns an error"""
@@ -34,6 +50,36 @@ class GraphAPIError(Exception):
         self.error_code = error_code
 
 
+@dataclass
+class DeltaResult:
+    """Changes returned by a delta query"""
+
+    items: list[dict[str, Any]]
+    delta_link: Optional[str]
+    full_sync: bool  # True if items are a full enumeration (no valid delta link)
+
+
+@dataclass
+class BatchResult:
+    """Response to one request of a JSON batch"""
+
+    status_code: int
+    body: dict[str, Any]
+    error: Optional[GraphAPIError] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the request succeeded"""
+        return self.error is None
+
+
+def batch_url(endpoint: str, params: Optional[dict[str, Any]] = None) -> str:
+    """Relative URL of a batched request ("/me/chats?$top=10")"""
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(params, safe='$:,', quote_via=quote)}"
+
+
 @dataclass
 class GraphClient:
     """
@@ -55,8 +101,14 @@ class GraphClient:
         # POST
         await client.post("/me/chats/123/messages", {"body": {"content": "Hello"}})
 
+        # Many GETs in $batch calls
+        results = await client.get_batch({"a": ("/me/chats/1/messages", None)})
+
         # Clean up when done
         await client.close()
+
+    With a sync_store, delta links survive restarts (keyed by account_id
+    and resource), so only changes are fetched after the first sync.
     """
 
     authenticator: MicrosoftAuthenticator
@@ -64,10 +116,21 @@ class GraphClient:
     timeout_seconds: float = 30.0
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
+    max_concurrent_batches: int = MAX_CONCURRENT_BATCHES
+    account_id: str = ""
+    sync_store: Optional["GraphSyncStore"] = None
 
     _delta_links: dict[str, str] = field(default_factory=dict, init=False)
     _client: Optional[httpx.AsyncClient] = field(default=None, init=False)
 
+    def __post_init__(self) -> None:
+        """Default the account ID to the app registration"""
+        if not self.account_id:
+            config = getattr(self.authenticator, "config", None)
+            tenant_id = getattr(config, "tenant_id", "")
+            client_id = getattr(config, "client_id", "")
+            self.account_id = f"{tenant_id}:{client_id}" if client_id else "default"
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client"""
         if self._client is None or self._client.is_closed:
@@ -214,6 +277,133 @@ class GraphClient:
 
         return items
 
+    async def get_next_pages(
+        self,
+        next_link: Optional[str],
+        max_pages: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the remaining pages of a collection from an @odata.nextLink
+
+        Args:
+            next_link: @odata.nextLink of the last page fetched (None: nothing to do)
+            max_pages: Maximum pages to fetch (safety limit)
+
+        Returns:
+            Items of the following pages
+
+        Raises:
+            GraphAPIError: If any request fails
+        """
+        items: list[dict[str, Any]] = []
+        page_count = 0
+        while next_link and page_count < max_pages:
+            page_count += 1
+            data = await self._request_url("GET", next_link)
+            items.extend(data.get("value", []))
+            next_link = data.get("@odata.nextLink")
+
+        if next_link:
+            logger.warning(f"Hit max pages limit ({max_pages}) following {next_link}")
+        return items
+
+    async def get_batch(
+        self,
+        requests: dict[str, tuple[str, Optional[dict[str, Any]]]],
+    ) -> dict[str, BatchResult]:
+        """
+        Make many GET requests through JSON batching
+
+        Requests are packed into $batch calls of MAX_BATCH_REQUESTS, and
+        up to max_concurrent_batches calls are in flight at once. Batched
+        requests throttled by Graph (429/503/504) are sent again after the
+        longest Retry-After of their batch, up to max_retries times.
+
+        Args:
+            requests: Caller key -> (endpoint, query parameters)
+
+        Returns:
+            Caller key -> BatchResult (failed requests carry their error)
+
+        Raises:
+            GraphAPIError: If a $batch call itself fails
+        """
+        keys = list(requests)
+        chunks = [
+            keys[i:i + MAX_BATCH_REQUESTS] for i in range(0, len(keys), MAX_BATCH_REQUESTS)
+        ]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_batches))
+        results: dict[str, BatchResult] = {}
+
+        async def send(chunk: list[str]) -> None:
+            async with semaphore:
+                results.update(await self._send_batch({key: requests[key] for key in chunk}))
+
+        await asyncio.gather(*(send(chunk) for chunk in chunks))
+        logger.debug(f"Batched {len(keys)} requests in {len(chunks)} calls")
+        return results
+
+    async def _send_batch(
+        self,
+        requests: dict[str, tuple[str, Optional[dict[str, Any]]]],
+    ) -> dict[str, BatchResult]:
+        """Send one $batch call, retrying the throttled requests it contains"""
+        # Batch IDs are positions: caller keys may contain any character
+        keys = dict(enumerate(requests, start=1))
+        pending = {
+            str(position): {
+                "id": str(position),
+                "method": "GET",
+                "url": batch_url(*requests[key]),
+            }
+            for position, key in keys.items()
+        }
+        results: dict[str, BatchResult] = {}
+
+        for attempt in range(self.max_retries):
+            data = await self._request("POST", "/$batch", json={"requests": list(pending.values())})
+            last_attempt = attempt + 1 == self.max_retries
+            retry_after = 0.0
+
+            for response in data.get("responses", []):
+                batch_id = str(response.get("id"))
+                if batch_id not in pending:
+                    continue
+                status_code = int(response.get("status", 0))
+                headers = {k.lower(): v for k, v in (response.get("headers") or {}).items()}
+                if status_code in BATCH_RETRY_STATUS_CODES and not last_attempt:
+                    retry_after = max(
+                        retry_after,
+                        _retry_after_seconds(headers, self.retry_delay_seconds * (attempt + 1)),
+                    )
+                    continue
+
+                body = response.get("body")
+                body = body if isinstance(body, dict) else {}
+                error = None
+                if status_code >= 400:
+                    error_info = body.get("error", {})
+                    error = GraphAPIError(
+                        message=error_info.get("message", f"HTTP {status_code}"),
+                        status_code=status_code,
+                        error_code=error_info.get("code"),
+                    )
+                results[keys[int(batch_id)]] = BatchResult(status_code, body, error)
+                del pending[batch_id]
+
+            if not pending or last_attempt:
+                break
+            logger.warning(
+                f"{len(pending)} batched requests throttled, retrying in {retry_after:g}s"
+            )
+            await asyncio.sleep(retry_after)
+
+        for batch_id in pending:
+            results[keys[int(batch_id)]] = BatchResult(
+                0, {}, GraphAPIError(f"No batch response after {self.max_retries} attempts")
+            )
+        return results
+
     async def get_delta(
         self,
         resource: str,
@@ -235,36 +425,79 @@ class GraphClient:
         Raises:
             GraphAPIError: If request fails
         """
-        # Check for stored delta link
-        delta_link = self._delta_links.get(resource)
+        result = await self.get_delta_changes(resource, params=params)
+        return result.items, result.delta_link
 
+    async def get_delta_changes(
+        self,
+        resource: str,
+        params: Optional[dict[str, Any]] = None,
+        state_key: Optional[str] = None,
+    ) -> DeltaResult:
+        """
+        Get changes using delta query, resuming from the stored delta link
+
+        The delta link is looked up in memory, then in the sync store, and
+        the new one is written to both. An expired link (410 Gone) is
+        dropped and the resource is enumerated again.
+
+        Args:
+            resource: Resource path (e.g., "/me/calendarView")
+            params: Query parameters of the initial request
+            state_key: Key the delta link is stored under (default: resource),
+                e.g. to tell apart calendar views of different windows
+
+        Returns:
+            DeltaResult (full_sync is True when the items are a full enumeration)
+
+        Raises:
+            GraphAPIError: If request fails
+        """
+        key = state_key or resource
+        delta_link = self._delta_links.get(key)
+        if delta_link is None and self.sync_store is not None:
+            delta_link = self.sync_store.get_state(self.account_id, key)
+
+        data: Optional[dict[str, Any]] = None
         if delta_link:
-            # Use stored delta link
-            data = await self._request_url("GET", delta_link)
-        else:
+            try:
+                data = await self._request_url("GET", delta_link)
+            except GraphAPIError as e:
+                if e.status_code != 410 and e.error_code not in DELTA_RESYNC_ERROR_CODES:
+                    raise
+                logger.warning(f"Delta link expired for {key}, resyncing", extra={"error": str(e)})
+                self._forget_delta_link(key)
+
+        full_sync = data is None
+        if data is None:
             # Initial request with /delta
-            endpoint = f"{resource}/delta"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._request("GET", f"{resource}/delta", params=params)
 
         # Get items
-        items = data.get("value", [])
+        items = list(data.get("value", []))
 
-        # Handle pagination for delta
+        # Handle pagination for delta (the deltaLink is in the last page)
+        new_delta_link = data.get("@odata.deltaLink")
         next_link = data.get("@odata.nextLink")
         while next_link:
             next_data = await self._request_url("GET", next_link)
             items.extend(next_data.get("value", []))
             next_link = next_data.get("@odata.nextLink")
-            # deltaLink is in the last page
-            if "@odata.deltaLink" in next_data:
-                data["@odata.deltaLink"] = next_data["@odata.deltaLink"]
+            new_delta_link = next_data.get("@odata.deltaLink", new_delta_link)
 
         # Store new delta link for next call
-        new_delta_link = data.get("@odata.deltaLink")
         if new_delta_link:
-            self._delta_links[resource] = new_delta_link
+            self._delta_links[key] = new_delta_link
+            if self.sync_store is not None:
+                self.sync_store.set_state(self.account_id, key, new_delta_link)
+
+        return DeltaResult(items=items, delta_link=new_delta_link, full_sync=full_sync)
 
-        return items, new_delta_link
+    def _forget_delta_link(self, key: str) -> None:
+        """Drop a delta link (memory and sync store)"""
+        self._delta_links.pop(key, None)
+        if self.sync_store is not None:
+            self.sync_store.clear_state(self.account_id, key)
 
     async def _request(
         self,
@@ -341,3 +574,11 @@ class GraphClient:
 
         # All retries exhausted
         raise GraphAPIError(f"Request failed after {self.max_retries} attempts: {last_error}")
+
+
+def _retry_after_seconds(headers: dict[str, Any], default: float) -> float:
+    """Retry-After header of a batched response, in seconds"""
+    try:
+        return max(0.0, float(headers["retry-after"]))
+    except (KeyError, TypeError, ValueError):
+        return default
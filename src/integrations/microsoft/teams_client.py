@@ -7,18 +7,90 @@ Provides methods for:
 - Listing chats and messages
 - Sending messages
 - Marking messages as read
+
+With a GraphSyncStore, chats and messages are mirrored locally. Graph has
+no delegated delta query for chat messages, so each chat keeps a
+lastModifiedDateTime watermark: only chats updated since the last sync are
+queried, and only for messages modified since the watermark.
+
+Per-chat message requests are sent through Graph JSON batching
+(GraphClient.get_batch), so refreshing many chats costs a few concurrent
+$batch calls rather than one round-trip per chat.
 """
 
-from dataclasses import dataclass
+import json
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from src.integrations.microsoft.graph_client import GraphClient
 from src.integrations.microsoft.models import TeamsChat, TeamsMessage
+from src.integrations.storage.graph_sync_store import GraphSyncStore, MirrorChanges
 from src.monitoring.logger import get_logger
 
 logger = get_logger("integrations.microsoft.teams_client")
 
+# Mirrored resource names
+MIRROR_CHATS = "chats"
+MIRROR_MESSAGES = "chatMessages"
+
+# Messages fetched the first time a chat is synced
+INITIAL_MESSAGES_PER_CHAT = 50
+
+# Messages kept in the mirror per chat (older ones are deleted)
+MESSAGES_KEPT_PER_CHAT = 500
+
+# Page size and page limit of incremental message syncs
+SYNC_PAGE_SIZE = 50
+SYNC_MAX_PAGES = 20
+
+# Reads within this delay of the last sync do not query Graph
+MIN_SYNC_INTERVAL_SECONDS = 60.0
+
+
+def _parse_graph_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Graph ISO timestamp ("2025-01-15T10:00:00.123Z")"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _latest(*values: Optional[str]) -> Optional[str]:
+    """Latest of several Graph timestamps (as given)"""
+    dated = [(parsed, v) for v in values if (parsed := _parse_graph_timestamp(v))]
+    return max(dated)[1] if dated else None
+
+
+def _messages_params(limit: int, since: Optional[datetime]) -> dict[str, str]:
+    """Query parameters of a chat messages request (newest first)"""
+    params: dict[str, str] = {
+        "$top": str(limit),
+        "$orderby": "createdDateTime desc",
+    }
+
+    if since:
+        # Use OData filter for datetime
+        since_str = since.isoformat()
+        params["$filter"] = f"createdDateTime gt {since_str}"
+
+    return params
+
+
+def chat_times(data: dict[str, Any]) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Last activity of a Graph chat (mirror time key)"""
+    return _parse_graph_timestamp(
+        data.get("lastUpdatedDateTime") or data.get("createdDateTime")
+    ), None
+
+
+def message_times(data: dict[str, Any]) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Creation time of a Graph chat message (mirror time key)"""
+    return _parse_graph_timestamp(data.get("createdDateTime")), None
+
 
 @dataclass
 class TeamsClient:
@@ -34,9 +106,187 @@ class TeamsClient:
 
         chats = await client.get_chats()
         messages = await client.get_messages(chats[0].chat_id)
+
+    With sync_store set, get_chats/get_messages/get_recent_messages read the
+    local mirror (synced at most every min_sync_interval_seconds).
     """
 
     graph: GraphClient
+    sync_store: Optional[GraphSyncStore] = None
+    initial_messages_per_chat: int = INITIAL_MESSAGES_PER_CHAT
+    messages_kept_per_chat: int = MESSAGES_KEPT_PER_CHAT
+    min_sync_interval_seconds: float = MIN_SYNC_INTERVAL_SECONDS
+
+    _last_sync: Optional[float] = field(default=None, init=False, repr=False)
+
+    async def sync(self, force: bool = False) -> MirrorChanges:
+        """
+        Pull chat and message changes into the local mirror
+
+        Lists chats (one paged request), then fetches messages only for
+        chats whose lastUpdatedDateTime moved since their last sync.
+        Deleted messages (deletedDateTime set) become tombstones. Each chat
+        keeps its newest messages_kept_per_chat messages; expired
+        tombstones are purged.
+
+        Args:
+            force: Sync even if the last sync is recent
+
+        Returns:
+            MirrorChanges of chats and messages (empty if no store or skipped)
+        """
+        changes = MirrorChanges()
+        if self.sync_store is None:
+            return changes
+        if (
+            not force
+            and self._last_sync is not None
+            and time.monotonic() - self._last_sync < self.min_sync_interval_seconds
+        ):
+            return changes
+
+        chats_data = await self.graph.get_all_pages("/me/chats")
+        changes.extend(
+            self.sync_store.apply_changes(
+                self.graph.account_id, MIRROR_CHATS, chats_data, time_key=chat_times, full=True
+            )
+        )
+
+        plans = {
+            chat_data["id"]: plan
+            for chat_data in chats_data
+            if chat_data.get("id") and (plan := self._plan_chat_sync(chat_data)) is not None
+        }
+        results = await self.graph.get_batch(
+            {
+                chat_id: (f"/me/chats/{chat_id}/messages", plan["params"])
+                for chat_id, plan in plans.items()
+            }
+        )
+
+        synced_chats = 0
+        for chat_id, result in results.items():
+            try:
+                if result.error is not None:
+                    raise result.error
+                changes.extend(await self._apply_chat_messages(plans[chat_id], result.body))
+                synced_chats += 1
+            except Exception as e:
+                logger.warning(f"Failed to sync messages of chat {chat_id}: {e}")
+
+        for resource in (MIRROR_CHATS, MIRROR_MESSAGES):
+            self.sync_store.purge_tombstones(self.graph.account_id, resource)
+
+        self._last_sync = time.monotonic()
+        logger.info(
+            f"Teams mirror synced: {synced_chats}/{len(chats_data)} chats queried, "
+            f"{len(changes.upserted)} changed, {len(changes.deleted)} deleted"
+        )
+        return changes
+
+    def _plan_chat_sync(self, chat_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Decide how to sync the messages of one chat
+
+        Returns:
+            Sync plan (chat, state key, watermark, query parameters),
+            or None if the chat did not change since its last sync
+        """
+        if self.sync_store is None:
+            return None
+
+        chat_id = chat_data["id"]
+        state_key = f"/me/chats/{chat_id}/messages"
+        state = json.loads(self.sync_store.get_state(self.graph.account_id, state_key) or "{}")
+        watermark = state.get("messages")
+        chat_updated = chat_data.get("lastUpdatedDateTime")
+
+        if state and chat_updated and chat_updated == state.get("chat"):
+            return None
+
+        params: dict[str, str] = {"$orderby": "lastModifiedDateTime desc"}
+        if watermark:
+            params["$top"] = str(SYNC_PAGE_SIZE)
+            params["$filter"] = f"lastModifiedDateTime gt {watermark}"
+        else:
+            # First sync of this chat: latest messages only
+            params["$top"] = str(self.initial_messages_per_chat)
+
+        return {
+            "chat_id": chat_id,
+            "chat_updated": chat_updated,
+            "state_key": state_key,
+            "watermark": watermark,
+            "params": params,
+        }
+
+    async def _apply_chat_messages(
+        self, plan: dict[str, Any], first_page: dict[str, Any]
+    ) -> MirrorChanges:
+        """
+        Store the messages fetched for one chat and move its watermark
+
+        Incremental syncs follow @odata.nextLink; a first sync keeps only
+        the first page.
+        """
+        assert self.sync_store is not None
+        account_id = self.graph.account_id
+        messages = list(first_page.get("value", []))
+        if plan["watermark"]:
+            messages.extend(
+                await self.graph.get_next_pages(
+                    first_page.get("@odata.nextLink"), max_pages=SYNC_MAX_PAGES - 1
+                )
+            )
+
+        changes = self.sync_store.apply_changes(
+            account_id,
+            MIRROR_MESSAGES,
+            messages,
+            time_key=message_times,
+            container_id=plan["chat_id"],
+        )
+        if changes.upserted:
+            self.sync_store.trim_container(
+                account_id, MIRROR_MESSAGES, plan["chat_id"], keep=self.messages_kept_per_chat
+            )
+
+        latest = _latest(
+            plan["watermark"],
+            *(m.get("lastModifiedDateTime") or m.get("createdDateTime") for m in messages),
+        )
+        self.sync_store.set_state(
+            account_id,
+            plan["state_key"],
+            json.dumps({"messages": latest, "chat": plan["chat_updated"]}),
+        )
+        return changes
+
+    async def _refresh_mirror(self) -> None:
+        """Sync before a mirror read; serve the last synced state if Graph is unreachable"""
+        try:
+            await self.sync()
+        except Exception as e:
+            if self.sync_store is None or not self.sync_store.list_items(
+                self.graph.account_id, MIRROR_CHATS, limit=1
+            ):
+                raise
+            logger.warning(f"Teams sync failed, reading local mirror: {e}")
+
+    def _write_through(self, data: dict[str, Any], chat_id: str) -> None:
+        """Add a message sent through this client to the mirror"""
+        if self.sync_store is None:
+            return
+        try:
+            self.sync_store.apply_changes(
+                self.graph.account_id,
+                MIRROR_MESSAGES,
+                [data],
+                time_key=message_times,
+                container_id=chat_id,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update Teams mirror: {e}")
 
     async def get_chats(self) -> list[TeamsChat]:
         """
@@ -47,7 +297,13 @@ class TeamsClient:
         """
         logger.debug("Fetching chats")
 
-        data = await self.graph.get_all_pages("/me/chats")
+        if self.sync_store is not None:
+            await self._refresh_mirror()
+            data = self.sync_store.list_items(
+                self.graph.account_id, MIRROR_CHATS, newest_first=True
+            )
+        else:
+            data = await self.graph.get_all_pages("/me/chats")
         chats = [TeamsChat.from_api(chat_data) for chat_data in data]
 
         logger.info(f"Found {len(chats)} chats")
@@ -87,17 +343,21 @@ class TeamsClient:
         """
         logger.debug(f"Fetching messages from chat {chat_id}")
 
-        params: dict[str, str] = {
-            "$top": str(limit),
-            "$orderby": "createdDateTime desc",
-        }
-
-        if since:
-            # Use OData filter for datetime
-            since_str = since.isoformat()
-            params["$filter"] = f"createdDateTime gt {since_str}"
+        if self.sync_store is not None:
+            await self._refresh_mirror()
+            mirrored = self.sync_store.list_items(
+                self.graph.account_id,
+                MIRROR_MESSAGES,
+                since=since,
+                container_id=chat_id,
+                limit=limit,
+                newest_first=True,
+            )
+            return [TeamsMessage.from_api(m, chat_id) for m in mirrored]
 
-        data = await self.graph.get(f"/me/chats/{chat_id}/messages", params=params)
+        data = await self.graph.get(
+            f"/me/chats/{chat_id}/messages", params=_messages_params(limit, since)
+        )
 
         messages = [
             TeamsMessage.from_api(msg_data, chat_id)
@@ -151,31 +411,23 @@ class TeamsClient:
 
         all_messages: list[TeamsMessage] = []
         chats = await self.get_chats()
+        messages_by_chat = await self._get_messages_of_chats(chats, limit_per_chat, since)
 
         for chat in chats:
-            try:
-                messages = await self.get_messages(
-                    chat.chat_id,
-                    limit=limit_per_chat,
-                    since=since,
-                )
-
-                # Attach chat context if requested
-                if include_chat_context:
-                    messages = [msg.with_chat(chat) for msg in messages]
+            messages = messages_by_chat.get(chat.chat_id, [])
 
-                # Filter by mentions if requested
-                if mentions_only and current_user_id:
-                    messages = [
-                        msg for msg in messages
-                        if current_user_id in msg.mentions
-                    ]
+            # Attach chat context if requested
+            if include_chat_context:
+                messages = [msg.with_chat(chat) for msg in messages]
 
-                all_messages.extend(messages)
+            # Filter by mentions if requested
+            if mentions_only and current_user_id:
+                messages = [
+                    msg for msg in messages
+                    if current_user_id in msg.mentions
+                ]
 
-            except Exception as e:
-                logger.warning(f"Failed to fetch messages from chat {chat.chat_id}: {e}")
-                continue
+            all_messages.extend(messages)
 
         # Sort all messages by date (newest first)
         all_messages.sort(key=lambda m: m.created_at, reverse=True)
@@ -184,6 +436,41 @@ class TeamsClient:
         logger.info(f"Found {len(all_messages)} messages across {len(chats)} chats{filter_info}")
         return all_messages
 
+    async def _get_messages_of_chats(
+        self,
+        chats: list[TeamsChat],
+        limit: int,
+        since: Optional[datetime],
+    ) -> dict[str, list[TeamsMessage]]:
+        """
+        Get the latest messages of many chats
+
+        Reads the mirror when there is one; otherwise the per-chat requests
+        go out in concurrent $batch calls instead of one round-trip each.
+        Chats whose request failed are logged and left out.
+        """
+        if self.sync_store is not None:
+            return {
+                chat.chat_id: await self.get_messages(chat.chat_id, limit=limit, since=since)
+                for chat in chats
+            }
+
+        params = _messages_params(limit, since)
+        results = await self.graph.get_batch(
+            {chat.chat_id: (f"/me/chats/{chat.chat_id}/messages", params) for chat in chats}
+        )
+
+        messages_by_chat: dict[str, list[TeamsMessage]] = {}
+        for chat_id, result in results.items():
+            if result.error is not None:
+                logger.warning(f"Failed to fetch messages from chat {chat_id}: {result.error}")
+                continue
+            messages_by_chat[chat_id] = [
+                TeamsMessage.from_api(msg_data, chat_id)
+                for msg_data in result.body.get("value", [])
+            ]
+        return messages_by_chat
+
     async def send_message(
         self,
         chat_id: str,
@@ -212,6 +499,7 @@ class TeamsClient:
         )
 
         message = TeamsMessage.from_api(data, chat_id)
+        self._write_through(data, chat_id)
         logger.debug(f"Sent message {message.message_id}")
         return message
 
@@ -259,6 +547,13 @@ class TeamsClient:
         """
         logger.debug(f"Fetching message {message_id} from chat {chat_id}")
 
+        if self.sync_store is not None:
+            mirrored = self.sync_store.get_item(
+                self.graph.account_id, MIRROR_MESSAGES, message_id, container_id=chat_id
+            )
+            if mirrored is not None:
+                return TeamsMessage.from_api(mirrored, chat_id)
+
         data = await self.graph.get(f"/me/chats/{chat_id}/messages/{message_id}")
         return TeamsMessage.from_api(data, chat_id)
 
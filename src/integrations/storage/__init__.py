@@ -11,6 +11,12 @@ from src.integrations.storage.action_history import (
     ActionType,
     get_action_history,
 )
+from src.integrations.storage.archive_index import (
+    ArchiveHit,
+    ArchiveIndex,
+    ArchiveItem,
+    get_archive_index,
+)
 from src.integrations.storage.draft_storage import (
     DraftReply,
     DraftStatus,
@@ -18,6 +24,11 @@ from src.integrations.storage.draft_storage import (
     ReplyFormat,
     get_draft_storage,
 )
+from src.integrations.storage.graph_sync_store import (
+    GraphSyncStore,
+    MirrorChanges,
+    get_graph_sync_store,
+)
 from src.integrations.storage.queue_storage import QueueStorage, get_queue_storage
 from src.integrations.storage.snooze_storage import (
     SnoozeReason,
@@ -33,6 +44,15 @@ __all__ = [
     # Queue Storage
     "QueueStorage",
     "get_queue_storage",
+    # Archive Index
+    "ArchiveIndex",
+    "ArchiveItem",
+    "ArchiveHit",
+    "get_archive_index",
+    # Graph Sync Store
+    "GraphSyncStore",
+    "MirrorChanges",
+    "get_graph_sync_store",
     # Action History
     "ActionHistoryStorage",
     "ActionRecord",
@@ -0,0 +1,610 @@
+"""
+Archive Index
+
+Local full-text index of the emails, Teams messages and calendar events that
+pass through Trivelin, so global and cross-source search work offline and
+without querying IMAP or Microsoft Graph for every keystroke.
+
+Items are fed incrementally (one upsert per item as it is processed) into a
+SQLite FTS5 table:
+
+- Ranking uses BM25 with the title weighted above the sender and the body.
+- Tokens are accent-folded ("reunion" matches "Réunion").
+- Queries are filtered by source, account and date in SQL.
+- Each hit carries a snippet with the matched terms highlighted.
+
+Usage:
+    index = get_archive_index()
+    index.add_event(perceived_event, account_id="work")
+    hits = index.search("budget alpha", sources=["email"], limit=10)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from src.integrations.storage.queue_index import normalize_message_id
+from src.monitoring.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.core.events.universal_event import PerceivedEvent
+    from src.core.schemas import EmailContent, EmailMetadata
+
+logger = get_logger("archive_index")
+
+# Default database location (next to the queue and the other local stores)
+DEFAULT_ARCHIVE_INDEX_PATH = Path("data/archive_index.db")
+
+# Body text kept per item (enough for snippets and ranking)
+MAX_BODY_CHARS = 20_000
+
+# Snippet markers and size (in tokens)
+HIGHLIGHT_START = "**"
+HIGHLIGHT_END = "**"
+SNIPPET_TOKENS = 16
+
+# BM25 column weights: title, sender, body
+BM25_WEIGHTS = (5.0, 2.0, 1.0)
+
+# Query terms beyond this are ignored
+MAX_QUERY_TERMS = 16
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class ArchiveItem:
+    """An item to index"""
+
+    source: str  # "email", "teams" or "calendar"
+    item_id: str  # Unique within its source
+    title: str
+    body: str
+    timestamp: datetime
+    account_id: Optional[str] = None
+    sender: str = ""
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ArchiveHit:
+    """A search result"""
+
+    source: str
+    item_id: str
+    title: str
+    snippet: str  # Matched terms wrapped in HIGHLIGHT_START/HIGHLIGHT_END
+    score: float  # 0-1, higher is better
+    timestamp: datetime
+    account_id: Optional[str]
+    sender: str
+    metadata: dict[str, Any]
+
+
+def _timestamp(value: datetime) -> float:
+    """POSIX timestamp (naive datetimes are taken as UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ISO datetime string (None if invalid)"""
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def build_match_query(query: str, any_term: bool = False) -> str:
+    """
+    Translate user input into an FTS5 MATCH expression
+
+    Each whitespace-separated chunk becomes a quoted phrase of its word
+    tokens (so "marc@acme.fr" matches the address, not any of its parts
+    anywhere), the last one as a prefix to support search-as-you-type.
+    Only word characters reach FTS5, so user input cannot inject syntax.
+
+    Args:
+        query: Raw user query
+        any_term: Combine phrases with OR instead of AND
+
+    Returns:
+        MATCH expression ("" if the query has no searchable term)
+    """
+    phrases = []
+    for chunk in query.split():
+        tokens = _WORD_RE.findall(chunk)
+        if tokens:
+            phrases.append(" ".join(tokens))
+    phrases = phrases[:MAX_QUERY_TERMS]
+    if not phrases:
+        return ""
+
+    parts = [f'"{phrase}"' for phrase in phrases]
+    parts[-1] += "*"
+    return (" OR " if any_term else " AND ").join(parts)
+
+
+def item_from_event(event: "PerceivedEvent", account_id: Optional[str] = None) -> ArchiveItem:
+    """
+    Build an archive item from a normalized event
+
+    Calendar events are dated by their start, other events by occurred_at.
+
+    Args:
+        event: PerceivedEvent (email, Teams or calendar)
+        account_id: Account the event came from
+
+    Returns:
+        ArchiveItem
+    """
+    source = event.source.value
+    metadata = dict(event.metadata)
+    timestamp = event.occurred_at
+    if source == "calendar":
+        timestamp = _parse_datetime(metadata.get("start")) or timestamp
+
+    item_id = event.source_id
+    if source == "email" and metadata.get("message_id"):
+        item_id = normalize_message_id(metadata["message_id"])
+
+    return ArchiveItem(
+        source=source,
+        item_id=item_id,
+        title=event.title,
+        body=event.content,
+        timestamp=timestamp,
+        account_id=account_id,
+        sender=event.from_person,
+        metadata=metadata,
+    )
+
+
+def item_from_email(
+    metadata: "EmailMetadata",
+    content: "EmailContent",
+    account_id: Optional[str] = None,
+    queue_item_id: Optional[str] = None,
+    status: Optional[str] = None,
+) -> ArchiveItem:
+    """
+    Build an archive item from a fetched email
+
+    Emails are keyed by their normalized Message-ID, so the same message
+    seen twice (re-fetch, other folder) is indexed once.
+
+    Args:
+        metadata: Email metadata
+        content: Email content
+        account_id: Account the email came from
+        queue_item_id: Queue item created for the email, if any
+        status: Queue status at indexing time (e.g. "pending", "approved")
+
+    Returns:
+        ArchiveItem
+    """
+    item_id = normalize_message_id(metadata.message_id) or (
+        f"{account_id or 'default'}:{metadata.folder}:{metadata.id}"
+    )
+    sender = f"{metadata.from_name} <{metadata.from_address}>" if metadata.from_name else (
+        metadata.from_address
+    )
+    return ArchiveItem(
+        source="email",
+        item_id=item_id,
+        title=metadata.subject,
+        body=content.plain_text or content.preview or "",
+        timestamp=metadata.date,
+        account_id=account_id,
+        sender=sender,
+        metadata={
+            "message_id": metadata.message_id,
+            "from_address": metadata.from_address,
+            "from_name": metadata.from_name or "",
+            "folder": metadata.folder,
+            "imap_id": metadata.id,
+            "has_attachments": metadata.has_attachments,
+            "queue_item_id": queue_item_id,
+            "status": status,
+        },
+    )
+
+
+def item_from_queue_item(item: dict[str, Any]) -> Optional[ArchiveItem]:
+    """
+    Build an archive item from a queue item (backfill of existing queues)
+
+    Args:
+        item: Queue item dictionary
+
+    Returns:
+        ArchiveItem, or None if the item has no usable metadata
+    """
+    metadata = item.get("metadata") or {}
+    content = item.get("content") or {}
+    if not item.get("id") or not metadata.get("subject"):
+        return None
+
+    from_address = metadata.get("from_address", "")
+    from_name = metadata.get("from_name", "")
+    timestamp = (
+        _parse_datetime(metadata.get("date"))
+        or _parse_datetime(item.get("queued_at"))
+        or datetime.now(timezone.utc)
+    )
+    item_id = normalize_message_id(metadata.get("message_id")) or f"queue:{item['id']}"
+
+    return ArchiveItem(
+        source="email",
+        item_id=item_id,
+        title=metadata["subject"],
+        body=content.get("full_text") or content.get("preview") or "",
+        timestamp=timestamp,
+        account_id=item.get("account_id"),
+        sender=f"{from_name} <{from_address}>" if from_name else from_address,
+        metadata={
+            "message_id": metadata.get("message_id"),
+            "from_address": from_address,
+            "from_name": from_name,
+            "folder": metadata.get("folder"),
+            "imap_id": metadata.get("id"),
+            "has_attachments": metadata.get("has_attachments", False),
+            "queue_item_id": item["id"],
+            "status": item.get("status"),
+        },
+    )
+
+
+class ArchiveIndex:
+    """
+    SQLite FTS5 index of archived items
+
+    Thread-safe: each thread gets its own connection; the database runs in
+    WAL mode so the API and worker processes share it.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_ARCHIVE_INDEX_PATH):
+        """
+        Open (or create) the index
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+        logger.info(
+            "ArchiveIndex initialized",
+            extra={"db_path": str(self.db_path), "items": self.count()},
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            self._local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS archive_items (
+                    rowid INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    item_id TEXT NOT NULL,
+                    account_id TEXT,
+                    timestamp REAL NOT NULL,
+                    metadata TEXT NOT NULL,
+                    indexed_at REAL NOT NULL,
+                    UNIQUE (source, item_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_archive_source_time
+                ON archive_items(source, timestamp)
+            """)
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS archive_fts USING fts5(
+                    title, sender, body,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+
+    def add_items(self, items: list[ArchiveItem]) -> None:
+        """
+        Index (or re-index) items in one transaction
+
+        Args:
+            items: Items to upsert
+        """
+        if not items:
+            return
+
+        now = datetime.now(timezone.utc).timestamp()
+        with self._get_cursor() as cursor:
+            for item in items:
+                cursor.execute(
+                    "SELECT rowid FROM archive_items WHERE source = ? AND item_id = ?",
+                    (item.source, item.item_id),
+                )
+                row = cursor.fetchone()
+                values = (
+                    item.account_id,
+                    _timestamp(item.timestamp),
+                    json.dumps(item.metadata, ensure_ascii=False, default=str),
+                    now,
+                )
+                if row is None:
+                    cursor.execute(
+                        "INSERT INTO archive_items "
+                        "(source, item_id, account_id, timestamp, metadata, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (item.source, item.item_id, *values),
+                    )
+                    rowid = cursor.lastrowid
+                else:
+                    rowid = row[0]
+                    cursor.execute(
+                        "UPDATE archive_items SET account_id = ?, timestamp = ?, "
+                        "metadata = ?, indexed_at = ? WHERE rowid = ?",
+                        (*values, rowid),
+                    )
+                    cursor.execute("DELETE FROM archive_fts WHERE rowid = ?", (rowid,))
+                cursor.execute(
+                    "INSERT INTO archive_fts (rowid, title, sender, body) VALUES (?, ?, ?, ?)",
+                    (rowid, item.title or "", item.sender or "", (item.body or "")[:MAX_BODY_CHARS]),
+                )
+
+    def add_item(self, item: ArchiveItem) -> None:
+        """
+        Index (or re-index) one item
+
+        Args:
+            item: Item to upsert
+        """
+        self.add_items([item])
+
+    def add_event(self, event: "PerceivedEvent", account_id: Optional[str] = None) -> None:
+        """
+        Index a normalized event (email, Teams message or calendar event)
+
+        Args:
+            event: PerceivedEvent
+            account_id: Account the event came from
+        """
+        self.add_item(item_from_event(event, account_id))
+
+    def add_email(
+        self,
+        metadata: "EmailMetadata",
+        content: "EmailContent",
+        account_id: Optional[str] = None,
+        queue_item_id: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Index a fetched email
+
+        Args:
+            metadata: Email metadata
+            content: Email content
+            account_id: Account the email came from
+            queue_item_id: Queue item created for the email, if any
+            status: Queue status at indexing time
+        """
+        self.add_item(item_from_email(metadata, content, account_id, queue_item_id, status))
+
+    def remove_item(self, source: str, item_id: str) -> bool:
+        """
+        Remove an item
+
+        Args:
+            source: Item source
+            item_id: Item identifier
+
+        Returns:
+            True if the item was indexed
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT rowid FROM archive_items WHERE source = ? AND item_id = ?",
+                (source, item_id),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            cursor.execute("DELETE FROM archive_fts WHERE rowid = ?", (row[0],))
+            cursor.execute("DELETE FROM archive_items WHERE rowid = ?", (row[0],))
+            return True
+
+    def search(
+        self,
+        query: str,
+        sources: Optional[list[str]] = None,
+        account_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 20,
+    ) -> list[ArchiveHit]:
+        """
+        Ranked full-text search
+
+        Every query term must match; when nothing does, items matching any
+        term are returned instead.
+
+        Args:
+            query: User query
+            sources: Restrict to these sources (None = all)
+            account_id: Restrict to one account
+            date_from: Only items at or after this date
+            date_to: Only items at or before this date
+            limit: Maximum number of hits
+
+        Returns:
+            Hits, best first
+
+        Raises:
+            ValueError: If limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        hits = self._search(match, sources, account_id, date_from, date_to, limit)
+        if not hits and " AND " in match:
+            hits = self._search(
+                build_match_query(query, any_term=True),
+                sources, account_id, date_from, date_to, limit,
+            )
+        return hits
+
+    def _search(
+        self,
+        match: str,
+        sources: Optional[list[str]],
+        account_id: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        limit: int,
+    ) -> list[ArchiveHit]:
+        """Run one MATCH query with filters"""
+        conditions = ["archive_fts MATCH ?"]
+        params: list[Any] = [match]
+        if sources:
+            conditions.append(f"i.source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+        if account_id is not None:
+            conditions.append("i.account_id = ?")
+            params.append(account_id)
+        if date_from is not None:
+            conditions.append("i.timestamp >= ?")
+            params.append(_timestamp(date_from))
+        if date_to is not None:
+            conditions.append("i.timestamp <= ?")
+            params.append(_timestamp(date_to))
+
+        sql = (
+            "SELECT i.source, i.item_id, archive_fts.title, archive_fts.sender, "
+            "i.account_id, i.timestamp, i.metadata, "
+            "snippet(archive_fts, -1, ?, ?, '…', ?), "
+            "bm25(archive_fts, ?, ?, ?) AS rank "
+            "FROM archive_fts JOIN archive_items i ON i.rowid = archive_fts.rowid "
+            f"WHERE {' AND '.join(conditions)} "  # noqa: S608 - placeholders only
+            "ORDER BY rank LIMIT ?"
+        )
+        params = [HIGHLIGHT_START, HIGHLIGHT_END, SNIPPET_TOKENS, *BM25_WEIGHTS, *params, limit]
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            # Malformed MATCH expressions are filtered out by build_match_query
+            logger.warning(f"Archive search failed: {e}", extra={"match": match})
+            return []
+
+        hits = []
+        for source, item_id, title, sender, account, ts, metadata, snippet, rank in rows:
+            relevance = max(0.0, -rank)  # bm25() is negative, lower is better
+            hits.append(
+                ArchiveHit(
+                    source=source,
+                    item_id=item_id,
+                    title=title,
+                    snippet=snippet,
+                    score=relevance / (1.0 + relevance),
+                    timestamp=datetime.fromtimestamp(ts, tz=timezone.utc),
+                    account_id=account,
+                    sender=sender,
+                    metadata=json.loads(metadata),
+                )
+            )
+        return hits
+
+    def count(self, source: Optional[str] = None) -> int:
+        """
+        Number of indexed items
+
+        Args:
+            source: Only count this source (None = all)
+        """
+        with self._get_cursor() as cursor:
+            if source is None:
+                cursor.execute("SELECT COUNT(*) FROM archive_items")
+            else:
+                cursor.execute("SELECT COUNT(*) FROM archive_items WHERE source = ?", (source,))
+            return cursor.fetchone()[0]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Index statistics"""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT source, COUNT(*) FROM archive_items GROUP BY source")
+            by_source = dict(cursor.fetchall())
+        return {
+            "db_path": str(self.db_path),
+            "total_items": sum(by_source.values()),
+            "by_source": by_source,
+        }
+
+    def close(self) -> None:
+        """Close thread-local connection."""
+        if hasattr(self._local, "conn") and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+_archive_index_instance: Optional[ArchiveIndex] = None
+_archive_index_lock = threading.Lock()
+
+
+def get_archive_index(db_path: Optional[Path] = None) -> ArchiveIndex:
+    """
+    Get global ArchiveIndex instance (thread-safe singleton)
+
+    Args:
+        db_path: Database path (only used on first call)
+
+    Returns:
+        ArchiveIndex instance
+    """
+    global _archive_index_instance
+
+    if _archive_index_instance is None:
+        with _archive_index_lock:
+            # Double-check locking
+            if _archive_index_instance is None:
+                _archive_index_instance = ArchiveIndex(db_path or DEFAULT_ARCHIVE_INDEX_PATH)
+
+    return _archive_index_instance
@@ -0,0 +1,546 @@
+"""
+Graph Sync Store
+
+Persistent Microsoft Graph sync state and a local mirror of the synced
+resources (calendar events, Teams chats and messages), per account.
+
+- Sync state: the delta link (or watermark) of each resource, so a
+  restart resumes where the last sync stopped instead of re-enumerating.
+- Mirror: the latest version of every item. Delta changes are merged into
+  it; removed items become tombstones with the time of the change, purged
+  after TOMBSTONE_RETENTION_DAYS by the clients' sync().
+
+Reads (calendar view, chats, recent messages) become local queries; only
+the changes reported by Graph cross the network.
+
+Usage:
+    store = get_graph_sync_store()
+    store.set_state("work", "/me/calendarView", delta_link)
+    changes = store.apply_changes("work", "calendarView", items, time_key=event_times)
+    events = store.list_items("work", "calendarView", since=now, until=tomorrow)
+    store.purge_tombstones("work", "calendarView")
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("graph_sync_store")
+
+# Default database location (next to the other local stores)
+DEFAULT_GRAPH_SYNC_STORE_PATH = Path("data/graph_sync.db")
+
+# Tombstones older than this are purged by purge_tombstones()
+TOMBSTONE_RETENTION_DAYS = 30
+
+# Extracts (start, end) times of an item for range queries
+TimeKey = Callable[[dict[str, Any]], tuple[Optional[datetime], Optional[datetime]]]
+
+
+@dataclass
+class MirrorChanges:
+    """Items changed by one apply_changes() call
+
+    deleted holds items Graph reported as deleted; dropped holds items that
+    only left the synced view (moved out of a calendar window, missing from
+    a full enumeration). Both are tombstoned in the mirror.
+    """
+
+    upserted: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of changed items"""
+        return len(self.upserted) + len(self.deleted) + len(self.dropped)
+
+    def extend(self, other: "MirrorChanges") -> None:
+        """Add the changes of another call"""
+        self.upserted.extend(other.upserted)
+        self.deleted.extend(other.deleted)
+        self.dropped.extend(other.dropped)
+
+
+def is_removed(item: dict[str, Any]) -> bool:
+    """Whether a delta item reports a removal (deletion or leaving the view)"""
+    return "@removed" in item or bool(item.get("deletedDateTime"))
+
+
+def _is_deleted(item: dict[str, Any]) -> bool:
+    """Whether a removal is a deletion ("@removed" reason "changed" is not)"""
+    removed = item.get("@removed")
+    return not isinstance(removed, dict) or removed.get("reason") != "changed"
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Datetime to epoch seconds (naive datetimes are UTC)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class GraphSyncStore:
+    """
+    SQLite store for Graph sync state and mirrored items
+
+    Thread-safe: each thread gets its own connection; the database runs in
+    WAL mode so the API and worker processes share it.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_GRAPH_SYNC_STORE_PATH):
+        """
+        Open (or create) the store
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+        logger.info("GraphSyncStore initialized", extra={"db_path": str(self.db_path)})
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            self._local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    account_id TEXT NOT NULL,
+                    resource TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (account_id, resource)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS mirror_items (
+                    account_id TEXT NOT NULL,
+                    resource TEXT NOT NULL,
+                    container_id TEXT NOT NULL DEFAULT '',
+                    item_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    start_time REAL,
+                    end_time REAL,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    changed_at REAL NOT NULL,
+                    PRIMARY KEY (account_id, resource, container_id, item_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_mirror_time
+                ON mirror_items(account_id, resource, deleted, start_time)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_mirror_changed
+                ON mirror_items(account_id, resource, changed_at)
+            """)
+
+    # =========================================================================
+    # Sync state
+    # =========================================================================
+
+    def get_state(self, account_id: str, resource: str) -> Optional[str]:
+        """
+        Get the stored delta link (or watermark) of a resource
+
+        Args:
+            account_id: Account identifier
+            resource: Resource key (e.g. "/me/calendarView")
+
+        Returns:
+            Stored state, or None if the resource was never synced
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT state FROM sync_state WHERE account_id = ? AND resource = ?",
+                (account_id, resource),
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def set_state(self, account_id: str, resource: str, state: str) -> None:
+        """
+        Store the delta link (or watermark) of a resource
+
+        Args:
+            account_id: Account identifier
+            resource: Resource key
+            state: Delta link or watermark
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO sync_state (account_id, resource, state, updated_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(account_id, resource) DO UPDATE SET "
+                "state = excluded.state, updated_at = excluded.updated_at",
+                (account_id, resource, state, time.time()),
+            )
+
+    def clear_state(self, account_id: str, resource: str, prefix: bool = False) -> int:
+        """
+        Forget sync state (the next sync starts a full enumeration)
+
+        Args:
+            account_id: Account identifier
+            resource: Resource key
+            prefix: Clear every resource key starting with resource
+
+        Returns:
+            Number of cleared entries
+        """
+        with self._get_cursor() as cursor:
+            if prefix:
+                cursor.execute(
+                    "DELETE FROM sync_state WHERE account_id = ? AND substr(resource, 1, ?) = ?",
+                    (account_id, len(resource), resource),
+                )
+            else:
+                cursor.execute(
+                    "DELETE FROM sync_state WHERE account_id = ? AND resource = ?",
+                    (account_id, resource),
+                )
+            return cursor.rowcount
+
+    # =========================================================================
+    # Mirror
+    # =========================================================================
+
+    def apply_changes(
+        self,
+        account_id: str,
+        resource: str,
+        items: list[dict[str, Any]],
+        time_key: Optional[TimeKey] = None,
+        container_id: str = "",
+        full: bool = False,
+    ) -> MirrorChanges:
+        """
+        Merge delta items into the mirror in one transaction
+
+        Changed items are merged over the stored version (delta responses
+        may only carry the changed properties); items identical to the
+        stored version are left untouched. Removed items become tombstones.
+
+        Args:
+            account_id: Account identifier
+            resource: Mirrored resource (e.g. "calendarView", "chatMessages")
+            items: Items as returned by Graph (with "id")
+            time_key: Extracts (start, end) of an item for range queries
+            container_id: Parent of the items (e.g. chat ID for messages)
+            full: Items are a full enumeration: tombstone every other item
+
+        Returns:
+            MirrorChanges with the upserted and deleted item IDs
+        """
+        changes = MirrorChanges()
+        seen: set[str] = set()
+        now = time.time()
+
+        with self._get_cursor() as cursor:
+            for item in items:
+                item_id = item.get("id")
+                if not item_id:
+                    continue
+                seen.add(item_id)
+
+                if is_removed(item):
+                    cursor.execute(
+                        "UPDATE mirror_items SET deleted = 1, changed_at = ? "
+                        "WHERE account_id = ? AND resource = ? AND container_id = ? "
+                        "AND item_id = ? AND deleted = 0",
+                        (now, account_id, resource, container_id, item_id),
+                    )
+                    if cursor.rowcount:
+                        (changes.deleted if _is_deleted(item) else changes.dropped).append(item_id)
+                    continue
+
+                cursor.execute(
+                    "SELECT data, deleted FROM mirror_items "
+                    "WHERE account_id = ? AND resource = ? AND container_id = ? AND item_id = ?",
+                    (account_id, resource, container_id, item_id),
+                )
+                row = cursor.fetchone()
+                data = dict(item)
+                if row is not None and not row[1]:
+                    stored = json.loads(row[0])
+                    data = {**stored, **item}
+                    if data == stored:
+                        continue
+
+                start, end = time_key(data) if time_key else (None, None)
+                cursor.execute(
+                    "INSERT INTO mirror_items "
+                    "(account_id, resource, container_id, item_id, data, start_time, end_time, "
+                    "deleted, changed_at) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?) "
+                    "ON CONFLICT(account_id, resource, container_id, item_id) DO UPDATE SET "
+                    "data = excluded.data, start_time = excluded.start_time, "
+                    "end_time = excluded.end_time, deleted = 0, changed_at = excluded.changed_at",
+                    (
+                        account_id,
+                        resource,
+                        container_id,
+                        item_id,
+                        json.dumps(data, ensure_ascii=False, default=str),
+                        _timestamp(start),
+                        _timestamp(end),
+                        now,
+                    ),
+                )
+                changes.upserted.append(item_id)
+
+            if full:
+                # Everything not enumerated disappeared while we were not syncing
+                cursor.execute(
+                    "SELECT item_id FROM mirror_items "
+                    "WHERE account_id = ? AND resource = ? AND container_id = ? AND deleted = 0",
+                    (account_id, resource, container_id),
+                )
+                stale = [row[0] for row in cursor.fetchall() if row[0] not in seen]
+                cursor.executemany(
+                    "UPDATE mirror_items SET deleted = 1, changed_at = ? "
+                    "WHERE account_id = ? AND resource = ? AND container_id = ? AND item_id = ?",
+                    [(now, account_id, resource, container_id, item_id) for item_id in stale],
+                )
+                changes.dropped.extend(stale)
+
+        if changes.total:
+            logger.debug(
+                "Mirror updated",
+                extra={
+                    "account_id": account_id,
+                    "resource": resource,
+                    "upserted": len(changes.upserted),
+                    "deleted": len(changes.deleted),
+                    "dropped": len(changes.dropped),
+                },
+            )
+        return changes
+
+    def get_item(
+        self,
+        account_id: str,
+        resource: str,
+        item_id: str,
+        container_id: Optional[str] = "",
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get a mirrored item (tombstones excluded)
+
+        Args:
+            account_id: Account identifier
+            resource: Mirrored resource
+            item_id: Item identifier
+            container_id: Parent of the item (None = any parent)
+
+        Returns:
+            Item data, or None if not mirrored or deleted
+        """
+        sql = (
+            "SELECT data FROM mirror_items "
+            "WHERE account_id = ? AND resource = ? AND item_id = ? AND deleted = 0"
+        )
+        params: list[Any] = [account_id, resource, item_id]
+        if container_id is not None:
+            sql += " AND container_id = ?"
+            params.append(container_id)
+
+        with self._get_cursor() as cursor:
+            cursor.execute(sql + " LIMIT 1", params)
+            row = cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_items(
+        self,
+        account_id: str,
+        resource: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        container_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        List mirrored items overlapping a time range (tombstones excluded)
+
+        An item overlaps [since, until) if it starts before until and ends
+        (or, without an end, starts) after since.
+
+        Args:
+            account_id: Account identifier
+            resource: Mirrored resource
+            since: Range start (None = unbounded)
+            until: Range end (None = unbounded)
+            container_id: Only items of this parent
+            limit: Maximum number of items
+            newest_first: Sort by start time descending instead of ascending
+
+        Returns:
+            Item data dicts, sorted by start time
+        """
+        conditions = ["account_id = ?", "resource = ?", "deleted = 0"]
+        params: list[Any] = [account_id, resource]
+        if container_id is not None:
+            conditions.append("container_id = ?")
+            params.append(container_id)
+        if since is not None:
+            conditions.append("COALESCE(end_time, start_time) > ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            conditions.append("start_time < ?")
+            params.append(_timestamp(until))
+
+        sql = (
+            f"SELECT data FROM mirror_items WHERE {' AND '.join(conditions)} "  # noqa: S608
+            f"ORDER BY start_time {'DESC' if newest_first else 'ASC'}, item_id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def purge_tombstones(
+        self,
+        account_id: str,
+        resource: str,
+        older_than_days: int = TOMBSTONE_RETENTION_DAYS,
+    ) -> int:
+        """
+        Delete tombstones older than the retention period
+
+        Args:
+            account_id: Account identifier
+            resource: Mirrored resource
+            older_than_days: Retention in days
+
+        Returns:
+            Number of purged tombstones
+        """
+        cutoff = time.time() - older_than_days * 86400
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM mirror_items "
+                "WHERE account_id = ? AND resource = ? AND changed_at < ? AND deleted = 1",
+                (account_id, resource, cutoff),
+            )
+            return cursor.rowcount
+
+    def trim_container(
+        self,
+        account_id: str,
+        resource: str,
+        container_id: str,
+        keep: int,
+    ) -> int:
+        """
+        Delete all but the newest items of one parent (by start time)
+
+        Args:
+            account_id: Account identifier
+            resource: Mirrored resource
+            container_id: Parent of the items (e.g. chat ID for messages)
+            keep: Number of items to keep
+
+        Returns:
+            Number of deleted items
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM mirror_items "
+                "WHERE account_id = ? AND resource = ? AND container_id = ? AND deleted = 0 "
+                "AND item_id NOT IN ("
+                "SELECT item_id FROM mirror_items "
+                "WHERE account_id = ? AND resource = ? AND container_id = ? AND deleted = 0 "
+                "ORDER BY start_time DESC, item_id LIMIT ?)",
+                (account_id, resource, container_id) * 2 + (keep,),
+            )
+            return cursor.rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        """Store statistics"""
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT resource, SUM(deleted = 0), SUM(deleted) FROM mirror_items "
+                "GROUP BY resource"
+            )
+            resources = {
+                resource: {"items": items, "tombstones": tombstones}
+                for resource, items, tombstones in cursor.fetchall()
+            }
+            cursor.execute("SELECT COUNT(*) FROM sync_state")
+            synced = cursor.fetchone()[0]
+        return {
+            "db_path": str(self.db_path),
+            "synced_resources": synced,
+            "resources": resources,
+        }
+
+    def close(self) -> None:
+        """Close thread-local connection."""
+        if hasattr(self._local, "conn") and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+_graph_sync_store_instance: Optional[GraphSyncStore] = None
+_graph_sync_store_lock = threading.Lock()
+
+
+def get_graph_sync_store(db_path: Optional[Path] = None) -> GraphSyncStore:
+    """
+    Get global GraphSyncStore instance (thread-safe singleton)
+
+    Args:
+        db_path: Database path (only used on first call)
+
+    Returns:
+        GraphSyncStore instance
+    """
+    global _graph_sync_store_instance
+
+    if _graph_sync_store_instance is None:
+        with _graph_sync_store_lock:
+            # Double-check locking
+            if _graph_sync_store_instance is None:
+                _graph_sync_store_instance = GraphSyncStore(
+                    db_path or DEFAULT_GRAPH_SYNC_STORE_PATH
+                )
+
+    return _graph_sync_store_instance
@@ -0,0 +1,763 @@
+"""
+Queue Index
+
+SQLite secondary index over the per-file queue (data/queue/*.json).
+
+The JSON files stay the source of truth for each péripétie; this index keeps
+a copy of every item alongside the fields the queue is queried by (state,
+tab, account, legacy status, snooze expiry, message-id, queued_at), so list,
+count and stats calls no longer glob and parse the whole directory.
+
+Consistency:
+    - QueueStorage writes the file first, then upserts the index row
+    - On startup, reconcile() compares file mtimes with the index and
+      (re)indexes new or changed files and drops rows for deleted files.
+      The first start on an existing queue directory is the migration,
+      and so is the first start after a schema change (the index is
+      rebuilt from the files).
+    - The database runs in WAL mode so API and worker processes share it
+
+Listing:
+    - Each sort order (SORT_ORDERS) has a precomputed key column, so
+      filter, order and keyset cursor are all answered by SQLite indexes
+    - Every upsert or delete takes the next change sequence number;
+      changes() returns what changed after a sequence number, for clients
+      polling a listing
+
+Usage:
+    index = QueueIndex(queue_dir / ".queue_index.db")
+    index.reconcile(queue_dir)
+    items, cursor = index.query(state="awaiting_review", limit=20)
+    history, cursor = index.query(tab="history", sort="resolved", limit=20)
+    changes = index.changes(since=seq, tab="to_process")
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from src.core.models.peripetie import PeripetieState, migrate_legacy_status, state_to_tab
+from src.monitoring.logger import get_logger
+
+logger = get_logger("queue_index")
+
+# Index database filename (dot-prefixed so queue globs ignore it)
+QUEUE_INDEX_FILENAME = ".queue_index.db"
+
+# Bumped when indexed columns change: older indexes are rebuilt from the files
+SCHEMA_VERSION = 2
+
+# Columns a query may filter on by equality
+_EQUALITY_FILTERS = ("account_id", "status", "state", "tab")
+
+# Sort orders: name -> (key column, descending)
+#   queued: oldest first, to process the oldest items first
+#   resolved: most recently reviewed first (history)
+#   error: most recent error first
+#   snooze: soonest wake-up first
+SORT_ORDERS: dict[str, tuple[str, bool]] = {
+    "queued": ("queued_at", False),
+    "resolved": ("resolved_key", True),
+    "error": ("error_key", True),
+    "snooze": ("snooze_key", False),
+}
+
+
+@dataclass
+class QueueChanges:
+    """Items changed after a change sequence number
+
+    items holds the changed items that match the listing's filters;
+    removed_ids the changed items that no longer do (deleted, or moved to
+    another state or tab). seq is the sequence number to poll from next.
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    removed_ids: list[str] = field(default_factory=list)
+    seq: int = 0
+    has_more: bool = False
+
+
+def default_sort(
+    status: Optional[str] = None,
+    state: Optional[str] = None,
+    tab: Optional[str] = None,
+) -> str:
+    """
+    Sort order of a listing, from its filters
+
+    Reviewed items (history, processed, approved/rejected) are listed by
+    review date, errors by error date and snoozed items by wake-up date;
+    everything else by queue date.
+    """
+    if status in ("approved", "rejected") or state == PeripetieState.PROCESSED.value:
+        return "resolved"
+    if tab == "history":
+        return "resolved"
+    if state == PeripetieState.ERROR.value or tab == "errors":
+        return "error"
+    if tab == "snoozed":
+        return "snooze"
+    return "queued"
+
+
+def normalize_message_id(message_id: Optional[str]) -> str:
+    """
+    Normalize message_id for consistent deduplication.
+
+    Removes angle brackets and converts to lowercase to handle
+    variations like '<id@domain>' vs 'id@domain'.
+    """
+    if not message_id:
+        return ""
+    return message_id.strip().strip("<>").lower()
+
+
+def item_state(item: dict[str, Any]) -> str:
+    """
+    Get the state of an item, handling legacy format.
+
+    Args:
+        item: Queue item dictionary
+
+    Returns:
+        State value (from PeripetieState enum)
+    """
+    state_value = item.get("state")
+    if state_value is not None:
+        return state_value
+
+    # Fall back to legacy status mapping
+    state, _ = migrate_legacy_status(item.get("status", "pending"))
+    return state.value
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    """Parse an ISO datetime string to a POSIX timestamp (None if invalid)"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def encode_cursor(sort: str, sort_key: str, item_id: str) -> str:
+    """
+    Encode a keyset position as an opaque cursor
+
+    Args:
+        sort: Sort order of the listing (see SORT_ORDERS)
+        sort_key: Sort key of the last item of the page
+        item_id: ID of the last item of the page
+    """
+    raw = json.dumps([sort, sort_key, item_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor to decode
+        sort: Sort order of the listing the cursor is used with
+
+    Returns:
+        (sort_key, item_id)
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort order
+    """
+    try:
+        cursor_sort, sort_key, item_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid queue cursor: {cursor!r}") from e
+    if cursor_sort != sort:
+        raise ValueError(
+            f"Queue cursor was issued for sort order {cursor_sort!r}, not {sort!r}"
+        )
+    return str(sort_key), str(item_id)
+
+
+def _filter_clauses(
+    account_id: Optional[str],
+    status: Optional[str],
+    state: Optional[str],
+    tab: Optional[str],
+    include_snoozed: bool = True,
+) -> tuple[list[str], list[Any]]:
+    """SQL conditions and parameters for the equality and snooze filters"""
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, value in zip(_EQUALITY_FILTERS, (account_id, status, state, tab)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if not include_snoozed:
+        clauses.append("snoozed = 0")
+    return clauses, params
+
+
+class QueueIndex:
+    """
+    SQLite index of queue items
+
+    Thread-safe: each thread gets its own connection. Writers are expected
+    to be serialized by the caller (QueueStorage's write lock).
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the index, creating the schema if needed
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        # Bumped on every write from this process (invalidates stats caches)
+        self._generation = 0
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if getattr(self._local, "conn", None) is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] < SCHEMA_VERSION:
+                # Derived data: dropped tables are refilled by reconcile()
+                for table in ("queue_items", "queue_data", "queue_changes"):
+                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS queue_items (
+                    id TEXT PRIMARY KEY,
+                    account_id TEXT,
+                    status TEXT,
+                    state TEXT NOT NULL,
+                    tab TEXT,
+                    snoozed INTEGER NOT NULL DEFAULT 0,
+                    snooze_until TEXT,
+                    message_id TEXT,
+                    queued_at TEXT NOT NULL DEFAULT '',
+                    resolution_type TEXT,
+                    resolved_ts REAL,
+                    mtime_ns INTEGER NOT NULL DEFAULT 0,
+                    resolved_key TEXT NOT NULL DEFAULT '',
+                    error_key TEXT NOT NULL DEFAULT '',
+                    snooze_key TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            # Item bodies live apart so aggregate scans only touch narrow rows
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS queue_data (
+                    id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            # Last change of each item (deleted items included), in change order
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS queue_changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    deleted INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            for name, columns in (
+                ("idx_queue_state", "state, queued_at, id"),
+                ("idx_queue_tab", "tab, queued_at, id"),
+                ("idx_queue_status", "status, queued_at, id"),
+                ("idx_queue_account", "account_id, state, queued_at, id"),
+                ("idx_queue_queued", "queued_at, id"),
+                ("idx_queue_message_id", "message_id"),
+                # History listings grow without bound: keyset pages by review date
+                ("idx_queue_tab_resolved", "tab, resolved_key, id"),
+                ("idx_queue_state_resolved", "state, resolved_key, id"),
+                ("idx_queue_status_resolved", "status, resolved_key, id"),
+            ):
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON queue_items({columns})")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_queue_history
+                ON queue_items(tab, resolved_ts, snoozed)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_queue_snooze
+                ON queue_items(snooze_until) WHERE snoozed = 1
+            """)
+
+    @staticmethod
+    def _row(item_id: str, item: dict[str, Any], mtime_ns: int) -> tuple:
+        """Build the indexed column values for an item"""
+        state = item_state(item)
+        snooze = item.get("snooze")
+        has_snooze = snooze is not None
+        try:
+            tab: Optional[str] = state_to_tab(PeripetieState(state), has_snooze)
+        except ValueError:
+            tab = None
+
+        resolution = item.get("resolution")
+        resolution_type = resolution.get("type", "unknown") if resolution else None
+        resolved_at = resolution.get("resolved_at") if resolution else item.get("reviewed_at")
+
+        snooze_until = snooze.get("until", "") if isinstance(snooze, dict) else None
+
+        queued_at = item.get("queued_at") or ""
+        error = item.get("error")
+        error_at = error.get("occurred_at") if isinstance(error, dict) else None
+
+        return (
+            item_id,
+            item.get("account_id"),
+            item.get("status", "unknown"),
+            state,
+            tab,
+            int(has_snooze),
+            snooze_until,
+            normalize_message_id((item.get("metadata") or {}).get("message_id")),
+            queued_at,
+            resolution_type,
+            _to_timestamp(resolved_at),
+            mtime_ns,
+            # Sort keys (see SORT_ORDERS); unreviewed items sort by queue date
+            resolved_at or queued_at,
+            (error_at or "") if error else queued_at,
+            snooze_until or "",
+        )
+
+    def upsert_many(self, entries: list[tuple[str, dict[str, Any], int]]) -> None:
+        """
+        Insert or replace index rows
+
+        Args:
+            entries: (item_id, item, file mtime_ns) triples
+        """
+        if not entries:
+            return
+        with self._get_cursor() as cursor:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO queue_items VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(item_id, item, mtime_ns) for item_id, item, mtime_ns in entries],
+            )
+            cursor.executemany(
+                "INSERT OR REPLACE INTO queue_data VALUES (?, ?)",
+                [(item_id, json.dumps(item, ensure_ascii=False)) for item_id, item, _ in entries],
+            )
+            self._record_changes(cursor, [item_id for item_id, _, _ in entries], deleted=False)
+        self._generation += 1
+
+    def upsert(self, item_id: str, item: dict[str, Any], mtime_ns: int = 0) -> None:
+        """Insert or replace one item"""
+        self.upsert_many([(item_id, item, mtime_ns)])
+
+    def delete_many(self, item_ids: list[str]) -> None:
+        """Delete index rows"""
+        if not item_ids:
+            return
+        with self._get_cursor() as cursor:
+            cursor.executemany("DELETE FROM queue_items WHERE id = ?", [(i,) for i in item_ids])
+            cursor.executemany("DELETE FROM queue_data WHERE id = ?", [(i,) for i in item_ids])
+            self._record_changes(cursor, item_ids, deleted=True)
+        self._generation += 1
+
+    def delete(self, item_id: str) -> None:
+        """Delete one index row"""
+        self.delete_many([item_id])
+
+    @staticmethod
+    def _record_changes(cursor: sqlite3.Cursor, item_ids: list[str], deleted: bool) -> None:
+        """Give changed items the next change sequence numbers"""
+        # REPLACE drops the item's previous change row: one row per item
+        cursor.executemany(
+            "INSERT OR REPLACE INTO queue_changes (id, deleted) VALUES (?, ?)",
+            [(item_id, int(deleted)) for item_id in item_ids],
+        )
+
+    def reconcile(self, queue_dir: Path) -> dict[str, int]:
+        """
+        Bring the index in line with the JSON files on disk
+
+        Only files whose mtime changed since they were indexed are parsed,
+        so a restart on an unchanged queue costs one directory scan.
+
+        Args:
+            queue_dir: Directory holding {item_id}.json files
+
+        Returns:
+            Counts of added, updated and removed rows
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT id, mtime_ns FROM queue_items")
+            indexed = dict(cursor.fetchall())
+
+        on_disk: dict[str, tuple[str, int]] = {}
+        with os.scandir(queue_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+                try:
+                    on_disk[entry.name[: -len(".json")]] = (entry.path, entry.stat().st_mtime_ns)
+                except OSError:
+                    continue
+
+        changed: list[tuple[str, dict[str, Any], int]] = []
+        added = 0
+        for item_id, (path, mtime_ns) in on_disk.items():
+            if indexed.get(item_id) == mtime_ns:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    item = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to index queue item {item_id}: {e}")
+                continue
+            if item_id not in indexed:
+                added += 1
+            changed.append((item_id, item, mtime_ns))
+
+        removed = [item_id for item_id in indexed if item_id not in on_disk]
+
+        self.upsert_many(changed)
+        self.delete_many(removed)
+
+        counts = {"added": added, "updated": len(changed) - added, "removed": len(removed)}
+        if changed or removed:
+            logger.info("Queue index reconciled", extra={**counts, "total": len(on_disk)})
+        return counts
+
+    def query(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        include_snoozed: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "queued",
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        List items in a sort order, with keyset pagination
+
+        Args:
+            account_id: Filter by account
+            status: Filter by legacy status
+            state: Filter by state
+            tab: Filter by UI tab
+            include_snoozed: Whether to include snoozed items
+            limit: Page size (None = all matching items)
+            cursor: Cursor returned by a previous call, to fetch the next page
+            sort: Sort order (see SORT_ORDERS; default: oldest queued first)
+            offset: Items to skip (offset paging; prefer cursors for deep pages)
+
+        Returns:
+            (items, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed or the sort order unknown
+        """
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"Unknown queue sort order: {sort!r}")
+        key_column, descending = SORT_ORDERS[sort]
+
+        clauses, params = _filter_clauses(account_id, status, state, tab, include_snoozed)
+        if cursor:
+            after_key, after_id = decode_cursor(cursor, sort)
+            clauses.append(f"({key_column}, id) {'<' if descending else '>'} (?, ?)")
+            params.extend([after_key, after_id])
+
+        sql = f"SELECT id, {key_column}, data FROM queue_items JOIN queue_data USING (id)"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        direction = " DESC" if descending else ""
+        sql += f" ORDER BY {key_column}{direction}, id{direction}"
+        if limit is not None:
+            # One extra row tells whether another page exists
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit + 1, offset])
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+
+        with self._get_cursor() as db:
+            db.execute(sql, params)
+            rows = db.fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort, rows[-1][1], rows[-1][0])
+
+        return [json.loads(data) for _, _, data in rows], next_cursor
+
+    def count(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        include_snoozed: bool = True,
+    ) -> int:
+        """Count items matching the filters (None = no filter); index-only"""
+        clauses, params = _filter_clauses(account_id, status, state, tab, include_snoozed)
+        sql = "SELECT COUNT(*) FROM queue_items"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, params)
+            return int(cursor.fetchone()[0])
+
+    def change_seq(self) -> int:
+        """Sequence number of the latest change (0 if none)"""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM queue_changes")
+            return int(cursor.fetchone()[0])
+
+    def changes(
+        self,
+        since: int,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        include_snoozed: bool = True,
+        limit: int = 200,
+    ) -> QueueChanges:
+        """
+        Items changed after a change sequence number, split by the filters
+
+        Only the last change of each item is kept, so the cost is
+        O(items changed since), whatever the size of the queue.
+
+        Args:
+            since: Sequence number from change_seq() or a previous call
+            account_id: Filter by account
+            status: Filter by legacy status
+            state: Filter by state
+            tab: Filter by UI tab
+            include_snoozed: Whether snoozed items match
+            limit: Maximum changes returned (has_more tells if there are more)
+
+        Returns:
+            QueueChanges; poll again from its seq
+        """
+        clauses, params = _filter_clauses(account_id, status, state, tab, include_snoozed)
+        matches = " AND ".join(["queue_items.id IS NOT NULL", *clauses])
+
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT queue_changes.seq, queue_changes.id,
+                    CASE WHEN {matches} THEN queue_data.data END
+                FROM queue_changes
+                LEFT JOIN queue_items ON queue_items.id = queue_changes.id
+                LEFT JOIN queue_data ON queue_data.id = queue_changes.id
+                WHERE queue_changes.seq > ?
+                ORDER BY queue_changes.seq
+                LIMIT ?
+                """,
+                [*params, since, limit + 1],
+            )
+            rows = cursor.fetchall()
+
+        result = QueueChanges(seq=since, has_more=len(rows) > limit)
+        for seq, item_id, data in rows[:limit]:
+            if data is None:
+                result.removed_ids.append(item_id)
+            else:
+                result.items.append(json.loads(data))
+            result.seq = seq
+        return result
+
+    def select_ids(
+        self, account_id: Optional[str] = None, status: Optional[str] = None
+    ) -> list[str]:
+        """IDs of items matching account and exact legacy status (None = any)"""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if account_id:
+            clauses.append("account_id = ?")
+            params.append(account_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        sql = "SELECT id FROM queue_items"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def has_message_id(self, normalized_message_id: str) -> bool:
+        """Whether an item with this normalized message-id is queued"""
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM queue_items WHERE message_id = ? LIMIT 1",
+                (normalized_message_id,),
+            )
+            return cursor.fetchone() is not None
+
+    def snoozed(
+        self, account_id: Optional[str] = None, until_before: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Snoozed items sorted by snooze expiry (soonest first)
+
+        Args:
+            account_id: Filter by account
+            until_before: Only items whose snooze 'until' is <= this ISO string
+        """
+        sql = "SELECT data FROM queue_items JOIN queue_data USING (id) WHERE snoozed = 1"
+        params: list[Any] = []
+        if account_id:
+            sql += " AND account_id = ?"
+            params.append(account_id)
+        if until_before is not None:
+            sql += " AND snooze_until <= ?"
+            params.append(until_before)
+        sql += " ORDER BY snooze_until, id"
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, params)
+            return [json.loads(row[0]) for row in cursor.fetchall()]
+
+    def _aggregates(self, cursor: sqlite3.Cursor) -> dict[str, Any]:
+        """
+        Time-independent aggregates, cached until the table changes
+
+        The cache is per connection: PRAGMA data_version moves when another
+        connection (thread or process) commits, and _generation when this
+        process writes.
+        """
+        cursor.execute("PRAGMA data_version")
+        version = (cursor.fetchone()[0], self._generation)
+        cached = getattr(self._local, "aggregates", None)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        def grouped(column: str, where: str = "") -> dict:
+            cursor.execute(f"SELECT {column}, COUNT(*) FROM queue_items {where} GROUP BY {column}")
+            return dict(cursor.fetchall())
+
+        cursor.execute(
+            f"SELECT COUNT(*), MIN(queued_at), MAX(queued_at), COALESCE(SUM(snoozed), 0), "
+            f"COALESCE(SUM(state = '{PeripetieState.ERROR.value}'), 0) "
+            f"FROM queue_items"
+        )
+        total, oldest, newest, snoozed_count, error_count = cursor.fetchone()
+
+        # History items are split into dated (filtered by cutoff per call) and undated
+        cursor.execute(
+            "SELECT COALESCE(SUM(snoozed), 0), COUNT(*) FILTER (WHERE resolved_ts IS NULL), "
+            "COALESCE(SUM(snoozed) FILTER (WHERE resolved_ts IS NULL), 0) "
+            "FROM queue_items WHERE tab = 'history'"
+        )
+        history_snoozed, undated_history, undated_snoozed = cursor.fetchone()
+
+        aggregates = {
+            "total": total,
+            "by_status": grouped("status"),
+            "by_state": grouped("state"),
+            "by_resolution": grouped("resolution_type", "WHERE resolution_type IS NOT NULL"),
+            "by_tab": grouped("tab", "WHERE tab IS NOT NULL"),
+            "by_account": grouped("COALESCE(NULLIF(account_id, ''), 'unknown')"),
+            "oldest_item": oldest or None,
+            "newest_item": newest or None,
+            "snoozed_count": snoozed_count,
+            "error_count": error_count,
+            # Internal, removed by stats()
+            "_history_snoozed": history_snoozed,
+            "_undated_history": undated_history,
+            "_undated_snoozed": undated_snoozed,
+        }
+        self._local.aggregates = (version, aggregates)
+        return aggregates
+
+    def stats(self, history_cutoff_ts: float) -> dict[str, Any]:
+        """
+        Aggregate counts for QueueStorage.get_stats()
+
+        Args:
+            history_cutoff_ts: Items in the history tab resolved before this
+                POSIX timestamp are left out of by_tab and snoozed_count
+                (items without a parsable resolution date still count)
+
+        Returns:
+            Dictionary with the same keys as QueueStorage.get_stats()
+        """
+        with self._get_cursor() as cursor:
+            aggregates = self._aggregates(cursor)
+
+            # Only recent history is counted per call: O(items resolved in the window)
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(snoozed), 0) FROM queue_items "
+                "WHERE tab = 'history' AND resolved_ts >= ?",
+                (history_cutoff_ts,),
+            )
+            recent_history, recent_snoozed = cursor.fetchone()
+
+        stats = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in aggregates.items()
+            if not key.startswith("_")
+        }
+        history = recent_history + aggregates["_undated_history"]
+        if history:
+            stats["by_tab"]["history"] = history
+        else:
+            stats["by_tab"].pop("history", None)
+        stats["snoozed_count"] += (
+            recent_snoozed + aggregates["_undated_snoozed"] - aggregates["_history_snoozed"]
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Drop every index row"""
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO queue_changes (id, deleted) SELECT id, 1 FROM queue_items"
+            )
+            cursor.execute("DELETE FROM queue_items")
+            cursor.execute("DELETE FROM queue_data")
+        self._generation += 1
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -8,6 +8,8 @@ Architecture:
     - Filename: {item_id}.json
     - Directory: data/queue/
     - Thread-safe file operations
+    - SQLite secondary index (.queue_index.db, see queue_index.py) serves
+      list/count/stats queries without reading every file
 
 v2.4 Changes:
     - New data model separating state/resolution/snooze/error
@@ -31,6 +33,10 @@ Usage:
     # Load items (legacy API, still works)
     items = storage.load_queue(status="pending")
 
+    # Page through a tab with a keyset cursor
+    items, cursor = storage.list_page(tab="to_process", limit=20)
+    more, cursor = storage.list_page(tab="to_process", limit=20, cursor=cursor)
+
     # Remove from queue after processing
     storage.remove_item(item_id)
 """
@@ -40,7 +46,7 @@ import threading
 import uuid
 from collections.abc import Generator
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
@@ -49,10 +55,18 @@ from src.core.models.peripetie import (
     ResolutionType,
     ResolvedBy,
     migrate_legacy_status,
-    state_to_tab,
 )
 from src.core.schemas import EmailAnalysis, EmailMetadata
+from src.integrations.storage.queue_index import (
+    QUEUE_INDEX_FILENAME,
+    QueueChanges,
+    QueueIndex,
+    default_sort,
+    item_state,
+    normalize_message_id,
+)
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import QUEUE_ITEMS_ADDED, QUEUE_TRANSITIONS, get_metrics_store
 from src.utils import get_data_dir, now_utc
 
 logger = get_logger("queue_storage")
@@ -111,8 +125,36 @@ class QueueStorage:
         # ReadWriteLock for concurrent reads, exclusive writes
         self._rwlock = ReadWriteLock()
 
+        # Secondary index; indexes files written by older versions on first start
+        self._index = QueueIndex(self.queue_dir / QUEUE_INDEX_FILENAME)
+        with self._rwlock.write_lock():
+            self._index.reconcile(self.queue_dir)
+
+        # Activity counters behind the stats endpoints
+        self._metrics = get_metrics_store()
+
         logger.info("QueueStorage initialized", extra={"queue_dir": str(self.queue_dir)})
 
+    def _write_item(self, file_path: Path, item: dict[str, Any]) -> None:
+        """
+        Write an item file and update its index row
+
+        Must be called with the write lock held.
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(item, f, indent=2, ensure_ascii=False)
+        self._index.upsert(file_path.stem, item, file_path.stat().st_mtime_ns)
+
+    def reindex(self) -> dict[str, int]:
+        """
+        Re-sync the index with files changed outside QueueStorage
+
+        Returns:
+            Counts of added, updated and removed index rows
+        """
+        with self._rwlock.write_lock():
+            return self._index.reconcile(self.queue_dir)
+
     def _load_processed_ids(self) -> set[str]:
         """Load processed message IDs from persistent storage"""
         if self._processed_ids_file.exists():
@@ -139,11 +181,7 @@ class QueueStorage:
         Removes angle brackets and converts to lowercase to handle
         variations like '<id@domain>' vs 'id@domain'.
         """
-        if not message_id:
-            return ""
-        # Remove leading/trailing whitespace and angle brackets
-        normalized = message_id.strip().strip("<>").lower()
-        return normalized
+        return normalize_message_id(message_id)
 
     def mark_message_processed(self, message_id: str) -> None:
         """Mark a message_id as processed (Bug #60 fix)"""
@@ -183,20 +221,9 @@ class QueueStorage:
 
         # Check if in current queue (any status)
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                if file_path.name.startswith("."):
-                    continue
-                try:
-                    with open(file_path) as f:
-                        item = json.load(f)
-                        item_message_id = item.get("metadata", {}).get("message_id")
-                        if item_message_id:
-                            item_normalized = self._normalize_message_id(item_message_id)
-                            if item_normalized == normalized:
-                                logger.debug(f"Email already in queue: {normalized}")
-                                return True
-                except Exception:
-                    continue
+            if self._index.has_message_id(normalized):
+                logger.debug(f"Email already in queue: {normalized}")
+                return True
 
         return False
 
@@ -308,8 +335,9 @@ class QueueStorage:
         # Write to file (thread-safe)
         file_path = self.queue_dir / f"{item_id}.json"
 
-        with self._rwlock.write_lock(), open(file_path, "w", encoding="utf-8") as f:
-            json.dump(item, f, indent=2, ensure_ascii=False)
+        with self._rwlock.write_lock():
+            self._write_item(file_path, item)
+        self._metrics.increment(QUEUE_ITEMS_ADDED, label=account_id or "")
 
         logger.info(
             "Email queued for review",
@@ -409,8 +437,9 @@ class QueueStorage:
         # Write to file (thread-safe)
         file_path = self.queue_dir / f"{item_id}.json"
 
-        with self._rwlock.write_lock(), open(file_path, "w", encoding="utf-8") as f:
-            json.dump(item, f, indent=2, ensure_ascii=False)
+        with self._rwlock.write_lock():
+            self._write_item(file_path, item)
+        self._metrics.increment(QUEUE_ITEMS_ADDED, label=account_id or "")
 
         logger.info(
             "Email queued for analysis",
@@ -536,8 +565,7 @@ class QueueStorage:
                 item["timestamps"]["analysis_completed_at"] = now.isoformat()
 
                 # Write back
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(item, f, indent=2, ensure_ascii=False)
+                self._write_item(file_path, item)
 
                 logger.info(
                     "Analysis completed for item",
@@ -590,8 +618,7 @@ class QueueStorage:
                 }
 
                 # Write back
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(item, f, indent=2, ensure_ascii=False)
+                self._write_item(file_path, item)
 
                 logger.warning(
                     "Analysis failed for item",
@@ -624,31 +651,8 @@ class QueueStorage:
             # Load pending items for specific account
             items = storage.load_queue(account_id="personal")
         """
-        items = []
-
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-
-                    # Apply filters
-                    if account_id and item.get("account_id") != account_id:
-                        continue
-
-                    if status and item.get("status") != status:
-                        continue
-
-                    items.append(item)
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load queue item {file_path.name}: {e}",
-                        extra={"file": str(file_path)},
-                    )
-
-        # Sort by queued_at (oldest first)
-        items.sort(key=lambda x: x.get("queued_at", ""))
+            items, _ = self._index.query(account_id=account_id, status=status)
 
         logger.debug(
             f"Loaded {len(items)} queue items",
@@ -714,8 +718,7 @@ class QueueStorage:
                 item.update(updates)
 
                 # Write back
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(item, f, indent=2, ensure_ascii=False)
+                self._write_item(file_path, item)
 
             logger.info("Queue item updated", extra={"item_id": item_id, "updates": list(updates.keys())})
             return True
@@ -747,6 +750,7 @@ class QueueStorage:
         try:
             with self._rwlock.write_lock():
                 file_path.unlink()
+                self._index.delete(item_id)
 
             logger.info("Queue item removed", extra={"item_id": item_id})
             return True
@@ -766,8 +770,8 @@ class QueueStorage:
         Returns:
             Number of items matching filters
         """
-        items = self.load_queue(account_id=account_id, status=status)
-        return len(items)
+        with self._rwlock.read_lock():
+            return self._index.count(account_id=account_id, status=status)
 
     def clear_queue(self, account_id: Optional[str] = None, status: Optional[str] = None) -> int:
         """
@@ -786,26 +790,16 @@ class QueueStorage:
         deleted_count = 0
 
         with self._rwlock.write_lock():
-            for file_path in list(self.queue_dir.glob("*.json")):
+            deleted_ids = []
+            for item_id in self._index.select_ids(account_id=account_id, status=status):
                 try:
-                    # Read item to check filters
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-
-                    # Apply filters
-                    if account_id and item.get("account_id") != account_id:
-                        continue
-
-                    if status is not None and item.get("status") != status:
-                        continue
-
-                    # Delete matching item
-                    file_path.unlink()
-                    deleted_count += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path.name}: {e}")
+                    (self.queue_dir / f"{item_id}.json").unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Failed to delete {item_id}.json: {e}")
                     continue
+                deleted_ids.append(item_id)
+                deleted_count += 1
+            self._index.delete_many(deleted_ids)
 
         logger.warning(
             "Queue cleared",
@@ -837,112 +831,11 @@ class QueueStorage:
                 "error_count": int,  # v2.4
             }
         """
-        all_items = []
+        # History tab counter is limited to last 24 hours for relevance
+        cutoff_24h = now_utc() - timedelta(hours=24)
 
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                if file_path.name.startswith("."):
-                    continue
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-                    all_items.append(item)
-                except Exception:
-                    pass
-
-        if not all_items:
-            return {
-                "total": 0,
-                "by_status": {},
-                "by_state": {},
-                "by_resolution": {},
-                "by_tab": {},
-                "by_account": {},
-                "oldest_item": None,
-                "newest_item": None,
-                "snoozed_count": 0,
-                "error_count": 0,
-            }
-
-        # Count by legacy status
-        by_status: dict[str, int] = {}
-        for item in all_items:
-            status = item.get("status", "unknown")
-            by_status[status] = by_status.get(status, 0) + 1
-
-        # v2.4: Count by state
-        by_state: dict[str, int] = {}
-        for item in all_items:
-            state = self._get_item_state(item)
-            by_state[state] = by_state.get(state, 0) + 1
-
-        # v2.4: Count by resolution type
-        by_resolution: dict[str, int] = {}
-        for item in all_items:
-            resolution = item.get("resolution")
-            if resolution:
-                res_type = resolution.get("type", "unknown")
-                by_resolution[res_type] = by_resolution.get(res_type, 0) + 1
-
-        # v2.4: Count by UI tab
-        # History tab counter is limited to last 24 hours for relevance
-        from datetime import datetime, timedelta, timezone
-        now = datetime.now(timezone.utc)
-        cutoff_24h = now - timedelta(hours=24)
-
-        by_tab: dict[str, int] = {}
-        snoozed_count = 0
-        error_count = 0
-        for item in all_items:
-            state = self._get_item_state(item)
-            has_snooze = item.get("snooze") is not None
-            tab = state_to_tab(PeripetieState(state), has_snooze)
-
-            # For history tab, only count items resolved in last 24h
-            if tab == "history":
-                resolved_at = None
-                if item.get("resolution"):
-                    resolved_at = item["resolution"].get("resolved_at")
-                elif item.get("reviewed_at"):
-                    resolved_at = item["reviewed_at"]
-
-                if resolved_at:
-                    try:
-                        resolved_dt = datetime.fromisoformat(resolved_at.replace("Z", "+00:00"))
-                        if resolved_dt < cutoff_24h:
-                            continue  # Skip old history items in counter
-                    except (ValueError, AttributeError):
-                        pass  # Include if date parsing fails
-
-            by_tab[tab] = by_tab.get(tab, 0) + 1
-            if has_snooze:
-                snoozed_count += 1
-            if state == PeripetieState.ERROR.value:
-                error_count += 1
-
-        # Count by account
-        by_account: dict[str, int] = {}
-        for item in all_items:
-            account = item.get("account_id") or "unknown"
-            by_account[account] = by_account.get(account, 0) + 1
-
-        # Find oldest/newest
-        sorted_items = sorted(all_items, key=lambda x: x.get("queued_at", ""))
-        oldest = sorted_items[0].get("queued_at") if sorted_items else None
-        newest = sorted_items[-1].get("queued_at") if sorted_items else None
-
-        return {
-            "total": len(all_items),
-            "by_status": by_status,
-            "by_state": by_state,
-            "by_resolution": by_resolution,
-            "by_tab": by_tab,
-            "by_account": by_account,
-            "oldest_item": oldest,
-            "newest_item": newest,
-            "snoozed_count": snoozed_count,
-            "error_count": error_count,
-        }
+            return self._index.stats(history_cutoff_ts=cutoff_24h.timestamp())
 
     # =========================================================================
     # v2.4 NEW METHODS
@@ -958,15 +851,7 @@ class QueueStorage:
         Returns:
             State value (from PeripetieState enum)
         """
-        # Check for v2.4 state field first (must be non-None)
-        state_value = item.get("state")
-        if state_value is not None:
-            return state_value
-
-        # Fall back to legacy status mapping
-        legacy_status = item.get("status", "pending")
-        state, _ = migrate_legacy_status(legacy_status)
-        return state.value
+        return item_state(item)
 
     def load_queue_by_state(
         self,
@@ -994,49 +879,10 @@ class QueueStorage:
             # Load items for "À traiter" tab (excludes snoozed)
             items = storage.load_queue_by_state(tab="to_process", include_snoozed=False)
         """
-        items = []
-
-        # Use read lock for concurrent reads (doesn't block other readers)
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                if file_path.name.startswith("."):
-                    continue
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-
-                    # Apply account filter
-                    if account_id and item.get("account_id") != account_id:
-                        continue
-
-                    # Get item state
-                    item_state = self._get_item_state(item)
-                    has_snooze = item.get("snooze") is not None
-
-                    # Filter out snoozed if requested
-                    if not include_snoozed and has_snooze:
-                        continue
-
-                    # Apply state filter
-                    if state and item_state != state:
-                        continue
-
-                    # Apply tab filter
-                    if tab:
-                        item_tab = state_to_tab(PeripetieState(item_state), has_snooze)
-                        if item_tab != tab:
-                            continue
-
-                    items.append(item)
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load queue item {file_path.name}: {e}",
-                        extra={"file": str(file_path)},
-                    )
-
-        # Sort by queued_at (oldest first)
-        items.sort(key=lambda x: x.get("queued_at", ""))
+            items, _ = self._index.query(
+                state=state, tab=tab, account_id=account_id, include_snoozed=include_snoozed
+            )
 
         logger.debug(
             f"Loaded {len(items)} queue items",
@@ -1050,6 +896,149 @@ class QueueStorage:
 
         return items
 
+    def list_page(
+        self,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_snoozed: bool = True,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        Load one page of queue items with a keyset cursor.
+
+        Unlike offset paging, each page costs O(limit) however deep into
+        the queue it is.
+
+        Args:
+            state: Filter by state
+            tab: Filter by UI tab
+            account_id: Filter by account (None = all accounts)
+            status: Filter by legacy status
+            include_snoozed: Whether to include snoozed items
+            limit: Maximum items per page
+            cursor: next_cursor from the previous page (None = first page)
+            sort: Sort order ('queued', 'resolved', 'error', 'snooze';
+                None = the listing's natural order, see default_sort)
+            offset: Items to skip before the page (page-number paging)
+
+        Returns:
+            (items, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If limit or offset is invalid, the sort order unknown
+                or the cursor malformed
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+
+        with self._rwlock.read_lock():
+            return self._index.query(
+                account_id=account_id,
+                status=status,
+                state=state,
+                tab=tab,
+                include_snoozed=include_snoozed,
+                limit=limit,
+                cursor=cursor,
+                sort=sort or default_sort(status=status, state=state, tab=tab),
+                offset=offset,
+            )
+
+    def count_items(
+        self,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_snoozed: bool = True,
+    ) -> int:
+        """
+        Count queue items by state, tab, status and/or account (v2.4 API).
+
+        Args:
+            state: Filter by state
+            tab: Filter by UI tab
+            account_id: Filter by account (None = all accounts)
+            status: Filter by legacy status
+            include_snoozed: Whether to count snoozed items
+
+        Returns:
+            Number of matching items
+        """
+        with self._rwlock.read_lock():
+            return self._index.count(
+                account_id=account_id,
+                status=status,
+                state=state,
+                tab=tab,
+                include_snoozed=include_snoozed,
+            )
+
+    def change_seq(self) -> int:
+        """
+        Current change sequence number of the queue.
+
+        Pass it to list_changes() later to get what changed in between.
+        """
+        with self._rwlock.read_lock():
+            return self._index.change_seq()
+
+    def list_changes(
+        self,
+        since: int,
+        state: Optional[str] = None,
+        tab: Optional[str] = None,
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_snoozed: bool = True,
+        limit: int = 200,
+    ) -> QueueChanges:
+        """
+        Queue items changed since a change sequence number.
+
+        Lets a client keep a listing up to date without reloading it:
+        changed items matching the filters are returned in full, changed
+        items that no longer match (deleted, or moved to another state or
+        tab) by ID.
+
+        Args:
+            since: change_seq() value or seq of a previous call
+            state: Filter by state
+            tab: Filter by UI tab
+            account_id: Filter by account (None = all accounts)
+            status: Filter by legacy status
+            include_snoozed: Whether snoozed items match
+            limit: Maximum changes returned
+
+        Returns:
+            QueueChanges (poll again from its seq while has_more is True)
+
+        Raises:
+            ValueError: If since is negative or limit not positive
+        """
+        if since < 0:
+            raise ValueError(f"since must not be negative, got {since}")
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        with self._rwlock.read_lock():
+            return self._index.changes(
+                since,
+                account_id=account_id,
+                status=status,
+                state=state,
+                tab=tab,
+                include_snoozed=include_snoozed,
+                limit=limit,
+            )
+
     def set_state(
         self,
         item_id: str,
@@ -1110,7 +1099,10 @@ class QueueStorage:
         if error:
             updates["error"] = error
 
-        return self.update_item(item_id, updates)
+        if not self.update_item(item_id, updates):
+            return False
+        self._metrics.increment(QUEUE_TRANSITIONS, label=new_state.value)
+        return True
 
     def set_snooze(
         self,
@@ -1170,33 +1162,8 @@ class QueueStorage:
         Returns:
             List of snoozed items sorted by snooze expiry (soonest first)
         """
-        items = []
-
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                if file_path.name.startswith("."):
-                    continue
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-
-                    # Filter: must have snooze
-                    if not item.get("snooze"):
-                        continue
-
-                    # Apply account filter
-                    if account_id and item.get("account_id") != account_id:
-                        continue
-
-                    items.append(item)
-
-                except Exception:
-                    continue
-
-        # Sort by snooze expiry (soonest first)
-        items.sort(key=lambda x: x.get("snooze", {}).get("until", ""))
-
-        return items
+            return self._index.snoozed(account_id=account_id)
 
     def get_expired_snoozes(self) -> list[dict[str, Any]]:
         """
@@ -1206,24 +1173,9 @@ class QueueStorage:
             List of items with expired snoozes
         """
         now = now_utc().isoformat()
-        items = []
 
         with self._rwlock.read_lock():
-            for file_path in self.queue_dir.glob("*.json"):
-                if file_path.name.startswith("."):
-                    continue
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        item = json.load(f)
-
-                    snooze = item.get("snooze")
-                    if snooze and snooze.get("until", "") <= now:
-                        items.append(item)
-
-                except Exception:
-                    continue
-
-        return items
+            return self._index.snoozed(until_before=now)
 
     def wake_expired_snoozes(self) -> int:
         """
@@ -0,0 +1,728 @@
+"""
+Metrics Store
+
+Embedded time-series store for activity counters and latency histograms,
+bucketed per minute, hour and day.
+
+- Writes never touch the disk: increment() and observe() add to in-memory
+  minute buckets under a lock. A daemon thread flushes them every few
+  seconds, consolidating each minute bucket into its hour and day buckets.
+- Retention downsamples: minute buckets are kept MINUTE_RETENTION, hour
+  buckets HOUR_RETENTION, day buckets forever. Older history stays
+  available at the coarser resolution.
+- Reads are O(buckets): a 30-day trend reads 30 day rows per series,
+  whatever the number of events behind them.
+
+Usage:
+    metrics = get_metrics_store()
+    metrics.increment(ITEMS_PROCESSED, label="email")
+    metrics.observe(API_REQUEST_SECONDS, 0.042, label="GET /api/queue")
+
+    daily = metrics.counter_series(ITEMS_PROCESSED, "day", start, end, label="email")
+    latency = metrics.histogram_summary(API_REQUEST_SECONDS, "hour", since=last_day)
+"""
+
+import atexit
+import bisect
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("metrics_store")
+
+# Default database location (next to the other local stores)
+DEFAULT_METRICS_STORE_PATH = Path("data/metrics.db")
+
+# Bucket width of each resolution, in seconds
+RESOLUTIONS: dict[str, int] = {"minute": 60, "hour": 3600, "day": 86400}
+
+# How long buckets are kept (day buckets are never dropped)
+MINUTE_RETENTION = timedelta(hours=48)
+HOUR_RETENTION = timedelta(days=90)
+
+# Pending buckets are written at least this often by the flush thread
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Expired buckets are dropped at most this often by the flush thread
+COMPACT_INTERVAL = 3600.0
+
+# Upper bounds of the histogram bins, in seconds (plus an overflow bin)
+HISTOGRAM_BOUNDS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# Metric names fed by the processors, the queue and the API
+ITEMS_PROCESSED = "items_processed"  # label: source (email, teams, calendar)
+PROCESSING_SECONDS = "processing_seconds"  # label: source
+QUEUE_ITEMS_ADDED = "queue_items_added"  # label: account ID
+QUEUE_TRANSITIONS = "queue_transitions"  # label: new state
+NOTES_REVIEWED = "notes_reviewed"
+API_REQUEST_SECONDS = "api_request_seconds"  # label: "METHOD /route/template"
+
+_RETENTION: dict[str, Optional[timedelta]] = {
+    "minute": MINUTE_RETENTION,
+    "hour": HOUR_RETENTION,
+    "day": None,
+}
+
+
+def _epoch(value: Optional[datetime]) -> Optional[int]:
+    """Datetime to epoch seconds (naive datetimes are UTC)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _bucket_start(timestamp: float, resolution: str) -> int:
+    """Start of the bucket containing a timestamp"""
+    width = RESOLUTIONS[resolution]
+    return int(timestamp) // width * width
+
+
+def _validate_resolution(resolution: str) -> None:
+    """Raise ValueError for unknown resolutions"""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Unknown resolution: {resolution} (expected one of {', '.join(RESOLUTIONS)})"
+        )
+
+
+@dataclass
+class MetricPoint:
+    """Value of a counter over one bucket"""
+
+    start: datetime
+    value: float
+
+
+@dataclass
+class HistogramSummary:
+    """Observations of a histogram over a time range"""
+
+    count: int = 0
+    total: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    bins: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+
+    @property
+    def mean(self) -> float:
+        """Mean observed value (0.0 without observations)"""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float) -> None:
+        """Record one observation"""
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.bins[bisect.bisect_left(HISTOGRAM_BOUNDS, value)] += 1
+
+    def merge(self, other: "HistogramSummary") -> None:
+        """Add the observations of another summary"""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        if self.min is None or (other.min is not None and other.min < self.min):
+            self.min = other.min
+        if self.max is None or (other.max is not None and other.max > self.max):
+            self.max = other.max
+        self.bins = [a + b for a, b in zip(self.bins, other.bins)]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile (upper bound of the bin holding it)
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Estimated value, capped by the observed maximum (None if empty)
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.bins):
+            seen += count
+            if count and seen >= rank:
+                if index < len(HISTOGRAM_BOUNDS):
+                    return min(HISTOGRAM_BOUNDS[index], self.max)  # type: ignore[type-var]
+                break
+        return self.max
+
+    def to_dict(self) -> dict[str, Optional[float]]:
+        """Summary statistics (bins omitted)"""
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6),
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+
+class MetricsStore:
+    """
+    SQLite time-series store of counters and histograms
+
+    Thread-safe: recording only takes an in-memory lock; each thread gets
+    its own database connection and the database runs in WAL mode, so the
+    API and worker processes feed the same store.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_METRICS_STORE_PATH):
+        """
+        Open (or create) the store
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+        # Pending minute buckets: (name, label, bucket start) -> value
+        self._counters: dict[tuple[str, str, int], float] = {}
+        self._histograms: dict[tuple[str, str, int], HistogramSummary] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_compact = 0.0
+
+        logger.info("MetricsStore initialized", extra={"db_path": str(self.db_path)})
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            self._local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    resolution TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (name, resolution, bucket, label)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS histograms (
+                    name TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    resolution TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    count INTEGER NOT NULL,
+                    total REAL NOT NULL,
+                    min REAL,
+                    max REAL,
+                    bins TEXT NOT NULL,
+                    PRIMARY KEY (name, resolution, bucket, label)
+                ) WITHOUT ROWID
+            """)
+
+    # --- Recording (hot path, no I/O) ---
+
+    def increment(
+        self,
+        name: str,
+        value: float = 1,
+        label: str = "",
+        at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add to a counter
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            label: Series label (e.g. the source)
+            at: Time of the event (default: now)
+        """
+        timestamp = at.timestamp() if at is not None else time.time()
+        key = (name, label, _bucket_start(timestamp, "minute"))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        label: str = "",
+        at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Record an observation in a histogram (e.g. a duration in seconds)
+
+        Args:
+            name: Metric name
+            value: Observed value
+            label: Series label
+            at: Time of the observation (default: now)
+        """
+        timestamp = at.timestamp() if at is not None else time.time()
+        key = (name, label, _bucket_start(timestamp, "minute"))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = HistogramSummary()
+            histogram.add(value)
+
+    # --- Persistence ---
+
+    def flush(self) -> int:
+        """
+        Write pending buckets to the database
+
+        Each pending minute bucket is added to its minute, hour and day
+        buckets. On failure, pending values are kept for the next flush.
+
+        Returns:
+            Number of pending minute buckets written
+        """
+        with self._flush_lock:
+            with self._lock:
+                counters, self._counters = self._counters, {}
+                histograms, self._histograms = self._histograms, {}
+            if not counters and not histograms:
+                return 0
+
+            try:
+                with self._get_cursor() as cursor:
+                    # Take the write lock before reading the histograms to
+                    # merge: another process flushing in between would
+                    # otherwise have its observations overwritten
+                    cursor.execute("BEGIN IMMEDIATE")
+                    self._write_counters(cursor, counters)
+                    self._write_histograms(cursor, histograms)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to flush metrics, will retry: {e}")
+                self._requeue(counters, histograms)
+                return 0
+
+            return len(counters) + len(histograms)
+
+    def _write_counters(
+        self,
+        cursor: sqlite3.Cursor,
+        counters: dict[tuple[str, str, int], float],
+    ) -> None:
+        """Add minute counters to every resolution"""
+        rows: dict[tuple[str, str, str, int], float] = {}
+        for (name, label, minute), value in counters.items():
+            for resolution in RESOLUTIONS:
+                key = (name, label, resolution, _bucket_start(minute, resolution))
+                rows[key] = rows.get(key, 0) + value
+
+        cursor.executemany(
+            """
+            INSERT INTO counters (name, label, resolution, bucket, value)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (name, resolution, bucket, label)
+            DO UPDATE SET value = value + excluded.value
+            """,
+            [(*key, value) for key, value in rows.items()],
+        )
+
+    def _write_histograms(
+        self,
+        cursor: sqlite3.Cursor,
+        histograms: dict[tuple[str, str, int], HistogramSummary],
+    ) -> None:
+        """Merge minute histograms into every resolution"""
+        rows: dict[tuple[str, str, str, int], HistogramSummary] = {}
+        for (name, label, minute), histogram in histograms.items():
+            for resolution in RESOLUTIONS:
+                key = (name, label, resolution, _bucket_start(minute, resolution))
+                merged = rows.get(key)
+                if merged is None:
+                    merged = rows[key] = HistogramSummary()
+                merged.merge(histogram)
+
+        for (name, label, resolution, bucket), histogram in rows.items():
+            cursor.execute(
+                """
+                SELECT count, total, min, max, bins FROM histograms
+                WHERE name = ? AND resolution = ? AND bucket = ? AND label = ?
+                """,
+                (name, resolution, bucket, label),
+            )
+            existing = cursor.fetchone()
+            if existing is not None:
+                histogram.merge(self._histogram_from_row(existing))
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO histograms
+                    (name, label, resolution, bucket, count, total, min, max, bins)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    name,
+                    label,
+                    resolution,
+                    bucket,
+                    histogram.count,
+                    histogram.total,
+                    histogram.min,
+                    histogram.max,
+                    json.dumps(histogram.bins),
+                ),
+            )
+
+    def _requeue(
+        self,
+        counters: dict[tuple[str, str, int], float],
+        histograms: dict[tuple[str, str, int], HistogramSummary],
+    ) -> None:
+        """Put back values of a failed flush"""
+        with self._lock:
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, histogram in histograms.items():
+                pending = self._histograms.get(key)
+                if pending is None:
+                    self._histograms[key] = histogram
+                else:
+                    pending.merge(histogram)
+
+    @staticmethod
+    def _histogram_from_row(row: tuple) -> HistogramSummary:
+        """Build a HistogramSummary from (count, total, min, max, bins)"""
+        count, total, min_value, max_value, bins = row
+        summary = HistogramSummary(count=count, total=total, min=min_value, max=max_value)
+        stored = json.loads(bins)
+        if len(stored) == len(summary.bins):
+            summary.bins = stored
+        return summary
+
+    def compact(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop buckets past their resolution's retention
+
+        Their values remain in the coarser buckets.
+
+        Args:
+            now: Reference time (default: now)
+
+        Returns:
+            Number of buckets dropped
+        """
+        reference = _epoch(now) if now is not None else time.time()
+        deleted = 0
+        with self._get_cursor() as cursor:
+            for resolution, retention in _RETENTION.items():
+                if retention is None:
+                    continue
+                cutoff = int(reference - retention.total_seconds())
+                for table in ("counters", "histograms"):
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE resolution = ? AND bucket < ?",
+                        (resolution, cutoff),
+                    )
+                    deleted += cursor.rowcount
+        if deleted:
+            logger.debug(f"Metrics compaction dropped {deleted} expired buckets")
+        return deleted
+
+    # --- Background flushing ---
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the flush thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """
+        Flush pending buckets from a daemon thread (no-op if already running)
+
+        Args:
+            flush_interval: Seconds between flushes
+        """
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(flush_interval,), name="metrics-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the flush thread and write what is pending
+
+        Args:
+            timeout: Seconds to wait for the flush thread
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self, flush_interval: float) -> None:
+        """Flush thread body"""
+        while not self._stop_event.wait(flush_interval):
+            try:
+                self.flush()
+                if time.monotonic() - self._last_compact >= COMPACT_INTERVAL:
+                    self._last_compact = time.monotonic()
+                    self.compact()
+            except Exception as e:
+                logger.warning(f"Metrics flush error: {e}")
+
+    # --- Reads (O(buckets)) ---
+
+    def counter_series(
+        self,
+        name: str,
+        resolution: str,
+        start: datetime,
+        end: datetime,
+        label: Optional[str] = None,
+    ) -> list[MetricPoint]:
+        """
+        Counter values per bucket, zero-filled
+
+        Args:
+            name: Metric name
+            resolution: "minute", "hour" or "day"
+            start: Start of the range (its bucket is included)
+            end: End of the range (its bucket is included)
+            label: Series label (None: sum of all labels)
+
+        Returns:
+            One point per bucket from start to end
+        """
+        _validate_resolution(resolution)
+        self.flush()
+        first = _bucket_start(_epoch(start), resolution)  # type: ignore[arg-type]
+        last = _bucket_start(_epoch(end), resolution)  # type: ignore[arg-type]
+
+        query = """
+            SELECT bucket, SUM(value) FROM counters
+            WHERE name = ? AND resolution = ? AND bucket BETWEEN ? AND ?
+        """
+        params: list = [name, resolution, first, last]
+        if label is not None:
+            query += " AND label = ?"
+            params.append(label)
+        query += " GROUP BY bucket"
+
+        with self._get_cursor() as cursor:
+            cursor.execute(query, params)
+            values = dict(cursor.fetchall())
+
+        width = RESOLUTIONS[resolution]
+        return [
+            MetricPoint(
+                start=datetime.fromtimestamp(bucket, tz=timezone.utc),
+                value=values.get(bucket, 0),
+            )
+            for bucket in range(first, last + 1, width)
+        ]
+
+    def counter_total(
+        self,
+        name: str,
+        label: Optional[str] = None,
+        since: Optional[datetime] = None,
+        resolution: str = "day",
+    ) -> float:
+        """
+        Sum of a counter
+
+        Args:
+            name: Metric name
+            label: Series label (None: all labels)
+            since: Count from the bucket containing this time (None: all history)
+            resolution: Buckets to sum (day buckets hold the whole history)
+
+        Returns:
+            Counter total
+        """
+        return sum(self.counter_totals_by_label(name, since, resolution, label).values())
+
+    def counter_totals_by_label(
+        self,
+        name: str,
+        since: Optional[datetime] = None,
+        resolution: str = "day",
+        label: Optional[str] = None,
+    ) -> dict[str, float]:
+        """
+        Sum of a counter per label
+
+        Args:
+            name: Metric name
+            since: Count from the bucket containing this time (None: all history)
+            resolution: Buckets to sum
+            label: Only this label (None: all labels)
+
+        Returns:
+            Label -> total
+        """
+        _validate_resolution(resolution)
+        self.flush()
+        query = "SELECT label, SUM(value) FROM counters WHERE name = ? AND resolution = ?"
+        params: list = [name, resolution]
+        if since is not None:
+            query += " AND bucket >= ?"
+            params.append(_bucket_start(_epoch(since), resolution))  # type: ignore[arg-type]
+        if label is not None:
+            query += " AND label = ?"
+            params.append(label)
+        query += " GROUP BY label"
+
+        with self._get_cursor() as cursor:
+            cursor.execute(query, params)
+            return dict(cursor.fetchall())
+
+    def histogram_summary(
+        self,
+        name: str,
+        resolution: str = "hour",
+        since: Optional[datetime] = None,
+        label: Optional[str] = None,
+    ) -> HistogramSummary:
+        """
+        Merged observations of a histogram
+
+        Args:
+            name: Metric name
+            resolution: Buckets to merge
+            since: From the bucket containing this time (None: all retained)
+            label: Series label (None: all labels)
+
+        Returns:
+            HistogramSummary of the range
+        """
+        _validate_resolution(resolution)
+        self.flush()
+        query = """
+            SELECT count, total, min, max, bins FROM histograms
+            WHERE name = ? AND resolution = ?
+        """
+        params: list = [name, resolution]
+        if since is not None:
+            query += " AND bucket >= ?"
+            params.append(_bucket_start(_epoch(since), resolution))  # type: ignore[arg-type]
+        if label is not None:
+            query += " AND label = ?"
+            params.append(label)
+
+        summary = HistogramSummary()
+        with self._get_cursor() as cursor:
+            cursor.execute(query, params)
+            for row in cursor.fetchall():
+                summary.merge(self._histogram_from_row(row))
+        return summary
+
+    def get_stats(self) -> dict[str, Union[int, dict[str, int]]]:
+        """Number of stored buckets per resolution, and pending buckets"""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                SELECT resolution, COUNT(*) FROM (
+                    SELECT resolution FROM counters
+                    UNION ALL SELECT resolution FROM histograms
+                ) GROUP BY resolution
+            """)
+            buckets = dict(cursor.fetchall())
+        with self._lock:
+            pending = len(self._counters) + len(self._histograms)
+        return {"buckets": buckets, "pending": pending}
+
+    def clear(self) -> None:
+        """Drop all metrics (pending and stored)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+        with self._get_cursor() as cursor:
+            cursor.execute("DELETE FROM counters")
+            cursor.execute("DELETE FROM histograms")
+
+    def close(self) -> None:
+        """Stop flushing and close this thread's database connection"""
+        self.stop()
+        if getattr(self._local, "conn", None) is not None:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+# Singleton instance
+_metrics_store_instance: Optional[MetricsStore] = None
+_metrics_store_lock = threading.Lock()
+
+
+def get_metrics_store(db_path: Optional[Path] = None) -> MetricsStore:
+    """
+    Get global MetricsStore instance (thread-safe singleton)
+
+    The instance flushes in a background thread and on interpreter exit.
+
+    Args:
+        db_path: Database path (only used on first call)
+
+    Returns:
+        MetricsStore instance
+    """
+    global _metrics_store_instance
+
+    if _metrics_store_instance is None:
+        with _metrics_store_lock:
+            # Double-check locking
+            if _metrics_store_instance is None:
+                store = MetricsStore(db_path or DEFAULT_METRICS_STORE_PATH)
+                store.start()
+                # Short-lived processes (CLI runs) write their last buckets on exit
+                atexit.register(store.stop)
+                _metrics_store_instance = store
+
+    return _metrics_store_instance
+
+
+def reset_metrics_store() -> None:
+    """Stop and drop the global MetricsStore (for tests)"""
+    global _metrics_store_instance
+
+    with _metrics_store_lock:
+        store = _metrics_store_instance
+        _metrics_store_instance = None
+    if store is not None:
+        atexit.unregister(store.stop)
+        store.close()
@@ -27,6 +27,7 @@ from src.passepartout.background_worker import (
     WorkerStats,
 )
 from src.passepartout.context_engine import ContextEngine, ContextRetrievalResult
+from src.passepartout.embedding_cache import PersistentEmbeddingCache
 from src.passepartout.embeddings import EmbeddingGenerator
 from src.passepartout.enricher import (
     EnricherError,
@@ -39,6 +40,7 @@ from src.passepartout.entity_search import (
     EntitySearchStats,
     create_entity_searcher,
 )
+from src.passepartout.metadata_filter import MetadataFilter
 from src.passepartout.note_enricher import (
     Enrichment,
     EnrichmentContext,
@@ -87,7 +89,9 @@ from src.passepartout.vector_store import VectorStore
 __all__ = [
     # Original exports
     "EmbeddingGenerator",
+    "PersistentEmbeddingCache",
     "VectorStore",
+    "MetadataFilter",
     "NoteManager",
     "Note",
     "ContextEngine",
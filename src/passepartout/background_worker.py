@@ -9,6 +9,7 @@ Designed to run without blocking the frontend or API.
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -22,6 +23,7 @@ from src.passepartout.note_manager import NoteManager
 from src.passepartout.note_metadata import NoteMetadataStore
 from src.passepartout.note_scheduler import NoteScheduler
 from src.passepartout.note_types import CycleType
+from src.passepartout.note_watcher import NoteChange, NoteWatcher
 
 if TYPE_CHECKING:
     from src.passepartout.cross_source import CrossSourceEngine
@@ -80,6 +82,7 @@ class WorkerConfig:
     ingestion_interval_seconds: float = 60.0  # Check for modified notes every minute
     janitor_interval_hours: float = 24.0  # Run janitor once per day
     index_refresh_interval_minutes: float = 30.0  # Refresh metadata index every 30 min
+    watch_notes: bool = True  # Sync external edits as they happen (filesystem watcher)
 
     # Throttling
     cpu_throttle_threshold: float = 80.0  # Pause if CPU > 80%
@@ -157,6 +160,12 @@ class BackgroundWorker:
         # Note: _reviewer removed - using _retouche_reviewer for all reviews
         self._processor: NoteProcessor | None = None
         self._janitor: NoteJanitor | None = None
+        self._watcher: NoteWatcher | None = None
+
+        # Notes changed outside Scapin, reported by the watcher thread
+        self._changed_note_ids: set[str] = set()
+        self._changed_lock = threading.Lock()
+        self._offline_changes_checked = False
 
         # Memory Cycles v2 components
         self._retouche_reviewer: RetoucheReviewer | None = None
@@ -227,6 +236,15 @@ class BackgroundWorker:
         if self._janitor is None:
             self._janitor = NoteJanitor(self.notes_dir)
 
+        if self._watcher is None and self.config.watch_notes:
+            self._watcher = NoteWatcher(self._note_manager, metadata_store=self._metadata_store)
+            self._watcher.subscribe(self._on_notes_changed)
+
+    def _on_notes_changed(self, changes: list[NoteChange]) -> None:
+        """Queue externally edited notes for ingestion (watcher thread)"""
+        with self._changed_lock:
+            self._changed_note_ids.update(c.note_id for c in changes if c.kind != "deleted")
+
     def _remaining_today(self) -> int:
         """Calculate remaining reviews for today"""
         return max(0, self.config.max_daily_reviews - self._stats.reviews_today)
@@ -280,6 +298,8 @@ class BackgroundWorker:
         self._init_components()
         self._set_state(WorkerState.RUNNING)
         self._stop_requested = False
+        if self._watcher is not None:
+            self._watcher.start()
 
         # Initial ingestion check lookback (e.g., last 1 hour on startup)
         # This catches changes made while offline
@@ -363,6 +383,9 @@ class BackgroundWorker:
                 self._stats.errors_today += 1
                 await asyncio.sleep(self.config.sleep_on_error_seconds)
 
+        if self._watcher is not None:
+            await asyncio.to_thread(self._watcher.stop)
+
     async def _check_janitor(self) -> None:
         """Run janitor if enough time has passed since last run"""
         if not self._janitor:
@@ -412,8 +435,13 @@ class BackgroundWorker:
             logger.info("Running periodic metadata index refresh...")
             # Run in thread pool to avoid blocking
             count = await asyncio.to_thread(self._note_manager.refresh_index)
+            # Re-embed only notes changed outside Scapin since the last sync
+            sync_stats = await asyncio.to_thread(self._note_manager.sync_index)
             self._stats.last_index_refresh = now
-            logger.info(f"Index refresh completed: {count} notes indexed")
+            logger.info(
+                f"Index refresh completed: {count} notes indexed",
+                extra={"vector_sync": sync_stats},
+            )
 
         except Exception as e:
             logger.error(f"Index refresh failed: {e}", exc_info=True)
@@ -424,9 +452,21 @@ class BackgroundWorker:
             return
 
         try:
-            # Look for notes modified since last check
-            since = datetime.fromtimestamp(self._last_ingestion_check, tz=timezone.utc)
-            modified_notes = self._note_manager.get_recently_modified_notes(since)
+            if self._offline_changes_checked and self._watcher and self._watcher.is_running:
+                # The watcher already synced these; no directory scan needed
+                with self._changed_lock:
+                    note_ids = sorted(self._changed_note_ids)
+                    self._changed_note_ids.clear()
+                notes = (self._note_manager.get_note(note_id) for note_id in note_ids)
+                modified_notes = [note for note in notes if note is not None]
+            else:
+                # Look for notes modified since last check
+                since = datetime.fromtimestamp(self._last_ingestion_check, tz=timezone.utc)
+                modified_notes = self._note_manager.get_recently_modified_notes(since)
+                # Edits made while offline are covered by this first scan
+                with self._changed_lock:
+                    self._changed_note_ids.clear()
+                self._offline_changes_checked = True
 
             if modified_notes:
                 logger.info(
@@ -668,6 +708,7 @@ class BackgroundWorker:
                 # Index refresh
                 "index_refresh_interval_minutes": self.config.index_refresh_interval_minutes,
             },
+            "watcher": self._watcher.get_stats() if self._watcher else None,
             "memory_cycles": {
                 "is_quiet_hours": self._is_quiet_hours(),
                 "is_filage_hour": self._is_filage_hour(),
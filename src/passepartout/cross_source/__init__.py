@@ -181,15 +181,17 @@ def _register_ms_calendar_adapter(
         from src.integrations.microsoft.auth import MicrosoftAuthenticator
         from src.integrations.microsoft.calendar_client import CalendarClient
         from src.integrations.microsoft.graph_client import GraphClient
+        from src.integrations.storage.graph_sync_store import get_graph_sync_store
         from src.passepartout.cross_source.adapters.calendar_adapter import (
             CalendarAdapter,
         )
         from src.passepartout.cross_source.config import CalendarAdapterConfig
 
-        # Create auth and clients
+        # Create auth and clients (reading the local calendar mirror)
         auth = MicrosoftAuthenticator(calendar_config.account)
-        graph_client = GraphClient(auth)
-        calendar_client = CalendarClient(graph_client)
+        sync_store = get_graph_sync_store()
+        graph_client = GraphClient(auth, sync_store=sync_store)
+        calendar_client = CalendarClient(graph_client, sync_store=sync_store)
 
         # Create adapter config
         adapter_config = CalendarAdapterConfig(
@@ -230,13 +232,15 @@ def _register_teams_adapter(
         from src.integrations.microsoft.auth import MicrosoftAuthenticator
         from src.integrations.microsoft.graph_client import GraphClient
         from src.integrations.microsoft.teams_client import TeamsClient
+        from src.integrations.storage.graph_sync_store import get_graph_sync_store
         from src.passepartout.cross_source.adapters.teams_adapter import TeamsAdapter
         from src.passepartout.cross_source.config import TeamsAdapterConfig
 
-        # Create auth and clients
+        # Create auth and clients (reading the local Teams mirror)
         auth = MicrosoftAuthenticator(teams_config.account)
-        graph_client = GraphClient(auth)
-        teams_client = TeamsClient(graph_client)
+        sync_store = get_graph_sync_store()
+        graph_client = GraphClient(auth, sync_store=sync_store)
+        teams_client = TeamsClient(graph_client, sync_store=sync_store)
 
         # Create adapter config
         adapter_config = TeamsAdapterConfig(enabled=True)
@@ -264,6 +268,7 @@ def _register_email_adapter(
 
     try:
         from src.core.config_manager import EmailAccountConfig
+        from src.integrations.storage.archive_index import get_archive_index
         from src.passepartout.cross_source.adapters.email_adapter import EmailAdapter
         from src.passepartout.cross_source.config import EmailAdapterConfig
 
@@ -289,7 +294,14 @@ def _register_email_adapter(
                 imap_password=email_config.imap_password or "",
             )
 
-        if account_config is None:
+        # Local archive index, searched before IMAP (and instead of it offline)
+        archive_index = None
+        try:
+            archive_index = get_archive_index()
+        except Exception as e:
+            logger.warning("Email archive index unavailable: %s", e)
+
+        if account_config is None and archive_index is None:
             logger.debug("Email adapter disabled (no valid account)")
             return
 
@@ -297,10 +309,13 @@ def _register_email_adapter(
         adapter_config = EmailAdapterConfig(enabled=True)
 
         # Create and register adapter
-        adapter = EmailAdapter(account_config, adapter_config)
+        adapter = EmailAdapter(account_config, adapter_config, archive_index=archive_index)
         engine.register_adapter(adapter)
 
-        logger.info("Registered Email adapter for account: %s", account_config.account_name)
+        logger.info(
+            "Registered Email adapter for account: %s",
+            account_config.account_name if account_config else "(archive only)",
+        )
 
     except Exception as e:
         logger.error("Failed to register Email adapter: %s", e)
@@ -1,8 +1,9 @@
 """
 Email adapter for CrossSourceEngine.
 
-Provides IMAP search functionality for finding relevant emails
-in the user's archived mail.
+Provides search functionality for finding relevant emails in the user's
+archived mail: the local archive index (fed by Trivelin) is queried first,
+IMAP SEARCH only when the archive has no match.
 
 Uses connection pooling for improved performance across multiple searches.
 """
@@ -16,7 +17,7 @@ import imaplib
 import logging
 import threading
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email.header import decode_header
 from typing import TYPE_CHECKING, Any
 
@@ -25,6 +26,7 @@ from src.passepartout.cross_source.models import SourceItem
 
 if TYPE_CHECKING:
     from src.core.config_manager import EmailAccountConfig
+    from src.integrations.storage.archive_index import ArchiveHit, ArchiveIndex
     from src.passepartout.cross_source.config import EmailAdapterConfig
 
 logger = logging.getLogger("scapin.cross_source.email")
@@ -308,10 +310,11 @@ class IMAPConnectionContext:
 
 class EmailAdapter(BaseAdapter):
     """
-    Email adapter using IMAP SEARCH for cross-source queries.
+    Email adapter using the local archive index, then IMAP SEARCH.
 
-    Searches across all email folders for messages matching
-    the query in subject, body, or sender fields.
+    Searches the archive index first (offline, ranked); falls back to
+    IMAP SEARCH across folders for messages matching the query in
+    subject, body, or sender fields when the archive has no match.
 
     Uses connection pooling for improved performance across
     multiple searches - connections are reused with TTL-based
@@ -324,6 +327,7 @@ class EmailAdapter(BaseAdapter):
         self,
         account_config: EmailAccountConfig | None = None,
         adapter_config: EmailAdapterConfig | None = None,
+        archive_index: ArchiveIndex | None = None,
     ) -> None:
         """
         Initialize the email adapter.
@@ -331,9 +335,11 @@ class EmailAdapter(BaseAdapter):
         Args:
             account_config: Email account configuration (IMAP credentials)
             adapter_config: Adapter-specific configuration
+            archive_index: Local archive index searched before IMAP (optional)
         """
         self._account_config = account_config
         self._adapter_config = adapter_config
+        self._archive_index = archive_index
         # Legacy connection field (deprecated, use pool instead)
         self._connection: imaplib.IMAP4_SSL | None = None
         # Connection pool for improved performance
@@ -343,7 +349,23 @@ class EmailAdapter(BaseAdapter):
 
     @property
     def is_available(self) -> bool:
-        """Check if email is configured and accessible."""
+        """Check if the archive has emails or IMAP is configured and accessible."""
+        if self._archive_has_emails():
+            return True
+        return self._imap_configured()
+
+    def _archive_has_emails(self) -> bool:
+        """Whether the local archive index holds any email."""
+        if self._archive_index is None:
+            return False
+        try:
+            return self._archive_index.count("email") > 0
+        except Exception as e:
+            logger.debug("Archive index unavailable: %s", e)
+            return False
+
+    def _imap_configured(self) -> bool:
+        """Check if IMAP credentials are configured."""
         if self._account_config is None:
             return False
         return bool(
@@ -497,7 +519,7 @@ class EmailAdapter(BaseAdapter):
         Returns:
             List of SourceItem objects representing matching emails
         """
-        if not self.is_available or self._account_config is None:
+        if not self.is_available:
             logger.warning("Email adapter not available, skipping search")
             return []
 
@@ -507,6 +529,16 @@ class EmailAdapter(BaseAdapter):
             logger.warning("Invalid or empty email search query")
             return []
 
+        # Local archive first: offline and ranked, no IMAP round-trips.
+        # Raw IMAP filters can only be honoured by the server.
+        if not (context and context.get("email_filter")):
+            archived = self._search_archive(safe_query, max_results, context)
+            if archived:
+                return archived
+
+        if not self._imap_configured() or self._account_config is None:
+            return []
+
         # Run IMAP search in thread pool (blocking I/O)
         loop = asyncio.get_event_loop()
         try:
@@ -522,6 +554,70 @@ class EmailAdapter(BaseAdapter):
             logger.error("Email search failed: %s", e)
             return []
 
+    def _search_archive(
+        self,
+        query: str,
+        max_results: int,
+        context: dict[str, Any] | None,
+    ) -> list[SourceItem]:
+        """
+        Search the local archive index.
+
+        Args:
+            query: The search query (already validated)
+            max_results: Maximum results
+            context: Optional context (folders restricts the folders)
+
+        Returns:
+            List of SourceItem objects (empty if no archive or no match)
+        """
+        if self._archive_index is None:
+            return []
+
+        date_from = None
+        if self._adapter_config and self._adapter_config.date_range_days:
+            date_from = datetime.now(timezone.utc) - timedelta(
+                days=self._adapter_config.date_range_days
+            )
+        folders = set(context["folders"]) if context and context.get("folders") else None
+
+        try:
+            hits = self._archive_index.search(
+                query,
+                sources=["email"],
+                date_from=date_from,
+                # Folder filtering happens after ranking: fetch extra candidates
+                limit=max_results * 3 if folders else max_results,
+            )
+        except Exception as e:
+            logger.warning("Archive email search failed, using IMAP: %s", e)
+            return []
+
+        if folders:
+            hits = [hit for hit in hits if hit.metadata.get("folder") in folders]
+        return [self._archive_hit_to_item(hit) for hit in hits[:max_results]]
+
+    def _archive_hit_to_item(self, hit: ArchiveHit) -> SourceItem:
+        """Convert an archive hit to a SourceItem."""
+        content = f"From: {hit.sender}\n{hit.snippet}" if hit.sender else hit.snippet
+        return SourceItem(
+            source="email",
+            type="message",
+            title=hit.title or "(No Subject)",
+            content=content,
+            timestamp=hit.timestamp,
+            relevance_score=hit.score,
+            url=None,
+            metadata={
+                "message_id": hit.metadata.get("message_id"),
+                "from": hit.sender,
+                "folder": hit.metadata.get("folder"),
+                "imap_id": hit.metadata.get("imap_id"),
+                "account_id": hit.account_id,
+                "from_archive": True,
+            },
+        )
+
     def _search_sync(
         self,
         query: str,
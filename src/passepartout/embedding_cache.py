@@ -0,0 +1,303 @@
+"""
+Persistent Embedding Cache
+
+SQLite-backed second-level cache for EmbeddingGenerator. Vectors are keyed
+by (model_name, normalize, text hash) so API, CLI and background worker
+processes reuse each other's embeddings across restarts instead of
+re-encoding the same notes and emails.
+
+The database runs in WAL mode: readers never block the writer and several
+processes can share the same file. Size is bounded by evicting the least
+recently used entries.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("passepartout.embedding_cache")
+
+# Default maximum number of cached vectors (~75 MB at 384 float32 dims)
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Only refresh last_used on hits older than this, to keep reads write-free
+TOUCH_INTERVAL_SECONDS = 3600
+
+# Evict down to this fraction of max_entries so eviction runs in bulk
+EVICTION_TARGET_RATIO = 0.9
+
+# SQLite limits host parameters per statement
+_QUERY_CHUNK_SIZE = 500
+
+
+class PersistentEmbeddingCache:
+    """
+    On-disk embedding cache shared across processes
+
+    Lookups that fail (locked or corrupted database) are logged and treated
+    as misses, so the cache can never break embedding generation.
+
+    Usage:
+        cache = PersistentEmbeddingCache(Path("data/embeddings.db"))
+        cache.put_many("model", True, [("<sha256>", vector)])
+        found = cache.get_many("model", True, ["<sha256>"])
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize persistent cache
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            max_entries: Maximum number of vectors kept before LRU eviction
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+
+        self._init_db()
+        self._approx_size = self._count()
+
+        logger.info(
+            "PersistentEmbeddingCache initialized",
+            extra={"db_path": str(self.db_path), "entries": self._approx_size},
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if getattr(self._local, "conn", None) is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    normalized INTEGER NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (model, normalized, text_hash)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_embeddings_last_used
+                ON embeddings(last_used)
+            """)
+
+    def _count(self) -> int:
+        """Exact number of cached vectors."""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM embeddings")
+            return int(cursor.fetchone()[0])
+
+    def get_many(
+        self, model: str, normalize: bool, text_hashes: list[str]
+    ) -> dict[str, np.ndarray]:
+        """
+        Look up cached vectors
+
+        Args:
+            model: Embedding model identifier
+            normalize: Whether the vectors were L2-normalized
+            text_hashes: SHA-256 hex digests of the normalized texts
+
+        Returns:
+            Mapping text_hash -> vector for the hashes found
+        """
+        if not text_hashes:
+            return {}
+
+        found: dict[str, np.ndarray] = {}
+        stale: list[str] = []
+        now = int(time.time())
+
+        try:
+            with self._get_cursor() as cursor:
+                for start in range(0, len(text_hashes), _QUERY_CHUNK_SIZE):
+                    chunk = text_hashes[start:start + _QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT text_hash, vector, last_used FROM embeddings "
+                        f"WHERE model = ? AND normalized = ? AND text_hash IN ({placeholders})",
+                        (model, int(normalize), *chunk),
+                    )
+                    for text_hash, blob, last_used in cursor.fetchall():
+                        found[text_hash] = np.frombuffer(blob, dtype=np.float32).copy()
+                        if now - last_used > TOUCH_INTERVAL_SECONDS:
+                            stale.append(text_hash)
+
+                # Refresh recency in bulk, and only for entries not touched lately
+                if stale:
+                    cursor.executemany(
+                        "UPDATE embeddings SET last_used = ? "
+                        "WHERE model = ? AND normalized = ? AND text_hash = ?",
+                        [(now, model, int(normalize), h) for h in stale],
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            with self._stats_lock:
+                self._errors += 1
+                self._misses += len(text_hashes)
+            return {}
+
+        with self._stats_lock:
+            self._hits += len(found)
+            self._misses += len(text_hashes) - len(found)
+
+        return found
+
+    def put_many(
+        self, model: str, normalize: bool, items: list[tuple[str, np.ndarray]]
+    ) -> None:
+        """
+        Store vectors, evicting least recently used entries if over capacity
+
+        Args:
+            model: Embedding model identifier
+            normalize: Whether the vectors were L2-normalized
+            items: (text_hash, vector) pairs
+        """
+        if not items:
+            return
+
+        now = int(time.time())
+        rows = []
+        for text_hash, vector in items:
+            vector = np.asarray(vector, dtype=np.float32).ravel()
+            rows.append((model, int(normalize), text_hash, vector.shape[0], vector.tobytes(), now))
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model, normalized, text_hash, dim, vector, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+            with self._stats_lock:
+                self._errors += 1
+            return
+
+        with self._stats_lock:
+            self._writes += len(rows)
+            self._approx_size += len(rows)
+            over_capacity = self._approx_size > self.max_entries
+
+        if over_capacity:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries down to EVICTION_TARGET_RATIO of max_entries."""
+        try:
+            # Other processes write too, so recount before deleting
+            size = self._count()
+            excess = size - int(self.max_entries * EVICTION_TARGET_RATIO)
+            if size > self.max_entries and excess > 0:
+                with self._get_cursor() as cursor:
+                    cursor.execute(
+                        "DELETE FROM embeddings WHERE (model, normalized, text_hash) IN ("
+                        "SELECT model, normalized, text_hash FROM embeddings "
+                        "ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    )
+                    evicted = cursor.rowcount
+                size -= evicted
+                with self._stats_lock:
+                    self._evictions += evicted
+                logger.debug(f"Evicted {evicted} persistent cache entries")
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache eviction failed: {e}")
+            with self._stats_lock:
+                self._errors += 1
+            return
+
+        with self._stats_lock:
+            self._approx_size = size
+
+    def clear(self) -> None:
+        """Delete all cached vectors and reset statistics."""
+        with self._get_cursor() as cursor:
+            cursor.execute("DELETE FROM embeddings")
+
+        with self._stats_lock:
+            self._approx_size = 0
+            self._hits = 0
+            self._misses = 0
+            self._writes = 0
+            self._evictions = 0
+            self._errors = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics (thread-safe)
+
+        Returns:
+            Dictionary with hits, misses, writes, evictions, errors, size and hit rate
+        """
+        with self._stats_lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "errors": self._errors,
+                "size": self._approx_size,
+                "max_size": self.max_entries,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -8,12 +8,14 @@ Includes caching for performance and batch processing support.
 import hashlib
 import threading
 from collections import OrderedDict
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from src.monitoring.logger import get_logger
+from src.passepartout.embedding_cache import DEFAULT_MAX_ENTRIES, PersistentEmbeddingCache
 
 logger = get_logger("passepartout.embeddings")
 
@@ -24,6 +26,7 @@ class EmbeddingGenerator:
 
     Features:
     - Caching with hash-based lookup
+    - Optional on-disk cache shared across processes and restarts
     - Batch processing for efficiency
     - L2 normalization for cosine similarity
     - Configurable model selection
@@ -39,6 +42,8 @@ class EmbeddingGenerator:
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         cache_size: int = 10000,
         device: Optional[str] = None,
+        persistent_cache_path: Optional[Union[str, Path]] = None,
+        persistent_cache_size: int = DEFAULT_MAX_ENTRIES,
     ):
         """
         Initialize embedding generator
@@ -48,6 +53,9 @@ class EmbeddingGenerator:
                        Default: all-MiniLM-L6-v2 (384 dimensions, fast, good quality)
             cache_size: Maximum number of embeddings to cache
             device: Device for computation ('cuda', 'cpu', or None for auto)
+            persistent_cache_path: SQLite file for the on-disk cache
+                                   (None keeps the cache in memory only)
+            persistent_cache_size: Maximum number of vectors kept on disk
 
         Raises:
             ImportError: If sentence-transformers not installed
@@ -63,6 +71,19 @@ class EmbeddingGenerator:
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Second-level cache, consulted on in-memory misses
+        self._persistent_cache: Optional[PersistentEmbeddingCache] = None
+        if persistent_cache_path is not None:
+            try:
+                self._persistent_cache = PersistentEmbeddingCache(
+                    persistent_cache_path, max_entries=persistent_cache_size
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Persistent embedding cache disabled: {e}",
+                    extra={"path": str(persistent_cache_path)},
+                )
+
         try:
             self.model = SentenceTransformer(model_name, device=device)
             self.embedding_dimension = self.model.get_sentence_embedding_dimension()
@@ -93,7 +114,7 @@ class EmbeddingGenerator:
 
         # Normalize text
         text_normalized = text.strip()
-        cache_key = self._get_cache_key(text_normalized)
+        cache_key = self._get_cache_key(text_normalized, normalize)
 
         # Check cache (thread-safe)
         with self._cache_lock:
@@ -110,6 +131,14 @@ class EmbeddingGenerator:
         with self._stats_lock:
             self._cache_misses += 1
 
+        # Check the on-disk cache before paying for the model
+        if self._persistent_cache is not None:
+            text_hash = self._hash_text(text_normalized)
+            stored = self._persistent_cache.get_many(self.model_name, normalize, [text_hash])
+            if text_hash in stored:
+                self._add_to_cache(cache_key, stored[text_hash])
+                return stored[text_hash].copy()
+
         # Generate embedding (outside lock - expensive operation)
         try:
             embedding = self.model.encode(
@@ -118,6 +147,10 @@ class EmbeddingGenerator:
 
             # Cache result (thread-safe with LRU eviction)
             self._add_to_cache(cache_key, embedding)
+            if self._persistent_cache is not None:
+                self._persistent_cache.put_many(
+                    self.model_name, normalize, [(self._hash_text(text_normalized), embedding)]
+                )
 
             logger.debug(
                 f"Generated embedding for text: {text_normalized[:50]}...",
@@ -168,7 +201,7 @@ class EmbeddingGenerator:
         uncached_indices = []
 
         for i, text in enumerate(texts_normalized):
-            cache_key = self._get_cache_key(text)
+            cache_key = self._get_cache_key(text, normalize)
 
             with self._cache_lock:
                 if cache_key in self._cache:
@@ -184,6 +217,23 @@ class EmbeddingGenerator:
                     uncached_texts.append(text)
                     uncached_indices.append(i)
 
+        # Resolve in-memory misses from the on-disk cache in one query
+        if uncached_texts and self._persistent_cache is not None:
+            hashes = [self._hash_text(text) for text in uncached_texts]
+            stored = self._persistent_cache.get_many(self.model_name, normalize, hashes)
+            if stored:
+                remaining_texts = []
+                remaining_indices = []
+                for text, idx, text_hash in zip(uncached_texts, uncached_indices, hashes):
+                    if text_hash in stored:
+                        self._add_to_cache(self._get_cache_key(text, normalize), stored[text_hash])
+                        embeddings.append((idx, stored[text_hash]))
+                    else:
+                        remaining_texts.append(text)
+                        remaining_indices.append(idx)
+                uncached_texts = remaining_texts
+                uncached_indices = remaining_indices
+
         # Generate embeddings for uncached texts
         if uncached_texts:
             try:
@@ -197,8 +247,17 @@ class EmbeddingGenerator:
 
                 # Cache new embeddings
                 for text, embedding in zip(uncached_texts, new_embeddings):
-                    cache_key = self._get_cache_key(text)
+                    cache_key = self._get_cache_key(text, normalize)
                     self._add_to_cache(cache_key, embedding)
+                if self._persistent_cache is not None:
+                    self._persistent_cache.put_many(
+                        self.model_name,
+                        normalize,
+                        [
+                            (self._hash_text(text), embedding)
+                            for text, embedding in zip(uncached_texts, new_embeddings)
+                        ],
+                    )
 
                 # Add to results
                 for idx, embedding in zip(uncached_indices, new_embeddings):
@@ -249,12 +308,13 @@ class EmbeddingGenerator:
 
         logger.info(f"Cleared embedding cache ({cache_size} entries)")
 
-    def get_cache_stats(self) -> dict[str, int]:
+    def get_cache_stats(self) -> dict[str, Any]:
         """
         Get cache performance statistics (thread-safe)
 
         Returns:
-            Dictionary with cache hits, misses, size, and hit rate
+            Dictionary with cache hits, misses, size, and hit rate, plus
+            "persistent" statistics when the on-disk cache is enabled
         """
         with self._stats_lock:
             total = self._cache_hits + self._cache_misses
@@ -265,25 +325,35 @@ class EmbeddingGenerator:
         with self._cache_lock:
             cache_size = len(self._cache)
 
-        return {
+        stats: dict[str, Any] = {
             "hits": hits,
             "misses": misses,
             "size": cache_size,
             "max_size": self.cache_size,
             "hit_rate": hit_rate,
         }
+        if self._persistent_cache is not None:
+            stats["persistent"] = self._persistent_cache.get_stats()
+        return stats
 
-    def _get_cache_key(self, text: str) -> str:
+    def _get_cache_key(self, text: str, normalize: bool = True) -> str:
         """
         Generate cache key from text using hash
 
         Args:
             text: Normalized text
+            normalize: Whether the embedding is L2-normalized
 
         Returns:
             Hash string for cache lookup
         """
-        # Use SHA256 for collision resistance
+        text_hash = self._hash_text(text)
+        # Normalized and raw vectors for the same text must not collide
+        return text_hash if normalize else f"{text_hash}:raw"
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        """SHA-256 hex digest of text (collision resistant)"""
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
     def _add_to_cache(self, key: str, embedding: np.ndarray) -> None:
@@ -317,7 +387,9 @@ class EmbeddingGenerator:
 
 
 def get_embedding_generator(
-    model_name: str = "sentence-transformers/all-MiniLM-L6-v2", cache_size: int = 10000
+    model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+    cache_size: int = 10000,
+    persistent_cache_path: Optional[Union[str, Path]] = None,
 ) -> EmbeddingGenerator:
     """
     Get or create global embedding generator (singleton pattern)
@@ -325,10 +397,15 @@ def get_embedding_generator(
     Args:
         model_name: HuggingFace model identifier
         cache_size: Maximum cache size
+        persistent_cache_path: SQLite file for the on-disk cache (optional)
 
     Returns:
         EmbeddingGenerator instance
     """
     # For now, just create new instance
     # In production, could use singleton pattern
-    return EmbeddingGenerator(model_name=model_name, cache_size=cache_size)
+    return EmbeddingGenerator(
+        model_name=model_name,
+        cache_size=cache_size,
+        persistent_cache_path=persistent_cache_path,
+    )
@@ -6,7 +6,8 @@ This is used BEFORE the main semantic search to find notes by entity names.
 
 Key features:
 - Exact match on note titles
-- Fuzzy match using difflib (no external dependencies)
+- Fuzzy match using difflib (no external dependencies), narrowed by the
+  NoteManager's bigram title index when available
 - Partial match (entity name appears in note title)
 - Integration with ScapinConfig for entity resolution rules
 
@@ -14,7 +15,6 @@ Part of the v2.2+ context retrieval improvements.
 See TODO list item "Option D" for design decisions.
 """
 
-import unicodedata
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -22,6 +22,8 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from src.core.scapin_config import ScapinConfigReader, get_scapin_config
 from src.monitoring.logger import get_logger
+from src.passepartout.lexical_index import LexicalIndex, fold, tokenize
+from src.passepartout.title_index import TitleIndex, extract_name_from_title, normalize_name
 
 if TYPE_CHECKING:
     from src.passepartout.note_manager import Note, NoteManager
@@ -160,32 +162,7 @@ class EntitySearcher:
         - Accent/diacritic removal (e.g., "Nàutil" -> "nautil")
         - Common abbreviations (M., Mme, Dr, etc.)
         """
-        name = name.lower().strip()
-
-        # Remove accents/diacritics for accent-insensitive matching
-        # NFKD decomposes characters (é -> e + combining accent)
-        # encode('ascii', 'ignore') removes non-ASCII (the combining accents)
-        name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
-
-        # Expand common French abbreviations
-        abbreviations = {
-            "m.": "monsieur",
-            "mme": "madame",
-            "mme.": "madame",
-            "mlle": "mademoiselle",
-            "mlle.": "mademoiselle",
-            "dr": "docteur",
-            "dr.": "docteur",
-            "pr": "professeur",
-            "pr.": "professeur",
-        }
-
-        for abbr, _full in abbreviations.items():
-            if name.startswith(abbr + " "):
-                name = name.replace(abbr + " ", "", 1)
-                break
-
-        return name
+        return normalize_name(name)
 
     def _fuzzy_match(self, s1: str, s2: str) -> float:
         """
@@ -211,16 +188,19 @@ class EntitySearcher:
         - "Marc Dupont - Tech Lead" -> "Marc Dupont"
         - "Projet Alpha (2024)" -> "Projet Alpha"
         """
-        title = title.strip()
-
-        # Split on common separators
-        separators = [" - ", " – ", " — ", " | ", " ("]
-        for sep in separators:
-            if sep in title:
-                title = title.split(sep)[0].strip()
-                break
+        return extract_name_from_title(title)
 
-        return title
+    def _get_title_index(self) -> Optional[TitleIndex]:
+        """The NoteManager's title index, or None to scan cached titles"""
+        get_title_index = getattr(self.note_manager, "get_title_index", None)
+        if get_title_index is None:
+            return None
+        try:
+            title_index = get_title_index()
+        except Exception as e:
+            logger.warning(f"Title index unavailable, scanning titles: {e}")
+            return None
+        return title_index if isinstance(title_index, TitleIndex) else None
 
     def search_entities(
         self,
@@ -240,15 +220,19 @@ class EntitySearcher:
         if include_content_search is None:
             include_content_search = self.search_content
 
-        # Rebuild cache if needed
-        if not self._title_cache_valid:
+        # The title index stays current by itself; the title cache is only
+        # needed (and rebuilt) when scanning
+        title_index = self._get_title_index()
+        if title_index is None and not self._title_cache_valid:
             self._rebuild_title_cache()
 
         results: list[EntitySearchResult] = []
         stats = EntitySearchStats(entities_searched=len(entity_names))
 
         for entity_name in entity_names:
-            entity_results = self._search_single_entity(entity_name, include_content_search)
+            entity_results = self._search_single_entity(
+                entity_name, include_content_search, title_index
+            )
 
             # Apply ScapinConfig rules
             for result in entity_results:
@@ -291,11 +275,62 @@ class EntitySearcher:
         self,
         entity_name: str,
         include_content_search: bool,
+        title_index: Optional[TitleIndex] = None,
     ) -> list[EntitySearchResult]:
         """Search for a single entity name"""
-        results: list[EntitySearchResult] = []
         normalized_entity = self._normalize_name(entity_name)
 
+        if title_index is not None:
+            results = self._search_title_index(title_index, entity_name)
+            seen_note_ids = {r.note.note_id for r in results}
+        else:
+            results, seen_note_ids = self._scan_titles(entity_name, normalized_entity)
+
+        # 4. Content search (if enabled and not enough results)
+        if include_content_search and len(results) < self.max_results_per_entity:
+            content_results = self._search_in_content(
+                entity_name,
+                normalized_entity,
+                seen_note_ids,
+                limit=self.max_results_per_entity - len(results),
+            )
+            results.extend(content_results)
+
+        # Sort by score
+        results.sort(key=lambda r: r.match_score, reverse=True)
+
+        return results
+
+    def _search_title_index(
+        self,
+        title_index: TitleIndex,
+        entity_name: str,
+    ) -> list[EntitySearchResult]:
+        """Exact, fuzzy and partial title/alias matches from the title index"""
+        results: list[EntitySearchResult] = []
+        for match in title_index.search(entity_name, self.fuzzy_threshold, PARTIAL_MATCH_SCORE):
+            note = self.note_manager.get_note(match.note_id)
+            if note is None:
+                continue
+            results.append(
+                EntitySearchResult(
+                    note=note,
+                    entity_name=entity_name,
+                    matched_title=note.title,
+                    match_type=match.match_type,
+                    match_score=match.score,
+                )
+            )
+        return results
+
+    def _scan_titles(
+        self,
+        entity_name: str,
+        normalized_entity: str,
+    ) -> tuple[list[EntitySearchResult], set[str]]:
+        """Exact, fuzzy and partial matches by comparing every cached title"""
+        results: list[EntitySearchResult] = []
+
         # Track seen note IDs to avoid duplicates
         seen_note_ids: set[str] = set()
 
@@ -350,20 +385,7 @@ class EntitySearcher:
                 )
                 seen_note_ids.add(note.note_id)
 
-        # 4. Content search (if enabled and not enough results)
-        if include_content_search and len(results) < self.max_results_per_entity:
-            content_results = self._search_in_content(
-                entity_name,
-                normalized_entity,
-                seen_note_ids,
-                limit=self.max_results_per_entity - len(results),
-            )
-            results.extend(content_results)
-
-        # Sort by score
-        results.sort(key=lambda r: r.match_score, reverse=True)
-
-        return results
+        return results, seen_note_ids
 
     def _search_in_content(
         self,
@@ -372,7 +394,25 @@ class EntitySearcher:
         exclude_ids: set[str],
         limit: int,
     ) -> list[EntitySearchResult]:
-        """Search for entity name in note content"""
+        """
+        Search for entity name in note content
+
+        With a lexical index, only notes containing every term of the name
+        are read (most mentions first); otherwise every cached note is
+        scanned.
+        """
+        lexical_index = getattr(self.note_manager, "lexical_index", None)
+        # Names made only of stopwords or single letters have no postings
+        if isinstance(lexical_index, LexicalIndex) and tokenize(normalized_entity):
+            try:
+                return self._search_in_postings(
+                    lexical_index, entity_name, normalized_entity, exclude_ids, limit
+                )
+            except Exception as e:
+                logger.warning(f"Lexical content search failed, scanning notes: {e}")
+
+        if not self._title_cache_valid:
+            self._rebuild_title_cache()
         results: list[EntitySearchResult] = []
 
         for note in self._title_cache.values():
@@ -402,6 +442,44 @@ class EntitySearcher:
 
         return results
 
+    def _search_in_postings(
+        self,
+        lexical_index: LexicalIndex,
+        entity_name: str,
+        normalized_entity: str,
+        exclude_ids: set[str],
+        limit: int,
+    ) -> list[EntitySearchResult]:
+        """Search for entity name in the content of notes found by the lexical index"""
+        candidates = lexical_index.term_frequencies(normalized_entity)
+        ranked = sorted(candidates.items(), key=lambda item: item[1], reverse=True)
+
+        results: list[EntitySearchResult] = []
+        for note_id, _ in ranked:
+            if len(results) >= limit:
+                break
+            if note_id in exclude_ids:
+                continue
+            note = self.note_manager.get_note(note_id)
+            if note is None:
+                continue
+
+            # Terms may be scattered: confirm the name itself appears
+            mention_count = fold(note.content or "").count(normalized_entity)
+            if not mention_count:
+                continue
+            results.append(
+                EntitySearchResult(
+                    note=note,
+                    entity_name=entity_name,
+                    matched_title=note.title,
+                    match_type="content",
+                    match_score=min(0.7, 0.5 + (mention_count - 1) * 0.05),
+                )
+            )
+
+        return results
+
     def invalidate_cache(self) -> None:
         """Invalidate the title cache (call after note changes)"""
         self._title_cache_valid = False
@@ -7,14 +7,20 @@ Responsible for maintaining the hygiene of notes:
 - detecting broken links (future)
 """
 
+import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Optional
 
 import yaml
 
 from src.monitoring.logger import get_logger
+from src.passepartout.frontmatter_cache import (
+    FRONTMATTER_CACHE_FILENAME,
+    FrontmatterCache,
+    load_yaml,
+)
 
 logger = get_logger("passepartout.janitor")
 
@@ -24,15 +30,27 @@ class NoteJanitor:
     The Janitor cleans up notes and ensures they adhere to the schema.
     """
 
-    def __init__(self, notes_dir: Path):
+    def __init__(self, notes_dir: Path, frontmatter_cache: Optional[FrontmatterCache] = None):
         self.notes_dir = Path(notes_dir)
+        # Files parsed at their current stat (by NoteManager or a previous
+        # run) have valid frontmatter and are not read again
+        self.frontmatter_cache = frontmatter_cache or FrontmatterCache(
+            self.notes_dir / FRONTMATTER_CACHE_FILENAME
+        )
         # Regex to separate frontmatter from content
         self.frontmatter_pattern = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
 
-    def validate_note(self, content: str) -> Tuple[bool, List[str]]:
+    def validate_note(
+        self, content: str, file_key: Optional[tuple[str, int, int]] = None
+    ) -> tuple[bool, list[str]]:
         """
         Validate a note's structure.
 
+        Args:
+            content: Note file content
+            file_key: (relative path, mtime_ns, size) of the file content was
+                read from, to reuse and record the parse in the frontmatter cache
+
         Returns:
             (is_valid, list_of_issues)
         """
@@ -46,7 +64,10 @@ class NoteJanitor:
 
         fm_text = match.group(1)
         try:
-            frontmatter = yaml.safe_load(fm_text)
+            if file_key is not None:
+                frontmatter = self.frontmatter_cache.parse(*file_key, fm_text)
+            else:
+                frontmatter = load_yaml(fm_text)
             if not isinstance(frontmatter, dict):
                 issues.append("Frontmatter is not a dictionary")
         except yaml.YAMLError as e:
@@ -70,7 +91,7 @@ class NoteJanitor:
             body = match.group(2)
 
             try:
-                fm = yaml.safe_load(fm_text) or {}
+                fm = load_yaml(fm_text) or {}
                 if not isinstance(fm, dict):
                     fm = {}  # Forced reset if corrupted
 
@@ -120,8 +141,16 @@ class NoteJanitor:
         for file_path in self.notes_dir.rglob("*.md"):
             stats["scanned"] += 1
             try:
-                content = file_path.read_text(encoding="utf-8")
-                is_valid, issues = self.validate_note(content)
+                rel_path = str(file_path.relative_to(self.notes_dir))
+                stat = file_path.stat()
+                if self.frontmatter_cache.has(rel_path, stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                with open(file_path, encoding="utf-8") as f:
+                    content = f.read()
+                    stat = os.fstat(f.fileno())
+                file_key = (rel_path, stat.st_mtime_ns, stat.st_size)
+                is_valid, issues = self.validate_note(content, file_key)
 
                 if not is_valid:
                     stats["issues_found"] += 1
@@ -138,4 +167,5 @@ class NoteJanitor:
                 stats["errors"] += 1
                 logger.error(f"Error processing {file_path}: {e}")
 
+        self.frontmatter_cache.flush()
         return stats
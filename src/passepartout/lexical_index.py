@@ -0,0 +1,405 @@
+"""
+Persistent BM25 inverted index over notes
+
+Vector search misses exact strings: names, IBANs, ticket numbers, acronyms.
+This index complements it with lexical retrieval:
+
+- Tokens are lowercased and accent-folded ("Réunion" -> "reunion").
+- Alphabetic tokens are reduced with a light French stemmer (plural and
+  feminine endings), so "réunions" matches "réunion". Tokens containing
+  digits are kept verbatim.
+- Compound tokens ("JIRA-1234", "marc@acme.fr") are indexed whole and by
+  part, so both the exact identifier and its pieces match.
+
+Postings live in SQLite (one row per term and note), so adding, updating or
+removing a note only touches that note's rows, and a query only reads the
+postings of its own terms.
+"""
+
+import math
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("passepartout.lexical_index")
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_COMPOUND_RE = re.compile(r"[a-z0-9]+(?:[-_./@'][a-z0-9]+)*")
+_PART_RE = re.compile(r"[a-z0-9]+")
+
+# Frequent French/English words that carry no retrieval value
+STOPWORDS = frozenset({
+    # French
+    "au", "aux", "avec", "avoir", "ce", "ces", "dans", "de", "des", "du", "elle", "en",
+    "est", "et", "ete", "etre", "il", "ils", "je", "la", "le", "les", "leur", "lui", "ma",
+    "mais", "me", "meme", "mes", "moi", "mon", "ne", "nos", "notre", "nous", "on", "ou",
+    "par", "pas", "pour", "qu", "que", "qui", "sa", "se", "ses", "son", "sont", "sur", "ta",
+    "te", "tes", "toi", "ton", "tu", "un", "une", "vos", "votre", "vous",
+    # English
+    "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is",
+    "it", "its", "of", "or", "that", "the", "this", "to", "was", "were", "will", "with",
+})
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents ("Élodie" -> "elodie")"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def stem_fr(token: str) -> str:
+    """
+    Light French stemmer for accent-folded tokens
+
+    Removes plural marks, then feminine / infinitive endings and a final
+    doubled letter (after J. Savoy's light stemmer). Deliberately
+    conservative: names and identifiers must still match exactly.
+
+    Args:
+        token: Accent-folded token
+
+    Returns:
+        Stem
+    """
+    if len(token) <= 4 or not token.isalpha():
+        return token
+
+    if token.endswith("aux"):
+        token = token[:-3] + "al"
+    elif token.endswith(("s", "x")):
+        token = token[:-1]
+
+    if len(token) > 4 and token.endswith(("e", "r")):
+        token = token[:-1]
+    if len(token) > 4 and token[-1] == token[-2]:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Tokenize text into index terms
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Terms in document order (stopwords removed, stems applied)
+    """
+    terms: list[str] = []
+    for compound in _COMPOUND_RE.findall(fold(text)):
+        parts = _PART_RE.findall(compound)
+        if len(parts) > 1:
+            terms.append(compound)
+        for part in parts:
+            if part in STOPWORDS or (len(part) < 2 and not part.isdigit()):
+                continue
+            terms.append(stem_fr(part))
+    return terms
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index stored in SQLite
+
+    Thread- and process-safe: connections are thread-local, and collection
+    statistics (document count, average length) are read from the database
+    with each query, so documents indexed by another process are ranked
+    with the same statistics as local ones.
+
+    Usage:
+        index = LexicalIndex(notes_dir / ".scapin_lexical.db")
+        index.add_document("note-1", "Virement IBAN FR76 3000 6000")
+        index.search("FR76 3000")  # [("note-1", 1.38)]
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Open (or create) an index
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._init_db()
+
+        logger.info(
+            "LexicalIndex initialized",
+            extra={"db_path": self.db_path, "documents": self.document_count()},
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            self._local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+        return self._local.conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for database cursor with auto-commit."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS lexical_docs (
+                    note_id TEXT PRIMARY KEY,
+                    length INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS lexical_postings (
+                    term TEXT NOT NULL,
+                    note_id TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, note_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_postings_note
+                ON lexical_postings(note_id)
+            """)
+
+    @staticmethod
+    def _remove(cursor: sqlite3.Cursor, note_id: str) -> None:
+        """Delete a document's rows"""
+        cursor.execute("DELETE FROM lexical_postings WHERE note_id = ?", (note_id,))
+        cursor.execute("DELETE FROM lexical_docs WHERE note_id = ?", (note_id,))
+
+    @staticmethod
+    def _collection_stats(cursor: sqlite3.Cursor) -> tuple[int, int]:
+        """Document count and total document length"""
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM lexical_docs")
+        doc_count, total_length = cursor.fetchone()
+        return int(doc_count), int(total_length)
+
+    def add_documents(self, documents: list[tuple[str, str]]) -> None:
+        """
+        Index (or re-index) documents in one transaction
+
+        Args:
+            documents: (note_id, text) pairs
+        """
+        if not documents:
+            return
+
+        tokenized = [(note_id, Counter(tokenize(text))) for note_id, text in documents]
+        with self._get_cursor() as cursor:
+            for note_id, counts in tokenized:
+                self._remove(cursor, note_id)
+                length = sum(counts.values())
+                cursor.execute(
+                    "INSERT INTO lexical_docs (note_id, length) VALUES (?, ?)",
+                    (note_id, length),
+                )
+                cursor.executemany(
+                    "INSERT INTO lexical_postings (term, note_id, tf) VALUES (?, ?, ?)",
+                    [(term, note_id, tf) for term, tf in counts.items()],
+                )
+
+    def add_document(self, note_id: str, text: str) -> None:
+        """
+        Index (or re-index) one document
+
+        Args:
+            note_id: Note identifier
+            text: Text to index
+        """
+        self.add_documents([(note_id, text)])
+
+    def remove_document(self, note_id: str) -> None:
+        """
+        Remove a document
+
+        Args:
+            note_id: Note identifier
+        """
+        with self._get_cursor() as cursor:
+            self._remove(cursor, note_id)
+
+    def has_document(self, note_id: str) -> bool:
+        """Whether a document is indexed"""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT 1 FROM lexical_docs WHERE note_id = ?", (note_id,))
+            return cursor.fetchone() is not None
+
+    def document_ids(self) -> set[str]:
+        """Identifiers of all indexed documents"""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT note_id FROM lexical_docs")
+            return {row[0] for row in cursor.fetchall()}
+
+    def document_count(self) -> int:
+        """Number of indexed documents"""
+        with self._get_cursor() as cursor:
+            return self._collection_stats(cursor)[0]
+
+    @staticmethod
+    def _postings(
+        cursor: sqlite3.Cursor, terms: list[str]
+    ) -> dict[str, list[tuple[str, int]]]:
+        """Postings lists of the given terms"""
+        postings: dict[str, list[tuple[str, int]]] = {}
+        for term in terms:
+            cursor.execute("SELECT note_id, tf FROM lexical_postings WHERE term = ?", (term,))
+            postings[term] = cursor.fetchall()
+        return postings
+
+    @staticmethod
+    def _lengths(cursor: sqlite3.Cursor, note_ids: set[str]) -> dict[str, int]:
+        """Document lengths of the given notes"""
+        lengths: dict[str, int] = {}
+        ids = list(note_ids)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            cursor.execute(
+                f"SELECT note_id, length FROM lexical_docs "
+                f"WHERE note_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            lengths.update(cursor.fetchall())
+        return lengths
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        require_all: bool = False,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank documents by BM25
+
+        Args:
+            query: Query text (tokenized like documents)
+            top_k: Maximum number of results
+            require_all: Only return documents containing every query term
+
+        Returns:
+            (note_id, score) pairs, best first
+
+        Raises:
+            ValueError: If top_k is not positive
+        """
+        if top_k <= 0:
+            raise ValueError(f"top_k must be positive, got {top_k}")
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._get_cursor() as cursor:
+            # One read transaction: statistics, postings and lengths come
+            # from the same snapshot, even while another process writes
+            cursor.execute("BEGIN")
+            doc_count, total_length = self._collection_stats(cursor)
+            if not doc_count:
+                return []
+            avg_length = total_length / doc_count
+
+            postings = self._postings(cursor, terms)
+            if require_all:
+                if any(not postings[term] for term in terms):
+                    return []
+                candidates = set.intersection(
+                    *({note_id for note_id, _ in postings[term]} for term in terms)
+                )
+            else:
+                candidates = {note_id for term in terms for note_id, _ in postings[term]}
+            if not candidates:
+                return []
+
+            lengths = self._lengths(cursor, candidates)
+
+        scores: dict[str, float] = dict.fromkeys(candidates, 0.0)
+        for term in terms:
+            df = len(postings[term])
+            if not df:
+                continue
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for note_id, tf in postings[term]:
+                if note_id not in scores:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths.get(note_id, 0) / avg_length)
+                scores[note_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:top_k]
+
+    def term_frequencies(self, query: str) -> dict[str, int]:
+        """
+        Documents containing every query term, with their mention count
+
+        The mention count is the smallest frequency among the query terms,
+        a cheap stand-in for the number of occurrences of the whole phrase.
+
+        Args:
+            query: Query text
+
+        Returns:
+            note_id -> mention count
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return {}
+
+        with self._get_cursor() as cursor:
+            postings = self._postings(cursor, terms)
+        counts: Optional[dict[str, int]] = None
+        for term in terms:
+            term_counts = dict(postings[term])
+            if counts is None:
+                counts = term_counts
+            else:
+                counts = {
+                    note_id: min(tf, term_counts[note_id])
+                    for note_id, tf in counts.items()
+                    if note_id in term_counts
+                }
+            if not counts:
+                return {}
+        return counts or {}
+
+    def clear(self) -> None:
+        """Remove all documents"""
+        with self._get_cursor() as cursor:
+            cursor.execute("DELETE FROM lexical_postings")
+            cursor.execute("DELETE FROM lexical_docs")
+
+    def close(self) -> None:
+        """Close thread-local connection."""
+        if hasattr(self._local, "conn") and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+    def get_stats(self) -> dict[str, float]:
+        """Index statistics"""
+        with self._get_cursor() as cursor:
+            doc_count, total_length = self._collection_stats(cursor)
+        return {
+            "documents": doc_count,
+            "avg_length": round(total_length / doc_count, 1) if doc_count else 0.0,
+        }
@@ -0,0 +1,327 @@
+"""
+Wikilink graph over notes
+
+Resolving a [[wikilink]] by semantic search costs an embedding and a FAISS
+query per link, and finding the backlinks of a note means reading every
+note summary. This graph keeps, for every note, its title, aliases and
+outgoing link texts, and derives:
+
+- name -> note_id resolution (titles win over aliases, then the first
+  note registered), an O(1) dict lookup;
+- backlinks: the notes whose links resolve to a note;
+- broken links: link texts that resolve to no note.
+
+Link texts are matched case-insensitively, without "#heading" / "^block"
+suffixes. The graph is updated note by note and saved as JSON next to the
+notes, so it survives restarts without re-reading every file.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("passepartout.link_graph")
+
+LINK_GRAPH_VERSION = 1
+
+
+def link_key(text: str) -> str:
+    """
+    Normalize a wikilink target or note name for resolution
+
+    "Marc Dupont#Contact" -> "marc dupont"
+
+    Args:
+        text: Link text, title or alias
+
+    Returns:
+        Lookup key ("" if nothing is left)
+    """
+    for marker in ("#", "^"):
+        text = text.split(marker, 1)[0]
+    return " ".join(text.split()).lower()
+
+
+class LinkGraph:
+    """
+    Wikilink resolution index and backlink graph
+
+    Thread-safe: all operations hold a lock.
+
+    Usage:
+        graph = LinkGraph()
+        graph.set_note("marc", "Marc Dupont", aliases=["Marc"], links=["Acme"])
+        graph.set_note("acme", "Acme", aliases=[], links=["Marc"])
+        graph.resolve("marc dupont")  # "marc"
+        graph.backlinks("marc")  # ["acme"]
+    """
+
+    def __init__(self):
+        """Create an empty graph"""
+        self._lock = threading.Lock()
+        # note_id -> {"title": str, "aliases": [...], "links": [...]}
+        self._notes: dict[str, dict[str, Any]] = {}
+        # key -> note IDs with that title / alias, in registration order
+        self._titles: dict[str, dict[str, None]] = {}
+        self._aliases: dict[str, dict[str, None]] = {}
+        # key -> note IDs linking to it
+        self._linked_from: dict[str, set[str]] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._notes)
+
+    def __contains__(self, note_id: str) -> bool:
+        with self._lock:
+            return note_id in self._notes
+
+    @staticmethod
+    def _keys(names: list[str]) -> list[str]:
+        """Distinct non-empty keys of names"""
+        return list(dict.fromkeys(key for key in map(link_key, names) if key))
+
+    def _register_locked(self, note_id: str, record: dict[str, Any]) -> None:
+        """Add a note's names and links to the lookup tables (lock held)"""
+        self._notes[note_id] = record
+        title_key = link_key(record["title"])
+        if title_key:
+            self._titles.setdefault(title_key, {})[note_id] = None
+        for key in self._keys(record["aliases"]):
+            self._aliases.setdefault(key, {})[note_id] = None
+        for key in self._keys(record["links"]):
+            self._linked_from.setdefault(key, set()).add(note_id)
+
+    def _unregister_locked(self, note_id: str) -> None:
+        """Remove a note from the lookup tables (lock held)"""
+        record = self._notes.pop(note_id, None)
+        if record is None:
+            return
+        tables = (
+            (self._titles, [link_key(record["title"])]),
+            (self._aliases, self._keys(record["aliases"])),
+        )
+        for table, keys in tables:
+            for key in keys:
+                owners = table.get(key)
+                if owners is not None:
+                    owners.pop(note_id, None)
+                    if not owners:
+                        del table[key]
+        for key in self._keys(record["links"]):
+            sources = self._linked_from.get(key)
+            if sources is not None:
+                sources.discard(note_id)
+                if not sources:
+                    del self._linked_from[key]
+
+    def set_note(
+        self,
+        note_id: str,
+        title: str,
+        aliases: Optional[list[str]] = None,
+        links: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Add or replace a note
+
+        Args:
+            note_id: Note identifier
+            title: Note title
+            aliases: Alternative names links may use
+            links: Outgoing wikilink texts
+        """
+        record = {"title": title or "", "aliases": list(aliases or []), "links": list(links or [])}
+        with self._lock:
+            if self._notes.get(note_id) == record:
+                return
+            self._unregister_locked(note_id)
+            self._register_locked(note_id, record)
+            self.dirty = True
+
+    def remove_note(self, note_id: str) -> None:
+        """
+        Remove a note (links to it become broken)
+
+        Args:
+            note_id: Note identifier
+        """
+        with self._lock:
+            if note_id in self._notes:
+                self._unregister_locked(note_id)
+                self.dirty = True
+
+    def clear(self) -> None:
+        """Remove all notes"""
+        with self._lock:
+            self._notes.clear()
+            self._titles.clear()
+            self._aliases.clear()
+            self._linked_from.clear()
+            self.dirty = True
+
+    def _resolve_key_locked(self, key: str) -> Optional[str]:
+        """Note a key resolves to (lock held)"""
+        owners = self._titles.get(key) or self._aliases.get(key)
+        return next(iter(owners)) if owners else None
+
+    def resolve(self, text: str) -> Optional[str]:
+        """
+        Resolve a wikilink target to a note
+
+        Args:
+            text: Link text ("Note", "Note#Section", any case)
+
+        Returns:
+            note_id, or None if no note has that title or alias
+        """
+        with self._lock:
+            return self._resolve_key_locked(link_key(text))
+
+    def title(self, note_id: str) -> Optional[str]:
+        """
+        Title of a note
+
+        Args:
+            note_id: Note identifier
+
+        Returns:
+            Title, or None if the note is not in the graph
+        """
+        with self._lock:
+            record = self._notes.get(note_id)
+            return record["title"] if record is not None else None
+
+    def outgoing(self, note_id: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Outgoing links of a note with their resolution
+
+        Args:
+            note_id: Note identifier
+
+        Returns:
+            (link text, target note_id or None) pairs, in link order
+        """
+        with self._lock:
+            record = self._notes.get(note_id)
+            if record is None:
+                return []
+            return [(text, self._resolve_key_locked(link_key(text))) for text in record["links"]]
+
+    def backlinks(self, note_id: str) -> list[str]:
+        """
+        Notes linking to a note by its title or one of its aliases
+
+        Args:
+            note_id: Note identifier
+
+        Returns:
+            Source note IDs (sorted, excluding the note itself)
+        """
+        with self._lock:
+            record = self._notes.get(note_id)
+            if record is None:
+                return []
+            sources: set[str] = set()
+            for key in self._keys([record["title"], *record["aliases"]]):
+                # A shared name links to whichever note it resolves to
+                if self._resolve_key_locked(key) == note_id:
+                    sources.update(self._linked_from.get(key, ()))
+            sources.discard(note_id)
+            return sorted(sources)
+
+    def broken_links(self, note_id: Optional[str] = None) -> dict[str, list[str]]:
+        """
+        Link texts that resolve to no note
+
+        Args:
+            note_id: Restrict to one note's outgoing links (all notes if None)
+
+        Returns:
+            source note_id -> its broken link texts
+        """
+        with self._lock:
+            note_ids = [note_id] if note_id is not None else list(self._notes)
+            broken: dict[str, list[str]] = {}
+            for source_id in note_ids:
+                record = self._notes.get(source_id)
+                if record is None:
+                    continue
+                texts = [
+                    text
+                    for text in record["links"]
+                    if self._resolve_key_locked(link_key(text)) is None
+                ]
+                if texts:
+                    broken[source_id] = texts
+            return broken
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the graph to a JSON file (atomically)
+
+        Args:
+            path: Target file
+        """
+        path = Path(path)
+        with self._lock:
+            payload = {"version": LINK_GRAPH_VERSION, "notes": self._notes}
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            tmp_path.replace(path)
+            self.dirty = False
+
+    def load(self, path: Union[str, Path]) -> bool:
+        """
+        Replace the graph with one saved by save()
+
+        Args:
+            path: Source file
+
+        Returns:
+            True if loaded, False if missing, unreadable or of another version
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load link graph", extra={"path": str(path), "error": str(e)})
+            return False
+        if payload.get("version") != LINK_GRAPH_VERSION:
+            return False
+
+        with self._lock:
+            self._notes.clear()
+            self._titles.clear()
+            self._aliases.clear()
+            self._linked_from.clear()
+            for note_id, record in payload.get("notes", {}).items():
+                self._register_locked(
+                    note_id,
+                    {
+                        "title": record.get("title", ""),
+                        "aliases": list(record.get("aliases", [])),
+                        "links": list(record.get("links", [])),
+                    },
+                )
+            self.dirty = False
+        return True
+
+    def get_stats(self) -> dict[str, int]:
+        """Graph statistics"""
+        with self._lock:
+            links = sum(len(record["links"]) for record in self._notes.values())
+            broken = sum(
+                1
+                for record in self._notes.values()
+                for text in record["links"]
+                if self._resolve_key_locked(link_key(text)) is None
+            )
+            return {"notes": len(self._notes), "links": links, "broken_links": broken}
@@ -0,0 +1,274 @@
+"""
+Structured metadata pre-filters for VectorStore
+
+Inverted bitset index over selected metadata fields. A filter is resolved
+to a bitmap over index IDs before vector scoring, and handed to FAISS as an
+IDSelectorBitmap, so selective filters still return a full top_k instead of
+running out of post-filtered candidates.
+
+Bitsets are Python ints: bit i is index ID i. Their little-endian byte
+encoding is exactly the bitmap layout IDSelectorBitmap expects.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional, Union
+
+import numpy as np
+
+# Metadata fields indexed for equality / membership filters
+DEFAULT_FILTER_FIELDS = ("tags", "entities", "type", "folder")
+
+# Metadata fields indexed for date range filters (ISO 8601 strings or datetimes)
+DEFAULT_DATE_FIELDS = ("created_at", "updated_at")
+
+
+@dataclass
+class MetadataFilter:
+    """
+    Structured filter on document metadata
+
+    Conditions are combined with AND; the values listed for one field are
+    combined with OR. List-valued metadata (tags, entities) matches when any
+    element matches.
+
+    Attributes:
+        match: Field -> accepted value(s), e.g. {"tags": ["projet", "urgent"]}
+        date_field: Date field used by date_from/date_to
+        date_from: Inclusive lower bound
+        date_to: Inclusive upper bound
+
+    Usage:
+        MetadataFilter(match={"type": "personne"}, date_from=datetime(2025, 1, 1))
+    """
+
+    match: dict[str, Union[str, list[str]]] = field(default_factory=dict)
+    date_field: str = "updated_at"
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        """Whether the filter has no conditions"""
+        return not self.match and self.date_from is None and self.date_to is None
+
+    def matches(self, metadata: dict[str, Any]) -> bool:
+        """
+        Check one document's metadata against the filter
+
+        Same semantics as MetadataBitsetIndex.resolve(), for candidates that
+        do not come from a VectorStore search (e.g. lexical hits).
+
+        Args:
+            metadata: Document metadata
+
+        Returns:
+            True if the document passes every condition
+        """
+        for name, accepted in self.match.items():
+            values = MetadataBitsetIndex._values(metadata.get(name))
+            if not set(values) & set(MetadataBitsetIndex._values(accepted)):
+                return False
+
+        if self.date_from is not None or self.date_to is not None:
+            timestamp = _to_timestamp(metadata.get(self.date_field))
+            # NaN (missing date) compares False, so undated documents drop out
+            if self.date_from is not None and not timestamp >= self.date_from.timestamp():
+                return False
+            if self.date_to is not None and not timestamp <= self.date_to.timestamp():
+                return False
+        return True
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert an ISO string or datetime to a POSIX timestamp (NaN if invalid)"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return float("nan")
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float("nan")
+
+
+class MetadataBitsetIndex:
+    """
+    Inverted index: (field, value) -> bitset of index IDs
+
+    Not thread-safe on its own; VectorStore calls it under _store_lock.
+    """
+
+    def __init__(
+        self,
+        fields: tuple[str, ...] = DEFAULT_FILTER_FIELDS,
+        date_fields: tuple[str, ...] = DEFAULT_DATE_FIELDS,
+    ):
+        """
+        Initialize an empty index
+
+        Args:
+            fields: Metadata fields indexed for match filters
+            date_fields: Metadata fields indexed for date range filters
+        """
+        self.fields = tuple(fields)
+        self.date_fields = tuple(date_fields)
+        self._postings: dict[str, dict[str, int]] = {f: {} for f in self.fields}
+        self._dates: dict[str, np.ndarray] = {
+            f: np.full(0, np.nan, dtype=np.float64) for f in self.date_fields
+        }
+
+    @staticmethod
+    def _values(raw: Any) -> list[str]:
+        """Normalize a metadata value to a list of string keys"""
+        if raw is None:
+            return []
+        if isinstance(raw, (list, tuple, set)):
+            return [str(v) for v in raw if v is not None]
+        return [str(raw)]
+
+    def _ensure_date_capacity(self, index_id: int) -> None:
+        """Grow date arrays (geometrically) to hold index_id"""
+        for name, array in self._dates.items():
+            if index_id >= len(array):
+                grown = np.full(max(index_id + 1, len(array) * 2, 64), np.nan, dtype=np.float64)
+                grown[: len(array)] = array
+                self._dates[name] = grown
+
+    def add(self, index_id: int, metadata: dict[str, Any]) -> None:
+        """
+        Index a document's metadata
+
+        Args:
+            index_id: Document index ID
+            metadata: Document metadata
+        """
+        bit = 1 << index_id
+        for name in self.fields:
+            postings = self._postings[name]
+            for value in self._values(metadata.get(name)):
+                postings[value] = postings.get(value, 0) | bit
+
+        if self.date_fields:
+            self._ensure_date_capacity(index_id)
+            for name in self.date_fields:
+                self._dates[name][index_id] = _to_timestamp(metadata.get(name))
+
+    def build(self, documents: list[tuple[int, dict[str, Any]]]) -> None:
+        """
+        Replace the index contents in one pass
+
+        Faster than repeated add() on large stores: each bitset is built once
+        from its posting list instead of being copied on every insert.
+
+        Args:
+            documents: (index_id, metadata) pairs
+        """
+        self.clear()
+        if not documents:
+            return
+
+        id_bound = max(index_id for index_id, _ in documents) + 1
+        postings: dict[str, dict[str, list[int]]] = {f: {} for f in self.fields}
+        for index_id, metadata in documents:
+            for name in self.fields:
+                for value in self._values(metadata.get(name)):
+                    postings[name].setdefault(value, []).append(index_id)
+
+        for name, values in postings.items():
+            for value, ids in values.items():
+                mask = np.zeros(id_bound, dtype=bool)
+                mask[ids] = True
+                self._postings[name][value] = int.from_bytes(
+                    np.packbits(mask, bitorder="little").tobytes(), "little"
+                )
+
+        if self.date_fields:
+            self._ensure_date_capacity(id_bound - 1)
+            for index_id, metadata in documents:
+                for name in self.date_fields:
+                    self._dates[name][index_id] = _to_timestamp(metadata.get(name))
+
+    def remove(self, index_id: int, metadata: dict[str, Any]) -> None:
+        """
+        Unindex a document's metadata
+
+        Args:
+            index_id: Document index ID
+            metadata: Metadata the document was indexed with
+        """
+        mask = ~(1 << index_id)
+        for name in self.fields:
+            postings = self._postings[name]
+            for value in self._values(metadata.get(name)):
+                if value in postings:
+                    remaining = postings[value] & mask
+                    if remaining:
+                        postings[value] = remaining
+                    else:
+                        del postings[value]
+
+        for name in self.date_fields:
+            if index_id < len(self._dates[name]):
+                self._dates[name][index_id] = np.nan
+
+    def clear(self) -> None:
+        """Drop all postings"""
+        self._postings = {f: {} for f in self.fields}
+        self._dates = {f: np.full(0, np.nan, dtype=np.float64) for f in self.date_fields}
+
+    def resolve(self, metadata_filter: MetadataFilter, id_bound: int) -> np.ndarray:
+        """
+        Resolve a filter to a packed bitmap over index IDs [0, id_bound)
+
+        Args:
+            metadata_filter: Filter to resolve
+            id_bound: One past the highest index ID in use
+
+        Returns:
+            uint8 bitmap (little-endian bit order) suitable for IDSelectorBitmap
+
+        Raises:
+            ValueError: If the filter uses a field that is not indexed
+        """
+        nbytes = (id_bound + 7) // 8
+        selected: Optional[int] = None
+
+        for name, accepted in metadata_filter.match.items():
+            if name not in self._postings:
+                raise ValueError(
+                    f"Metadata field '{name}' is not indexed for filtering. "
+                    f"Indexed fields: {self.fields}"
+                )
+            postings = self._postings[name]
+            field_bits = 0
+            for value in self._values(accepted):
+                field_bits |= postings.get(value, 0)
+            selected = field_bits if selected is None else selected & field_bits
+            if not selected:
+                return np.zeros(nbytes, dtype=np.uint8)
+
+        if selected is None:
+            bitmap = np.full(nbytes, 0xFF, dtype=np.uint8)
+        else:
+            bitmap = np.frombuffer(selected.to_bytes(nbytes, "little"), dtype=np.uint8).copy()
+
+        if metadata_filter.date_from is not None or metadata_filter.date_to is not None:
+            name = metadata_filter.date_field
+            if name not in self._dates:
+                raise ValueError(
+                    f"Date field '{name}' is not indexed for filtering. "
+                    f"Indexed date fields: {self.date_fields}"
+                )
+            dates = np.full(id_bound, np.nan, dtype=np.float64)
+            known = min(id_bound, len(self._dates[name]))
+            dates[:known] = self._dates[name][:known]
+
+            # NaN (missing date) compares False, so undated documents drop out
+            in_range = np.ones(id_bound, dtype=bool)
+            if metadata_filter.date_from is not None:
+                in_range &= dates >= metadata_filter.date_from.timestamp()
+            if metadata_filter.date_to is not None:
+                in_range &= dates <= metadata_filter.date_to.timestamp()
+            bitmap &= np.packbits(in_range, bitorder="little")
+
+        return bitmap
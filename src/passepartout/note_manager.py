@@ -23,12 +23,23 @@ import yaml
 from src.core.events import Entity
 from src.monitoring.logger import get_logger
 from src.passepartout.embeddings import EmbeddingGenerator
+from src.passepartout.frontmatter_cache import (
+    FRONTMATTER_CACHE_FILENAME,
+    FrontmatterCache,
+    load_yaml,
+)
 from src.passepartout.frontmatter_parser import FrontmatterParser
 from src.passepartout.frontmatter_schema import AnyFrontmatter, PersonneFrontmatter
 from src.passepartout.git_versioning import GitVersionManager
+from src.passepartout.lexical_index import LexicalIndex
+from src.passepartout.link_graph import LinkGraph
+from src.passepartout.metadata_filter import MetadataFilter
 from src.passepartout.note_types import ImportanceLevel, NoteStatus, NoteType
+from src.passepartout.passage_index import PassageIndex, extract_snippet
 from src.passepartout.templates import TemplateManager
+from src.passepartout.title_index import TitleIndex
 from src.passepartout.vector_store import VectorStore
+from src.utils import get_data_dir
 
 logger = get_logger("passepartout.note_manager")
 
@@ -38,6 +49,26 @@ DEFAULT_CACHE_MAX_SIZE = 2000  # Maximum notes to keep in memory
 # Trash folder for soft-deleted notes
 TRASH_FOLDER = "_Supprimées"
 
+# Incremental index sync: per-note (mtime, size, content hash) records
+SYNC_STATE_FILENAME = "sync_state.json"
+# Snapshot the vector index after this many journaled mutations
+INDEX_CHECKPOINT_INTERVAL = 200
+# On-disk embedding cache shared by every process, in the data directory (not
+# the notes directory, which may be synced or versioned)
+EMBEDDING_CACHE_FILENAME = "embeddings.db"
+# Passage index of long notes, saved inside the vector index directory
+PASSAGE_INDEX_DIRNAME = "passages"
+# Default length of query-specific note snippets
+DEFAULT_SNIPPET_CHARS = 200
+# BM25 inverted index of note text (exact names, identifiers, acronyms)
+LEXICAL_INDEX_FILENAME = ".scapin_lexical.db"
+# Wikilink graph (titles, aliases, outgoing links of every note)
+LINK_GRAPH_FILENAME = ".scapin_links.json"
+# search_notes() retrieval modes
+SEARCH_MODES = ("vector", "lexical", "hybrid")
+# Reciprocal rank fusion constant (Cormack et al., 2009)
+RRF_K = 60
+
 
 def _is_visible_note_path(file_path: Path) -> bool:
     """Check if a note path is visible (not hidden, not in trash)."""
@@ -118,6 +149,8 @@ class NoteManager:
         auto_index: bool = True,
         git_enabled: bool = True,
         cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        index_passages: bool = True,
+        index_lexical: bool = True,
     ):
         """
         Initialize note manager
@@ -125,10 +158,15 @@ class NoteManager:
         Args:
             notes_dir: Directory to store notes
             vector_store: VectorStore instance (creates new if None)
-            embedder: EmbeddingGenerator instance (creates new if None)
+            embedder: EmbeddingGenerator instance (creates new if None, with
+                      an on-disk embedding cache in notes_dir)
             auto_index: Whether to automatically index existing notes on init
             git_enabled: Whether to enable Git versioning
             cache_max_size: Maximum number of notes to keep in LRU cache
+            index_passages: Whether to also index long notes passage by
+                            passage (needs a real VectorStore)
+            index_lexical: Whether to maintain a BM25 index of note text for
+                           lexical and hybrid search (needs a real VectorStore)
 
         Raises:
             ValueError: If notes_dir is invalid
@@ -144,14 +182,44 @@ class NoteManager:
         # { note_id: { title, path, updated_at, pinned, tags } }
         self._notes_metadata: dict[str, dict[str, Any]] = {}
 
+        # Incremental sync state: { note_id: { path, mtime_ns, size, content_hash } }
+        self._sync_state: dict[str, dict[str, Any]] = {}
+        self._sync_lock = threading.RLock()
+        self._mutations_since_save = 0
+
         # Initialize embedder and vector store
-        self.embedder = embedder if embedder is not None else EmbeddingGenerator()
+        self.embedder = (
+            embedder
+            if embedder is not None
+            else EmbeddingGenerator(
+                persistent_cache_path=get_data_dir() / EMBEDDING_CACHE_FILENAME
+            )
+        )
         self.vector_store = (
             vector_store
             if vector_store is not None
             else VectorStore(dimension=self.embedder.get_dimension(), embedder=self.embedder)
         )
 
+        # Passage index: makes the body of long notes searchable past the
+        # embedding model's truncation limit
+        self.passage_index: Optional[PassageIndex] = None
+        if index_passages and isinstance(self.vector_store, VectorStore):
+            self.passage_index = PassageIndex(
+                dimension=self.vector_store.dimension,
+                embedder=self.vector_store.embedder,
+                metric=self.vector_store.metric,
+            )
+        self._passages_need_backfill = False
+
+        # Lexical index: exact-term retrieval for names, identifiers and
+        # acronyms that embeddings blur. Reconciled with the vector index on
+        # the first sync, since either may have been saved without the other.
+        self.lexical_index: Optional[LexicalIndex] = None
+        if index_lexical and isinstance(self.vector_store, VectorStore):
+            self.lexical_index = LexicalIndex(self.notes_dir / LEXICAL_INDEX_FILENAME)
+        self._lexical_needs_reconcile = self.lexical_index is not None
+
         # Initialize Git versioning if enabled
         self.git: Optional[GitVersionManager] = None
         if git_enabled:
@@ -175,10 +243,25 @@ class NoteManager:
         # Frontmatter Parser for typed frontmatter access
         self._frontmatter_parser = FrontmatterParser()
 
+        # Parsed YAML frontmatter of unchanged files, across restarts
+        self.frontmatter_cache = FrontmatterCache(self.notes_dir / FRONTMATTER_CACHE_FILENAME)
+
         # Aliases index cache (title.lower() -> note_id, alias.lower() -> note_id)
         self._aliases_index: dict[str, str] = {}
         self._aliases_index_dirty = True  # Needs rebuild
 
+        # Fuzzy title/alias index for entity lookups: built on first use,
+        # then kept current note by note
+        self._title_index: Optional[TitleIndex] = None
+        self._title_index_lock = threading.Lock()
+
+        # Wikilink graph: loaded from disk if saved, otherwise built from all
+        # notes on first use. Kept current note by note either way.
+        self.link_graph = LinkGraph()
+        self._link_graph_path = self.notes_dir / LINK_GRAPH_FILENAME
+        self._link_graph_ready = self.link_graph.load(self._link_graph_path)
+        self._link_graph_lock = threading.Lock()
+
         # LRU cache: OrderedDict maintains insertion order for LRU eviction
         self._note_cache: OrderedDict[str, Note] = OrderedDict()
         self._cache_max_size = cache_max_size
@@ -200,11 +283,18 @@ class NoteManager:
         )
 
         # Always try to load existing index from disk
-        # If auto_index is True, rebuild if index doesn't exist or is stale
+        # If auto_index is True, re-embed only notes changed since the last
+        # save, or build the index from scratch if none could be loaded
         index_loaded = self._try_load_index()
-        if auto_index and not index_loaded:
-            self._index_all_notes()
-            self._save_index()
+        if auto_index:
+            if index_loaded:
+                self.sync_index()
+            else:
+                if self.lexical_index is not None:
+                    self.lexical_index.clear()
+                self._lexical_needs_reconcile = False
+                self._index_all_notes()
+                self._save_index()
 
     def _extract_wikilinks(self, content: str) -> list[str]:
         """
@@ -311,22 +401,15 @@ class NoteManager:
         Triggers rebuild if:
         - Index file doesn't exist
         - Index is empty (0 documents)
-        - Index is older than 24 hours
+
+        Staleness is no longer judged by age: sync_index() brings a loaded
+        index up to date by re-embedding only changed notes.
         """
         # Check if index exists
         if not self._index_path.exists():
             logger.info("No index cache found, will rebuild")
             return False
 
-        # Check index age (rebuild if older than 24 hours)
-        index_age_hours = self._get_index_age_hours()
-        if index_age_hours is not None and index_age_hours > 24:
-            logger.info(
-                "Index is stale, will rebuild",
-                extra={"age_hours": round(index_age_hours, 1), "threshold_hours": 24},
-            )
-            return False
-
         try:
             self.vector_store.load(self._index_path)
             doc_count = len(self.vector_store.id_to_doc)
@@ -338,9 +421,16 @@ class NoteManager:
 
             logger.info(
                 "Loaded index from disk",
-                extra={"path": str(self._index_path), "documents": doc_count},
+                extra={
+                    "path": str(self._index_path),
+                    "documents": doc_count,
+                    "age_hours": self._get_index_age_hours(),
+                },
             )
 
+            self._load_sync_state()
+            self._load_passage_index()
+
             # Load metadata index for fast tree building
             if not self._load_metadata_index():
                 # Rebuild if metadata index doesn't exist
@@ -375,16 +465,573 @@ class NoteManager:
         except Exception:
             return None
 
+    def _load_passage_index(self) -> None:
+        """Load the passage index saved alongside the vector index"""
+        if self.passage_index is None:
+            return
+
+        passage_path = self._index_path / PASSAGE_INDEX_DIRNAME
+        try:
+            self.passage_index.load(passage_path)
+        except Exception as e:
+            # Index saved before passages existed (or unreadable): the next
+            # sync_index() splits every long note once
+            if passage_path.exists():
+                logger.warning("Failed to load passage index", extra={"error": str(e)})
+            self.passage_index.clear()
+            self._passages_need_backfill = True
+
     def _save_index(self) -> None:
-        """Save vector index to disk for faster startup"""
+        """Save vector index and sync state to disk for faster startup"""
         try:
-            self.vector_store.save(self._index_path)
+            with self._sync_lock:
+                self.vector_store.save(self._index_path)
+                if self.passage_index is not None:
+                    self.passage_index.save(self._index_path / PASSAGE_INDEX_DIRNAME)
+                self._save_sync_state()
+                self._mutations_since_save = 0
             logger.info("Saved index to disk", extra={"path": str(self._index_path)})
         except Exception as e:
             logger.warning(
                 "Failed to save index cache", extra={"path": str(self._index_path), "error": str(e)}
             )
 
+    # === INCREMENTAL INDEX SYNC ===
+
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        """Hash of the text that gets embedded for a note"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _note_search_text(note: Note) -> str:
+        """Text embedded in the vector store for a note"""
+        return f"{note.title}\n\n{note.content}"
+
+    def _note_vector_metadata(self, note: Note) -> dict[str, Any]:
+        """Metadata stored alongside a note's embedding (filterable: type, folder, tags, ...)"""
+        folder = ""
+        if note.file_path:
+            try:
+                rel_parent = note.file_path.relative_to(self.notes_dir).parent
+                folder = "" if rel_parent == Path(".") else str(rel_parent)
+            except ValueError:
+                pass
+
+        return {
+            "title": note.title,
+            "type": (note.metadata or {}).get("type"),
+            "folder": folder,
+            "tags": note.tags or [],
+            "created_at": note.created_at.isoformat() if note.created_at else None,
+            "updated_at": note.updated_at.isoformat() if note.updated_at else None,
+            "entities": [e.value for e in note.entities],
+            "outgoing_links": note.outgoing_links,
+        }
+
+    def _index_note_derived(self, notes: list[Note]) -> None:
+        """(Re)index the passages, terms and titles of notes whose embedded text changed"""
+        if not notes:
+            return
+        for note in notes:
+            self._update_title_index(note)
+            self._update_link_graph(note)
+        if self.lexical_index is not None:
+            try:
+                self.lexical_index.add_documents(
+                    [(note.note_id, self._note_search_text(note)) for note in notes]
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to index note terms",
+                    extra={"count": len(notes), "error": str(e)},
+                )
+        if self.passage_index is None:
+            return
+        try:
+            self.passage_index.index_notes(
+                [
+                    (note.note_id, note.title, note.content, self._note_vector_metadata(note))
+                    for note in notes
+                ]
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to index note passages",
+                extra={"count": len(notes), "error": str(e)},
+            )
+
+    def _update_derived_metadata(self, note: Note) -> None:
+        """Refresh the note metadata copied to a note's passages and title entry"""
+        if self.passage_index is not None:
+            self.passage_index.update_metadata(note.note_id, self._note_vector_metadata(note))
+        # Aliases live in the frontmatter
+        self._update_title_index(note)
+        self._update_link_graph(note)
+
+    def _remove_note_derived(self, note_id: str) -> None:
+        """Drop a note's passages, terms and title entry"""
+        if self.passage_index is not None:
+            self.passage_index.remove_note(note_id)
+        if self.lexical_index is not None:
+            self.lexical_index.remove_document(note_id)
+        if self._title_index is not None:
+            self._title_index.remove_note(note_id)
+        if self._link_graph_ready:
+            self.link_graph.remove_note(note_id)
+
+    def _note_aliases(self, note: Note) -> list[str]:
+        """Frontmatter aliases of a note (empty if unparseable)"""
+        try:
+            return [alias for alias in self._frontmatter_parser.parse(note.metadata).aliases if alias]
+        except Exception:
+            return []
+
+    def _update_link_graph(self, note: Note) -> None:
+        """Record a note's names and outgoing links, once the link graph exists"""
+        if self._link_graph_ready:
+            self.link_graph.set_note(
+                note.note_id, note.title, self._note_aliases(note), note.outgoing_links
+            )
+
+    def _save_link_graph(self) -> None:
+        """Save the link graph if it changed since the last save"""
+        if not (self._link_graph_ready and self.link_graph.dirty):
+            return
+        try:
+            self.link_graph.save(self._link_graph_path)
+        except Exception as e:
+            logger.warning("Failed to save link graph", extra={"error": str(e)})
+
+    def _update_title_index(self, note: Note) -> None:
+        """(Re)index a note's title and aliases, once the title index exists"""
+        if self._title_index is not None:
+            self._title_index.add_note(note.note_id, note.title, self._note_aliases(note))
+
+    def _has_current_vector_metadata(self, note_id: str) -> bool:
+        """Whether a note is indexed with metadata in the current layout"""
+        doc = self.vector_store.get_document(note_id)
+        # Indexes built before filterable fields existed lack "folder"
+        return doc is not None and "folder" in doc["metadata"]
+
+    def _load_sync_state(self) -> None:
+        """Load per-note sync records saved alongside the vector index"""
+        import json
+
+        state_path = self._index_path / SYNC_STATE_FILENAME
+        if not state_path.exists():
+            return
+
+        try:
+            with open(state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            with self._sync_lock:
+                self._sync_state = state
+        except Exception as e:
+            # Without records every note is re-hashed, but nothing re-embedded
+            logger.warning("Failed to load index sync state", extra={"error": str(e)})
+
+    def _save_sync_state(self) -> None:
+        """Persist per-note sync records (atomic write)"""
+        import json
+
+        from src.utils.file_utils import atomic_write
+
+        with self._sync_lock:
+            payload = json.dumps(self._sync_state, separators=(",", ":"))
+        if not atomic_write(self._index_path / SYNC_STATE_FILENAME, payload):
+            logger.warning("Failed to save index sync state")
+
+    def _record_indexed(self, note: Note, content_hash: Optional[str] = None) -> None:
+        """
+        Record the file state a note was indexed from
+
+        Args:
+            note: Note as read from / written to disk
+            content_hash: Hash of the embedded text (computed if omitted)
+        """
+        if note.file_path is None:
+            return
+        try:
+            stat = note.file_path.stat()
+            rel_path = str(note.file_path.relative_to(self.notes_dir))
+        except (OSError, ValueError):
+            return
+
+        if content_hash is None:
+            content_hash = self._content_hash(self._note_search_text(note))
+
+        with self._sync_lock:
+            self._sync_state[note.note_id] = {
+                "path": rel_path,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "content_hash": content_hash,
+            }
+
+    def _forget_indexed(self, note_id: str) -> None:
+        """Drop a note's sync record"""
+        with self._sync_lock:
+            self._sync_state.pop(note_id, None)
+
+    def _after_index_mutation(self, count: int = 1) -> None:
+        """
+        Count vector store mutations and checkpoint the index periodically
+
+        Mutations are already journaled by the vector store; checkpointing
+        only bounds how much journal has to be replayed at startup.
+        """
+        with self._sync_lock:
+            self._mutations_since_save += count
+            due = self._mutations_since_save >= INDEX_CHECKPOINT_INTERVAL
+        if due and self._index_path.exists():
+            self._save_index()
+
+    def reindex_note(self, note_id: str) -> bool:
+        """
+        Re-read a note from disk and refresh its vector index entry
+
+        Use after the note file was changed outside NoteManager (e.g. a Git
+        restore). Skips re-embedding when the embedded text is unchanged.
+
+        Args:
+            note_id: Note identifier
+
+        Returns:
+            True if the note was found and indexed, False otherwise
+        """
+        with self._cache_lock:
+            self._note_cache.pop(note_id, None)
+
+        note = self.get_note(note_id)
+        if not note:
+            return False
+
+        search_text = self._note_search_text(note)
+        content_hash = self._content_hash(search_text)
+        metadata = self._note_vector_metadata(note)
+        existing = self.vector_store.get_document(note_id)
+
+        if existing is not None and self._content_hash(existing["text"]) == content_hash:
+            self.vector_store.update_metadata(note_id, metadata)
+            self._update_derived_metadata(note)
+            self._after_index_mutation()
+        else:
+            self.vector_store.remove(note_id)
+            self.vector_store.add(doc_id=note_id, text=search_text, metadata=metadata)
+            self._index_note_derived([note])
+            self._after_index_mutation(2)
+
+        self._record_indexed(note, content_hash)
+        self._update_metadata_index(note)
+        self._save_metadata_index()
+        return True
+
+    def sync_index(self) -> dict[str, int]:
+        """
+        Bring the vector index up to date with the notes directory
+
+        Only files whose mtime/size differ from their sync record are read.
+        Of those, only notes whose embedded text actually changed are
+        re-embedded; metadata-only changes update the stored metadata.
+        Notes whose file disappeared are removed from the index.
+
+        Returns:
+            Counts of added, updated, removed and unchanged notes
+        """
+        import time
+
+        start_time = time.time()
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        with self._sync_lock:
+            seen: set[str] = set()
+            changed_files: list[Path] = []
+
+            for file_path in self.notes_dir.rglob("*.md"):
+                if not _is_visible_note_path(file_path):
+                    continue
+                seen.add(file_path.stem)
+                if self._file_needs_sync(file_path):
+                    changed_files.append(file_path)
+                else:
+                    stats["unchanged"] += 1
+
+            self._sync_files_locked(changed_files, stats)
+
+            # Notes whose file is gone (deleted, moved to trash, renamed)
+            indexed_ids = set(self._sync_state) | set(self.vector_store.doc_id_to_index_id)
+            self._remove_missing_notes_locked(indexed_ids - seen, stats)
+
+            backfilled = self._backfill_passages() if self._passages_need_backfill else 0
+            if self._lexical_needs_reconcile:
+                backfilled += self._reconcile_lexical_index()
+
+        if stats["added"] or stats["updated"] or stats["removed"] or backfilled:
+            self.invalidate_aliases_index()
+            self._save_metadata_index()
+            self._save_index()
+        elif changed_files:
+            # Only stat records changed; no need to rewrite the vector snapshot
+            self._save_sync_state()
+            self.frontmatter_cache.flush()
+
+        logger.info(
+            "Synced vector index",
+            extra={**stats, "elapsed_seconds": round(time.time() - start_time, 2)},
+        )
+        return stats
+
+    def sync_files(self, paths: list[Path]) -> dict[str, str]:
+        """
+        Bring the index up to date for specific files only
+
+        For a filesystem watcher: the given paths (created, modified,
+        deleted or moved files) are synced like sync_index() would, without
+        scanning the rest of the notes directory. Files NoteManager wrote
+        itself match their sync record and are skipped. A folder path
+        stands for every note under it: the notes on disk when the folder
+        exists, the indexed notes when it was removed or moved away.
+
+        Args:
+            paths: Note file or folder paths (absolute, or relative to notes_dir)
+
+        Returns:
+            note_id -> "created", "modified" or "deleted", for notes that changed
+        """
+        present: list[Path] = []
+        present_ids: set[str] = set()
+        gone: set[str] = set()
+        gone_folders: list[str] = []
+        for path in paths:
+            path = Path(path)
+            file_path = path if path.is_absolute() else self.notes_dir / path
+            if file_path.is_dir():
+                # Created or moved-in folder: its notes produce no events of their own
+                for note_path in file_path.rglob("*.md"):
+                    if note_path.is_file() and _is_visible_note_path(note_path):
+                        present.append(note_path)
+                        present_ids.add(note_path.stem)
+                continue
+            if file_path.suffix != ".md":
+                if not file_path.exists() and file_path.is_relative_to(self.notes_dir):
+                    gone_folders.append(str(file_path.relative_to(self.notes_dir)))
+                continue
+            if file_path.is_file() and _is_visible_note_path(file_path):
+                present.append(file_path)
+                present_ids.add(file_path.stem)
+            else:
+                gone.add(file_path.stem)
+
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._sync_lock:
+            changed_files = [p for p in dict.fromkeys(present) if self._file_needs_sync(p)]
+            changes = self._sync_files_locked(changed_files, stats)
+
+            # Removed or moved-away folder: every note indexed under it
+            for folder in gone_folders:
+                prefix = folder + os.sep
+                gone.update(
+                    note_id
+                    for note_id, record in self._sync_state.items()
+                    if record.get("path", "").startswith(prefix)
+                )
+
+            # A moved note is gone from one path but present at another
+            missing = set()
+            for note_id in gone - present_ids:
+                record = self._sync_state.get(note_id)
+                folder = self._notes_metadata.get(note_id, {}).get("path", "")
+                known_paths = [self.notes_dir / folder / f"{note_id}.md"]
+                if record is not None:
+                    known_paths.append(self.notes_dir / record["path"])
+                if not any(path.exists() for path in known_paths):
+                    missing.add(note_id)
+            for note_id in self._remove_missing_notes_locked(missing, stats):
+                changes[note_id] = "deleted"
+
+        if changes:
+            self.invalidate_aliases_index()
+            self._save_metadata_index()
+        if changed_files or missing:
+            self._save_sync_state()
+
+        if changes:
+            logger.info("Synced changed note files", extra=stats)
+        return changes
+
+    def _file_needs_sync(self, file_path: Path) -> bool:
+        """Whether a note file differs from the state it was indexed from"""
+        try:
+            stat = file_path.stat()
+            rel_path = str(file_path.relative_to(self.notes_dir))
+        except (OSError, ValueError):
+            return False
+
+        record = self._sync_state.get(file_path.stem)
+        return not (
+            record is not None
+            and record.get("mtime_ns") == stat.st_mtime_ns
+            and record.get("size") == stat.st_size
+            and record.get("path") == rel_path
+            and (
+                record.get("content_hash") is None
+                or self._has_current_vector_metadata(file_path.stem)
+            )
+        )
+
+    def _sync_files_locked(
+        self, changed_files: list[Path], stats: dict[str, int]
+    ) -> dict[str, str]:
+        """
+        Read changed note files and update every index from them (sync lock held)
+
+        Args:
+            changed_files: Files that differ from their sync record
+            stats: Counters updated in place (added, updated, unchanged)
+
+        Returns:
+            note_id -> "created" or "modified"
+        """
+        changes: dict[str, str] = {}
+
+        # Read changed files in parallel, re-embed only real content changes
+        BATCH_SIZE = 50
+        notes_to_index: list[tuple[Note, str, dict[str, Any]]] = []
+        max_workers = min(8, len(changed_files) + 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, note in zip(
+                changed_files, executor.map(self._read_note_file, changed_files)
+            ):
+                if note is None:
+                    # Unparseable file: remember its stat so it is not re-read
+                    try:
+                        stat = file_path.stat()
+                        self._sync_state[file_path.stem] = {
+                            "path": str(file_path.relative_to(self.notes_dir)),
+                            "mtime_ns": stat.st_mtime_ns,
+                            "size": stat.st_size,
+                            "content_hash": None,
+                        }
+                    except (OSError, ValueError):
+                        pass
+                    continue
+
+                search_text = self._note_search_text(note)
+                content_hash = self._content_hash(search_text)
+                metadata = self._note_vector_metadata(note)
+                existing = self.vector_store.get_document(note.note_id)
+
+                if existing is None:
+                    notes_to_index.append((note, search_text, metadata))
+                    stats["added"] += 1
+                    changes[note.note_id] = "created"
+                elif self._content_hash(existing["text"]) != content_hash:
+                    self.vector_store.remove(note.note_id)
+                    notes_to_index.append((note, search_text, metadata))
+                    stats["updated"] += 1
+                    changes[note.note_id] = "modified"
+                else:
+                    self.vector_store.update_metadata(note.note_id, metadata)
+                    self._update_derived_metadata(note)
+                    stats["unchanged"] += 1
+                    changes[note.note_id] = "modified"
+
+                self._record_indexed(note, content_hash)
+                self._update_metadata_index(note)
+                with self._cache_lock:
+                    self._note_cache.pop(note.note_id, None)
+
+                if len(notes_to_index) >= BATCH_SIZE:
+                    self._batch_add_to_vector_store(notes_to_index)
+                    self._after_index_mutation(len(notes_to_index))
+                    notes_to_index = []
+
+        if notes_to_index:
+            self._batch_add_to_vector_store(notes_to_index)
+            self._after_index_mutation(len(notes_to_index))
+        return changes
+
+    def _remove_missing_notes_locked(self, note_ids: set[str], stats: dict[str, int]) -> list[str]:
+        """
+        Drop notes whose file is gone from every index (sync lock held)
+
+        Args:
+            note_ids: Notes without a visible file
+            stats: Counters updated in place (removed)
+
+        Returns:
+            IDs of the notes that were indexed or tracked
+        """
+        removed = []
+        for note_id in note_ids:
+            tracked = note_id in self._sync_state or note_id in self._notes_metadata
+            if self.vector_store.remove(note_id):
+                stats["removed"] += 1
+                tracked = True
+            self._remove_note_derived(note_id)
+            self._forget_indexed(note_id)
+            with self._cache_lock:
+                self._note_cache.pop(note_id, None)
+            if not self.is_note_in_trash(note_id):
+                self._remove_from_metadata_index(note_id)
+            if tracked:
+                removed.append(note_id)
+        return removed
+
+    def _backfill_passages(self) -> int:
+        """
+        Build passages for every long note (index saved without passages)
+
+        Returns:
+            Number of notes split into passages
+        """
+        self._passages_need_backfill = False
+        if self.passage_index is None:
+            return 0
+
+        long_notes = [
+            note
+            for note in self.get_all_notes()
+            if not self.passage_index.has_passages(note.note_id)
+            and self.passage_index.needs_passages(note.title, note.content)
+        ]
+        BATCH_SIZE = 50
+        for start in range(0, len(long_notes), BATCH_SIZE):
+            self._index_note_derived(long_notes[start : start + BATCH_SIZE])
+
+        logger.info("Backfilled note passages", extra={"notes": len(long_notes)})
+        return len(long_notes)
+
+    def _reconcile_lexical_index(self) -> int:
+        """
+        Make the lexical index cover exactly the notes of the vector index
+
+        Returns:
+            Number of notes added to or dropped from the lexical index
+        """
+        self._lexical_needs_reconcile = False
+        if self.lexical_index is None:
+            return 0
+
+        vector_ids = set(self.vector_store.doc_id_to_index_id)
+        lexical_ids = self.lexical_index.document_ids()
+        for note_id in lexical_ids - vector_ids:
+            self.lexical_index.remove_document(note_id)
+
+        missing = sorted(vector_ids - lexical_ids)
+        BATCH_SIZE = 200
+        for start in range(0, len(missing), BATCH_SIZE):
+            notes = self._batch_get_notes(missing[start : start + BATCH_SIZE])
+            self.lexical_index.add_documents(
+                [(note.note_id, self._note_search_text(note)) for note in notes.values()]
+            )
+
+        changed = len(missing) + len(lexical_ids - vector_ids)
+        if changed:
+            logger.info("Reconciled lexical index", extra={"notes": changed})
+        return changed
+
     def _load_metadata_index(self) -> bool:
         """
         Load lightweight metadata index from disk
@@ -413,9 +1060,12 @@ class NoteManager:
             return False
 
     def _save_metadata_index(self) -> None:
-        """Save lightweight metadata index to disk"""
+        """Save lightweight metadata index (and the link graph, frontmatter cache) to disk"""
         import json
 
+        self._save_link_graph()
+        self.frontmatter_cache.flush()
+
         try:
             with open(self._metadata_index_path, "w", encoding="utf-8") as f:
                 json.dump(self._notes_metadata, f, default=str, indent=2)
@@ -496,6 +1146,9 @@ class NoteManager:
 
         self._notes_metadata.clear()
         count = 0
+        self.frontmatter_cache.retain_only(
+            {self._relative_file_path(file_path) for file_path in visible_files}
+        )
 
         # Use parallel execution to read frontmatter from all files
         max_workers = min(8, len(visible_files) + 1)
@@ -563,6 +1216,7 @@ class NoteManager:
                         self._cache_put(note.note_id, note)
                     count += 1
 
+        self.frontmatter_cache.flush()
         logger.debug("Populated note cache", extra={"count": count})
 
     def create_note(
@@ -605,7 +1259,7 @@ class NoteManager:
                     if match:
                         fm_str, body = match.groups()
                         try:
-                            tmpl_fm = yaml.safe_load(fm_str) or {}
+                            tmpl_fm = load_yaml(fm_str) or {}
                             # Merge: Template defaults < Provided metadata
                             # We want template keys to be present, but overridden by specific args if any
                             # But 'metadata' arg here is authoritative.
@@ -652,18 +1306,15 @@ class NoteManager:
         note.file_path = file_path
 
         # Add to vector store
-        search_text = f"{title}\n\n{content}"
+        search_text = self._note_search_text(note)
         self.vector_store.add(
             doc_id=note_id,
             text=search_text,
-            metadata={
-                "title": title,
-                "tags": tags or [],
-                "created_at": now.isoformat(),
-                "entities": [e.value for e in (entities or [])],
-                "outgoing_links": note.outgoing_links,
-            },
+            metadata=self._note_vector_metadata(note),
         )
+        self._index_note_derived([note])
+        self._record_indexed(note, self._content_hash(search_text))
+        self._after_index_mutation()
 
         # Cache with LRU eviction (thread-safe)
         with self._cache_lock:
@@ -788,21 +1439,19 @@ class NoteManager:
         # Write to file
         file_path = self._get_note_path(note_id)
         self._write_note_file(note, file_path)
+        note.file_path = file_path
 
         # Update vector store (remove old, add new)
         self.vector_store.remove(note_id)
-        search_text = f"{note.title}\n\n{note.content}"
+        search_text = self._note_search_text(note)
         self.vector_store.add(
             doc_id=note_id,
             text=search_text,
-            metadata={
-                "title": note.title,
-                "tags": note.tags,
-                "updated_at": note.updated_at.isoformat(),
-                "entities": [e.value for e in note.entities],
-                "outgoing_links": note.outgoing_links,
-            },
+            metadata=self._note_vector_metadata(note),
         )
+        self._index_note_derived([note])
+        self._record_indexed(note, self._content_hash(search_text))
+        self._after_index_mutation(2)
 
         # Git commit
         if self.git:
@@ -1282,6 +1931,9 @@ class NoteManager:
 
         # Remove from vector store
         self.vector_store.remove(note_id)
+        self._remove_note_derived(note_id)
+        self._forget_indexed(note_id)
+        self._after_index_mutation()
 
         # Remove from cache (thread-safe)
         with self._cache_lock:
@@ -1373,13 +2025,14 @@ class NoteManager:
         note = self._read_note_file(target_path)
         if note:
             # Build search text and add to vector store
-            search_text = f"{note.title}\n{note.content}"
-            metadata = {
-                "title": note.title,
-                "tags": note.tags,
-                "path": target_folder,
-            }
+            search_text = self._note_search_text(note)
+            metadata = {**self._note_vector_metadata(note), "path": target_folder}
+            self.vector_store.remove(note.note_id)
             self.vector_store.add(doc_id=note.note_id, text=search_text, metadata=metadata)
+            self._index_note_derived([note])
+            self._record_indexed(note, self._content_hash(search_text))
+            self._after_index_mutation()
+            self._save_link_graph()
 
         # Git commit restore
         if self.git:
@@ -1421,7 +2074,10 @@ class NoteManager:
         logger.info("Permanently deleted note", extra={"note_id": note_id})
 
         # Remove from vector store (in case it wasn't already)
-        self.vector_store.remove(note_id)
+        if self.vector_store.remove(note_id):
+            self._after_index_mutation()
+        self._remove_note_derived(note_id)
+        self._forget_indexed(note_id)
 
         # Remove from cache
         with self._cache_lock:
@@ -1530,8 +2186,9 @@ class NoteManager:
             extra={"from": str(old_file_path), "to": str(new_file_path)},
         )
 
-        # Update note's file_path
+        # Update note's file_path (content unchanged, no re-embedding needed)
         note.file_path = new_file_path
+        self._record_indexed(note)
 
         # Update cache with new path
         with self._cache_lock:
@@ -1560,38 +2217,194 @@ class NoteManager:
         top_k: int = 10,
         tags: Optional[list[str]] = None,
         return_scores: bool = False,
+        note_type: Optional[str] = None,
+        folder: Optional[str] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        mode: str = "vector",
     ) -> Union[list[Note], list[tuple[Note, float]]]:
         """
         Semantic search for notes (optimized with batch loading)
 
+        Up to top_k matching notes are returned even when a filter is very
+        selective: vector search filters before scoring, lexical search
+        widens its BM25 candidates until enough notes match. Long notes are
+        also matched passage by passage; a note scores as the better of its
+        note-level and best passage score.
+
+        In "lexical" mode notes are ranked by BM25 over their title and
+        content, which finds exact names, identifiers and acronyms. In
+        "hybrid" mode the vector and lexical rankings are merged by
+        reciprocal rank fusion. Scores are then higher-is-better whatever
+        the vector metric.
+
         Args:
             query: Search query
             top_k: Number of results to return
-            tags: Optional tag filter
+            tags: Optional tag filter (notes with any of these tags)
             return_scores: If True, return tuples of (Note, similarity_score)
+            note_type: Optional note type filter (frontmatter "type")
+            folder: Optional folder filter (relative to notes_dir, "" = root)
+            updated_after: Optional lower bound on updated_at (inclusive)
+            updated_before: Optional upper bound on updated_at (inclusive)
+            mode: "vector", "lexical" or "hybrid" (lexical/hybrid fall back
+                  to vector search when the lexical index is disabled)
 
         Returns:
             List of Note objects (or (Note, score) tuples if return_scores=True),
             sorted by relevance
+
+        Raises:
+            ValueError: If mode is unknown
         """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}'. Expected one of: {SEARCH_MODES}")
+        if self.lexical_index is None:
+            mode = "vector"
+
+        metadata_filter = self._build_search_filter(
+            tags, note_type, folder, updated_after, updated_before
+        )
+
+        if mode == "lexical":
+            results = self._lexical_search(query, top_k, metadata_filter)
+        else:
+            # Hybrid fusion looks deeper than top_k on both sides
+            depth = top_k * 2 if mode == "hybrid" else top_k
+            results = self.vector_store.search(
+                query=query, top_k=depth, metadata_filter=metadata_filter
+            )
+            results = self._merge_passage_hits(query, results, depth, metadata_filter)
+            if mode == "hybrid":
+                results = self._fuse_rankings(
+                    [results, self._lexical_search(query, depth, metadata_filter)], top_k
+                )
 
-        # Define filter function for tags
-        def tag_filter(metadata: dict[str, Any]) -> bool:
-            if not tags:
-                return True
-            note_tags = set(metadata.get("tags", []))
-            return bool(note_tags.intersection(tags))
+        notes_result = self._load_search_results(results, return_scores)
 
-        # Search in vector store
-        results = self.vector_store.search(
-            query=query, top_k=top_k, filter_fn=tag_filter if tags else None
+        logger.debug(
+            "Search completed",
+            extra={"query": query[:50], "results": len(notes_result), "tags": tags},
+        )
+
+        return notes_result
+
+    def search_by_id(
+        self,
+        note_id: str,
+        top_k: int = 10,
+        tags: Optional[list[str]] = None,
+        return_scores: bool = False,
+        note_type: Optional[str] = None,
+        folder: Optional[str] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> Union[list[Note], list[tuple[Note, float]]]:
+        """
+        Notes similar to a note ("more like this")
+
+        Searches with the note's stored embedding instead of embedding its
+        text again. Scores are those of search_notes in vector mode; the
+        note itself is not returned.
+
+        Args:
+            note_id: Note to find neighbours of
+            top_k: Number of results to return
+            tags: Optional tag filter (notes with any of these tags)
+            return_scores: If True, return tuples of (Note, similarity_score)
+            note_type: Optional note type filter (frontmatter "type")
+            folder: Optional folder filter (relative to notes_dir, "" = root)
+            updated_after: Optional lower bound on updated_at (inclusive)
+            updated_before: Optional upper bound on updated_at (inclusive)
+
+        Returns:
+            List of Note objects (or (Note, score) tuples if return_scores=True),
+            sorted by relevance (empty if the note is not indexed)
+        """
+        metadata_filter = self._build_search_filter(
+            tags, note_type, folder, updated_after, updated_before
+        )
+        results = self.vector_store.search_by_id(
+            note_id, top_k=top_k, metadata_filter=metadata_filter
         )
+        return self._load_search_results(results, return_scores)
 
+    def search_by_vector(
+        self,
+        vector: Any,
+        top_k: int = 10,
+        tags: Optional[list[str]] = None,
+        return_scores: bool = False,
+        note_type: Optional[str] = None,
+        folder: Optional[str] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> Union[list[Note], list[tuple[Note, float]]]:
+        """
+        Notes similar to an embedding already computed by the caller
+
+        Args:
+            vector: Query embedding (same model and dimension as the index)
+            top_k: Number of results to return
+            tags: Optional tag filter (notes with any of these tags)
+            return_scores: If True, return tuples of (Note, similarity_score)
+            note_type: Optional note type filter (frontmatter "type")
+            folder: Optional folder filter (relative to notes_dir, "" = root)
+            updated_after: Optional lower bound on updated_at (inclusive)
+            updated_before: Optional upper bound on updated_at (inclusive)
+
+        Returns:
+            List of Note objects (or (Note, score) tuples if return_scores=True),
+            sorted by relevance
+        """
+        metadata_filter = self._build_search_filter(
+            tags, note_type, folder, updated_after, updated_before
+        )
+        results = self.vector_store.search_by_vector(
+            vector, top_k=top_k, metadata_filter=metadata_filter
+        )
+        return self._load_search_results(results, return_scores)
+
+    def find_duplicate_notes(
+        self,
+        min_similarity: float = 0.9,
+        note_ids: Optional[list[str]] = None,
+    ) -> list[tuple[str, str, float]]:
+        """
+        Pairs of notes with near-identical embeddings
+
+        Compares all stored note embeddings at once (cosine similarity,
+        whatever the store metric), without embedding anything.
+
+        Args:
+            min_similarity: Minimum cosine similarity of a pair
+            note_ids: Only pairs involving these notes (all pairs if None)
+
+        Returns:
+            (note_id_a, note_id_b, similarity) tuples, most similar first
+        """
+        return self.vector_store.find_near_duplicates(
+            min_similarity=min_similarity, doc_ids=note_ids
+        )
+
+    def _load_search_results(
+        self,
+        results: list[tuple[str, float, dict[str, Any]]],
+        return_scores: bool,
+    ) -> list[Any]:
+        """
+        Turn (doc_id, score, metadata) hits into notes, keeping their order
+
+        Args:
+            results: Vector store or fused hits, best first
+            return_scores: If True, return (Note, score) tuples
+
+        Returns:
+            Notes (or (Note, score) tuples), skipping notes that no longer exist
+        """
         # Batch load notes: check cache first, then load missing from disk
-        doc_ids = [doc_id for doc_id, _, _ in results]
-        notes_map = self._batch_get_notes(doc_ids)
+        notes_map = self._batch_get_notes([doc_id for doc_id, _, _ in results])
 
-        # Build result list preserving order and scores
         notes_result: list[Any] = []
         for doc_id, score, _metadata in results:
             note = notes_map.get(doc_id)
@@ -1600,13 +2413,153 @@ class NoteManager:
                     notes_result.append((note, score))
                 else:
                     notes_result.append(note)
+        return notes_result
 
-        logger.debug(
-            "Search completed",
-            extra={"query": query[:50], "results": len(notes_result), "tags": tags},
+    def _merge_passage_hits(
+        self,
+        query: str,
+        results: list[tuple[str, float, dict[str, Any]]],
+        top_k: int,
+        metadata_filter: Optional[MetadataFilter] = None,
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """
+        Fold passage hits into note-level search results
+
+        Args:
+            query: Search query
+            results: Note-level (doc_id, score, metadata) results
+            top_k: Number of results to keep
+            metadata_filter: Filter used for the note-level search
+
+        Returns:
+            Merged results, best first
+        """
+        if self.passage_index is None:
+            return results
+
+        try:
+            matches = self.passage_index.search(query, top_k, metadata_filter)
+        except Exception as e:
+            logger.warning("Passage search failed", extra={"error": str(e)})
+            return results
+
+        merged = {doc_id: (doc_id, score, metadata) for doc_id, score, metadata in results}
+        for match in matches:
+            current = merged.get(match.note_id)
+            if current is None or self.passage_index.is_better(match.score, current[1]):
+                doc = self.vector_store.get_document(match.note_id)
+                metadata = doc["metadata"] if doc else {}
+                merged[match.note_id] = (match.note_id, match.score, metadata)
+
+        ranked = sorted(
+            merged.values(),
+            key=lambda hit: hit[1],
+            reverse=self.vector_store.metric == "cosine",
         )
+        return ranked[:top_k]
 
-        return notes_result
+    def _lexical_search(
+        self,
+        query: str,
+        top_k: int,
+        metadata_filter: Optional[MetadataFilter] = None,
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """
+        BM25 search over note text
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            metadata_filter: Optional filter on note metadata, applied to the
+                ranked candidates (up to top_k matches are returned)
+
+        Returns:
+            (doc_id, score, metadata) results, best first
+        """
+        if self.lexical_index is None or not query.strip():
+            return []
+
+        # The filter applies after BM25 scoring, so a filtered search widens
+        # its candidate depth until top_k matches are found or the index runs out
+        depth = top_k if metadata_filter is None else max(top_k * 10, 100)
+        while True:
+            ranked = self.lexical_index.search(query, depth)
+            results: list[tuple[str, float, dict[str, Any]]] = []
+            for note_id, score in ranked:
+                doc = self.vector_store.get_document(note_id)
+                metadata = doc["metadata"] if doc else {}
+                if metadata_filter is not None and not metadata_filter.matches(metadata):
+                    continue
+                results.append((note_id, score, metadata))
+                if len(results) >= top_k:
+                    return results
+            if len(ranked) < depth:
+                return results
+            depth *= 2
+
+    @staticmethod
+    def _fuse_rankings(
+        rankings: list[list[tuple[str, float, dict[str, Any]]]], top_k: int
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """
+        Merge ranked result lists by reciprocal rank fusion
+
+        Each list contributes 1 / (RRF_K + rank) to a document's score, so
+        lists with incomparable scores (L2 distance, BM25) combine fairly.
+
+        Args:
+            rankings: (doc_id, score, metadata) lists, each best first
+            top_k: Number of results to keep
+
+        Returns:
+            Fused (doc_id, rrf_score, metadata) results, best first
+        """
+        fused: dict[str, float] = {}
+        metadata_by_id: dict[str, dict[str, Any]] = {}
+        for ranking in rankings:
+            for rank, (doc_id, _score, metadata) in enumerate(ranking, start=1):
+                fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (RRF_K + rank)
+                metadata_by_id.setdefault(doc_id, metadata)
+
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)
+        return [(doc_id, score, metadata_by_id[doc_id]) for doc_id, score in ranked[:top_k]]
+
+    def get_note_snippet(
+        self, note: Union[Note, str], query: str, max_chars: int = DEFAULT_SNIPPET_CHARS
+    ) -> str:
+        """
+        Query-specific snippet of a note
+
+        Uses the note's best-matching passage when it has passages, so the
+        snippet of a long note shows the part relevant to the query rather
+        than its opening.
+
+        Args:
+            note: Note or note identifier
+            query: Search query
+            max_chars: Maximum snippet length
+
+        Returns:
+            Snippet text ("" if the note does not exist)
+        """
+        if isinstance(note, str):
+            loaded = self.get_note(note)
+            if loaded is None:
+                return ""
+            note = loaded
+
+        text = note.content or ""
+        if self.passage_index is not None and query.strip():
+            try:
+                match = self.passage_index.best_passage(note.note_id, query)
+                if match is not None:
+                    text = match.text
+            except Exception as e:
+                logger.debug(
+                    "Passage lookup failed", extra={"note_id": note.note_id, "error": str(e)}
+                )
+
+        return extract_snippet(text, query, max_chars)
 
     def search_notes_batch(
         self,
@@ -1633,16 +2586,11 @@ class NoteManager:
         if not queries:
             return []
 
-        # Define filter function for tags
-        def tag_filter(metadata: dict[str, Any]) -> bool:
-            if not tags:
-                return True
-            note_tags = set(metadata.get("tags", []))
-            return bool(note_tags.intersection(tags))
-
-        # Batch search in vector store
+        # Batch search in vector store, pre-filtered on tags
         all_results = self.vector_store.search_batch(
-            queries=queries, top_k=top_k, filter_fn=tag_filter if tags else None
+            queries=queries,
+            top_k=top_k,
+            metadata_filter=self._build_search_filter(tags),
         )
 
         # Collect all unique doc_ids for batch loading
@@ -1692,15 +2640,13 @@ class NoteManager:
         Returns:
             List of Note objects (or (Note, score) tuples if return_scores=True)
         """
-        # Search using entity value
+        # Search using entity value, restricted to notes mentioning it
         query = entity.value
-
-        # Filter for notes with this entity
-        def entity_filter(metadata: dict[str, Any]) -> bool:
-            note_entities = metadata.get("entities", [])
-            return entity.value in note_entities
-
-        results = self.vector_store.search(query=query, top_k=top_k, filter_fn=entity_filter)
+        results = self.vector_store.search(
+            query=query,
+            top_k=top_k,
+            metadata_filter=MetadataFilter(match={"entities": [entity.value]}),
+        )
 
         # Batch load notes
         doc_ids = [doc_id for doc_id, _, _ in results]
@@ -1718,6 +2664,28 @@ class NoteManager:
 
         return notes
 
+    @staticmethod
+    def _build_search_filter(
+        tags: Optional[list[str]] = None,
+        note_type: Optional[str] = None,
+        folder: Optional[str] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> Optional[MetadataFilter]:
+        """Translate search_notes filter arguments to a vector store pre-filter"""
+        match: dict[str, Union[str, list[str]]] = {}
+        if tags:
+            match["tags"] = list(tags)
+        if note_type:
+            match["type"] = note_type
+        if folder is not None:
+            match["folder"] = folder.strip("/")
+
+        metadata_filter = MetadataFilter(
+            match=match, date_from=updated_after, date_to=updated_before
+        )
+        return None if metadata_filter.is_empty() else metadata_filter
+
     def _batch_get_notes(self, note_ids: list[str]) -> dict[str, Note]:
         """
         Batch load multiple notes efficiently (thread-safe)
@@ -1813,6 +2781,7 @@ class NoteManager:
                         # Update cache
                         with self._cache_lock:
                             self._cache_put(note.note_id, note)
+            self.frontmatter_cache.flush()
 
         # Apply limit if specified (post-loading)
         if limit is not None:
@@ -1850,6 +2819,7 @@ class NoteManager:
                     extra={"file_path": str(file_path), "error": str(e)},
                 )
 
+        self.frontmatter_cache.flush()
         return modified_notes
 
     def _index_all_notes(self) -> int:
@@ -1880,15 +2850,11 @@ class NoteManager:
             for note in executor.map(self._read_note_file, visible_files):
                 if note:
                     # Check if already indexed
+                    search_text = self._note_search_text(note)
                     if not self.vector_store.get_document(note.note_id):
-                        search_text = f"{note.title}\n\n{note.content}"
-                        metadata = {
-                            "title": note.title,
-                            "tags": note.tags,
-                            "created_at": note.created_at.isoformat(),
-                            "entities": [e.value for e in note.entities],
-                        }
+                        metadata = self._note_vector_metadata(note)
                         notes_to_index.append((note, search_text, metadata))
+                    self._record_indexed(note, self._content_hash(search_text))
 
                     # Always cache the note
                     with self._cache_lock:
@@ -1947,6 +2913,7 @@ class NoteManager:
             ]
             self.vector_store.add_batch(documents)
             logger.debug("Batch added notes to vector store", extra={"count": len(documents)})
+            self._index_note_derived([note for note, _, _ in notes_data])
         except Exception as e:
             # Fallback to individual adds if batch fails
             logger.warning(
@@ -1955,6 +2922,7 @@ class NoteManager:
             for note, search_text, metadata in notes_data:
                 try:
                     self.vector_store.add(doc_id=note.note_id, text=search_text, metadata=metadata)
+                    self._index_note_derived([note])
                 except Exception as add_error:
                     logger.warning(
                         "Failed to add note to vector store",
@@ -1979,11 +2947,21 @@ class NoteManager:
 
         # Clear vector store
         self.vector_store.clear()
+        if self.passage_index is not None:
+            self.passage_index.clear()
+        self._passages_need_backfill = False
+        if self.lexical_index is not None:
+            self.lexical_index.clear()
+        self._lexical_needs_reconcile = False
+        self._title_index = None
+        # Rebuilt from the files on next use, dropping notes removed meanwhile
+        self._link_graph_ready = False
 
         # Clear caches
         with self._cache_lock:
-            self._cache.clear()
-            self._cache_order.clear()
+            self._note_cache.clear()
+        with self._sync_lock:
+            self._sync_state.clear()
 
         # Clear metadata index
         self._notes_metadata.clear()
@@ -2002,6 +2980,10 @@ class NoteManager:
             "elapsed_seconds": round(elapsed, 2),
             "index_stats": self.vector_store.get_stats(),
         }
+        if self.passage_index is not None:
+            result["passage_stats"] = self.passage_index.get_stats()
+        if self.lexical_index is not None:
+            result["lexical_stats"] = self.lexical_index.get_stats()
 
         logger.info(
             "Index rebuild completed",
@@ -2102,8 +3084,14 @@ class NoteManager:
         if not file_path.exists():
             # Quick check for common locations or just root if not searched yet
             root_path = (self.notes_dir / f"{note_id}.md").resolve()
+            # Sync records follow moves seen by sync_index()/sync_files()
+            with self._sync_lock:
+                record = self._sync_state.get(note_id)
+            synced_path = (self.notes_dir / record["path"]).resolve() if record else None
             if root_path.exists():
                 file_path = root_path
+            elif synced_path is not None and synced_path.exists():
+                file_path = synced_path
             else:
                 # Last resort: glob for the file (limited to notes_dir)
                 # We skip hidden folders like .git or .scapin_index
@@ -2192,6 +3180,9 @@ class NoteManager:
         try:
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
+                # Stat the open file: an atomic replace during the read
+                # cannot pair this content with another version's stat
+                stat = os.fstat(f.fileno())
 
             # Parse frontmatter using pre-compiled regex
             match = FRONTMATTER_PATTERN.match(content)
@@ -2203,7 +3194,15 @@ class NoteManager:
 
             # Try to parse YAML frontmatter, with fallback for malformed YAML
             try:
-                frontmatter = yaml.safe_load(frontmatter_str) or {}
+                frontmatter = (
+                    self.frontmatter_cache.parse(
+                        self._relative_file_path(file_path),
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        frontmatter_str,
+                    )
+                    or {}
+                )
             except yaml.YAMLError as yaml_err:
                 # Fallback: try to recover title from raw frontmatter using regex
                 # This handles cases like "title: Corde Band : 22,2" where unquoted colons break YAML
@@ -2247,7 +3246,7 @@ class NoteManager:
             # Get dates - support both formats (created_at/updated_at and created/modified)
             # Use file modification time as fallback
             # PyYAML may parse ISO dates as datetime objects automatically
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
+            file_mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
 
             created_at_raw = frontmatter.get("created_at") or frontmatter.get("created")
             updated_at_raw = frontmatter.get("updated_at") or frontmatter.get("modified")
@@ -2321,6 +3320,13 @@ class NoteManager:
             )
             return None
 
+    def _relative_file_path(self, file_path: Path) -> str:
+        """Path of a file relative to notes_dir (absolute if outside it)"""
+        try:
+            return str(file_path.relative_to(self.notes_dir))
+        except ValueError:
+            return str(file_path)
+
     def create_folder(self, path: str) -> Path:
         """
         Create a new folder in the notes directory
@@ -2407,6 +3413,7 @@ class NoteManager:
                 "cache_evictions": self._cache_evictions,
                 "hit_rate": round(hit_rate, 3),
                 "total_requests": total_requests,
+                "frontmatter": self.frontmatter_cache.get_stats(),
             }
 
     def __repr__(self) -> str:
@@ -2525,6 +3532,90 @@ class NoteManager:
         """
         self._aliases_index_dirty = True
 
+    def get_title_index(self) -> TitleIndex:
+        """
+        Retourne l'index flou des titres et aliases (recherche d'entités).
+
+        Construit au premier appel à partir de toutes les notes, puis tenu à
+        jour note par note à chaque création/modification/suppression.
+
+        Returns:
+            TitleIndex couvrant toutes les notes
+        """
+        if self._title_index is not None:
+            return self._title_index
+
+        with self._title_index_lock:
+            if self._title_index is None:
+                index = TitleIndex()
+                for note in self.get_all_notes():
+                    index.add_note(note.note_id, note.title, self._note_aliases(note))
+                self._title_index = index
+                logger.debug("Built title index", extra=index.get_stats())
+        return self._title_index
+
+    def get_link_graph(self) -> LinkGraph:
+        """
+        Retourne le graphe des wikilinks (résolution, liens sortants, backlinks).
+
+        Chargé depuis le disque au démarrage, ou construit au premier appel à
+        partir de toutes les notes, puis tenu à jour note par note.
+
+        Returns:
+            LinkGraph couvrant toutes les notes
+        """
+        if self._link_graph_ready:
+            return self.link_graph
+
+        with self._link_graph_lock:
+            if not self._link_graph_ready:
+                self.link_graph.clear()
+                for note in self.get_all_notes():
+                    self.link_graph.set_note(
+                        note.note_id, note.title, self._note_aliases(note), note.outgoing_links
+                    )
+                self._link_graph_ready = True
+                self._save_link_graph()
+                logger.info("Built link graph", extra=self.link_graph.get_stats())
+        return self.link_graph
+
+    def resolve_wikilink(self, link: str) -> Optional[Note]:
+        """
+        Résout un [[wikilink]] vers sa note, par titre puis alias (O(1)).
+
+        Args:
+            link: Texte du lien ("Note", "Note#Section", casse indifférente)
+
+        Returns:
+            Note ciblée ou None si le lien est cassé
+        """
+        note_id = self.get_link_graph().resolve(link)
+        return self.get_note(note_id) if note_id else None
+
+    def get_backlinks(self, note_id: str) -> list[str]:
+        """
+        Retourne les notes qui pointent vers une note (par titre ou alias).
+
+        Args:
+            note_id: Identifiant de la note
+
+        Returns:
+            Identifiants des notes sources, triés
+        """
+        return self.get_link_graph().backlinks(note_id)
+
+    def get_broken_links(self, note_id: str) -> list[str]:
+        """
+        Retourne les wikilinks d'une note qui ne mènent à aucune note.
+
+        Args:
+            note_id: Identifiant de la note
+
+        Returns:
+            Textes des liens cassés
+        """
+        return self.get_link_graph().broken_links(note_id).get(note_id, [])
+
     def get_all_aliases(self) -> dict[str, list[str]]:
         """
         Retourne toutes les notes avec leurs aliases.
@@ -0,0 +1,370 @@
+"""
+Filesystem watcher for the notes directory
+
+Notes are also edited outside Scapin (Obsidian, Apple Notes sync, git
+checkouts). Without a watcher those edits are only noticed by periodic full
+scans (refresh_index, sync_index, get_recently_modified_notes), which stat
+every file. NoteWatcher instead:
+
+- receives change events from the OS (inotify on Linux, FSEvents on macOS)
+  through watchfiles, or polls directory snapshots when watchfiles is not
+  installed or the native watcher fails;
+- debounces them, so an editor's save burst is handled once;
+- syncs exactly the changed files through NoteManager.sync_files() (metadata
+  index, note cache, vector store, derived indexes) and, when given, the
+  NoteMetadataStore;
+- publishes the resulting NoteChange batches to subscribers (the background
+  worker's ingestion, the websocket layer).
+
+Writes made through NoteManager match their sync record and produce no
+events.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from src.monitoring.logger import get_logger
+from src.passepartout.note_manager import TRASH_FOLDER
+from src.passepartout.note_types import detect_note_type_from_path
+
+if TYPE_CHECKING:
+    from src.passepartout.note_manager import NoteManager
+    from src.passepartout.note_metadata import NoteMetadataStore
+
+logger = get_logger("passepartout.note_watcher")
+
+try:
+    import watchfiles
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+
+@dataclass
+class NoteChange:
+    """A note changed on disk"""
+
+    note_id: str
+    kind: str  # "created", "modified" or "deleted"
+    path: Optional[str] = None  # Relative to the notes directory (None when deleted)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "note_id": self.note_id,
+            "kind": self.kind,
+            "path": self.path,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+def _is_watched_path(rel_path: str) -> bool:
+    """Whether a path (relative to the notes directory) can be a note"""
+    parts = rel_path.replace("\\", "/").split("/")
+    return (
+        rel_path.endswith(".md")
+        and not any(part.startswith(".") for part in parts)
+        and TRASH_FOLDER not in parts
+    )
+
+
+def _is_watched_folder(rel_path: str) -> bool:
+    """Whether a path (relative to the notes directory) can be a folder of notes"""
+    parts = rel_path.replace("\\", "/").split("/")
+    return (
+        not rel_path.endswith(".md")
+        and not any(part.startswith(".") for part in parts)
+        and TRASH_FOLDER not in parts
+    )
+
+
+class NoteWatcher:
+    """
+    Keep NoteManager in sync with external edits of the notes directory
+
+    Runs in a daemon thread. Subscriber callbacks are called in that thread
+    with each batch of changes; they should be quick and must not raise.
+
+    Usage:
+        watcher = NoteWatcher(note_manager, metadata_store=store)
+        watcher.subscribe(lambda changes: print(changes))
+        watcher.start()
+        ...
+        watcher.stop()
+    """
+
+    def __init__(
+        self,
+        note_manager: "NoteManager",
+        metadata_store: Optional["NoteMetadataStore"] = None,
+        debounce_seconds: float = 1.0,
+        poll_interval_seconds: float = 2.0,
+        use_native: bool = True,
+    ):
+        """
+        Initialize watcher
+
+        Args:
+            note_manager: NoteManager whose notes directory is watched
+            metadata_store: Metadata store to keep in sync (optional)
+            debounce_seconds: Quiet time before a burst of changes is handled
+            poll_interval_seconds: Snapshot interval of the polling backend
+            use_native: Use OS notifications when watchfiles is available
+        """
+        self.note_manager = note_manager
+        self.metadata_store = metadata_store
+        self.notes_dir = Path(note_manager.notes_dir)
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.use_native = use_native and WATCHFILES_AVAILABLE
+
+        self._subscribers: list[Callable[[list[NoteChange]], None]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._backend: Optional[str] = None
+
+        self._batches = 0
+        self._changes = 0
+        self._errors = 0
+        self._last_change_at: Optional[datetime] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, callback: Callable[[list[NoteChange]], None]) -> None:
+        """
+        Subscribe to note changes
+
+        Args:
+            callback: Called with each batch of changes (in the watcher thread)
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[list[NoteChange]], None]) -> None:
+        """
+        Unsubscribe from note changes
+
+        Args:
+            callback: Callback to remove
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self) -> None:
+        """Start watching in a daemon thread (no-op if already running)"""
+        if self.is_running:
+            return
+        self.notes_dir.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="note-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop watching
+
+        Args:
+            timeout: Seconds to wait for the watcher thread
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Note watcher stopped")
+
+    def _run(self) -> None:
+        """Watcher thread body"""
+        if self.use_native:
+            try:
+                self._backend = "native"
+                logger.info("Note watcher started", extra={"backend": "native"})
+                self._run_native()
+                return
+            except Exception as e:
+                # e.g. inotify watch limit reached: fall back to polling
+                self._errors += 1
+                logger.warning(f"Native note watcher failed, polling instead: {e}")
+
+        self._backend = "polling"
+        logger.info("Note watcher started", extra={"backend": "polling"})
+        self._run_polling()
+
+    def _run_native(self) -> None:
+        """Handle OS change notifications (watchfiles debounces bursts)"""
+        # Folder events are kept: moving a folder reports the folder, not its notes
+        for changes in watchfiles.watch(
+            self.notes_dir,
+            watch_filter=lambda _change, path: path.endswith(".md") or not os.path.isfile(path),
+            debounce=int(self.debounce_seconds * 1000),
+            stop_event=self._stop_event,
+            raise_interrupt=False,
+        ):
+            self.process_paths([Path(path) for _, path in changes])
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """Relative path -> (mtime_ns, size) of every watched file"""
+        snapshot: dict[str, tuple[int, int]] = {}
+        for root, dirs, files in os.walk(self.notes_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != TRASH_FOLDER]
+            rel_root = os.path.relpath(root, self.notes_dir)
+            for name in files:
+                if not name.endswith(".md") or name.startswith("."):
+                    continue
+                rel_path = name if rel_root == "." else os.path.join(rel_root, name)
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _run_polling(self) -> None:
+        """Diff directory snapshots, handling changes once they settle"""
+        previous = self._snapshot()
+        pending: set[str] = set()
+        last_change = 0.0
+
+        while not self._stop_event.wait(self.poll_interval_seconds):
+            try:
+                current = self._snapshot()
+            except OSError as e:
+                self._errors += 1
+                logger.warning(f"Note watcher scan failed: {e}")
+                continue
+
+            changed = {
+                path
+                for path in previous.keys() | current.keys()
+                if previous.get(path) != current.get(path)
+            }
+            previous = current
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+
+            if pending and time.monotonic() - last_change >= self.debounce_seconds:
+                self.process_paths([self.notes_dir / path for path in pending])
+                pending = set()
+
+    def process_paths(self, paths: list[Path]) -> list[NoteChange]:
+        """
+        Sync changed files and publish the resulting note changes
+
+        Called by the watcher thread; may also be called directly.
+
+        Args:
+            paths: Changed file or folder paths (absolute, or relative to the
+                notes directory)
+
+        Returns:
+            Changes published to subscribers
+        """
+        relevant = []
+        for path in paths:
+            rel_path = self._relative_path(Path(path))
+            if rel_path is None:
+                continue
+            # Files moved to the trash are synced too: the note disappeared.
+            # Folders created, moved or removed stand for the notes under them.
+            is_folder = _is_watched_folder(rel_path) and not (self.notes_dir / rel_path).is_file()
+            if is_folder or _is_watched_path(rel_path) or TRASH_FOLDER in Path(rel_path).parts:
+                relevant.append(self.notes_dir / rel_path)
+        if not relevant:
+            return []
+
+        try:
+            synced = self.note_manager.sync_files(relevant)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Failed to sync changed notes: {e}", exc_info=True)
+            return []
+
+        changes = []
+        for note_id, kind in synced.items():
+            rel_path = None if kind == "deleted" else self.note_manager.get_relative_path(note_id)
+            changes.append(NoteChange(note_id=note_id, kind=kind, path=rel_path))
+        if not changes:
+            return []
+
+        if self.metadata_store is not None:
+            self._sync_metadata_store(changes)
+
+        self._batches += 1
+        self._changes += len(changes)
+        self._last_change_at = datetime.now(timezone.utc)
+        logger.info(
+            f"Detected {len(changes)} external note changes",
+            extra={"changes": {c.note_id: c.kind for c in changes}},
+        )
+        self._publish(changes)
+        return changes
+
+    def _relative_path(self, path: Path) -> Optional[str]:
+        """Path relative to the notes directory (None if outside it)"""
+        if not path.is_absolute():
+            return str(path)
+        # Native events carry resolved paths (e.g. /private/var on macOS)
+        for root in (self.notes_dir.absolute(), self.notes_dir.resolve()):
+            try:
+                return str(path.relative_to(root))
+            except ValueError:
+                continue
+        return None
+
+    def _sync_metadata_store(self, changes: list[NoteChange]) -> None:
+        """Create, re-hash or delete the review metadata of changed notes"""
+        assert self.metadata_store is not None
+        for change in changes:
+            try:
+                if change.kind == "deleted":
+                    # Trashed notes keep their metadata until purged
+                    if not self.note_manager.is_note_in_trash(change.note_id):
+                        self.metadata_store.delete(change.note_id)
+                    continue
+
+                note = self.note_manager.get_note(change.note_id)
+                if note is None:
+                    continue
+                if self.metadata_store.get(change.note_id) is None:
+                    note_type = detect_note_type_from_path(change.path or "")
+                    self.metadata_store.create_for_note(change.note_id, note_type, note.content)
+                else:
+                    self.metadata_store.update_content_hash(change.note_id, note.content)
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"Failed to sync metadata of note {change.note_id}: {e}")
+
+    def _publish(self, changes: list[NoteChange]) -> None:
+        """Call subscribers (exceptions are logged, not propagated)"""
+        with self._lock:
+            subscribers = self._subscribers.copy()
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Note change subscriber failed: {e}", exc_info=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Watcher statistics"""
+        return {
+            "running": self.is_running,
+            "backend": self._backend,
+            "batches": self._batches,
+            "changes": self._changes,
+            "errors": self._errors,
+            "subscribers": len(self._subscribers),
+            "last_change_at": self._last_change_at.isoformat() if self._last_change_at else None,
+        }
@@ -0,0 +1,518 @@
+"""
+Passage-level semantic index for long notes
+
+The sentence embedding model truncates its input (~256 tokens for
+all-MiniLM-L6-v2), so a note embedded as one string is only searchable by
+its first screen. Long notes are therefore also split into overlapping
+passages along headings and paragraphs, each embedded with its note title
+and heading path for context.
+
+Passages live in their own VectorStore (doc_id "<note_id>#p<n>", metadata
+carrying note_id and the note's filterable fields). Passage hits are folded
+back into note scores by keeping each note's best passage, and the best
+passage doubles as a query-specific snippet.
+
+Notes short enough to fit in a single embedding get no passages: their
+note-level embedding already covers them.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from src.monitoring.logger import get_logger
+from src.passepartout.embeddings import EmbeddingGenerator
+from src.passepartout.metadata_filter import DEFAULT_FILTER_FIELDS, MetadataFilter
+from src.passepartout.vector_store import VectorStore
+
+logger = get_logger("passepartout.passage_index")
+
+# Target passage size; ~200 tokens keeps title + heading + body under the
+# embedding model's truncation limit
+DEFAULT_PASSAGE_CHARS = 800
+# Characters repeated from the end of a passage at the start of the next one
+DEFAULT_OVERLAP_CHARS = 160
+# Passage hits fetched per requested note (several passages per note compete)
+PASSAGE_OVERSAMPLE = 4
+# Passage filter fields: the note fields plus note_id, for per-note lookups
+PASSAGE_FILTER_FIELDS = (*DEFAULT_FILTER_FIELDS, "note_id")
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…])\s+|\n+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class Passage:
+    """
+    A chunk of a note
+
+    Attributes:
+        heading: Heading path of the section ("Projet > Budget"), "" before
+                 the first heading
+        text: Passage body (markdown, without the heading line)
+    """
+
+    heading: str
+    text: str
+
+
+@dataclass
+class PassageMatch:
+    """
+    Best-matching passage of a note for a query
+
+    Attributes:
+        note_id: Note the passage belongs to
+        score: Passage score (same scale as VectorStore.search scores)
+        heading: Heading path of the passage
+        text: Passage body
+    """
+
+    note_id: str
+    score: float
+    heading: str
+    text: str
+
+
+def _split_long_block(block: str, max_chars: int) -> list[str]:
+    """Split a paragraph longer than max_chars on sentences, then on words"""
+    pieces: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT_RE.split(block):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > max_chars // 2 else max_chars
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _overlap_tail(text: str, overlap_chars: int) -> str:
+    """Last overlap_chars of text, starting on a word boundary"""
+    if overlap_chars <= 0 or len(text) <= overlap_chars:
+        return text if overlap_chars > 0 else ""
+    tail = text[-overlap_chars:]
+    space = tail.find(" ")
+    return tail[space + 1 :] if 0 <= space < len(tail) - 1 else tail
+
+
+def split_passages(
+    content: str,
+    max_chars: int = DEFAULT_PASSAGE_CHARS,
+    overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+) -> list[Passage]:
+    """
+    Split note content into overlapping passages
+
+    Sections start at markdown headings (ignored inside code fences).
+    Within a section, paragraphs are packed into passages of at most
+    max_chars; a passage continuing a section starts with the last
+    overlap_chars of the previous one, so a fact straddling a boundary is
+    whole in at least one passage.
+
+    Args:
+        content: Note body (markdown, no frontmatter)
+        max_chars: Maximum passage length before overlap
+        overlap_chars: Characters carried over between passages of a section
+
+    Returns:
+        Passages in document order
+
+    Raises:
+        ValueError: If max_chars is not positive or overlap_chars is not
+                    smaller than max_chars
+    """
+    if max_chars <= 0:
+        raise ValueError(f"max_chars must be positive, got {max_chars}")
+    if not 0 <= overlap_chars < max_chars:
+        raise ValueError(f"overlap_chars must be in [0, max_chars), got {overlap_chars}")
+
+    # 1. Sections by heading
+    sections: list[tuple[str, list[str]]] = []
+    heading_stack: list[tuple[int, str]] = []
+    lines: list[str] = []
+    in_fence = False
+
+    def close_section() -> None:
+        heading = " > ".join(title for _, title in heading_stack)
+        sections.append((heading, lines.copy()))
+        lines.clear()
+
+    for line in content.splitlines():
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            close_section()
+            level = len(match.group(1))
+            while heading_stack and heading_stack[-1][0] >= level:
+                heading_stack.pop()
+            heading_stack.append((level, match.group(2)))
+        else:
+            lines.append(line)
+    close_section()
+
+    # 2. Pack paragraphs into passages, with overlap inside a section
+    passages: list[Passage] = []
+    for heading, section_lines in sections:
+        blocks: list[str] = []
+        for paragraph in _PARAGRAPH_SPLIT_RE.split("\n".join(section_lines)):
+            paragraph = paragraph.strip()
+            if paragraph:
+                blocks.extend(
+                    _split_long_block(paragraph, max_chars)
+                    if len(paragraph) > max_chars
+                    else [paragraph]
+                )
+
+        current = ""
+        fresh = False  # current holds more than the carried-over overlap
+        for block in blocks:
+            if current and fresh and len(current) + 2 + len(block) > max_chars:
+                passages.append(Passage(heading=heading, text=current))
+                current = _overlap_tail(current, overlap_chars)
+            current = f"{current}\n\n{block}" if current else block
+            fresh = True
+        if current and fresh:
+            passages.append(Passage(heading=heading, text=current))
+
+    return passages
+
+
+def extract_snippet(text: str, query: str, max_chars: int = 200) -> str:
+    """
+    Cut the part of a passage most relevant to a query
+
+    Starts at the sentence sharing the most words with the query and
+    extends forward up to max_chars, on sentence then word boundaries.
+
+    Args:
+        text: Passage or note text
+        query: Search query
+        max_chars: Maximum snippet length
+
+    Returns:
+        Snippet (text unchanged if it already fits)
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return text
+
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    query_words = {w.lower() for w in _WORD_RE.findall(query) if len(w) > 2}
+    start = 0
+    if query_words:
+        overlaps = [
+            len(query_words & {w.lower() for w in _WORD_RE.findall(sentence)})
+            for sentence in sentences
+        ]
+        if max(overlaps, default=0) > 0:
+            start = overlaps.index(max(overlaps))
+
+    snippet = ""
+    for sentence in sentences[start:]:
+        candidate = f"{snippet} {sentence}" if snippet else sentence
+        if len(candidate) > max_chars:
+            if not snippet:
+                cut = candidate.rfind(" ", 0, max_chars - 1)
+                snippet = candidate[: cut if cut > 0 else max_chars - 1].rstrip() + "…"
+            break
+        snippet = candidate
+    return snippet
+
+
+class PassageIndex:
+    """
+    Vector index of note passages, mapped back to notes
+
+    Usage:
+        passages = PassageIndex(dimension=384, embedder=embedder)
+        passages.index_note("note-1", "Projet Alpha", long_markdown, {"type": "projet"})
+        matches = passages.search("budget prévisionnel", top_k=5)
+    """
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        embedder: Optional[EmbeddingGenerator] = None,
+        metric: str = "L2",
+        max_chars: int = DEFAULT_PASSAGE_CHARS,
+        overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+    ):
+        """
+        Initialize an empty passage index
+
+        Args:
+            dimension: Embedding vector dimension
+            embedder: EmbeddingGenerator shared with the note-level store
+            metric: Distance metric of the note-level store ("L2" or "cosine")
+            max_chars: Maximum passage length
+            overlap_chars: Overlap between consecutive passages of a section
+
+        Raises:
+            ValueError: If the passage sizes are invalid
+        """
+        if not 0 <= overlap_chars < max_chars:
+            raise ValueError(
+                f"Invalid passage sizes: max_chars={max_chars}, overlap_chars={overlap_chars}"
+            )
+
+        self.max_chars = max_chars
+        self.overlap_chars = overlap_chars
+        self.store = VectorStore(
+            dimension=dimension,
+            embedder=embedder,
+            metric=metric,
+            filter_fields=PASSAGE_FILTER_FIELDS,
+        )
+
+        # note_id -> passage doc_ids
+        self._note_passages: dict[str, list[str]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def _higher_is_better(self) -> bool:
+        return self.store.metric == "cosine"
+
+    def needs_passages(self, title: str, content: str) -> bool:
+        """Whether a note is too long for its single note-level embedding"""
+        return len(title) + 2 + len(content) > self.max_chars
+
+    def index_note(
+        self, note_id: str, title: str, content: str, metadata: Optional[dict[str, Any]] = None
+    ) -> int:
+        """
+        (Re)index the passages of one note
+
+        Args:
+            note_id: Note identifier
+            title: Note title (prefixed to each passage for context)
+            content: Note body
+            metadata: Note metadata copied to each passage (filter fields)
+
+        Returns:
+            Number of passages indexed
+        """
+        return self.index_notes([(note_id, title, content, metadata or {})])
+
+    def index_notes(self, notes: list[tuple[str, str, str, dict[str, Any]]]) -> int:
+        """
+        (Re)index the passages of several notes with one batch embedding
+
+        Existing passages of each note are replaced; notes that fit in a
+        single embedding end up with none.
+
+        Args:
+            notes: (note_id, title, content, metadata) tuples
+
+        Returns:
+            Number of passages indexed
+        """
+        documents: list[tuple[str, str, Optional[dict[str, Any]]]] = []
+        passage_ids: dict[str, list[str]] = {}
+
+        for note_id, title, content, metadata in notes:
+            if not self.needs_passages(title, content):
+                continue
+            ids = passage_ids.setdefault(note_id, [])
+            for number, passage in enumerate(
+                split_passages(content, self.max_chars, self.overlap_chars)
+            ):
+                doc_id = f"{note_id}#p{number}"
+                label = f"{title} — {passage.heading}" if passage.heading else title
+                documents.append(
+                    (
+                        doc_id,
+                        f"{label}\n\n{passage.text}",
+                        {**metadata, "note_id": note_id, "heading": passage.heading},
+                    )
+                )
+                ids.append(doc_id)
+
+        with self._lock:
+            for note_id, _, _, _ in notes:
+                self._remove_locked(note_id)
+            if documents:
+                self.store.add_batch(documents)
+                self._note_passages.update(passage_ids)
+
+        return len(documents)
+
+    def update_metadata(self, note_id: str, metadata: dict[str, Any]) -> None:
+        """
+        Refresh the note metadata copied to a note's passages
+
+        Args:
+            note_id: Note identifier
+            metadata: New note metadata
+        """
+        with self._lock:
+            for doc_id in self._note_passages.get(note_id, []):
+                doc = self.store.get_document(doc_id)
+                heading = doc["metadata"].get("heading", "") if doc else ""
+                self.store.update_metadata(
+                    doc_id, {**metadata, "note_id": note_id, "heading": heading}
+                )
+
+    def remove_note(self, note_id: str) -> int:
+        """
+        Remove all passages of a note
+
+        Args:
+            note_id: Note identifier
+
+        Returns:
+            Number of passages removed
+        """
+        with self._lock:
+            return self._remove_locked(note_id)
+
+    def _remove_locked(self, note_id: str) -> int:
+        removed = 0
+        for doc_id in self._note_passages.pop(note_id, []):
+            if self.store.remove(doc_id):
+                removed += 1
+        return removed
+
+    def has_passages(self, note_id: str) -> bool:
+        """Whether a note has indexed passages"""
+        with self._lock:
+            return bool(self._note_passages.get(note_id))
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        metadata_filter: Optional[MetadataFilter] = None,
+    ) -> list[PassageMatch]:
+        """
+        Search passages and aggregate hits per note
+
+        A note scores as its best passage (max-passage aggregation), which
+        keeps scores on the same scale as note-level search.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of notes to return
+            metadata_filter: Optional pre-filter on note fields
+
+        Returns:
+            Best passage per note, best first
+        """
+        with self._lock:
+            if not self._note_passages:
+                return []
+
+        hits = self.store.search(
+            query=query, top_k=top_k * PASSAGE_OVERSAMPLE, metadata_filter=metadata_filter
+        )
+
+        best: dict[str, PassageMatch] = {}
+        for doc_id, score, metadata in hits:
+            note_id = metadata.get("note_id")
+            if note_id is None:
+                continue
+            current = best.get(note_id)
+            if current is None or self.is_better(score, current.score):
+                doc = self.store.get_document(doc_id)
+                best[note_id] = PassageMatch(
+                    note_id=note_id,
+                    score=score,
+                    heading=metadata.get("heading", ""),
+                    text=self._passage_body(doc["text"]) if doc else "",
+                )
+
+        matches = sorted(best.values(), key=lambda m: m.score, reverse=self._higher_is_better)
+        return matches[:top_k]
+
+    def best_passage(self, note_id: str, query: str) -> Optional[PassageMatch]:
+        """
+        Best-matching passage of one note
+
+        Args:
+            note_id: Note identifier
+            query: Search query
+
+        Returns:
+            PassageMatch, or None if the note has no passages
+        """
+        if not self.has_passages(note_id):
+            return None
+        matches = self.search(
+            query, top_k=1, metadata_filter=MetadataFilter(match={"note_id": note_id})
+        )
+        return matches[0] if matches else None
+
+    def is_better(self, score: float, other: float) -> bool:
+        """Whether score ranks above other under the store metric"""
+        return score > other if self._higher_is_better else score < other
+
+    @staticmethod
+    def _passage_body(embedded_text: str) -> str:
+        """Strip the "title — heading" label from embedded passage text"""
+        _, _, body = embedded_text.partition("\n\n")
+        return body
+
+    def clear(self) -> None:
+        """Remove all passages"""
+        with self._lock:
+            self.store.clear()
+            self._note_passages.clear()
+
+    def save(self, path: Path) -> None:
+        """
+        Save the passage store
+
+        Args:
+            path: Directory to save to
+        """
+        self.store.save(path)
+
+    def load(self, path: Path) -> None:
+        """
+        Load the passage store and rebuild the note -> passages mapping
+
+        Args:
+            path: Directory to load from
+
+        Raises:
+            FileNotFoundError: If the store does not exist
+        """
+        self.store.load(path)
+        with self._lock:
+            self._note_passages = {}
+            for doc_id in sorted(self.store.doc_id_to_index_id, key=self._passage_number):
+                doc = self.store.get_document(doc_id)
+                note_id = doc["metadata"].get("note_id") if doc else None
+                if note_id:
+                    self._note_passages.setdefault(note_id, []).append(doc_id)
+
+    @staticmethod
+    def _passage_number(doc_id: str) -> int:
+        _, _, number = doc_id.rpartition("#p")
+        return int(number) if number.isdigit() else 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Passage index statistics"""
+        with self._lock:
+            notes = len(self._note_passages)
+            passages = sum(len(ids) for ids in self._note_passages.values())
+        return {"notes": notes, "passages": passages}
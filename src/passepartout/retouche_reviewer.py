@@ -52,6 +52,9 @@ logger = get_logger("passepartout.retouche_reviewer")
 # Maximum regex matches to process per pattern to prevent DoS on large documents
 MAX_REGEX_MATCHES = 100
 
+# Cosine similarity above which a note is reported as a likely duplicate
+DUPLICATE_SIMILARITY_THRESHOLD = 0.8
+
 # Template files mapping for note types (Point #3 - Templates depuis notes Modèle)
 # Path relative to notes_dir: Personal Knowledge Management/Modèles/
 TEMPLATE_FOLDER = "Personal Knowledge Management/Modèles"
@@ -1008,12 +1011,9 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
         linked_excerpts = {}
 
         for link in wikilinks[:10]:  # Limit to 10 linked notes
-            linked_note_results = self.notes.search_notes(query=link, top_k=1)
-            if linked_note_results:
-                if isinstance(linked_note_results[0], tuple):
-                    linked_note_obj = linked_note_results[0][0]
-                else:
-                    linked_note_obj = linked_note_results[0]
+            # Link graph lookup by title/alias; broken links add no context
+            linked_note_obj = self.notes.resolve_wikilink(link)
+            if linked_note_obj:
                 linked_notes.append(linked_note_obj)
                 linked_excerpts[link] = linked_note_obj.content[:500]
 
@@ -1101,19 +1101,15 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
         broken_links: list[str] = []
         wikilinks = self._extract_wikilinks(note.content)
         for link in wikilinks[:20]:  # Limit checks to avoid slowdown
-            search_result = self.notes.search_notes(query=link, top_k=3)
-            if not search_result:
-                # No match found
-                similar = self.notes.search_notes(query=link, top_k=1)
-                if similar:
-                    similar_note = similar[0][0] if isinstance(similar[0], tuple) else similar[0]
-                    broken_links.append(f"{link} -> suggest: {similar_note.title}")
-                else:
-                    broken_links.append(link)
-            elif isinstance(search_result[0], tuple):
-                score = search_result[0][1] if len(search_result[0]) > 1 else 1.0
-                if score < 0.7:
-                    broken_links.append(f"{link} (low confidence)")
+            if self.notes.resolve_wikilink(link):
+                continue
+            # Broken link: only now pay for a semantic search to suggest a target
+            similar = self.notes.search_notes(query=link, top_k=1)
+            if similar:
+                similar_note = similar[0][0] if isinstance(similar[0], tuple) else similar[0]
+                broken_links.append(f"{link} -> suggest: {similar_note.title}")
+            else:
+                broken_links.append(link)
 
         # Check heading hierarchy
         heading_issues: list[str] = []
@@ -1134,20 +1130,15 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
             formatting_score -= 0.1 * min(len(broken_links), 5)
         formatting_score = max(0.0, formatting_score)
 
-        # Detect duplicate candidates using vector similarity
+        # Detect duplicate candidates by cosine similarity of stored embeddings
         duplicate_candidates: list[tuple[str, float]] = []
         try:
-            similar_notes = self.notes.search_notes(query=note.content[:500], top_k=5)
-            for result in similar_notes:
-                if isinstance(result, tuple):
-                    similar_note, score = result[0], result[1] if len(result) > 1 else 0.0
-                else:
-                    similar_note, score = result, 0.0
-
-                if similar_note.note_id == note.note_id:
-                    continue
-                if score > 0.8:
-                    duplicate_candidates.append((similar_note.note_id, score))
+            pairs = self.notes.find_duplicate_notes(
+                min_similarity=DUPLICATE_SIMILARITY_THRESHOLD, note_ids=[note.note_id]
+            )
+            for note_a, note_b, score in pairs[:5]:
+                other_id = note_b if note_a == note.note_id else note_a
+                duplicate_candidates.append((other_id, score))
         except Exception as e:
             logger.debug(f"Duplicate detection failed: {e}")
 
@@ -1286,8 +1277,8 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
             if len(entity) < 3:
                 continue
 
-            search_results = self.notes.search_notes(query=entity, top_k=1)
-            if search_results:
+            # Only suggest entities that name an existing note (title or alias)
+            if self.notes.resolve_wikilink(entity):
                 suggestions.append({
                     "entity": entity,
                     "confidence": 0.7,
@@ -1420,13 +1411,20 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
             existing_links = set(self._extract_wikilinks(note.content))
             existing_links.add(note.title)  # Exclude self
 
-        # Search for similar notes using note content
+        # Search for similar notes: the note's stored embedding when it is
+        # indexed, its text otherwise
         try:
-            results = self.notes.search_notes(
-                query=f"{note.title} {note.content[:500]}",
-                top_k=top_k + len(existing_links),  # Get extra to filter
-                return_scores=True,
-            )
+            depth = top_k + len(existing_links)  # Get extra to filter
+            found = self.notes.search_by_id(note.note_id, top_k=depth, return_scores=True)
+            if not found:
+                found = self.notes.search_notes(
+                    query=f"{note.title} {note.content[:500]}",
+                    top_k=depth,
+                    return_scores=True,
+                )
+            results: list[tuple[Note, float]] = [
+                result for result in found if isinstance(result, tuple)
+            ]
 
             # Filter and format results
             suggestions = []
@@ -1980,6 +1978,54 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
 
         return content
 
+    def detect_duplicates(self, min_similarity: float = 0.9) -> int:
+        """
+        Flag near-duplicate notes as merge candidates (batch job).
+
+        Compares all note embeddings in one pass and, for each pair above
+        min_similarity, points the follower's merge_target_id at the master
+        chosen by _determine_merge_master. Notes already pointing at a merge
+        target are left alone, and each note is given at most one target
+        (its most similar master).
+
+        Args:
+            min_similarity: Minimum cosine similarity of a duplicate pair
+
+        Returns:
+            Number of notes newly flagged for merge
+        """
+        pairs = self.notes.find_duplicate_notes(min_similarity=min_similarity)
+
+        flagged: dict[str, NoteMetadata] = {}
+        masters: set[str] = set()
+        for note_a_id, note_b_id, score in pairs:
+            if note_a_id in flagged or note_b_id in flagged:
+                continue
+            note_a = self.notes.get_note(note_a_id)
+            note_b = self.notes.get_note(note_b_id)
+            if note_a is None or note_b is None:
+                continue
+            master, follower = self._determine_merge_master(note_a, note_b)
+            # A master must not itself be merged away in the same run
+            if follower.note_id in masters:
+                continue
+
+            metadata = self.store.get(follower.note_id)
+            if metadata is None or metadata.merge_target_id:
+                continue
+            metadata.merge_target_id = master.note_id
+            metadata.updated_at = datetime.now(timezone.utc)
+            flagged[follower.note_id] = metadata
+            masters.add(master.note_id)
+            logger.debug(
+                f"Merge candidate: {follower.note_id} -> {master.note_id} ({score:.3f})"
+            )
+
+        if flagged:
+            self.store.save_batch(list(flagged.values()))
+        logger.info(f"Duplicate detection flagged {len(flagged)} notes for merge")
+        return len(flagged)
+
     def _determine_merge_master(
         self, note_a: Note, note_b: Note
     ) -> tuple[Note, Note]:
@@ -2040,18 +2086,19 @@ Réponds UNIQUEMENT avec le contenu markdown restructuré, sans commentaires."""
                 )
                 return False
 
-            # Find target note by title
-            target_results = self.notes.search_notes(query=target_note_title, top_k=1)
-            if not target_results:
-                logger.warning(
-                    f"Merge target not found: {target_note_title}",
-                    extra={"source_note_id": source_note_id},
-                )
-                return False
+            # Find target note by title, then by similarity for inexact titles
+            target_note = self.notes.resolve_wikilink(target_note_title)
+            if target_note is None:
+                target_results = self.notes.search_notes(query=target_note_title, top_k=1)
+                if not target_results:
+                    logger.warning(
+                        f"Merge target not found: {target_note_title}",
+                        extra={"source_note_id": source_note_id},
+                    )
+                    return False
 
-            target_note = target_results[0]
-            if isinstance(target_note, tuple):
-                target_note = target_note[0]
+                best = target_results[0]
+                target_note = best[0] if isinstance(best, tuple) else best
 
             # Determine master/follower based on PKM priority and age
             master, follower = self._determine_merge_master(source_note, target_note)
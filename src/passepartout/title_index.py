@@ -0,0 +1,299 @@
+"""
+Fuzzy title index for entity lookups
+
+EntitySearcher resolves every entity extracted from an email against note
+titles and aliases. Comparing each entity to each title costs
+O(entities x notes) SequenceMatcher calls; this index narrows the
+comparison to names sharing a character bigram with the entity:
+
+- Names are normalized like EntitySearcher always did (lowercase,
+  accent-free, leading civility dropped) and indexed under their bigrams,
+  padded with a space so first and last letters count.
+- A name sharing no bigram with the entity only matches it one letter at
+  a time, which keeps the SequenceMatcher ratio under the fuzzy
+  thresholds; a name containing the entity shares all its bigrams.
+- Candidates are filtered by length, then scored with the same
+  SequenceMatcher ratio, so results are those of a full scan.
+- Titles and aliases (frontmatter "aliases") are indexed per note, and
+  updated note by note as notes change.
+"""
+
+import threading
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Optional
+
+from src.monitoring.logger import get_logger
+
+logger = get_logger("passepartout.title_index")
+
+# Common French abbreviations dropped from the start of a name
+ABBREVIATIONS = (
+    "m.",
+    "mme",
+    "mme.",
+    "mlle",
+    "mlle.",
+    "dr",
+    "dr.",
+    "pr",
+    "pr.",
+)
+
+# Separators between a title's main name and its qualifier
+TITLE_SEPARATORS = (" - ", " – ", " — ", " | ", " (")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an entity name or title for matching
+
+    Handles case, surrounding whitespace, accents ("Nàutil" -> "nautil")
+    and a leading civility or title ("M. Dupont" -> "dupont").
+
+    Args:
+        name: Raw name
+
+    Returns:
+        Normalized name
+    """
+    name = name.lower().strip()
+    # NFKD splits accented characters; dropping non-ASCII removes the accents
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+
+    for abbr in ABBREVIATIONS:
+        if name.startswith(abbr + " "):
+            name = name.replace(abbr + " ", "", 1)
+            break
+    return name
+
+
+def extract_name_from_title(title: str) -> str:
+    """
+    Extract the main name from a note title
+
+    "Marc Dupont - Tech Lead" -> "Marc Dupont", "Projet Alpha (2024)" ->
+    "Projet Alpha".
+
+    Args:
+        title: Note title
+
+    Returns:
+        Main name
+    """
+    title = title.strip()
+    for sep in TITLE_SEPARATORS:
+        if sep in title:
+            return title.split(sep)[0].strip()
+    return title
+
+
+def _bigrams(text: str) -> set[str]:
+    """Character bigrams of a string padded with a space at both ends"""
+    text = f" {text} "
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass
+class TitleMatch:
+    """A note whose title or alias matches an entity name"""
+
+    note_id: str
+    match_type: str  # "exact", "fuzzy", "partial"
+    score: float
+    name: str  # Normalized title or alias that matched
+
+
+@dataclass
+class _NameEntry:
+    """An indexed title or alias"""
+
+    full: str  # Normalized name
+    core: str  # Normalized main name, compared by similarity
+    bigrams: set[str]
+
+
+class TitleIndex:
+    """
+    Bigram index over normalized note titles and aliases
+
+    Thread-safe: all operations hold a lock.
+
+    Usage:
+        index = TitleIndex()
+        index.add_note("marc-dupont", "Marc Dupont - Tech Lead", aliases=["Marco"])
+        index.search("M. Dupont", threshold=0.7, partial_score=0.8)
+    """
+
+    def __init__(self):
+        """Create an empty index"""
+        self._lock = threading.Lock()
+        # Normalized name -> note IDs, in insertion order
+        self._exact: dict[str, dict[str, None]] = {}
+        # note_id -> its indexed names
+        self._entries: dict[str, list[_NameEntry]] = {}
+        # bigram -> note IDs whose names contain it
+        self._postings: dict[str, set[str]] = {}
+        # note_id -> insertion sequence, to break score ties like a scan would
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, note_id: str) -> bool:
+        with self._lock:
+            return note_id in self._entries
+
+    def _remove_locked(self, note_id: str) -> None:
+        """Drop a note's names (lock held)"""
+        entries = self._entries.pop(note_id, None)
+        self._order.pop(note_id, None)
+        if not entries:
+            return
+        for entry in entries:
+            note_ids = self._exact.get(entry.full)
+            if note_ids is not None:
+                note_ids.pop(note_id, None)
+                if not note_ids:
+                    del self._exact[entry.full]
+            for bigram in entry.bigrams:
+                postings = self._postings.get(bigram)
+                if postings is not None:
+                    postings.discard(note_id)
+                    if not postings:
+                        del self._postings[bigram]
+
+    def add_note(self, note_id: str, title: str, aliases: Optional[list[str]] = None) -> None:
+        """
+        Index (or re-index) a note's title and aliases
+
+        Args:
+            note_id: Note identifier
+            title: Note title
+            aliases: Alternative names of the note
+        """
+        names = [title, *(aliases or [])]
+        entries: dict[str, _NameEntry] = {}
+        for name in names:
+            if not name or not name.strip():
+                continue
+            full = normalize_name(name)
+            if full and full not in entries:
+                core = normalize_name(extract_name_from_title(full))
+                entries[full] = _NameEntry(full=full, core=core, bigrams=_bigrams(full))
+
+        with self._lock:
+            order = self._order.get(note_id)
+            self._remove_locked(note_id)
+            if not entries:
+                return
+            if order is None:
+                order = self._next_order
+                self._next_order += 1
+            self._order[note_id] = order
+            self._entries[note_id] = list(entries.values())
+            for entry in entries.values():
+                self._exact.setdefault(entry.full, {})[note_id] = None
+                for bigram in entry.bigrams:
+                    self._postings.setdefault(bigram, set()).add(note_id)
+
+    def remove_note(self, note_id: str) -> None:
+        """
+        Remove a note
+
+        Args:
+            note_id: Note identifier
+        """
+        with self._lock:
+            self._remove_locked(note_id)
+
+    def clear(self) -> None:
+        """Remove all notes"""
+        with self._lock:
+            self._exact.clear()
+            self._entries.clear()
+            self._postings.clear()
+            self._order.clear()
+            self._next_order = 0
+
+    def search(self, name: str, threshold: float, partial_score: float) -> list[TitleMatch]:
+        """
+        Find notes whose title or an alias matches a name
+
+        For each note, the best of its names wins: exact (normalized names
+        equal), fuzzy (SequenceMatcher ratio of the main names at least
+        threshold) or partial (the name is contained in the title).
+
+        Args:
+            name: Entity name (normalized here)
+            threshold: Minimum similarity for a fuzzy match
+            partial_score: Score given to partial matches
+
+        Returns:
+            Matches, best score first (ties in indexing order)
+        """
+        query = normalize_name(name)
+        if not query:
+            return []
+
+        with self._lock:
+            best: dict[str, TitleMatch] = {}
+            for note_id in self._exact.get(query, {}):
+                best[note_id] = TitleMatch(note_id, "exact", 1.0, query)
+
+            candidates: set[str] = set()
+            for bigram in _bigrams(query):
+                candidates.update(self._postings.get(bigram, ()))
+            # A one-letter name has no inner bigram to find it inside a title
+            if len(query) < 2:
+                candidates = set(self._entries)
+            candidates.difference_update(best)
+
+            for note_id in candidates:
+                match = self._match_note_locked(note_id, query, threshold, partial_score)
+                if match is not None:
+                    best[note_id] = match
+
+            order = self._order
+            return sorted(best.values(), key=lambda m: (-m.score, order.get(m.note_id, 0)))
+
+    def _match_note_locked(
+        self, note_id: str, query: str, threshold: float, partial_score: float
+    ) -> Optional[TitleMatch]:
+        """Best fuzzy or partial match among a note's names (lock held)"""
+        best: Optional[TitleMatch] = None
+        for entry in self._entries.get(note_id, ()):
+            score = _similarity(query, entry.core, threshold)
+            if score >= threshold:
+                match = TitleMatch(note_id, "fuzzy", score, entry.full)
+            elif query in entry.full:
+                match = TitleMatch(note_id, "partial", partial_score, entry.full)
+            else:
+                continue
+            if best is None or match.score > best.score:
+                best = match
+        return best
+
+    def get_stats(self) -> dict[str, int]:
+        """Index statistics"""
+        with self._lock:
+            return {
+                "notes": len(self._entries),
+                "names": sum(len(entries) for entries in self._entries.values()),
+                "bigrams": len(self._postings),
+            }
+
+
+def _similarity(a: str, b: str, threshold: float) -> float:
+    """SequenceMatcher ratio, skipping the full computation below threshold"""
+    # Length alone bounds the ratio: 2 * min / (len_a + len_b)
+    total = len(a) + len(b)
+    if not total or 2 * min(len(a), len(b)) / total < threshold:
+        return 0.0
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
@@ -5,31 +5,115 @@ FAISS-based vector store for efficient similarity search over embeddings.
 Supports adding documents, searching, persistence, and filtering.
 """
 
+import base64
 import datetime
 import hashlib
 import hmac
 import json
+import math
+import os
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import IO, Any, Callable, Optional
 
 import faiss
 import numpy as np
 
 from src.monitoring.logger import get_logger
 from src.passepartout.embeddings import EmbeddingGenerator
+from src.passepartout.metadata_filter import (
+    DEFAULT_DATE_FIELDS,
+    DEFAULT_FILTER_FIELDS,
+    MetadataBitsetIndex,
+    MetadataFilter,
+)
+from src.utils.file_utils import get_file_hash
+from src.utils.stats_utils import calculate_percentiles
 
 logger = get_logger("passepartout.vector_store")
 
+# On-disk layout
+STORAGE_FORMAT_VERSION = 2
+INDEX_FILENAME = "index.faiss"
+METADATA_FILENAME = "metadata.json"
+EMBEDDINGS_FILENAME = "embeddings.npy"
+CHECKSUM_FILENAME = "metadata.sha256"
+JOURNAL_FILENAME = "journal.jsonl"
+
+# Index types
+INDEX_TYPES = ("flat", "ivf", "hnsw")
+# ANN index types stay exact (flat) until the corpus reaches this size
+DEFAULT_ANN_THRESHOLD = 10_000
+# IVF: probed lists per query; HNSW: graph degree and search breadth
+DEFAULT_IVF_NPROBE = 16
+DEFAULT_HNSW_M = 32
+DEFAULT_HNSW_EF_SEARCH = 64
+# HNSW cannot remove vectors: rebuild once this share of the graph is deleted
+HNSW_TOMBSTONE_REBUILD_RATIO = 0.2
+# Recent search latencies kept for get_stats()
+LATENCY_WINDOW = 1000
+
+
+def _make_serializable(obj: Any) -> Any:
+    """Recursively convert non-JSON-serializable types (dates, numpy arrays)"""
+    if isinstance(obj, dict):
+        return {k: _make_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_make_serializable(item) for item in obj]
+    elif isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
+
+
+def _journal_add_record(
+    doc_id: str, text: str, metadata: Optional[dict[str, Any]], embedding: np.ndarray
+) -> dict[str, Any]:
+    """Build an "add" journal record carrying the embedding as base64 float32"""
+    return {
+        "op": "add",
+        "doc_id": doc_id,
+        "text": text,
+        "metadata": _make_serializable(metadata or {}),
+        "embedding": base64.b64encode(
+            np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+        ).decode("ascii"),
+    }
+
+
+def _atomic_write_bytes(file_path: Path, write: Callable[[IO[bytes]], Any]) -> None:
+    """
+    Write a binary file atomically (temp file + rename)
+
+    Args:
+        file_path: Destination path
+        write: Callback receiving the open temporary file
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class VectorStore:
     """
     FAISS-based vector store for semantic search
 
     Features:
-    - Efficient similarity search using FAISS L2 index
+    - Exact (flat) or approximate (IVF/HNSW) FAISS index, ID-mapped so
+      removed documents leave the index instead of being scanned
     - Document metadata storage
-    - Persistence (save/load)
+    - Persistence (save/load) with memory-mapped float32 embeddings
+    - Structured metadata pre-filters (bitset index fed to FAISS)
     - Optional filtering on search results
     - Thread-safe operations
 
@@ -43,7 +127,15 @@ class VectorStore:
         self,
         dimension: int = 384,
         embedder: Optional[EmbeddingGenerator] = None,
-        metric: str = "L2"
+        metric: str = "L2",
+        mmap_embeddings: bool = True,
+        index_type: str = "flat",
+        ann_threshold: int = DEFAULT_ANN_THRESHOLD,
+        nprobe: int = DEFAULT_IVF_NPROBE,
+        hnsw_m: int = DEFAULT_HNSW_M,
+        ef_search: int = DEFAULT_HNSW_EF_SEARCH,
+        filter_fields: tuple[str, ...] = DEFAULT_FILTER_FIELDS,
+        date_filter_fields: tuple[str, ...] = DEFAULT_DATE_FIELDS
     ):
         """
         Initialize vector store
@@ -52,9 +144,19 @@ class VectorStore:
             dimension: Embedding vector dimension
             embedder: EmbeddingGenerator instance (creates new if None)
             metric: Distance metric ("L2" or "cosine")
+            mmap_embeddings: Memory-map embeddings.npy on load instead of
+                reading it into RAM
+            index_type: "flat" (exact), "ivf" or "hnsw" (approximate)
+            ann_threshold: Active document count at which an ANN index
+                type is trained and replaces the exact index
+            nprobe: IVF lists probed per query
+            hnsw_m: HNSW graph degree
+            ef_search: HNSW search breadth
+            filter_fields: Metadata fields indexed for MetadataFilter.match
+            date_filter_fields: Metadata fields indexed for date ranges
 
         Raises:
-            ValueError: If dimension invalid or metric unsupported
+            ValueError: If dimension invalid, metric or index type unsupported
         """
         if dimension <= 0:
             raise ValueError(f"Dimension must be positive, got {dimension}")
@@ -62,15 +164,27 @@ class VectorStore:
         if metric not in ["L2", "cosine"]:
             raise ValueError(f"Unsupported metric: {metric}. Use 'L2' or 'cosine'")
 
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unsupported index type: {index_type}. Use one of {INDEX_TYPES}")
+
         self.dimension = dimension
         self.metric = metric
-
-        # Initialize FAISS index
-        if metric == "L2":
-            self.index = faiss.IndexFlatL2(dimension)
-        else:  # cosine
-            # For cosine similarity, use inner product with normalized vectors
-            self.index = faiss.IndexFlatIP(dimension)
+        self.mmap_embeddings = mmap_embeddings
+        self.index_type = index_type
+        self.ann_threshold = ann_threshold
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+
+        # Initialize FAISS index (exact until an ANN index is trained)
+        self.index = self._new_flat_index()
+        self._ann_active = False
+        # Deleted vectors still inside an index that cannot remove them (HNSW)
+        self._tombstones = 0
+
+        # Search monitoring
+        self._search_latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._ann_recall: Optional[float] = None
 
         # Metadata storage: index_id → document info
         self.id_to_doc: dict[int, dict[str, Any]] = {}
@@ -81,12 +195,20 @@ class VectorStore:
         # Counter for index IDs
         self._next_index_id = 0
 
+        # Inverted bitsets over metadata for pre-filtered search
+        self._filter_index = MetadataBitsetIndex(filter_fields, date_filter_fields)
+
         # Embedder
         self.embedder = embedder if embedder is not None else EmbeddingGenerator()
 
         # Thread-safety lock (reentrant for nested calls)
         self._store_lock = threading.RLock()
 
+        # Append-only mutation journal, bound to the directory the store was
+        # last saved to / loaded from (None = not persisted yet)
+        self._journal_path: Optional[Path] = None
+        self._journal_entries = 0
+
         logger.info(
             "Initialized VectorStore",
             extra={
@@ -138,21 +260,9 @@ class VectorStore:
             if doc_id in self.doc_id_to_index_id:
                 raise ValueError(f"Document ID '{doc_id}' already exists in store")
 
-            # Add to FAISS index
-            embedding_2d = embedding.reshape(1, -1).astype(np.float32)
-            self.index.add(embedding_2d)
-
-            # Store metadata
-            index_id = self._next_index_id
-            self.id_to_doc[index_id] = {
-                "doc_id": doc_id,
-                "text": text,
-                "metadata": metadata or {},
-                "embedding": embedding  # Store for later use
-            }
-
-            self.doc_id_to_index_id[doc_id] = index_id
-            self._next_index_id += 1
+            index_id = self._insert_locked(doc_id, text, metadata, embedding)
+            self._journal_append([_journal_add_record(doc_id, text, metadata, embedding)])
+            self._maybe_train_ann()
 
             logger.debug(
                 "Added document to vector store",
@@ -208,9 +318,13 @@ class VectorStore:
                 if doc_id in self.doc_id_to_index_id:
                     raise ValueError(f"Document ID '{doc_id}' already exists in store")
 
-            # Add all embeddings to index
+            # Add all embeddings to index under their index IDs
             embeddings_float32 = embeddings.astype(np.float32)
-            self.index.add(embeddings_float32)
+            first_id = self._next_index_id
+            self.index.add_with_ids(
+                embeddings_float32,
+                np.arange(first_id, first_id + len(documents), dtype=np.int64),
+            )
 
             # Store metadata for all documents
             index_ids = []
@@ -226,6 +340,19 @@ class VectorStore:
                 index_ids.append(index_id)
                 self._next_index_id += 1
 
+            # Large batches: one bulk bitset build beats per-document updates
+            if len(documents) > len(self.doc_id_to_index_id) // 4:
+                self._rebuild_filter_index_locked()
+            else:
+                for index_id in index_ids:
+                    self._filter_index.add(index_id, self.id_to_doc[index_id]["metadata"])
+
+            self._journal_append([
+                _journal_add_record(doc_id, text, metadata, embedding)
+                for (doc_id, text, metadata), embedding in zip(documents, embeddings)
+            ])
+            self._maybe_train_ann()
+
             logger.info(
                 "Added batch to vector store",
                 extra={
@@ -240,7 +367,8 @@ class VectorStore:
         self,
         query: str,
         top_k: int = 10,
-        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None
+        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None,
+        metadata_filter: Optional[MetadataFilter] = None
     ) -> list[tuple[str, float, dict[str, Any]]]:
         """
         Search for similar documents (thread-safe)
@@ -250,6 +378,9 @@ class VectorStore:
             top_k: Number of results to return
             filter_fn: Optional filter function on metadata
                       Should return True to include document
+            metadata_filter: Optional structured filter, applied before
+                      scoring so a full top_k is returned when enough
+                      documents match
 
         Returns:
             List of (doc_id, score, metadata) tuples, sorted by relevance
@@ -276,66 +407,205 @@ class VectorStore:
             logger.error(f"Failed to generate query embedding: {e}", exc_info=True)
             raise RuntimeError(f"Query embedding generation failed: {e}") from e
 
-        # Acquire lock for reading store state and searching
+        results = self.search_by_vector(
+            query_embedding, top_k, filter_fn=filter_fn, metadata_filter=metadata_filter
+        )
+        logger.debug(
+            "Search completed",
+            extra={"query": query[:50], "results_count": len(results)}
+        )
+        return results
+
+    def search_by_vector(
+        self,
+        vector: np.ndarray,
+        top_k: int = 10,
+        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None,
+        metadata_filter: Optional[MetadataFilter] = None
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """
+        Search for documents similar to an embedding (thread-safe)
+
+        Same results and scores as search(), without embedding a query.
+
+        Args:
+            vector: Query embedding (normalized here for the cosine metric)
+            top_k: Number of results to return
+            filter_fn: Optional filter function on metadata
+            metadata_filter: Optional structured pre-filter
+
+        Returns:
+            List of (doc_id, score, metadata) tuples, sorted by relevance
+
+        Raises:
+            ValueError: If top_k is invalid or the vector has the wrong dimension
+        """
+        if top_k <= 0:
+            raise ValueError(f"top_k must be positive, got {top_k}")
+
+        query_2d = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        if query_2d.shape[1] != self.dimension:
+            raise ValueError(
+                f"Vector dimension {query_2d.shape[1]} does not match store "
+                f"dimension {self.dimension}"
+            )
+        if self.metric == "cosine":
+            query_2d = self._normalize_rows(query_2d)
+
         with self._store_lock:
             if len(self.id_to_doc) == 0:
                 logger.warning("Search called on empty vector store")
                 return []
+            return self._search_vectors_locked(
+                query_2d, top_k, filter_fn, metadata_filter
+            )[0]
 
-            # Search in FAISS
-            # Request more results if filtering
-            search_k = min(top_k * 3 if filter_fn else top_k, len(self.id_to_doc))
+    def search_by_id(
+        self,
+        doc_id: str,
+        top_k: int = 10,
+        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None,
+        metadata_filter: Optional[MetadataFilter] = None
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """
+        Find documents similar to a stored document ("more like this")
 
-            query_2d = query_embedding.reshape(1, -1).astype(np.float32)
-            distances, indices = self.index.search(query_2d, search_k)
+        Uses the stored embedding, so nothing is re-embedded. The document
+        itself is left out of the results.
 
-            # Convert to results
-            results = []
-            for distance, index_id in zip(distances[0], indices[0]):
-                # FAISS returns -1 for not found
-                if index_id == -1:
-                    continue
+        Args:
+            doc_id: Stored document identifier
+            top_k: Number of results to return
+            filter_fn: Optional filter function on metadata
+            metadata_filter: Optional structured pre-filter
 
-                index_id = int(index_id)
-                doc_info = self.id_to_doc.get(index_id)
-                if doc_info is None:
-                    logger.warning(f"Index ID {index_id} not found in metadata store")
-                    continue
+        Returns:
+            List of (doc_id, score, metadata) tuples, sorted by relevance
+            (empty if doc_id is not stored)
 
-                # Skip deleted documents
-                if doc_info.get("_deleted", False):
-                    continue
+        Raises:
+            ValueError: If top_k is invalid
+        """
+        if top_k <= 0:
+            raise ValueError(f"top_k must be positive, got {top_k}")
 
-                # Apply filter
-                if filter_fn and not filter_fn(doc_info["metadata"]):
-                    continue
+        embedding = self.get_embedding(doc_id)
+        if embedding is None:
+            logger.debug(f"search_by_id: unknown document {doc_id}")
+            return []
 
-                results.append((
-                    doc_info["doc_id"],
-                    float(distance),
-                    doc_info["metadata"]
-                ))
+        results = self.search_by_vector(
+            embedding, top_k + 1, filter_fn=filter_fn, metadata_filter=metadata_filter
+        )
+        return [result for result in results if result[0] != doc_id][:top_k]
 
-                # Stop if we have enough results
-                if len(results) >= top_k:
-                    break
+    def get_embedding(self, doc_id: str) -> Optional[np.ndarray]:
+        """
+        Get the stored embedding of a document (thread-safe)
 
-            logger.debug(
-                "Search completed",
-                extra={
-                    "query": query[:50],
-                    "results_count": len(results),
-                    "total_docs": len(self.id_to_doc)
-                }
-            )
+        Args:
+            doc_id: Document identifier
 
-            return results
+        Returns:
+            float32 vector (a copy), or None if the document is not stored
+        """
+        with self._store_lock:
+            index_id = self.doc_id_to_index_id.get(doc_id)
+            if index_id is None:
+                return None
+            return np.array(self.id_to_doc[index_id]["embedding"], dtype=np.float32)
+
+    def find_near_duplicates(
+        self,
+        min_similarity: float = 0.9,
+        doc_ids: Optional[list[str]] = None,
+        metadata_filter: Optional[MetadataFilter] = None,
+        block_size: int = 1024
+    ) -> list[tuple[str, str, float]]:
+        """
+        Find pairs of stored documents with near-identical embeddings
+
+        Compares stored embeddings by cosine similarity with one matrix
+        product per block of rows (block_size x N), so all pairs of a few
+        thousand documents cost a handful of BLAS calls and no embedding.
+
+        Args:
+            min_similarity: Minimum cosine similarity of a pair
+            doc_ids: Only pairs involving these documents (all pairs if None)
+            metadata_filter: Only compare documents matching this filter
+            block_size: Rows per matrix product (bounds memory to
+                block_size x N floats)
+
+        Returns:
+            (doc_id_a, doc_id_b, similarity) tuples, most similar first,
+            each pair once with doc_id_a < doc_id_b
+
+        Raises:
+            ValueError: If min_similarity is outside [-1, 1] or block_size invalid
+        """
+        if not -1.0 <= min_similarity <= 1.0:
+            raise ValueError(f"min_similarity must be in [-1, 1], got {min_similarity}")
+        if block_size <= 0:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+
+        # Snapshot the active documents under the lock, compute outside it
+        with self._store_lock:
+            index_ids = [
+                index_id for index_id in self.doc_id_to_index_id.values()
+                if not self.id_to_doc[index_id].get("_deleted", False)
+            ]
+            if metadata_filter is not None and not metadata_filter.is_empty():
+                bitmap = self._filter_index.resolve(metadata_filter, self._next_index_id)
+                selected = set(
+                    np.flatnonzero(
+                        np.unpackbits(bitmap, bitorder="little")[: self._next_index_id]
+                    ).tolist()
+                )
+                index_ids = [index_id for index_id in index_ids if index_id in selected]
+            if len(index_ids) < 2:
+                return []
+            names = [self.id_to_doc[index_id]["doc_id"] for index_id in index_ids]
+            matrix = np.stack(
+                [self.id_to_doc[index_id]["embedding"] for index_id in index_ids]
+            ).astype(np.float32)
+
+        matrix = self._normalize_rows(matrix)
+        if doc_ids is None:
+            rows = np.arange(len(names))
+        else:
+            wanted = set(doc_ids)
+            rows = np.array([i for i, name in enumerate(names) if name in wanted], dtype=np.int64)
+
+        pairs: dict[tuple[str, str], float] = {}
+        for start in range(0, len(rows), block_size):
+            block_rows = rows[start : start + block_size]
+            similarities = matrix[block_rows] @ matrix.T
+            # Drop self-pairs; in all-pairs mode keep each pair once (j > i)
+            similarities[np.arange(len(block_rows)), block_rows] = -np.inf
+            if doc_ids is None:
+                similarities[np.arange(len(matrix))[None, :] <= block_rows[:, None]] = -np.inf
+            for i, j in zip(*np.nonzero(similarities >= min_similarity)):
+                a, b = sorted((names[block_rows[i]], names[j]))
+                pairs[(a, b)] = float(similarities[i, j])
+
+        return sorted(
+            ((a, b, similarity) for (a, b), similarity in pairs.items()),
+            key=lambda pair: pair[2],
+            reverse=True
+        )
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Scale rows to unit L2 norm (zero rows are left as is)"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
 
     def search_batch(
         self,
         queries: list[str],
         top_k: int = 10,
-        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None
+        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None,
+        metadata_filter: Optional[MetadataFilter] = None
     ) -> list[list[tuple[str, float, dict[str, Any]]]]:
         """
         Search for similar documents with multiple queries (thread-safe)
@@ -347,6 +617,7 @@ class VectorStore:
             queries: List of search query texts
             top_k: Number of results per query
             filter_fn: Optional filter function on metadata (applied to all queries)
+            metadata_filter: Optional structured pre-filter (applied to all queries)
 
         Returns:
             List of results per query. Each result is a list of
@@ -383,42 +654,15 @@ class VectorStore:
                 logger.warning("Batch search called on empty vector store")
                 return [[] for _ in queries]
 
-            # Search for each query
+            # Search all queries in a single FAISS call
             all_results: list[list[tuple[str, float, dict[str, Any]]]] = [[] for _ in queries]
-
-            for (original_idx, _query), query_embedding in zip(valid_queries, query_embeddings):
-                # Search in FAISS
-                search_k = min(top_k * 3 if filter_fn else top_k, len(self.id_to_doc))
-
-                query_2d = query_embedding.reshape(1, -1).astype(np.float32)
-                distances, indices = self.index.search(query_2d, search_k)
-
-                # Convert to results
-                results = []
-                for distance, index_id in zip(distances[0], indices[0]):
-                    if index_id == -1:
-                        continue
-
-                    index_id = int(index_id)
-                    doc_info = self.id_to_doc.get(index_id)
-                    if doc_info is None:
-                        continue
-
-                    if doc_info.get("_deleted", False):
-                        continue
-
-                    if filter_fn and not filter_fn(doc_info["metadata"]):
-                        continue
-
-                    results.append((
-                        doc_info["doc_id"],
-                        float(distance),
-                        doc_info["metadata"]
-                    ))
-
-                    if len(results) >= top_k:
-                        break
-
+            queries_2d = np.asarray(
+                query_embeddings[:len(valid_queries)], dtype=np.float32
+            ).reshape(len(valid_queries), -1)
+            batch_results = self._search_vectors_locked(
+                queries_2d, top_k, filter_fn, metadata_filter
+            )
+            for (original_idx, _query), results in zip(valid_queries, batch_results):
                 all_results[original_idx] = results
 
             logger.debug(
@@ -432,6 +676,291 @@ class VectorStore:
 
             return all_results
 
+    def _search_vectors_locked(
+        self,
+        queries_2d: np.ndarray,
+        top_k: int,
+        filter_fn: Optional[Callable[[dict[str, Any]], bool]] = None,
+        metadata_filter: Optional[MetadataFilter] = None
+    ) -> list[list[tuple[str, float, dict[str, Any]]]]:
+        """
+        Run FAISS search for a batch of query vectors (must hold _store_lock)
+
+        Returns:
+            One list of (doc_id, score, metadata) tuples per query row
+        """
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(queries_2d))]
+
+        params = None
+        bitmap = None
+        if metadata_filter is not None and not metadata_filter.is_empty():
+            bitmap = self._filter_index.resolve(metadata_filter, self._next_index_id)
+            if not bitmap.any():
+                return [[] for _ in range(len(queries_2d))]
+            # IDSelectorBitmap takes the size in bytes; bitmap must stay
+            # referenced for the duration of the search
+            params = self._search_params(
+                faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap))
+            )
+
+        # Request more results if filtering, plus room for HNSW tombstones
+        search_k = min(
+            (top_k * 3 if filter_fn else top_k) + self._tombstones, self.index.ntotal
+        )
+
+        start = time.perf_counter()
+        distances, indices = self.index.search(queries_2d, search_k, params=params)
+        self._search_latencies_ms.append(
+            (time.perf_counter() - start) * 1000 / max(len(queries_2d), 1)
+        )
+
+        # ANN probing can miss selective filters; score the matches exactly instead
+        if bitmap is not None and self._ann_active:
+            selected = np.flatnonzero(
+                np.unpackbits(bitmap, bitorder="little")[: self._next_index_id]
+            )
+            short_rows = (indices >= 0).sum(axis=1) < min(search_k, len(selected))
+            if short_rows.any():
+                exact_d, exact_i = self._exact_search_ids(
+                    queries_2d[short_rows], selected, search_k
+                )
+                distances[short_rows] = exact_d
+                indices[short_rows] = exact_i
+
+        all_results = []
+        for row_distances, row_indices in zip(distances, indices):
+            results = []
+            for distance, index_id in zip(row_distances, row_indices):
+                # FAISS returns -1 for not found
+                if index_id == -1:
+                    continue
+
+                index_id = int(index_id)
+                doc_info = self.id_to_doc.get(index_id)
+                if doc_info is None:
+                    logger.warning(f"Index ID {index_id} not found in metadata store")
+                    continue
+
+                # Skip deleted documents (HNSW tombstones)
+                if doc_info.get("_deleted", False):
+                    continue
+
+                # Apply filter
+                if filter_fn and not filter_fn(doc_info["metadata"]):
+                    continue
+
+                results.append((
+                    doc_info["doc_id"],
+                    float(distance),
+                    doc_info["metadata"]
+                ))
+
+                # Stop if we have enough results
+                if len(results) >= top_k:
+                    break
+            all_results.append(results)
+
+        return all_results
+
+    def _search_params(self, selector: faiss.IDSelector) -> faiss.SearchParameters:
+        """Search parameters carrying selector, typed for the active index"""
+        base = faiss.downcast_index(self.index.index)
+        if isinstance(base, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(sel=selector, nprobe=base.nprobe)
+        if isinstance(base, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=base.hnsw.efSearch)
+        return faiss.SearchParameters(sel=selector)
+
+    def _exact_search_ids(
+        self, queries_2d: np.ndarray, index_ids: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Brute-force search restricted to index_ids (must hold _store_lock)
+
+        Returns:
+            (distances, indices) shaped like faiss search output, padded with -1
+        """
+        candidates = [
+            int(idx) for idx in index_ids
+            if int(idx) in self.id_to_doc and not self.id_to_doc[int(idx)].get("_deleted", False)
+        ]
+        distances = np.full((len(queries_2d), k), np.nan, dtype=np.float32)
+        indices = np.full((len(queries_2d), k), -1, dtype=np.int64)
+        if not candidates:
+            return distances, indices
+
+        exact = self._new_flat_index()
+        exact.add_with_ids(
+            np.array([self.id_to_doc[idx]["embedding"] for idx in candidates]).astype(np.float32),
+            np.array(candidates, dtype=np.int64),
+        )
+        found_d, found_i = exact.search(queries_2d, min(k, len(candidates)))
+        distances[:, : found_d.shape[1]] = found_d
+        indices[:, : found_i.shape[1]] = found_i
+        return distances, indices
+
+    # === INDEX MANAGEMENT ===
+
+    def _new_flat_index(self) -> faiss.Index:
+        """Create an empty exact index whose IDs are our index IDs"""
+        if self.metric == "L2":
+            base = faiss.IndexFlatL2(self.dimension)
+        else:  # cosine
+            # For cosine similarity, use inner product with normalized vectors
+            base = faiss.IndexFlatIP(self.dimension)
+        return faiss.IndexIDMap2(base)
+
+    def _build_index(
+        self, embeddings: np.ndarray, ids: np.ndarray
+    ) -> tuple[faiss.Index, bool]:
+        """
+        Build an index over the given vectors
+
+        Uses the configured ANN index type once the corpus is past
+        ann_threshold, an exact index otherwise.
+
+        Returns:
+            (index, ann_active)
+        """
+        count = len(ids)
+        if self.index_type == "flat" or count < self.ann_threshold:
+            index = self._new_flat_index()
+            if count:
+                index.add_with_ids(embeddings, ids)
+            return index, False
+
+        faiss_metric = faiss.METRIC_L2 if self.metric == "L2" else faiss.METRIC_INNER_PRODUCT
+
+        if self.index_type == "ivf":
+            # ~4*sqrt(N) lists, keeping FAISS' minimum of 39 training points per list
+            nlist = max(1, min(int(4 * math.sqrt(count)), count // 39))
+            if self.metric == "L2":
+                quantizer = faiss.IndexFlatL2(self.dimension)
+            else:
+                quantizer = faiss.IndexFlatIP(self.dimension)
+            base = faiss.IndexIVFFlat(quantizer, self.dimension, nlist, faiss_metric)
+            base.train(embeddings)
+            base.nprobe = min(self.nprobe, nlist)
+        else:  # hnsw
+            base = faiss.IndexHNSWFlat(self.dimension, self.hnsw_m, faiss_metric)
+            base.hnsw.efSearch = self.ef_search
+
+        index = faiss.IndexIDMap2(base)
+        index.add_with_ids(embeddings, ids)
+        return index, True
+
+    def _rebuild_faiss_index_locked(self) -> None:
+        """Recreate the FAISS index from stored embeddings (must hold _store_lock)"""
+        active = [
+            (idx, doc_info["embedding"])
+            for idx, doc_info in self.id_to_doc.items()
+            if not doc_info.get("_deleted", False)
+        ]
+        if active:
+            ids = np.array([idx for idx, _ in active], dtype=np.int64)
+            embeddings = np.array([emb for _, emb in active]).astype(np.float32)
+        else:
+            ids = np.empty(0, dtype=np.int64)
+            embeddings = np.empty((0, self.dimension), dtype=np.float32)
+
+        self.index, self._ann_active = self._build_index(embeddings, ids)
+        self._tombstones = 0
+
+    def _maybe_train_ann(self) -> None:
+        """Switch to the ANN index once the corpus passes ann_threshold (must hold _store_lock)"""
+        if self.index_type == "flat" or self._ann_active:
+            return
+        if len(self.doc_id_to_index_id) < self.ann_threshold:
+            return
+
+        start = time.perf_counter()
+        self._rebuild_faiss_index_locked()
+        logger.info(
+            "Trained ANN index",
+            extra={
+                "index_type": self.index_type,
+                "documents": self.index.ntotal,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            },
+        )
+        self.estimate_recall()
+
+    def _supports_remove(self) -> bool:
+        """Whether the current index can physically remove vectors"""
+        return not (self._ann_active and self.index_type == "hnsw")
+
+    def _adopt_loaded_index(self, index: faiss.Index, saved_index_type: str) -> None:
+        """
+        Install an index read from disk (must hold _store_lock)
+
+        Indexes from older layouts (plain sequential IDs) or built for a
+        different index_type are rebuilt from the stored embeddings.
+        """
+        if not isinstance(index, faiss.IndexIDMap2) or saved_index_type != self.index_type:
+            self._rebuild_faiss_index_locked()
+            return
+
+        base = faiss.downcast_index(index.index)
+        self.index = index
+        self._ann_active = not isinstance(base, faiss.IndexFlat)
+        if isinstance(base, faiss.IndexIVF):
+            base.nprobe = min(self.nprobe, base.nlist)
+        elif isinstance(base, faiss.IndexHNSW):
+            base.hnsw.efSearch = self.ef_search
+        active_count = len(self.doc_id_to_index_id)
+        self._tombstones = max(0, index.ntotal - active_count)
+
+    def estimate_recall(self, sample_size: int = 100, k: int = 10) -> Optional[float]:
+        """
+        Measure ANN recall@k against exact search on stored vectors
+
+        Queries the index with a random sample of stored embeddings and
+        compares the hits with brute-force results. The value is reported
+        by get_stats().
+
+        Args:
+            sample_size: Number of stored vectors used as queries
+            k: Neighbours compared per query
+
+        Returns:
+            Recall in [0, 1], or None if no ANN index is active
+        """
+        with self._store_lock:
+            if not self._ann_active:
+                return None
+
+            active_ids = list(self.doc_id_to_index_id.values())
+            if not active_ids:
+                return None
+
+            rng = np.random.default_rng()
+            sample = rng.choice(active_ids, size=min(sample_size, len(active_ids)), replace=False)
+            all_ids = np.array(active_ids, dtype=np.int64)
+            matrix = np.array(
+                [self.id_to_doc[idx]["embedding"] for idx in active_ids]
+            ).astype(np.float32)
+            queries = np.array([self.id_to_doc[int(idx)]["embedding"] for idx in sample]).astype(
+                np.float32
+            )
+
+            k = min(k, len(active_ids))
+            exact = self._new_flat_index()
+            exact.add_with_ids(matrix, all_ids)
+            _, expected = exact.search(queries, k)
+            _, actual = self.index.search(queries, k + self._tombstones)
+
+            hits = 0
+            for expected_row, actual_row in zip(expected, actual):
+                hits += len(set(expected_row.tolist()) & set(actual_row.tolist()))
+            self._ann_recall = hits / (len(queries) * k)
+
+            logger.info(
+                "Estimated ANN recall",
+                extra={"recall_at_k": round(self._ann_recall, 3), "k": k, "queries": len(queries)},
+            )
+            return self._ann_recall
+
     def get_document(self, doc_id: str) -> Optional[dict[str, Any]]:
         """
         Get document by ID
@@ -451,8 +980,11 @@ class VectorStore:
         """
         Remove document from store (thread-safe)
 
-        Note: FAISS doesn't support removal efficiently, so we just
-        mark as deleted in metadata. Use rebuild() to compact.
+        The vector is removed from the FAISS index right away (flat and
+        IVF), so it is no longer scanned. HNSW graphs cannot drop vectors:
+        there the document becomes a tombstone skipped at search time, and
+        the index is rebuilt once too many accumulate. Metadata stays
+        marked as deleted until rebuild() compacts it.
 
         Args:
             doc_id: Document identifier
@@ -461,25 +993,101 @@ class VectorStore:
             True if removed, False if not found
         """
         with self._store_lock:
-            index_id = self.doc_id_to_index_id.get(doc_id)
-            if index_id is None:
+            if not self._remove_locked(doc_id):
                 return False
 
-            # Mark as deleted
-            if index_id in self.id_to_doc:
-                self.id_to_doc[index_id]["_deleted"] = True
+            self._journal_append([{"op": "remove", "doc_id": doc_id}])
 
-            # Remove from doc_id mapping so add() can re-add it
-            del self.doc_id_to_index_id[doc_id]
+            if (
+                self._tombstones > 0
+                and self._tombstones >= HNSW_TOMBSTONE_REBUILD_RATIO * self.index.ntotal
+            ):
+                self.rebuild()
 
             logger.debug(f"Marked document as deleted: {doc_id}")
             return True
 
+    def update_metadata(self, doc_id: str, metadata: dict[str, Any]) -> bool:
+        """
+        Replace a document's metadata without re-embedding it (thread-safe)
+
+        Args:
+            doc_id: Document identifier
+            metadata: New metadata dictionary
+
+        Returns:
+            True if updated, False if not found
+        """
+        with self._store_lock:
+            index_id = self.doc_id_to_index_id.get(doc_id)
+            if index_id is None:
+                return False
+
+            self._filter_index.remove(index_id, self.id_to_doc[index_id]["metadata"])
+            self.id_to_doc[index_id]["metadata"] = metadata
+            self._filter_index.add(index_id, metadata)
+            self._journal_append([
+                {
+                    "op": "update_metadata",
+                    "doc_id": doc_id,
+                    "metadata": _make_serializable(metadata),
+                }
+            ])
+            return True
+
+    def _insert_locked(
+        self,
+        doc_id: str,
+        text: str,
+        metadata: Optional[dict[str, Any]],
+        embedding: np.ndarray
+    ) -> int:
+        """Add one embedded document to index and mappings (must hold _store_lock)"""
+        # Add to FAISS index
+        index_id = self._next_index_id
+        embedding_2d = embedding.reshape(1, -1).astype(np.float32)
+        self.index.add_with_ids(embedding_2d, np.array([index_id], dtype=np.int64))
+
+        # Store metadata
+        self.id_to_doc[index_id] = {
+            "doc_id": doc_id,
+            "text": text,
+            "metadata": metadata or {},
+            "embedding": embedding  # Store for later use
+        }
+
+        self.doc_id_to_index_id[doc_id] = index_id
+        self._filter_index.add(index_id, metadata or {})
+        self._next_index_id += 1
+        return index_id
+
+    def _remove_locked(self, doc_id: str) -> bool:
+        """Mark a document as deleted (must hold _store_lock)"""
+        index_id = self.doc_id_to_index_id.get(doc_id)
+        if index_id is None:
+            return False
+
+        # Drop the vector from the index, or leave a tombstone if it can't
+        if self._supports_remove():
+            self.index.remove_ids(np.array([index_id], dtype=np.int64))
+        else:
+            self._tombstones += 1
+
+        # Mark as deleted
+        if index_id in self.id_to_doc:
+            self._filter_index.remove(index_id, self.id_to_doc[index_id]["metadata"])
+            self.id_to_doc[index_id]["_deleted"] = True
+
+        # Remove from doc_id mapping so add() can re-add it
+        del self.doc_id_to_index_id[doc_id]
+        return True
+
     def rebuild(self) -> None:
         """
         Rebuild index removing deleted documents (thread-safe)
 
-        This creates a new FAISS index without deleted documents.
+        This creates a new FAISS index without deleted documents (an ANN
+        index if the corpus is past ann_threshold).
         Use periodically if many documents are removed.
         """
         with self._store_lock:
@@ -502,16 +1110,11 @@ class VectorStore:
 
             old_count = len(self.id_to_doc)
 
-            # Create new FAISS index
-            if self.metric == "L2":
-                new_index = faiss.IndexFlatL2(self.dimension)
-            else:  # cosine
-                new_index = faiss.IndexFlatIP(self.dimension)
-
-            # Add all active embeddings in one batch
-            if active_embeddings:
-                embeddings_array = np.array(active_embeddings).astype(np.float32)
-                new_index.add(embeddings_array)
+            # Create new FAISS index with all active embeddings in one batch
+            embeddings_array = np.array(active_embeddings).astype(np.float32)
+            new_index, ann_active = self._build_index(
+                embeddings_array, np.arange(len(active_docs), dtype=np.int64)
+            )
 
             # Rebuild metadata mappings
             new_id_to_doc = {}
@@ -528,9 +1131,12 @@ class VectorStore:
 
             # Atomic swap of all data structures
             self.index = new_index
+            self._ann_active = ann_active
+            self._tombstones = 0
             self.id_to_doc = new_id_to_doc
             self.doc_id_to_index_id = new_doc_id_to_index_id
             self._next_index_id = len(active_docs)
+            self._rebuild_filter_index_locked()
 
             logger.info(
                 "Rebuilt vector store",
@@ -545,6 +1151,21 @@ class VectorStore:
         """
         Save vector store to disk
 
+        Layout (format version 2):
+        - index.faiss: FAISS index
+        - embeddings.npy: contiguous float32 matrix, one row per document
+        - metadata.json: compact document metadata (no embeddings)
+        - metadata.sha256: per-file SHA-256 checksums (sha256sum format)
+
+        Every file is written to a temporary file then atomically renamed,
+        so no file is ever half-written and memory-mapped readers of the
+        previous files stay valid. The save as a whole is not atomic: a
+        crash between renames leaves files from two saves side by side.
+        metadata.sha256 is written last and covers all three data files, so
+        such a mix fails load()'s integrity check and the store has to be
+        rebuilt. Once the snapshot is written the mutation journal is
+        truncated and bound to this directory.
+
         Args:
             path: Directory path to save to
 
@@ -555,59 +1176,73 @@ class VectorStore:
         path.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Save FAISS index
-            index_path = path / "index.faiss"
-            faiss.write_index(self.index, str(index_path))
-
-            # Prepare metadata for JSON serialization
-            # Convert numpy arrays to lists and dates to ISO strings for JSON compatibility
-            def make_serializable(obj):
-                """Recursively convert non-JSON-serializable types"""
-                if isinstance(obj, dict):
-                    return {k: make_serializable(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [make_serializable(item) for item in obj]
-                elif isinstance(obj, (datetime.date, datetime.datetime)):
-                    return obj.isoformat()
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                return obj
-
-            serializable_id_to_doc = {}
-            for idx, doc_info in self.id_to_doc.items():
-                serializable_doc = {
-                    "doc_id": doc_info["doc_id"],
-                    "text": doc_info["text"],
-                    "metadata": make_serializable(doc_info["metadata"]),
-                    "_deleted": doc_info.get("_deleted", False),
-                    # Store embedding as list for JSON
-                    "embedding": doc_info["embedding"].tolist()
-                    if isinstance(doc_info["embedding"], np.ndarray)
-                    else doc_info["embedding"],
+            with self._store_lock:
+                # Row r of the embedding matrix belongs to documents[r]
+                index_ids = sorted(self.id_to_doc)
+                embeddings = np.empty((len(index_ids), self.dimension), dtype=np.float32)
+                documents = []
+                for row, idx in enumerate(index_ids):
+                    doc_info = self.id_to_doc[idx]
+                    embeddings[row] = np.asarray(doc_info["embedding"], dtype=np.float32)
+                    documents.append({
+                        "index_id": idx,
+                        "doc_id": doc_info["doc_id"],
+                        "text": doc_info["text"],
+                        "metadata": _make_serializable(doc_info["metadata"]),
+                        "_deleted": doc_info.get("_deleted", False),
+                    })
+
+                metadata = {
+                    "format_version": STORAGE_FORMAT_VERSION,
+                    "documents": documents,
+                    "doc_id_to_index_id": self.doc_id_to_index_id,
+                    "next_index_id": self._next_index_id,
+                    "dimension": self.dimension,
+                    "metric": self.metric,
+                    "index_type": self.index_type,
                 }
-                serializable_id_to_doc[str(idx)] = serializable_doc
 
-            metadata = {
-                "id_to_doc": serializable_id_to_doc,
-                "doc_id_to_index_id": self.doc_id_to_index_id,
-                "next_index_id": self._next_index_id,
-                "dimension": self.dimension,
-                "metric": self.metric,
-            }
-
-            # Save as JSON (safer than pickle - no code execution risk)
-            metadata_path = path / "metadata.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
-
-            # Also save integrity hash
-            content_hash = hashlib.sha256(
-                json.dumps(metadata, sort_keys=True).encode()
-            ).hexdigest()
-            hash_path = path / "metadata.sha256"
-            hash_path.write_text(content_hash)
+                # Save FAISS index
+                index_path = path / INDEX_FILENAME
+                tmp_index_path = path / f".{INDEX_FILENAME}.tmp"
+                faiss.write_index(self.index, str(tmp_index_path))
+                tmp_index_path.replace(index_path)
+
+                # Embeddings as raw float32 (memory-mappable on load)
+                embeddings_path = path / EMBEDDINGS_FILENAME
+                _atomic_write_bytes(embeddings_path, lambda f: np.save(f, embeddings))
+
+                # Compact JSON (safer than pickle - no code execution risk)
+                metadata_path = path / METADATA_FILENAME
+                _atomic_write_bytes(
+                    metadata_path,
+                    lambda f: f.write(
+                        json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode(
+                            "utf-8"
+                        )
+                    ),
+                )
+
+                # Integrity hashes, streamed from the files just written; written
+                # last, they only match once the whole snapshot is in place
+                checksums = "".join(
+                    f"{get_file_hash(path / name)}  {name}\n"
+                    for name in (METADATA_FILENAME, EMBEDDINGS_FILENAME, INDEX_FILENAME)
+                )
+                _atomic_write_bytes(
+                    path / CHECKSUM_FILENAME, lambda f: f.write(checksums.encode("utf-8"))
+                )
+
+                # Everything journaled so far is now in the snapshot
+                journal_path = path / JOURNAL_FILENAME
+                journal_path.unlink(missing_ok=True)
+                self._journal_path = journal_path
+                self._journal_entries = 0
 
-            logger.info(f"Saved vector store to {path}")
+            logger.info(
+                f"Saved vector store to {path}",
+                extra={"doc_count": len(documents), "format_version": STORAGE_FORMAT_VERSION},
+            )
 
         except Exception as e:
             logger.error(f"Failed to save vector store: {e}", exc_info=True)
@@ -617,6 +1252,12 @@ class VectorStore:
         """
         Load vector store from disk
 
+        Embeddings are memory-mapped from embeddings.npy when
+        mmap_embeddings is enabled. Mutations recorded in journal.jsonl
+        after the snapshot are replayed on top of it. Stores saved in the legacy JSON layout
+        (embeddings inlined in metadata.json) or as pickle are migrated to
+        the binary layout on first load.
+
         Args:
             path: Directory path to load from
 
@@ -631,92 +1272,252 @@ class VectorStore:
 
         try:
             # Load FAISS index
-            index_path = path / "index.faiss"
+            index_path = path / INDEX_FILENAME
             if not index_path.exists():
                 raise FileNotFoundError(f"Index file not found: {index_path}")
 
-            self.index = faiss.read_index(str(index_path))
+            index = faiss.read_index(str(index_path))
 
             # Load metadata from JSON (safer than pickle)
-            metadata_path = path / "metadata.json"
+            metadata_path = path / METADATA_FILENAME
+            needs_migration = False
 
             # Fallback to pickle for backward compatibility
             if not metadata_path.exists():
                 pickle_path = path / "metadata.pkl"
                 if pickle_path.exists():
                     logger.warning(
-                        "Found legacy pickle metadata - migrating to JSON. "
-                        "Please re-save to use secure JSON format."
+                        "Found legacy pickle metadata - migrating to binary format."
                     )
                     import pickle
                     with open(pickle_path, "rb") as f:
                         metadata = pickle.load(f)
-                    # Migrate: save as JSON after load
-                    self._migrate_pickle_metadata(metadata, path)
+                    id_to_doc = self._restore_legacy_documents(metadata)
+                    needs_migration = True
                 else:
                     raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
             else:
-                # Verify integrity if hash exists
-                hash_path = path / "metadata.sha256"
-                with open(metadata_path, encoding="utf-8") as f:
-                    content = f.read()
-                    metadata = json.loads(content)
-
-                if hash_path.exists():
-                    expected_hash = hash_path.read_text().strip()
-                    actual_hash = hashlib.sha256(
-                        json.dumps(metadata, sort_keys=True).encode()
-                    ).hexdigest()
-                    if not hmac.compare_digest(expected_hash, actual_hash):
-                        raise ValueError(
-                            "Metadata integrity check failed - file may be corrupted"
-                        )
+                expected_hashes = self._read_checksums(path)
 
-            # Restore data structures
-            # Convert string keys back to int for id_to_doc
-            self.id_to_doc = {}
-            for str_idx, doc_info in metadata["id_to_doc"].items():
-                idx = int(str_idx)
-                self.id_to_doc[idx] = {
-                    "doc_id": doc_info["doc_id"],
-                    "text": doc_info["text"],
-                    "metadata": doc_info["metadata"],
-                    "_deleted": doc_info.get("_deleted", False),
-                    # Convert list back to numpy array
-                    "embedding": np.array(doc_info["embedding"], dtype=np.float32),
-                }
+                # Verify binary layout files before parsing anything
+                if expected_hashes and "" not in expected_hashes:
+                    for name, expected_hash in expected_hashes.items():
+                        actual_hash = get_file_hash(path / name) or ""
+                        if not hmac.compare_digest(expected_hash, actual_hash):
+                            raise ValueError(
+                                f"Integrity check failed for {name} - file may be corrupted"
+                            )
+
+                with open(metadata_path, encoding="utf-8") as f:
+                    metadata = json.load(f)
 
-            self.doc_id_to_index_id = metadata["doc_id_to_index_id"]
-            self._next_index_id = metadata["next_index_id"]
-            self.dimension = metadata["dimension"]
-            self.metric = metadata["metric"]
+                if metadata.get("format_version", 1) >= 2:
+                    id_to_doc = self._restore_binary_documents(metadata, path)
+                else:
+                    # Legacy layout: single hash over the canonical JSON dump
+                    legacy_hash = expected_hashes.get("")
+                    if legacy_hash is not None:
+                        actual_hash = hashlib.sha256(
+                            json.dumps(metadata, sort_keys=True).encode()
+                        ).hexdigest()
+                        if not hmac.compare_digest(legacy_hash, actual_hash):
+                            raise ValueError(
+                                "Metadata integrity check failed - file may be corrupted"
+                            )
+                    id_to_doc = self._restore_legacy_documents(metadata)
+                    needs_migration = True
+
+            with self._store_lock:
+                self.id_to_doc = id_to_doc
+                self.doc_id_to_index_id = dict(metadata.get("doc_id_to_index_id", {}))
+                self._next_index_id = metadata.get("next_index_id", len(id_to_doc))
+                self.dimension = metadata.get("dimension", self.dimension)
+                self.metric = metadata.get("metric", self.metric)
+                self._adopt_loaded_index(index, metadata.get("index_type", "flat"))
+                self._rebuild_filter_index_locked()
+
+                # Re-apply mutations made after the snapshot was written
+                journal_path = path / JOURNAL_FILENAME
+                replayed = self._replay_journal(journal_path)
+                self._journal_path = journal_path
+                self._journal_entries = replayed
+                self._maybe_train_ann()
 
             logger.info(
                 f"Loaded vector store from {path}",
-                extra={"doc_count": len(self.id_to_doc)}
+                extra={"doc_count": len(self.id_to_doc), "journal_replayed": replayed}
             )
 
         except Exception as e:
             logger.error(f"Failed to load vector store: {e}", exc_info=True)
             raise OSError(f"Load failed: {e}") from e
 
-    def _migrate_pickle_metadata(self, metadata: dict, path: Path) -> None:
-        """Migrate legacy pickle metadata to JSON format"""
-        # Convert numpy arrays in id_to_doc
-        for _idx, doc_info in metadata.get("id_to_doc", {}).items():
-            if isinstance(doc_info.get("embedding"), np.ndarray):
-                doc_info["embedding"] = doc_info["embedding"].tolist()
+        if needs_migration:
+            try:
+                self.save(path)
+                (path / "metadata.pkl").unlink(missing_ok=True)
+                logger.info("Migrated vector store metadata to binary format")
+            except OSError as e:
+                # Keep serving from the legacy files; migration retries next load
+                logger.warning(f"Vector store migration failed: {e}")
+
+    # === MUTATION JOURNAL ===
+
+    @property
+    def journal_size(self) -> int:
+        """Number of mutations journaled since the last snapshot"""
+        return self._journal_entries
+
+    def _journal_append(self, records: list[dict[str, Any]]) -> None:
+        """
+        Append mutation records to the journal (must hold _store_lock)
+
+        No-op until the store has been saved or loaded. Records are fsynced
+        so that a crash before the next save() loses nothing.
+        """
+        if self._journal_path is None or not records:
+            return
+
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        try:
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += len(records)
+        except OSError as e:
+            # In-memory state is already updated; the next save() persists it
+            logger.warning(f"Failed to append to vector store journal: {e}")
+
+    def _replay_journal(self, journal_path: Path) -> int:
+        """
+        Apply journaled mutations in order (must hold _store_lock)
+
+        Replay is idempotent: adds are upserts and removes of unknown
+        documents are ignored, so replaying over a snapshot that already
+        contains some of the records is safe.
 
-        # Temporarily set attributes for save
-        self.id_to_doc = metadata.get("id_to_doc", {})
-        self.doc_id_to_index_id = metadata.get("doc_id_to_index_id", {})
-        self._next_index_id = metadata.get("next_index_id", 0)
-        self.dimension = metadata.get("dimension", self.dimension)
-        self.metric = metadata.get("metric", self.metric)
+        Returns:
+            Number of records applied
+        """
+        if not journal_path.exists():
+            return 0
+
+        applied = 0
+        with open(journal_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-append: stop at the last good record
+                    logger.warning(
+                        "Truncated vector store journal record ignored",
+                        extra={"path": str(journal_path), "line": line_number},
+                    )
+                    break
 
-        # Re-save as JSON
-        self.save(path)
-        logger.info("Migrated pickle metadata to JSON format")
+                op = record.get("op")
+                doc_id = record.get("doc_id")
+                if op == "add":
+                    embedding = np.frombuffer(
+                        base64.b64decode(record["embedding"]), dtype=np.float32
+                    ).copy()
+                    self._remove_locked(doc_id)
+                    self._insert_locked(doc_id, record["text"], record["metadata"], embedding)
+                elif op == "remove":
+                    self._remove_locked(doc_id)
+                elif op == "update_metadata":
+                    index_id = self.doc_id_to_index_id.get(doc_id)
+                    if index_id is not None:
+                        self._filter_index.remove(index_id, self.id_to_doc[index_id]["metadata"])
+                        self.id_to_doc[index_id]["metadata"] = record["metadata"]
+                        self._filter_index.add(index_id, record["metadata"])
+                elif op == "clear":
+                    self._reset_locked()
+                else:
+                    logger.warning(f"Unknown vector store journal op: {op}")
+                    continue
+                applied += 1
+
+        if applied:
+            logger.info(
+                "Replayed vector store journal",
+                extra={"path": str(journal_path), "records": applied},
+            )
+        return applied
+
+    def _restore_binary_documents(
+        self, metadata: dict[str, Any], path: Path
+    ) -> dict[int, dict[str, Any]]:
+        """Rebuild id_to_doc from a format-2 sidecar and its embedding matrix"""
+        documents = metadata["documents"]
+        embeddings = np.load(
+            path / EMBEDDINGS_FILENAME,
+            mmap_mode="r" if self.mmap_embeddings else None,
+            allow_pickle=False,
+        )
+
+        expected_shape = (len(documents), metadata["dimension"])
+        if embeddings.shape != expected_shape:
+            raise ValueError(
+                f"Embedding matrix shape mismatch: expected {expected_shape}, "
+                f"got {embeddings.shape}"
+            )
+
+        id_to_doc: dict[int, dict[str, Any]] = {}
+        for row, doc_info in enumerate(documents):
+            id_to_doc[int(doc_info["index_id"])] = {
+                "doc_id": doc_info["doc_id"],
+                "text": doc_info["text"],
+                "metadata": doc_info["metadata"],
+                "_deleted": doc_info.get("_deleted", False),
+                # Row view into the (possibly memory-mapped) matrix
+                "embedding": embeddings[row],
+            }
+        return id_to_doc
+
+    @staticmethod
+    def _restore_legacy_documents(metadata: dict[str, Any]) -> dict[int, dict[str, Any]]:
+        """Rebuild id_to_doc from the legacy layout (embeddings inlined as lists)"""
+        id_to_doc: dict[int, dict[str, Any]] = {}
+        # Convert string keys back to int for id_to_doc
+        for str_idx, doc_info in metadata.get("id_to_doc", {}).items():
+            id_to_doc[int(str_idx)] = {
+                "doc_id": doc_info["doc_id"],
+                "text": doc_info["text"],
+                "metadata": doc_info["metadata"],
+                "_deleted": doc_info.get("_deleted", False),
+                # Convert list back to numpy array
+                "embedding": np.asarray(doc_info["embedding"], dtype=np.float32),
+            }
+        return id_to_doc
+
+    @staticmethod
+    def _read_checksums(path: Path) -> dict[str, str]:
+        """
+        Read metadata.sha256
+
+        Returns:
+            {filename: hex_digest} for the binary layout, {"": hex_digest}
+            for the legacy single-hash file, or {} if no checksum file exists
+        """
+        hash_path = path / CHECKSUM_FILENAME
+        if not hash_path.exists():
+            return {}
+
+        checksums: dict[str, str] = {}
+        for line in hash_path.read_text().splitlines():
+            parts = line.strip().split(maxsplit=1)
+            if not parts:
+                continue
+            checksums[parts[1].strip() if len(parts) > 1 else ""] = parts[0]
+        return checksums
 
     def clear(self) -> None:
         """
@@ -725,19 +1526,33 @@ class VectorStore:
         Resets the store to empty state while preserving configuration.
         """
         with self._store_lock:
-            # Reinitialize FAISS index
-            if self.metric == "L2":
-                self.index = faiss.IndexFlatL2(self.dimension)
-            else:  # cosine
-                self.index = faiss.IndexFlatIP(self.dimension)
-
-            # Clear metadata
-            self.id_to_doc.clear()
-            self.doc_id_to_index_id.clear()
-            self._next_index_id = 0
+            self._reset_locked()
+            self._journal_append([{"op": "clear"}])
 
             logger.info("Cleared vector store")
 
+    def _reset_locked(self) -> None:
+        """Drop all documents and start a fresh index (must hold _store_lock)"""
+        # Reinitialize FAISS index
+        self.index = self._new_flat_index()
+        self._ann_active = False
+        self._tombstones = 0
+        self._ann_recall = None
+
+        # Clear metadata
+        self.id_to_doc.clear()
+        self.doc_id_to_index_id.clear()
+        self._filter_index.clear()
+        self._next_index_id = 0
+
+    def _rebuild_filter_index_locked(self) -> None:
+        """Re-index metadata of all active documents (must hold _store_lock)"""
+        self._filter_index.build([
+            (index_id, doc_info["metadata"])
+            for index_id, doc_info in self.id_to_doc.items()
+            if not doc_info.get("_deleted", False)
+        ])
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get vector store statistics
@@ -745,20 +1560,36 @@ class VectorStore:
         Returns:
             Dictionary with store statistics
         """
-        deleted_count = sum(
-            1 for doc in self.id_to_doc.values()
-            if doc.get("_deleted", False)
-        )
+        with self._store_lock:
+            deleted_count = sum(
+                1 for doc in self.id_to_doc.values()
+                if doc.get("_deleted", False)
+            )
+            latencies = list(self._search_latencies_ms)
+            percentiles = calculate_percentiles(latencies, [50, 95, 99])
 
-        return {
-            "total_docs": len(self.id_to_doc),
-            "active_docs": len(self.id_to_doc) - deleted_count,
-            "deleted_docs": deleted_count,
-            "dimension": self.dimension,
-            "metric": self.metric,
-            "index_size": self.index.ntotal,
-            "embedder_cache_stats": self.embedder.get_cache_stats()
-        }
+            return {
+                "total_docs": len(self.id_to_doc),
+                "active_docs": len(self.id_to_doc) - deleted_count,
+                "deleted_docs": deleted_count,
+                "dimension": self.dimension,
+                "metric": self.metric,
+                "index_type": self.index_type,
+                "ann_active": self._ann_active,
+                "ann_recall": (
+                    round(self._ann_recall, 3) if self._ann_recall is not None else None
+                ),
+                "tombstones": self._tombstones,
+                "index_size": self.index.ntotal,
+                "search_latency_ms": {
+                    "p50": round(percentiles[50], 3),
+                    "p95": round(percentiles[95], 3),
+                    "p99": round(percentiles[99], 3),
+                    "samples": len(latencies),
+                },
+                "journal_entries": self._journal_entries,
+                "embedder_cache_stats": self.embedder.get_cache_stats()
+            }
 
     def __repr__(self) -> str:
         """String representation"""
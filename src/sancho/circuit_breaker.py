@@ -7,6 +7,7 @@ after a threshold of failures.
 
 import threading
 import time
+from collections.abc import Awaitable
 from typing import Any, Callable, Optional
 
 from src.monitoring.logger import get_logger
@@ -70,6 +71,52 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: If function raises
         """
+        self._before_call()
+
+        # Attempt the call
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+
+        self._record_success()
+        return result
+
+    async def call_async(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection
+
+        Shares state with call(). Cancellation (asyncio.CancelledError) is
+        not counted as a failure.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Awaited result
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            Exception: If the coroutine raises
+        """
+        self._before_call()
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+
+        self._record_success()
+        return result
+
+    def _before_call(self) -> None:
+        """Fail fast if open, or move to half-open once the timeout elapsed"""
         with self._lock:
             # Check if circuit should transition to half-open
             if self.state == "open":
@@ -83,30 +130,23 @@ class CircuitBreaker:
                         f"(timeout: {self.timeout}s, remaining: {remaining}s)"
                     )
 
-        # Attempt the call
-        try:
-            result = func(*args, **kwargs)
-
-            # Success - reset or close circuit
-            with self._lock:
-                if self.state == "half-open":
-                    self.state = "closed"
-                    self.failure_count = 0
-                    logger.info("Circuit breaker CLOSED - service recovered")
-
-            return result
-
-        except Exception:
-            # Failure - increment counter and potentially open circuit
-            with self._lock:
-                self.failure_count += 1
-                self.last_failure_time = time.time()
-
-                if self.failure_count >= self.failure_threshold:
-                    self.state = "open"
-                    logger.error(
-                        f"Circuit breaker OPENED after {self.failure_count} failures",
-                        extra={"failure_threshold": self.failure_threshold},
-                    )
+    def _record_success(self) -> None:
+        """Success - reset or close circuit"""
+        with self._lock:
+            if self.state == "half-open":
+                self.state = "closed"
+                self.failure_count = 0
+                logger.info("Circuit breaker CLOSED - service recovered")
 
-            raise
+    def _record_failure(self) -> None:
+        """Failure - increment counter and potentially open circuit"""
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+
+            if self.failure_count >= self.failure_threshold:
+                self.state = "open"
+                logger.error(
+                    f"Circuit breaker OPENED after {self.failure_count} failures",
+                    extra={"failure_threshold": self.failure_threshold},
+                )
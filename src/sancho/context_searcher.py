@@ -499,7 +499,7 @@ class ContextSearcher:
                         note_id=note.note_id,
                         title=note.title,
                         note_type=getattr(note, "type", None) or "note",
-                        summary=(note.content[:200] if note.content else ""),
+                        summary=self._note_summary(note, result.entity_name),
                         relevance=min(1.0, result.match_score),
                         last_modified=getattr(note, "modified_at", None),
                         tags=note.tags or [],
@@ -575,7 +575,7 @@ class ContextSearcher:
                             note_id=note.note_id,
                             title=note.title,
                             note_type=getattr(note, "type", None) or "note",
-                            summary=(note.content[:200] if note.content else ""),
+                            summary=self._note_summary(note, entity),
                             relevance=relevance,
                             last_modified=getattr(note, "modified_at", None),
                             tags=note.tags or [],
@@ -611,6 +611,23 @@ class ContextSearcher:
 
         return notes[:max_results], profiles
 
+    def _note_summary(self, note: "Note", query: str) -> str:
+        """
+        Summary of a note for prompt injection
+
+        The passage of the note that best matches the query, so facts deep
+        in long person/project notes reach the prompt; falls back to the
+        opening of the note.
+        """
+        if self._note_manager is not None:
+            try:
+                snippet = self._note_manager.get_note_snippet(note, query)
+                if isinstance(snippet, str) and snippet:
+                    return snippet
+            except Exception as e:
+                logger.debug("Snippet lookup failed for %s: %s", note.note_id, e)
+        return note.content[:200] if note.content else ""
+
     def _build_profile_from_note(
         self,
         entity_name: str,
@@ -18,6 +18,7 @@ Part of Sancho's Four Valets extraction system.
 See ADR-005 for design decisions.
 """
 
+import asyncio
 import json
 import re
 import time
@@ -769,6 +770,26 @@ class MultiPassAnalyzer:
 
         return validated_extractions
 
+    async def _call_router(self, method: str, **kwargs: Any) -> tuple[Optional[str], dict]:
+        """
+        Call an AIRouter provider method without blocking the event loop
+
+        Uses the router's native async variant (``<method>_async``) when it
+        has one, so passes share one pooled connection and can be cancelled.
+        Routers without it are called in a worker thread.
+
+        Args:
+            method: Name of the synchronous router method
+            **kwargs: Arguments for the call
+
+        Returns:
+            Tuple of (response text or None, usage dict)
+        """
+        async_call = getattr(self.ai_router, f"{method}_async", None)
+        if async_call is not None and asyncio.iscoroutinefunction(async_call):
+            return await async_call(**kwargs)
+        return await asyncio.to_thread(getattr(self.ai_router, method), **kwargs)
+
     async def _call_model(
         self,
         prompt: str,
@@ -796,8 +817,9 @@ class MultiPassAnalyzer:
         model = self.MODEL_MAP[model_tier]
 
         try:
-            # Call Claude via router
-            response, usage = self.ai_router._call_claude(
+            # Call Claude via router without blocking the event loop
+            response, usage = await self._call_router(
+                "_call_claude",
                 prompt=prompt,
                 model=model,
                 max_tokens=2048,
@@ -859,8 +881,9 @@ class MultiPassAnalyzer:
         model = self.MODEL_MAP[model_tier]
 
         try:
-            # Call Claude via router with cache
-            response, usage = self.ai_router._call_claude_with_cache(
+            # Call Claude via router with cache, without blocking the event loop
+            response, usage = await self._call_router(
+                "_call_claude_with_cache",
                 user_prompt=user_prompt,
                 system_prompt=system_prompt,
                 model=model,
@@ -1,52 +1,331 @@
 """
 Rate Limiter
 
-Thread-safe sliding window rate limiter to prevent API rate limit errors.
+Thread-safe token-bucket rate limiter to prevent API rate limit errors.
+
+Buckets refill continuously, the way the provider enforces its limits, so
+throughput can stay right at the limit instead of bursting into 429s:
+
+- a global requests-per-window bucket (max_requests);
+- optional per-tier buckets (TierLimits) for requests, input tokens and
+  output tokens per minute.
+
+Token-aware callers reserve an estimate up front (reserve / reserve_async)
+and reconcile it with the usage the API reports, returning unused tokens to
+the buckets. Waiters sleep until the buckets they need have refilled, or
+until a reconcile returns tokens, instead of polling.
 """
 
+import asyncio
+import math
 import threading
 import time
-from collections import deque
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from src.monitoring.logger import get_logger
 
 logger = get_logger("rate_limiter")
 
+REQUESTS = "requests"
+INPUT_TOKENS = "input_tokens"
+OUTPUT_TOKENS = "output_tokens"
+
+
+class RateLimitTimeoutError(RuntimeError):
+    """Raised when rate limit permission could not be acquired in time"""
+
+
+@dataclass(frozen=True)
+class TierLimits:
+    """Provider limits of one model tier (None = not enforced)"""
+
+    requests_per_minute: Optional[int] = None
+    input_tokens_per_minute: Optional[int] = None
+    output_tokens_per_minute: Optional[int] = None
+
+
+@dataclass
+class Reservation:
+    """Capacity taken by one request, to be reconciled with actual usage"""
+
+    tier: Optional[str]
+    input_tokens: int
+    output_tokens: int
+    settled: bool = False
+
+
+class _Bucket:
+    """Continuously refilling token bucket (caller holds the limiter lock)"""
+
+    def __init__(self, capacity: float, window_seconds: float, now: float):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / window_seconds
+        self.level = self.capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be taken (larger than capacity: until full)"""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def give(self, amount: float) -> None:
+        """Return (amount > 0) or charge (amount < 0) capacity"""
+        self.level = min(self.capacity, self.level + amount)
+
 
 class RateLimiter:
     """
-    Thread-safe rate limiter
+    Thread-safe token-bucket rate limiter
 
-    Implements sliding window rate limiting to prevent API rate limit errors.
+    acquire()/acquire_async() take one request; reserve()/reserve_async()
+    also take input/output tokens of a model tier. Sync and async callers
+    share the same buckets.
+
+    Usage:
+        limiter = RateLimiter(
+            max_requests=40,
+            tier_limits={"sonnet": TierLimits(50, 30_000, 8_000)},
+        )
+        reservation = limiter.reserve("sonnet", input_tokens=1200, output_tokens=2048)
+        ...  # call the API
+        limiter.reconcile(reservation, input_tokens=1100, output_tokens=350)
     """
 
-    def __init__(self, max_requests: int, window_seconds: int = 60):
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int = 60,
+        tier_limits: Optional[dict[str, TierLimits]] = None,
+    ):
         """
         Initialize rate limiter
 
         Args:
-            max_requests: Maximum requests per window
+            max_requests: Maximum requests per window (all tiers together)
             window_seconds: Time window in seconds (default: 60)
+            tier_limits: Per-tier limits (per minute), keyed by tier name
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: deque[float] = deque()
+        self.tier_limits = dict(tier_limits or {})
+
         self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        # Async waiters: (loop, future) woken when capacity is returned
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+        now = time.monotonic()
+        self._requests = _Bucket(max_requests, window_seconds, now)
+        self._tier_buckets: dict[str, dict[str, _Bucket]] = {}
+        for tier, limits in self.tier_limits.items():
+            buckets = {}
+            for kind, limit in (
+                (REQUESTS, limits.requests_per_minute),
+                (INPUT_TOKENS, limits.input_tokens_per_minute),
+                (OUTPUT_TOKENS, limits.output_tokens_per_minute),
+            ):
+                if limit:
+                    buckets[kind] = _Bucket(limit, 60, now)
+            self._tier_buckets[tier] = buckets
+
+        self._waiting = 0
+        self._throttled_seconds = 0.0
 
         logger.debug(
             "Rate limiter initialized",
-            extra={"max_requests": max_requests, "window_seconds": window_seconds},
+            extra={
+                "max_requests": max_requests,
+                "window_seconds": window_seconds,
+                "tiers": sorted(self.tier_limits),
+            },
         )
 
     def __repr__(self) -> str:
         """String representation for debugging"""
-        with self._lock:
-            return (
-                f"RateLimiter(max_requests={self.max_requests}, "
-                f"window={self.window_seconds}s, "
-                f"current={len(self._requests)})"
-            )
+        return (
+            f"RateLimiter(max_requests={self.max_requests}, "
+            f"window={self.window_seconds}s, "
+            f"current={self.get_current_usage()['current_requests']})"
+        )
+
+    def _demand(
+        self, tier: Optional[str], input_tokens: int, output_tokens: int
+    ) -> list[tuple[_Bucket, float]]:
+        """Buckets a request draws from, with amounts"""
+        demand = [(self._requests, 1.0)]
+        buckets = self._tier_buckets.get(tier or "", {})
+        for kind, amount in (
+            (REQUESTS, 1),
+            (INPUT_TOKENS, input_tokens),
+            (OUTPUT_TOKENS, output_tokens),
+        ):
+            if kind in buckets and amount > 0:
+                demand.append((buckets[kind], float(amount)))
+        return demand
+
+    def _try_reserve_locked(
+        self, tier: Optional[str], input_tokens: int, output_tokens: int
+    ) -> tuple[Optional[Reservation], float]:
+        """Take capacity if every bucket has enough (lock held)
+
+        Returns:
+            (reservation, 0) on success, else (None, seconds until it could succeed)
+        """
+        now = time.monotonic()
+        demand = self._demand(tier, input_tokens, output_tokens)
+        wait = 0.0
+        for bucket, amount in demand:
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time(amount))
+        if wait > 0:
+            return None, wait
+
+        # Requests larger than a bucket drive it negative: later ones wait it out
+        for bucket, amount in demand:
+            bucket.level -= amount
+        return Reservation(tier, input_tokens, output_tokens), 0.0
+
+    def reserve(
+        self,
+        tier: Optional[str] = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        timeout: Optional[float] = None,
+    ) -> Optional[Reservation]:
+        """
+        Reserve one request and its estimated tokens, waiting if needed
+
+        Args:
+            tier: Model tier (tiers without limits only count requests)
+            input_tokens: Estimated input tokens
+            output_tokens: Output tokens to reserve (e.g. max_tokens)
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Returns:
+            Reservation, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        started = time.monotonic()
+
+        with self._condition:
+            while True:
+                reservation, wait = self._try_reserve_locked(tier, input_tokens, output_tokens)
+                if reservation is not None:
+                    self._throttled_seconds += time.monotonic() - started
+                    return reservation
+
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning("Rate limit timeout reached", extra={"tier": tier})
+                        return None
+                    wait = min(wait, remaining)
+
+                self._waiting += 1
+                try:
+                    self._condition.wait(wait)
+                finally:
+                    self._waiting -= 1
+
+    async def reserve_async(
+        self,
+        tier: Optional[str] = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        timeout: Optional[float] = None,
+    ) -> Optional[Reservation]:
+        """
+        Reserve one request and its estimated tokens without blocking the event loop
+
+        Args:
+            tier: Model tier (tiers without limits only count requests)
+            input_tokens: Estimated input tokens
+            output_tokens: Output tokens to reserve (e.g. max_tokens)
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Returns:
+            Reservation, or None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        started = time.monotonic()
+
+        while True:
+            with self._lock:
+                reservation, wait = self._try_reserve_locked(tier, input_tokens, output_tokens)
+                if reservation is not None:
+                    self._throttled_seconds += time.monotonic() - started
+                    return reservation
+
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning("Rate limit timeout reached", extra={"tier": tier})
+                        return None
+                    wait = min(wait, remaining)
+
+                waiter = (loop, loop.create_future())
+                self._async_waiters.add(waiter)
+                self._waiting += 1
+
+            try:
+                await asyncio.wait({waiter[1]}, timeout=wait)
+            finally:
+                with self._lock:
+                    self._async_waiters.discard(waiter)
+                    self._waiting -= 1
+
+    def reconcile(self, reservation: Reservation, input_tokens: Any, output_tokens: Any) -> None:
+        """
+        Replace a reservation's estimates with the tokens actually used
+
+        Unused tokens go back to the buckets (waking waiters); usage above
+        the estimate is charged. Reconciling twice has no effect.
+
+        Args:
+            reservation: Reservation returned by reserve()/reserve_async()
+            input_tokens: Input tokens the provider counted
+            output_tokens: Output tokens generated
+        """
+        actual_input = _as_count(input_tokens, reservation.input_tokens)
+        actual_output = _as_count(output_tokens, reservation.output_tokens)
+
+        with self._condition:
+            if reservation.settled:
+                return
+            reservation.settled = True
+
+            buckets = self._tier_buckets.get(reservation.tier or "", {})
+            returned = False
+            now = time.monotonic()
+            for kind, reserved, actual in (
+                (INPUT_TOKENS, reservation.input_tokens, actual_input),
+                (OUTPUT_TOKENS, reservation.output_tokens, actual_output),
+            ):
+                bucket = buckets.get(kind)
+                if bucket is None or actual == reserved:
+                    continue
+                bucket.refill(now)
+                bucket.give(reserved - actual)
+                returned = returned or actual < reserved
+
+            if returned:
+                self._notify_locked()
+
+    def _notify_locked(self) -> None:
+        """Wake every waiter to re-check the buckets (lock held)"""
+        self._condition.notify_all()
+        for loop, future in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # Loop closed: its waiter is gone
+                continue
 
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -58,27 +337,22 @@ class RateLimiter:
         Returns:
             True if permission granted, False if timeout
         """
-        start_time = time.time()
+        return self.reserve(timeout=timeout) is not None
 
-        while True:
-            with self._lock:
-                # Remove old requests outside the window
-                now = time.time()
-                while self._requests and self._requests[0] < now - self.window_seconds:
-                    self._requests.popleft()
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire permission to make a request without blocking the event loop
 
-                # Check if we can make a request
-                if len(self._requests) < self.max_requests:
-                    self._requests.append(now)
-                    return True
+        Shares the same buckets as acquire(), so sync and async callers are
+        limited together.
 
-            # Check timeout
-            if timeout is not None and (time.time() - start_time) >= timeout:
-                logger.warning("Rate limit timeout reached")
-                return False
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait forever)
 
-            # Wait before retrying
-            time.sleep(0.1)
+        Returns:
+            True if permission granted, False if timeout
+        """
+        return await self.reserve_async(timeout=timeout) is not None
 
     def get_current_usage(self) -> dict[str, Any]:
         """
@@ -88,14 +362,37 @@ class RateLimiter:
             Dict with usage statistics
         """
         with self._lock:
-            now = time.time()
-            # Clean old requests
-            while self._requests and self._requests[0] < now - self.window_seconds:
-                self._requests.popleft()
+            now = time.monotonic()
+            self._requests.refill(now)
+            current = max(0, round(self._requests.capacity - self._requests.level))
+
+            tiers = {}
+            for tier, buckets in self._tier_buckets.items():
+                tiers[tier] = {}
+                for kind, bucket in buckets.items():
+                    bucket.refill(now)
+                    tiers[tier][f"{kind}_available"] = math.floor(max(0.0, bucket.level))
+                    tiers[tier][f"{kind}_per_minute"] = int(bucket.capacity)
 
             return {
-                "current_requests": len(self._requests),
+                "current_requests": current,
                 "max_requests": self.max_requests,
                 "window_seconds": self.window_seconds,
-                "usage_percent": (len(self._requests) / self.max_requests) * 100,
+                "usage_percent": (current / self.max_requests) * 100,
+                "waiting": self._waiting,
+                "throttled_seconds_total": round(self._throttled_seconds, 3),
+                "tiers": tiers,
             }
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve an async waiter's future (in its loop)"""
+    if not future.done():
+        future.set_result(None)
+
+
+def _as_count(value: Any, default: int) -> int:
+    """Token count reported by the API (default if missing or not a number)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return max(0, int(value))
@@ -6,9 +6,11 @@ Routes AI requests to appropriate models with rate limiting and retry logic.
 
 import asyncio
 import json
+import math
 import re
 import threading
 import time
+import weakref
 from collections import deque
 from typing import Any, Optional
 
@@ -20,10 +22,37 @@ from src.passepartout.note_manager import Note
 from src.passepartout.note_metadata import NoteMetadata
 from src.sancho.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 from src.sancho.cost_calculator import AIModel, calculate_cost
-from src.sancho.rate_limiter import RateLimiter
+from src.sancho.rate_limiter import (
+    RateLimiter,
+    RateLimitTimeoutError,
+    Reservation,
+    TierLimits,
+)
 
 logger = get_logger("ai_router")
 
+# Prompt size estimate used to reserve input tokens before a call
+# (reconciled with the usage the API reports)
+CHARS_PER_TOKEN = 4
+
+# Seconds to wait for rate limit permission before giving up
+RATE_LIMIT_TIMEOUT_SECONDS = 30
+
+MODEL_TIERS = ("haiku", "sonnet", "opus")
+
+
+def model_tier(model_id: str) -> Optional[str]:
+    """
+    Rate limit tier of a model ("claude-sonnet-4-20250514" -> "sonnet")
+
+    Args:
+        model_id: Anthropic model identifier
+
+    Returns:
+        Tier name, or None for unknown models
+    """
+    return next((tier for tier in MODEL_TIERS if tier in model_id), None)
+
 
 def clean_json_string(json_str: str) -> str:
     """
@@ -116,6 +145,7 @@ class AIRouter:
 
     Features:
     - Claude API integration
+    - Native async path (pooled connections, per-call timeouts, cancellation)
     - Rate limiting (40 RPM default)
     - Automatic retries with exponential backoff
     - Response parsing and validation
@@ -135,7 +165,16 @@ class AIRouter:
         """
         self.config = config
         self.rate_limiter = RateLimiter(
-            max_requests=config.rate_limit_per_minute, window_seconds=60
+            max_requests=config.rate_limit_per_minute,
+            window_seconds=60,
+            tier_limits={
+                tier: TierLimits(
+                    requests_per_minute=limits.requests_per_minute or None,
+                    input_tokens_per_minute=limits.input_tokens_per_minute or None,
+                    output_tokens_per_minute=limits.output_tokens_per_minute or None,
+                )
+                for tier, limits in config.model_rate_limits.items()
+            },
         )
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
 
@@ -171,6 +210,13 @@ class AIRouter:
             logger.error(f"Failed to initialize Anthropic client: {e}", exc_info=True)
             raise
 
+        # Async clients are bound to the event loop that created them:
+        # loop -> (AsyncAnthropic client, in-flight semaphore)
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[Any, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+
         logger.info(
             "AI Router initialized",
             extra={
@@ -216,11 +262,6 @@ class AIRouter:
         """
         from src.sancho.templates import get_template_manager
 
-        # Acquire rate limit permission
-        if not self.rate_limiter.acquire(timeout=30):
-            logger.error("Rate limit timeout - could not acquire permission")
-            return None
-
         # Prepare prompt
         tm = get_template_manager()
         try:
@@ -255,8 +296,8 @@ class AIRouter:
                     },
                 )
 
-                # Use circuit breaker to prevent repeated calls to failing service
-                response, api_usage = self.circuit_breaker.call(self._call_claude, prompt, model)
+                # Rate limited, through the circuit breaker (see _create_message)
+                response, api_usage = self._call_claude(prompt, model)
 
                 if response:
                     # Parse response
@@ -291,6 +332,11 @@ class AIRouter:
 
             # SELECTIVE RETRY LOGIC: Different strategies for different error types
 
+            except RateLimitTimeoutError:
+                # NON-RETRIABLE: Our own limiter is saturated
+                logger.error("Rate limit timeout - could not acquire permission")
+                return None
+
             except self.anthropic.RateLimitError:
                 # RETRIABLE: Rate limit - wait and retry with backoff
                 self._record_error_metric("RateLimitError")
@@ -417,11 +463,6 @@ class AIRouter:
         """
         from src.sancho.templates import get_template_manager
 
-        # Acquire rate limit permission
-        if not self.rate_limiter.acquire(timeout=30):
-            logger.error("Rate limit timeout - could not acquire permission")
-            return None
-
         # Prepare prompt
         tm = get_template_manager()
         try:
@@ -458,10 +499,8 @@ class AIRouter:
                     extra={"model": model.value, "note_id": note.note_id, "title": note.title},
                 )
 
-                # Use circuit breaker
-                response, api_usage = self.circuit_breaker.call(
-                    self._call_claude, prompt, model, 4096
-                )
+                # Rate limited, through the circuit breaker (see _create_message)
+                response, api_usage = self._call_claude(prompt, model, 4096)
 
                 if response:
                     # Parse response
@@ -503,6 +542,10 @@ class AIRouter:
                         # Retry on parse error? usually bad JSON from LLM
                         continue
 
+            except RateLimitTimeoutError:
+                logger.error("Rate limit timeout - could not acquire permission")
+                return None
+
             except Exception as e:
                 # Handle general errors (circuit breaker handles its own)
                 logger.error(f"Note analysis error: {e}")
@@ -535,13 +578,9 @@ class AIRouter:
             Tuple of (response_text, usage_stats)
 
         Raises:
+            RateLimitTimeoutError: If rate limit permission times out
             Exception: If all retries fail
         """
-        # Acquire rate limit permission
-        if not self.rate_limiter.acquire(timeout=30):
-            logger.error("Rate limit timeout - could not acquire permission")
-            raise RuntimeError("Rate limit timeout")
-
         start_time = time.time()
 
         for attempt in range(max_retries):
@@ -551,9 +590,9 @@ class AIRouter:
                     extra={"model": model.value},
                 )
 
-                # Use circuit breaker for resilience
-                response, usage = self.circuit_breaker.call(
-                    self._call_claude_with_system, prompt, model, system_prompt, max_tokens
+                # Rate limited, through the circuit breaker (see _create_message)
+                response, usage = self._call_claude_with_system(
+                    prompt, model, system_prompt, max_tokens
                 )
 
                 if response:
@@ -569,6 +608,10 @@ class AIRouter:
 
                     return response, usage
 
+            except RateLimitTimeoutError:
+                logger.error("Rate limit timeout - could not acquire permission")
+                raise
+
             except self.anthropic.RateLimitError:
                 self._record_error_metric("RateLimitError")
                 if attempt < max_retries - 1:
@@ -636,13 +679,399 @@ class AIRouter:
         max_tokens: int = 2048,
         max_retries: int = 3,
     ) -> tuple[str, dict]:
-        """Async wrapper for analyze_with_prompt"""
+        """
+        Analyze with a custom prompt without blocking the event loop
+
+        Async counterpart of analyze_with_prompt() using the native async
+        client: retries back off with asyncio.sleep and cancelling the
+        calling task aborts the in-flight HTTP request.
+
+        Args:
+            prompt: User prompt to send
+            model: AI model to use
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens in response
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Tuple of (response_text, usage_stats)
+
+        Raises:
+            RateLimitTimeoutError: If rate limit permission times out
+            Exception: If all retries fail
+        """
+        start_time = time.time()
+
+        for attempt in range(max_retries):
+            try:
+                logger.debug(
+                    f"Calling Claude API async with custom prompt "
+                    f"(attempt {attempt + 1}/{max_retries})",
+                    extra={"model": model.value},
+                )
+
+                response, usage = await self._call_claude_with_system_async(
+                    prompt, model, system_prompt, max_tokens
+                )
+
+                if response:
+                    duration_ms = (time.time() - start_time) * 1000
+                    self._record_analysis_metrics(
+                        duration_ms=duration_ms,
+                        tokens=usage.get("total_tokens", 0),
+                        input_tokens=usage.get("input_tokens", 0),
+                        output_tokens=usage.get("output_tokens", 0),
+                        model=model,
+                    )
+
+                    return response, usage
+
+            except RateLimitTimeoutError:
+                logger.error("Rate limit timeout - could not acquire permission")
+                raise
+
+            except self.anthropic.RateLimitError:
+                self._record_error_metric("RateLimitError")
+                if attempt < max_retries - 1:
+                    wait_time = min(2**attempt, 60)
+                    logger.warning(f"Rate limit exceeded, retrying in {wait_time}s")
+                    await asyncio.sleep(wait_time)
+                    continue
+
+            except self.anthropic.APIConnectionError:
+                self._record_error_metric("APIConnectionError")
+                if attempt < max_retries - 1:
+                    wait_time = min(2**attempt, 30)
+                    logger.warning(f"Connection error, retrying in {wait_time}s")
+                    await asyncio.sleep(wait_time)
+                    continue
+
+            except CircuitBreakerOpenError as e:
+                self._record_error_metric("CircuitBreakerOpen")
+                logger.error(f"Circuit breaker open: {e}")
+                raise
+
+            except Exception as e:
+                self._record_error_metric("UnknownError")
+                if attempt < max_retries - 1:
+                    logger.warning(f"Error, retrying: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                raise
+
+        raise RuntimeError(f"Failed after {max_retries} attempts")
+
+    # === NATIVE ASYNC PROVIDER PATH ===
+
+    def _get_async_client(self) -> tuple[Any, asyncio.Semaphore]:
+        """
+        Get the async client and concurrency semaphore for the running loop
+
+        The client keeps a pooled HTTP connection per event loop, so
+        concurrent analyses reuse TLS connections instead of opening new ones.
+
+        Returns:
+            Tuple of (AsyncAnthropic client, semaphore bounding in-flight calls)
+        """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.analyze_with_prompt(prompt, model, system_prompt, max_tokens, max_retries),
+        with self._async_clients_lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                import httpx
+
+                max_concurrent = self.config.max_concurrent_requests
+                client = self.anthropic.AsyncAnthropic(
+                    api_key=self.config.anthropic_api_key,
+                    timeout=self.config.request_timeout_seconds,
+                    http_client=self.anthropic.DefaultAsyncHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=max_concurrent,
+                            max_keepalive_connections=max_concurrent,
+                        )
+                    ),
+                )
+                entry = (client, asyncio.Semaphore(max_concurrent))
+                self._async_clients[loop] = entry
+                logger.info(
+                    "Async Anthropic client initialized",
+                    extra={"max_concurrent_requests": max_concurrent},
+                )
+            return entry
+
+    async def _create_message_async(
+        self, timeout: Optional[float] = None, **request: Any
+    ) -> Any:
+        """
+        Send one Messages API request through rate limiter and circuit breaker
+
+        Args:
+            timeout: Per-call timeout in seconds (default: config.request_timeout_seconds)
+            **request: Arguments for messages.create()
+
+        Returns:
+            Anthropic Message
+
+        Raises:
+            RateLimitTimeoutError: If rate limit permission times out
+            CircuitBreakerOpenError: If circuit is open
+        """
+        reservation = await self.rate_limiter.reserve_async(
+            **self._rate_limit_demand(request), timeout=RATE_LIMIT_TIMEOUT_SECONDS
+        )
+        if reservation is None:
+            raise RateLimitTimeoutError("Rate limit timeout")
+
+        client, semaphore = self._get_async_client()
+        try:
+            async with semaphore:
+                message = await self.circuit_breaker.call_async(
+                    client.messages.create,
+                    timeout=timeout or self.config.request_timeout_seconds,
+                    **request,
+                )
+        except BaseException:
+            # Nothing was generated: give the reserved output tokens back
+            self.rate_limiter.reconcile(reservation, reservation.input_tokens, 0)
+            raise
+
+        self._reconcile_usage(reservation, message)
+        return message
+
+    def _create_message(self, **request: Any) -> Any:
+        """
+        Send one Messages API request through rate limiter and circuit breaker
+
+        Args:
+            **request: Arguments for messages.create()
+
+        Returns:
+            Anthropic Message
+
+        Raises:
+            RateLimitTimeoutError: If rate limit permission times out
+            CircuitBreakerOpenError: If circuit is open
+        """
+        reservation = self.rate_limiter.reserve(
+            **self._rate_limit_demand(request), timeout=RATE_LIMIT_TIMEOUT_SECONDS
+        )
+        if reservation is None:
+            raise RateLimitTimeoutError("Rate limit timeout")
+
+        try:
+            message = self.circuit_breaker.call(self._client.messages.create, **request)
+        except BaseException:
+            # Nothing was generated: give the reserved output tokens back
+            self.rate_limiter.reconcile(reservation, reservation.input_tokens, 0)
+            raise
+
+        self._reconcile_usage(reservation, message)
+        return message
+
+    @staticmethod
+    def _rate_limit_demand(request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Tier and token estimates a Messages API request reserves
+
+        Input is estimated from the prompt size; output reserves max_tokens,
+        as the provider does until the response is complete.
+
+        Args:
+            request: Arguments for messages.create()
+
+        Returns:
+            Keyword arguments for RateLimiter.reserve()
+        """
+        texts: list[str] = []
+        system = request.get("system")
+        if isinstance(system, str):
+            texts.append(system)
+        elif isinstance(system, list):
+            texts.extend(block.get("text", "") for block in system)
+        for message in request.get("messages", []):
+            content = message.get("content")
+            if isinstance(content, str):
+                texts.append(content)
+            elif isinstance(content, list):
+                texts.extend(block.get("text", "") for block in content)
+
+        return {
+            "tier": model_tier(str(request.get("model", ""))),
+            "input_tokens": math.ceil(sum(len(text) for text in texts) / CHARS_PER_TOKEN),
+            "output_tokens": int(request.get("max_tokens") or 0),
+        }
+
+    def _reconcile_usage(self, reservation: Reservation, message: Any) -> None:
+        """
+        Settle a reservation with the usage reported in a response
+
+        Cache reads do not count towards input token limits; cache writes do.
+
+        Args:
+            reservation: Reservation made for the request
+            message: Anthropic Message
+        """
+        usage = getattr(message, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", None)
+        cache_writes = getattr(usage, "cache_creation_input_tokens", None)
+        if isinstance(input_tokens, int) and isinstance(cache_writes, int):
+            input_tokens += cache_writes
+        self.rate_limiter.reconcile(
+            reservation, input_tokens, getattr(usage, "output_tokens", None)
+        )
+
+    async def _call_claude_with_cache_async(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        model: AIModel,
+        max_tokens: int = 2048,
+        timeout: Optional[float] = None,
+    ) -> tuple[Optional[str], dict]:
+        """
+        Async _call_claude_with_cache() (system prompt cached)
+
+        Args:
+            user_prompt: Dynamic user prompt (event data, context)
+            system_prompt: Static system prompt (instructions, rules) - will be cached
+            model: Model to use
+            max_tokens: Maximum tokens in response
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            Tuple of (response text or None, usage dict with cache info)
+        """
+        try:
+            message = await self._create_message_async(
+                timeout=timeout,
+                model=model.value,
+                max_tokens=max_tokens,
+                system=[
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+        except Exception as e:
+            logger.error(f"Async Claude API call with cache failed: {e}", exc_info=True)
+            raise
+
+        return self._extract_response(message, include_cache=True)
+
+    async def _call_claude_with_system_async(
+        self,
+        prompt: str,
+        model: AIModel,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2048,
+        timeout: Optional[float] = None,
+    ) -> tuple[Optional[str], dict]:
+        """
+        Async _call_claude_with_system()
+
+        Args:
+            prompt: User prompt
+            model: Model to use
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens in response
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            Tuple of (response text or None, usage dict)
+        """
+        request: dict[str, Any] = {
+            "model": model.value,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            request["system"] = system_prompt
+
+        try:
+            message = await self._create_message_async(timeout=timeout, **request)
+        except Exception as e:
+            logger.error(f"Async Claude API call failed: {e}", exc_info=True)
+            raise
+
+        return self._extract_response(message)
+
+    async def _call_claude_async(
+        self,
+        prompt: str,
+        model: AIModel,
+        max_tokens: int = 1024,
+        timeout: Optional[float] = None,
+    ) -> tuple[Optional[str], dict]:
+        """
+        Async _call_claude()
+
+        Args:
+            prompt: User prompt
+            model: Model to use
+            max_tokens: Maximum tokens in response
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            Tuple of (response text or None, usage dict)
+        """
+        return await self._call_claude_with_system_async(
+            prompt, model, max_tokens=max_tokens, timeout=timeout
         )
 
+    async def aclose(self) -> None:
+        """Close the async client (and its connection pool) of the running loop"""
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.pop(loop, None)
+        if entry is not None:
+            await entry[0].close()
+
+    @staticmethod
+    def _extract_response(message: Any, include_cache: bool = False) -> tuple[Optional[str], dict]:
+        """
+        Extract response text and usage from an Anthropic Message
+
+        Args:
+            message: Anthropic Message
+            include_cache: Include prompt caching token counts
+
+        Returns:
+            Tuple of (response text or None, usage dict)
+        """
+        input_tokens = message.usage.input_tokens if hasattr(message, "usage") else 0
+        output_tokens = message.usage.output_tokens if hasattr(message, "usage") else 0
+
+        usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+        if include_cache:
+            usage["cache_creation_input_tokens"] = getattr(
+                message.usage, "cache_creation_input_tokens", 0
+            ) or 0
+            usage["cache_read_input_tokens"] = getattr(
+                message.usage, "cache_read_input_tokens", 0
+            ) or 0
+
+            if usage["cache_read_input_tokens"] > 0:
+                logger.debug(
+                    f"Cache HIT: {usage['cache_read_input_tokens']} tokens read from cache"
+                )
+            elif usage["cache_creation_input_tokens"] > 0:
+                logger.debug(
+                    f"Cache WRITE: {usage['cache_creation_input_tokens']} tokens written to cache"
+                )
+
+        # Extract text from response
+        if message.content and len(message.content) > 0:
+            return message.content[0].text, usage
+
+        return None, usage
+
     def _call_claude_with_cache(
         self,
         user_prompt: str,
@@ -670,7 +1099,7 @@ class AIRouter:
         try:
             # Build request with cache_control on system prompt
             # See: https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
-            message = self._client.messages.create(
+            message = self._create_message(
                 model=model.value,
                 max_tokens=max_tokens,
                 system=[
@@ -753,7 +1182,7 @@ class AIRouter:
             if system_prompt:
                 kwargs["system"] = system_prompt
 
-            message = self._client.messages.create(**kwargs)
+            message = self._create_message(**kwargs)
 
             # Extract usage information
             input_tokens = message.usage.input_tokens if hasattr(message, "usage") else 0
@@ -790,7 +1219,7 @@ class AIRouter:
             Tuple of (response text or None, usage dict)
         """
         try:
-            message = self._client.messages.create(
+            message = self._create_message(
                 model=model.value,
                 max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
@@ -48,14 +48,13 @@ def main():
         logger.info("Vector store is NOT empty.")
         logger.info("To force re-index, delete the .scapin_index folder in your notes directory.")
 
-        # We can also call _index_all_notes which checks for missing ones
-        logger.info("Running incremental indexation to add missing notes...")
-        count = manager._index_all_notes()
-        if count > 0:
-            manager._save_index()
-            logger.info(f"Added {count} new notes to index.")
-        else:
-            logger.info("No new notes found to index.")
+        # Re-embed only notes added, changed or deleted since the last sync
+        logger.info("Running incremental sync of the index...")
+        stats = manager.sync_index()
+        logger.info(
+            f"Sync complete: {stats['added']} added, {stats['updated']} updated, "
+            f"{stats['removed']} removed, {stats['unchanged']} unchanged."
+        )
 
 
 if __name__ == "__main__":
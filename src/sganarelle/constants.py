@@ -99,6 +99,11 @@ PATTERN_CONFIDENCE_FAILURE_PENALTY = 0.9
 PATTERN_PRUNE_MIN_OCCURRENCES_MULTIPLIER = 2  # occurrences >= min * 2
 PATTERN_PRUNE_SUCCESS_RATE_THRESHOLD = 0.5  # 50% du min_success_rate
 
+# Persistence (journal append-only + compaction)
+PATTERN_LOG_SUFFIX = ".log.jsonl"  # patterns.json -> patterns.log.jsonl
+PATTERN_LOG_COMPACTION_MIN_ENTRIES = 500  # Jamais de compaction en dessous
+PATTERN_LOG_COMPACTION_RATIO = 2.0  # Compacter si entrées > ratio * patterns
+
 # Relevance scoring
 RELEVANCE_BASE_WEIGHT = 0.5
 RELEVANCE_RECENCY_WEIGHT = 0.3
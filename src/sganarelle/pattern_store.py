@@ -5,7 +5,14 @@ Gère le stockage, la récupération et la mise à jour des patterns appris.
 Les patterns représentent des comportements récurrents qui peuvent être
 utilisés pour suggérer des actions futures.
 
-Thread-safe avec persistence sur disque.
+Les patterns sont indexés par leur condition la plus discriminante (domaine
+de l'expéditeur, mot-clé, type d'événement) : find_matching_patterns()
+n'évalue que les candidats au lieu de tous les patterns.
+
+Thread-safe avec persistence sur disque : un snapshot JSON et un journal
+append-only (une ligne JSON par modification). Le journal est rejoué au
+chargement et compacté périodiquement dans le snapshot, donc une rafale
+d'apprentissages ne réécrit pas tout le fichier à chaque événement.
 """
 
 import json
@@ -23,6 +30,9 @@ from src.sganarelle.constants import (
     DEFAULT_MIN_SUCCESS_RATE,
     PATTERN_CONFIDENCE_FAILURE_PENALTY,
     PATTERN_CONFIDENCE_SUCCESS_BOOST,
+    PATTERN_LOG_COMPACTION_MIN_ENTRIES,
+    PATTERN_LOG_COMPACTION_RATIO,
+    PATTERN_LOG_SUFFIX,
     PATTERN_PRUNE_MIN_OCCURRENCES_MULTIPLIER,
     PATTERN_PRUNE_SUCCESS_RATE_THRESHOLD,
     RELEVANCE_BASE_WEIGHT,
@@ -31,10 +41,13 @@ from src.sganarelle.constants import (
     RELEVANCE_RECENCY_MIN_FACTOR,
     RELEVANCE_RECENCY_WEIGHT,
 )
-from src.sganarelle.types import Pattern, PatternType
+from src.sganarelle.types import Pattern, PatternType, sender_domain
 
 logger = logging.getLogger(__name__)
 
+# Index key of patterns without discriminating condition (always candidates)
+_WILDCARD_KEY = ("*", "")
+
 
 class PatternStoreError(Exception):
     """Erreur dans le pattern store"""
@@ -46,7 +59,9 @@ class PatternStore:
     Gestionnaire de patterns appris
 
     Store et récupère les patterns de manière thread-safe.
-    Supporte la persistence sur disque au format JSON.
+    Supporte la persistence sur disque : snapshot JSON + journal append-only
+    (fichier voisin `<nom>.log.jsonl`), compacté dans le snapshot quand il
+    dépasse PATTERN_LOG_COMPACTION_RATIO fois le nombre de patterns.
 
     Thread-safe: Utilise verrous pour accès concurrent.
     """
@@ -63,11 +78,11 @@ class PatternStore:
         Initialize pattern store
 
         Args:
-            storage_path: Chemin fichier JSON pour persistence (None = memory only)
+            storage_path: Chemin fichier JSON (snapshot) pour persistence (None = memory only)
             min_occurrences: Occurrences minimales pour pattern valide
             min_success_rate: Success rate minimal pour suggestions (0-1)
             max_age_days: Age max pattern (jours) avant pruning
-            auto_save: Si True, save après chaque modification
+            auto_save: Si True, journalise chaque modification sur disque
 
         Raises:
             ValueError: Si paramètres invalides
@@ -91,8 +106,19 @@ class PatternStore:
         self._patterns: dict[str, Pattern] = {}
         self._lock = Lock()
 
-        # Load existing patterns
-        if storage_path and storage_path.exists():
+        # Index: (condition, value) -> pattern IDs (one bucket per pattern)
+        self._index: dict[tuple[str, str], set[str]] = {}
+
+        # Append-only journal of modifications since the last snapshot
+        self._log_path = (
+            storage_path.with_name(storage_path.stem + PATTERN_LOG_SUFFIX)
+            if storage_path
+            else None
+        )
+        self._log_entries = 0
+
+        # Load existing patterns (snapshot, then journal)
+        if storage_path:
             self._load_from_disk()
 
         logger.info(
@@ -122,6 +148,7 @@ class PatternStore:
                 )
 
             self._patterns[pattern.pattern_id] = pattern
+            self._index_add(pattern)
 
             logger.debug(
                 "Pattern added",
@@ -133,7 +160,7 @@ class PatternStore:
             )
 
             if self.auto_save:
-                self._save_to_disk()
+                self._append_to_log({"op": "put", "pattern": pattern.to_dict()})
 
     def update_pattern(
         self,
@@ -205,7 +232,7 @@ class PatternStore:
             )
 
             if self.auto_save:
-                self._save_to_disk()
+                self._append_to_log({"op": "put", "pattern": new_pattern.to_dict()})
 
             return new_pattern
 
@@ -231,13 +258,18 @@ class PatternStore:
 
         min_conf = min_confidence if min_confidence is not None else self.min_success_rate
 
-        # Copy patterns list while holding lock (thread-safe)
+        # Collect candidates from the index while holding lock (thread-safe)
         with self._lock:
-            patterns_snapshot = list(self._patterns.values())
-
-        # Work on snapshot without lock (patterns are immutable)
+            candidates = [
+                self._patterns[pattern_id]
+                for key in _event_index_keys(event)
+                for pattern_id in self._index.get(key, ())
+            ]
+            total_patterns = len(self._patterns)
+
+        # Work on candidates without lock (patterns are immutable)
         matching = []
-        for pattern in patterns_snapshot:
+        for pattern in candidates:
             # Check minimum requirements
             if pattern.occurrences < self.min_occurrences:
                 continue
@@ -255,8 +287,9 @@ class PatternStore:
             "Found matching patterns",
             extra={
                 "event_id": event.event_id,
+                "candidates": len(candidates),
                 "matches_found": len(matching),
-                "total_patterns": len(self._patterns)
+                "total_patterns": total_patterns
             }
         )
 
@@ -328,7 +361,7 @@ class PatternStore:
 
             # Remove
             for pattern_id in to_remove:
-                del self._patterns[pattern_id]
+                self._index_remove(self._patterns.pop(pattern_id))
                 removed += 1
 
             logger.info(
@@ -340,7 +373,8 @@ class PatternStore:
             )
 
             if removed > 0 and self.auto_save:
-                self._save_to_disk()
+                for pattern_id in to_remove:
+                    self._append_to_log({"op": "delete", "pattern_id": pattern_id})
 
         return removed
 
@@ -379,19 +413,21 @@ class PatternStore:
         }
 
     def save(self) -> None:
-        """Force save to disk"""
+        """Force save to disk (writes the snapshot and compacts the journal)"""
         if self.storage_path:
-            self._save_to_disk()
+            with self._lock:
+                self._save_to_disk()
 
     def clear(self) -> None:
         """Clear all patterns (for testing)"""
         with self._lock:
             self._patterns.clear()
+            self._index.clear()
 
             logger.warning("All patterns cleared")
 
             if self.auto_save:
-                self._save_to_disk()
+                self._append_to_log({"op": "clear"})
 
     # Private methods
 
@@ -423,8 +459,57 @@ class PatternStore:
 
         return max(0.0, min(1.0, relevance))
 
+    def _index_add(self, pattern: Pattern) -> None:
+        """Add pattern to its index bucket (lock held)"""
+        self._index.setdefault(_index_key(pattern), set()).add(pattern.pattern_id)
+
+    def _index_remove(self, pattern: Pattern) -> None:
+        """Remove pattern from its index bucket (lock held)"""
+        key = _index_key(pattern)
+        bucket = self._index.get(key)
+        if bucket is not None:
+            bucket.discard(pattern.pattern_id)
+            if not bucket:
+                del self._index[key]
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the whole index from patterns (lock held or during init)"""
+        self._index.clear()
+        for pattern in self._patterns.values():
+            self._index_add(pattern)
+
+    def _append_to_log(self, record: dict[str, Any]) -> None:
+        """
+        Append one modification to the journal (lock held)
+
+        Compacts the journal into the snapshot once it outgrows the patterns.
+        """
+        if not self._log_path:
+            return
+
+        try:
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log_entries += 1
+        except Exception as e:
+            logger.error(
+                "Failed to append to pattern journal, saving snapshot",
+                extra={"path": str(self._log_path), "error": str(e)},
+                exc_info=True
+            )
+            self._save_to_disk()
+            return
+
+        compaction_threshold = max(
+            PATTERN_LOG_COMPACTION_MIN_ENTRIES,
+            PATTERN_LOG_COMPACTION_RATIO * len(self._patterns)
+        )
+        if self._log_entries > compaction_threshold:
+            self._save_to_disk()
+
     def _save_to_disk(self) -> None:
-        """Save patterns to disk (JSON)"""
+        """Save patterns to disk (JSON snapshot) and truncate the journal"""
         if not self.storage_path:
             return
 
@@ -450,11 +535,18 @@ class PatternStore:
             # Atomic rename
             temp_path.replace(self.storage_path)
 
+            # The snapshot now contains every journaled modification
+            compacted = self._log_entries
+            if self._log_path:
+                self._log_path.unlink(missing_ok=True)
+            self._log_entries = 0
+
             logger.debug(
                 "Patterns saved to disk",
                 extra={
                     "path": str(self.storage_path),
-                    "count": len(self._patterns)
+                    "count": len(self._patterns),
+                    "journal_entries_compacted": compacted
                 }
             )
 
@@ -466,34 +558,81 @@ class PatternStore:
             )
 
     def _load_from_disk(self) -> None:
-        """Load patterns from disk (JSON)"""
-        if not self.storage_path or not self.storage_path.exists():
+        """Load patterns from disk (JSON snapshot, then journal replay)"""
+        if not self.storage_path:
             return
 
-        try:
-            with open(self.storage_path, encoding='utf-8') as f:
-                data = json.load(f)
+        if self.storage_path.exists():
+            try:
+                with open(self.storage_path, encoding='utf-8') as f:
+                    data = json.load(f)
+
+                # Parse patterns
+                for pattern_data in data.get("patterns", []):
+                    pattern = self._pattern_from_dict(pattern_data)
+                    self._patterns[pattern.pattern_id] = pattern
+
+            except Exception as e:
+                logger.error(
+                    "Failed to load patterns",
+                    extra={"path": str(self.storage_path), "error": str(e)},
+                    exc_info=True
+                )
 
-            # Parse patterns
-            for pattern_data in data.get("patterns", []):
-                pattern = self._pattern_from_dict(pattern_data)
-                self._patterns[pattern.pattern_id] = pattern
+        self._replay_log()
+        self._rebuild_index()
 
-            logger.info(
-                "Patterns loaded from disk",
-                extra={
-                    "path": str(self.storage_path),
-                    "count": len(self._patterns)
-                }
-            )
+        logger.info(
+            "Patterns loaded from disk",
+            extra={
+                "path": str(self.storage_path),
+                "count": len(self._patterns),
+                "journal_entries": self._log_entries
+            }
+        )
+
+    def _replay_log(self) -> None:
+        """Apply journaled modifications on top of the snapshot"""
+        if not self._log_path or not self._log_path.exists():
+            return
+
+        try:
+            with open(self._log_path, encoding='utf-8') as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._apply_log_record(json.loads(line))
+                    except (ValueError, KeyError, TypeError) as e:
+                        # A crash during an append leaves a truncated last line
+                        logger.warning(
+                            "Skipping invalid pattern journal entry",
+                            extra={"line": line_number, "error": str(e)}
+                        )
+                        continue
+                    self._log_entries += 1
 
         except Exception as e:
             logger.error(
-                "Failed to load patterns",
-                extra={"path": str(self.storage_path), "error": str(e)},
+                "Failed to replay pattern journal",
+                extra={"path": str(self._log_path), "error": str(e)},
                 exc_info=True
             )
 
+    def _apply_log_record(self, record: dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory patterns"""
+        op = record["op"]
+        if op == "put":
+            pattern = self._pattern_from_dict(record["pattern"])
+            self._patterns[pattern.pattern_id] = pattern
+        elif op == "delete":
+            self._patterns.pop(record["pattern_id"], None)
+        elif op == "clear":
+            self._patterns.clear()
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
     def _pattern_from_dict(self, data: dict[str, Any]) -> Pattern:
         """Reconstruct Pattern from dict"""
         return Pattern(
@@ -509,6 +648,34 @@ class PatternStore:
         )
 
 
+def _index_key(pattern: Pattern) -> tuple[str, str]:
+    """
+    Most discriminating condition of a pattern, used as its index bucket
+
+    A pattern can only match events having this value, so looking up the
+    buckets of an event's values never misses a matching pattern.
+    """
+    conditions = pattern.conditions
+    if conditions.get("sender_domain"):
+        return ("sender_domain", str(conditions["sender_domain"]).lower())
+    if conditions.get("keywords"):
+        # All keywords are required: any one of them identifies candidates
+        return ("keyword", min(str(k).lower() for k in conditions["keywords"]))
+    if "event_type" in conditions:
+        return ("event_type", str(conditions["event_type"]))
+    return _WILDCARD_KEY
+
+
+def _event_index_keys(event: PerceivedEvent) -> list[tuple[str, str]]:
+    """Index buckets that may hold patterns matching an event"""
+    keys = [_WILDCARD_KEY, ("event_type", event.event_type.value)]
+    domain = sender_domain(event.from_person)
+    if domain:
+        keys.append(("sender_domain", domain))
+    keys.extend(dict.fromkeys(("keyword", k.lower()) for k in event.keywords))
+    return keys
+
+
 def create_pattern_from_execution(
     event: PerceivedEvent,
     actions: list[Action],
@@ -19,6 +19,20 @@ if TYPE_CHECKING:
     from src.figaro.actions.base import Action
 
 
+def sender_domain(address: str) -> str:
+    """
+    Domaine (minuscules) d'une adresse d'expéditeur
+
+    Accepte "alice@example.com" ou "Alice <alice@example.com>".
+    Retourne "" si l'adresse n'a pas de domaine.
+    """
+    address = (address or "").strip()
+    if "<" in address and address.endswith(">"):
+        address = address[address.rindex("<") + 1:-1]
+    _, at, domain = address.rpartition("@")
+    return domain.strip().lower() if at else ""
+
+
 class UpdateType(str, Enum):
     """Type de mise à jour de connaissances"""
     NOTE_CREATED = "note_created"
@@ -214,6 +228,19 @@ class Pattern:
         if "event_type" in self.conditions and event.event_type.value != self.conditions["event_type"]:
             return False
 
+        # Check sender domain
+        if "sender_domain" in self.conditions and (
+            sender_domain(event.from_person) != str(self.conditions["sender_domain"]).lower()
+        ):
+            return False
+
+        # Check keywords (all required, case-insensitive)
+        if "keywords" in self.conditions:
+            event_keywords = {k.lower() for k in event.keywords}
+            required_keywords = {str(k).lower() for k in self.conditions["keywords"]}
+            if not required_keywords.issubset(event_keywords):
+                return False
+
         # Check urgency
         if "min_urgency" in self.conditions and event.urgency.value < self.conditions["min_urgency"]:
             return False
@@ -17,14 +17,22 @@ from pathlib import Path
 from typing import Any, Optional
 
 from src.core.config_manager import CalendarConfig, get_config
-from src.core.events import PerceivedEvent
+from src.core.events import (
+    PerceivedEvent,
+    ProcessingEvent,
+    ProcessingEventType,
+    get_event_bus,
+)
 from src.core.state_manager import get_state_manager
 from src.integrations.microsoft.auth import MicrosoftAuthenticator
 from src.integrations.microsoft.calendar_client import CalendarClient
 from src.integrations.microsoft.calendar_models import CalendarEvent
 from src.integrations.microsoft.calendar_normalizer import CalendarNormalizer
 from src.integrations.microsoft.graph_client import GraphClient
+from src.integrations.storage.archive_index import ArchiveIndex, get_archive_index
+from src.integrations.storage.graph_sync_store import get_graph_sync_store
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import ITEMS_PROCESSED, MetricsStore, get_metrics_store
 from src.utils import now_utc
 
 logger = get_logger("trivelin.calendar_processor")
@@ -108,6 +116,8 @@ class CalendarProcessor:
         normalizer: Optional[CalendarNormalizer] = None,
         config: Optional[CalendarConfig] = None,
         data_dir: Optional[Path] = None,
+        archive_index: Optional[ArchiveIndex] = None,
+        metrics: Optional[MetricsStore] = None,
     ) -> None:
         """
         Initialize Calendar processor
@@ -117,10 +127,14 @@ class CalendarProcessor:
             normalizer: Optional pre-configured normalizer
             config: Optional Calendar configuration
             data_dir: Directory for token cache and state
+            archive_index: Local search archive (default: shared instance)
+            metrics: Activity metrics store (default: shared instance)
         """
         self.config = config or get_config().calendar
         self.data_dir = data_dir or Path("data")
         self.state_manager = get_state_manager()
+        self.archive_index = archive_index or get_archive_index()
+        self.metrics = metrics or get_metrics_store()
         self._last_poll: Optional[datetime] = None
 
         # Initialize client if not provided
@@ -152,8 +166,9 @@ class CalendarProcessor:
             config=self.config.account,
             cache_dir=self.data_dir,
         )
-        graph_client = GraphClient(authenticator=authenticator)
-        return CalendarClient(graph=graph_client)
+        sync_store = get_graph_sync_store()
+        graph_client = GraphClient(authenticator=authenticator, sync_store=sync_store)
+        return CalendarClient(graph=graph_client, sync_store=sync_store)
 
     async def poll_and_process(
         self,
@@ -178,6 +193,9 @@ class CalendarProcessor:
         )
 
         try:
+            # Pull changes into the local mirror (deleted events leave the archive)
+            await self._sync_mirror()
+
             # Fetch events
             events = await self.calendar_client.get_events(
                 days_ahead=self.config.days_ahead,
@@ -236,6 +254,9 @@ class CalendarProcessor:
             # Normalize to PerceivedEvent
             perceived_event = self.normalizer.normalize(event)
 
+            # Keep the local search archive current (edits included)
+            self._index_in_archive(perceived_event)
+
             # Check if already processed
             if self._is_processed(perceived_event.event_id):
                 logger.debug(f"Event {event.event_id} already processed")
@@ -250,6 +271,7 @@ class CalendarProcessor:
             # Note: For advanced analysis, use V2EmailProcessor with Calendar normalization
             logger.info(f"Processed event {event.event_id}")
             self._mark_processed(perceived_event.event_id, {"mode": "basic"})
+            self.metrics.increment(ITEMS_PROCESSED, label="calendar")
 
             return CalendarProcessingResult(
                 event_id=event.event_id,
@@ -264,6 +286,37 @@ class CalendarProcessor:
                 error=str(e),
             )
 
+    async def _sync_mirror(self) -> None:
+        """Sync the local calendar mirror, if the client keeps one"""
+        if self.calendar_client.sync_store is None:
+            return
+
+        changes = await self.calendar_client.sync(force=True)
+        for event_id in changes.deleted:
+            try:
+                self.archive_index.remove_item("calendar", event_id)
+            except Exception as e:
+                logger.warning(f"Failed to remove {event_id} from archive: {e}")
+
+        if changes.total:
+            # Notify consumers of calendar data (e.g. cached briefings)
+            get_event_bus().emit(
+                ProcessingEvent(
+                    event_type=ProcessingEventType.SOURCE_UPDATED,
+                    metadata={
+                        "source": "calendar",
+                        "item_ids": changes.upserted + changes.deleted + changes.dropped,
+                    },
+                )
+            )
+
+    def _index_in_archive(self, event: PerceivedEvent) -> None:
+        """Add an event to the local search archive (never fails processing)"""
+        try:
+            self.archive_index.add_event(event)
+        except Exception as e:
+            logger.warning(f"Failed to index {event.event_id} in archive: {e}")
+
     def _is_processed(self, event_id: str) -> bool:
         """Check if an event has already been processed"""
         try:
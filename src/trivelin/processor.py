@@ -6,6 +6,8 @@ Core email processing logic that orchestrates IMAP, AI analysis, and actions.
 
 import signal
 import sys
+import threading
+import time
 from typing import Any, Optional
 
 from src.core.config_manager import get_config
@@ -25,8 +27,11 @@ from src.core.schemas import (
 from src.core.state_manager import get_state_manager
 from src.integrations.email.folder_preferences import FolderPreferencesStore
 from src.integrations.email.imap_client import IMAPClient
+from src.integrations.storage.archive_index import get_archive_index
 from src.integrations.storage.queue_storage import get_queue_storage
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import ITEMS_PROCESSED, PROCESSING_SECONDS, get_metrics_store
+from src.sancho.rate_limiter import RateLimiter
 from src.sancho.router import AIModel, get_ai_router
 from src.utils import now_utc
 
@@ -75,9 +80,15 @@ class EmailProcessor:
         self.event_bus = get_event_bus()
         self.error_manager = get_error_manager()
         self.queue_storage = get_queue_storage()
+        self.archive_index = get_archive_index()
+        self.metrics = get_metrics_store()
         self.folder_preferences = FolderPreferencesStore()
         self._shutdown_requested = False
 
+        # Optional per-processor AI quota (set by MultiAccountProcessor in
+        # parallel mode so one account cannot starve the shared rate limit)
+        self.account_rate_limiter: Optional[RateLimiter] = None
+
         # Setup graceful shutdown handlers
         self._setup_signal_handlers()
 
@@ -128,6 +139,11 @@ class EmailProcessor:
             sys.stderr.write(f"\n[SHUTDOWN] Received {signal_name}, stopping gracefully...\n")
             sys.stderr.flush()
 
+        # signal.signal() only works in the main thread (parallel account workers)
+        if threading.current_thread() is not threading.main_thread():
+            logger.debug("Not in main thread - skipping signal handler registration")
+            return
+
         # Register handlers for SIGINT and SIGTERM
         signal.signal(signal.SIGINT, shutdown_handler)
         signal.signal(signal.SIGTERM, shutdown_handler)
@@ -183,6 +199,13 @@ class EmailProcessor:
         except Exception as e:
             logger.warning(f"Failed to get folder suggestions: {e}")
 
+        # Per-account share of the global AI rate budget
+        if self.account_rate_limiter is not None and not self.account_rate_limiter.acquire(
+            timeout=60
+        ):
+            logger.error("Account rate share timeout - could not acquire permission")
+            return None
+
         # Direct AI router call
         analysis = self.ai_router.analyze_email(
             metadata,
@@ -424,6 +447,8 @@ class EmailProcessor:
             self.state.increment("emails_skipped")
             return None
 
+        started = time.monotonic()
+
         # Apply content truncation if needed
         if validation_result.should_truncate:
             content = self._truncate_content(content, max_chars=10000)
@@ -469,6 +494,8 @@ class EmailProcessor:
         # Update state
         self.state.increment("emails_processed")
         self.state.add_confidence_score(analysis.confidence)
+        self.metrics.increment(ITEMS_PROCESSED, label="email")
+        self.metrics.observe(PROCESSING_SECONDS, time.monotonic() - started, label="email")
         self.state.mark_processed(tracking_id)
 
         # Cache email data
@@ -502,6 +529,8 @@ class EmailProcessor:
             except Exception as e:
                 logger.warning(f"Failed to flag auto-executed email {metadata.id}: {e}")
 
+            self._index_in_archive(metadata, content, status="approved")
+
             # Emit email completed event (executed)
             self.event_bus.emit(
                 ProcessingEvent(
@@ -540,12 +569,14 @@ class EmailProcessor:
                 metadata=metadata,
                 analysis=analysis,
                 content_preview=content_preview,
-                account_id=self.config.email.get_enabled_accounts()[0].account_id
-                if self.config.email.get_enabled_accounts()
-                else None,
+                account_id=self._account_id(),
                 html_body=content.html,  # Full HTML body for rendering in UI
                 full_text=content.plain_text,  # Full plain text body
             )
+            if queue_item_id is not None:
+                self._index_in_archive(
+                    metadata, content, queue_item_id=queue_item_id, status="pending"
+                )
 
             # Flag the email to prevent reimport on next run
             # Uses IMAP gray flag ($MailFlagBit6) for visual feedback AND
@@ -612,6 +643,30 @@ class EmailProcessor:
 
         return processed
 
+    def _account_id(self) -> Optional[str]:
+        """Account the processed emails belong to (first enabled account)"""
+        accounts = self.config.email.get_enabled_accounts()
+        return accounts[0].account_id if accounts else None
+
+    def _index_in_archive(
+        self,
+        metadata: EmailMetadata,
+        content: EmailContent,
+        queue_item_id: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """Add a processed email to the local search archive (never fails processing)"""
+        try:
+            self.archive_index.add_email(
+                metadata,
+                content,
+                account_id=self._account_id(),
+                queue_item_id=queue_item_id,
+                status=status,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index email {metadata.id} in archive: {e}")
+
     def _execute_action(self, metadata: EmailMetadata, analysis: EmailAnalysis) -> bool:
         """
         Execute action based on analysis
@@ -17,13 +17,22 @@ from pathlib import Path
 from typing import Any, Optional
 
 from src.core.config_manager import TeamsConfig, get_config
+from src.core.events import (
+    PerceivedEvent,
+    ProcessingEvent,
+    ProcessingEventType,
+    get_event_bus,
+)
 from src.core.state_manager import get_state_manager
 from src.integrations.microsoft.auth import MicrosoftAuthenticator
 from src.integrations.microsoft.graph_client import GraphClient
 from src.integrations.microsoft.models import TeamsMessage
 from src.integrations.microsoft.teams_client import TeamsClient
 from src.integrations.microsoft.teams_normalizer import TeamsNormalizer
+from src.integrations.storage.archive_index import ArchiveIndex, get_archive_index
+from src.integrations.storage.graph_sync_store import get_graph_sync_store
 from src.monitoring.logger import get_logger
+from src.monitoring.metrics_store import ITEMS_PROCESSED, MetricsStore, get_metrics_store
 from src.utils import now_utc
 
 logger = get_logger("trivelin.teams_processor")
@@ -104,6 +113,8 @@ class TeamsProcessor:
         normalizer: Optional[TeamsNormalizer] = None,
         config: Optional[TeamsConfig] = None,
         data_dir: Optional[Path] = None,
+        archive_index: Optional[ArchiveIndex] = None,
+        metrics: Optional[MetricsStore] = None,
     ) -> None:
         """
         Initialize Teams processor
@@ -113,10 +124,14 @@ class TeamsProcessor:
             normalizer: Optional pre-configured normalizer
             config: Optional Teams configuration
             data_dir: Directory for token cache and state
+            archive_index: Local search archive (default: shared instance)
+            metrics: Activity metrics store (default: shared instance)
         """
         self.config = config or get_config().teams
         self.data_dir = data_dir or Path("data")
         self.state_manager = get_state_manager()
+        self.archive_index = archive_index or get_archive_index()
+        self.metrics = metrics or get_metrics_store()
         self._last_poll: Optional[datetime] = None
 
         # Initialize client if not provided
@@ -147,8 +162,9 @@ class TeamsProcessor:
             config=self.config.account,
             cache_dir=self.data_dir,
         )
-        graph_client = GraphClient(authenticator=authenticator)
-        return TeamsClient(graph=graph_client)
+        sync_store = get_graph_sync_store()
+        graph_client = GraphClient(authenticator=authenticator, sync_store=sync_store)
+        return TeamsClient(graph=graph_client, sync_store=sync_store)
 
     async def poll_and_process(
         self,
@@ -173,6 +189,9 @@ class TeamsProcessor:
         )
 
         try:
+            # Pull changes into the local mirror (deleted messages leave the archive)
+            await self._sync_mirror()
+
             # Fetch recent messages
             messages = await self.teams_client.get_recent_messages(
                 limit_per_chat=limit or self.config.max_messages_per_poll,
@@ -230,6 +249,9 @@ class TeamsProcessor:
             # Normalize to PerceivedEvent
             event = self.normalizer.normalize(message)
 
+            # Keep the local search archive current (edits included)
+            self._index_in_archive(event)
+
             # Check if already processed
             if self._is_processed(event.event_id):
                 logger.debug(f"Message {message.message_id} already processed")
@@ -244,6 +266,7 @@ class TeamsProcessor:
             # Note: For advanced analysis, use V2EmailProcessor with Teams normalization
             logger.info(f"Processed message {message.message_id}")
             self._mark_processed(event.event_id, {"mode": "basic"})
+            self.metrics.increment(ITEMS_PROCESSED, label="teams")
 
             return TeamsProcessingResult(
                 message_id=message.message_id,
@@ -258,6 +281,37 @@ class TeamsProcessor:
                 error=str(e),
             )
 
+    async def _sync_mirror(self) -> None:
+        """Sync the local Teams mirror, if the client keeps one"""
+        if self.teams_client.sync_store is None:
+            return
+
+        changes = await self.teams_client.sync(force=True)
+        for item_id in changes.deleted:
+            try:
+                self.archive_index.remove_item("teams", item_id)
+            except Exception as e:
+                logger.warning(f"Failed to remove {item_id} from archive: {e}")
+
+        if changes.total:
+            # Notify consumers of Teams data (e.g. cached briefings)
+            get_event_bus().emit(
+                ProcessingEvent(
+                    event_type=ProcessingEventType.SOURCE_UPDATED,
+                    metadata={
+                        "source": "teams",
+                        "item_ids": changes.upserted + changes.deleted + changes.dropped,
+                    },
+                )
+            )
+
+    def _index_in_archive(self, event: PerceivedEvent) -> None:
+        """Add an event to the local search archive (never fails processing)"""
+        try:
+            self.archive_index.add_event(event)
+        except Exception as e:
+            logger.warning(f"Failed to index {event.event_id} in archive: {e}")
+
     def _is_processed(self, event_id: str) -> bool:
         """Check if an event has already been processed"""
         # Use state manager to check
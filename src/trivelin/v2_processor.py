@@ -16,6 +16,7 @@ Usage:
     result = await processor.process_event(event, context_notes)
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -34,6 +35,12 @@ from src.core.models.v2_models import (
     V2MemoryState,
     V2WorkingMemory,
 )
+from src.core.processing_events import (
+    EventBus,
+    ProcessingEvent,
+    ProcessingEventType,
+    get_event_bus,
+)
 from src.integrations.apple.omnifocus import OmniFocusClient, create_omnifocus_client
 from src.monitoring.logger import get_logger
 from src.passepartout.context_engine import ContextEngine
@@ -805,36 +812,126 @@ class V2EmailProcessor:
         self,
         events: list[PerceivedEvent],
         auto_apply: bool = True,
+        max_concurrency: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        event_bus: Optional[EventBus] = None,
     ) -> list[V2ProcessingResult]:
         """
-        Process multiple events sequentially.
+        Process multiple events with bounded parallelism.
+
+        Up to max_concurrency events are analyzed at once; events from the
+        same sender are processed one at a time, in input order, so
+        enrichments of a shared person note never interleave. AI calls still
+        go through the router's rate limiter, which throttles the whole batch
+        when the API quota is reached.
 
         Args:
             events: List of events to process
             auto_apply: Whether to auto-apply high-confidence extractions
+            max_concurrency: Maximum events in flight (default: config.batch_concurrency)
+            token_budget: Maximum AI tokens for the batch (default:
+                config.batch_token_budget). Events not started when the
+                budget is exhausted are returned as failures.
+            event_bus: Bus receiving BATCH_* progress events (default: global bus)
 
         Returns:
-            List of V2ProcessingResult objects
+            List of V2ProcessingResult objects, in the same order as events
+
+        Raises:
+            ValueError: If max_concurrency is not positive
         """
-        results = []
+        if max_concurrency is None:
+            max_concurrency = self.config.batch_concurrency
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if token_budget is None:
+            token_budget = self.config.batch_token_budget
+        if event_bus is None:
+            event_bus = get_event_bus()
+
+        total = len(events)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        sender_locks: dict[str, asyncio.Lock] = {}
+        state = {"completed": 0, "in_flight": 0, "tokens_used": 0}
+
+        def emit(event_type: ProcessingEventType, **kwargs) -> None:
+            event_bus.emit(
+                ProcessingEvent(
+                    event_type=event_type,
+                    total=total,
+                    metadata={
+                        "in_flight": state["in_flight"],
+                        "queued": total - state["completed"] - state["in_flight"],
+                        "tokens_used": state["tokens_used"],
+                        "token_budget": token_budget,
+                        **kwargs.pop("metadata", {}),
+                    },
+                    **kwargs,
+                )
+            )
 
-        for i, event in enumerate(events):
-            logger.debug(f"Processing event {i + 1}/{len(events)}: {event.event_id}")
-            result = await self.process_event(event, auto_apply=auto_apply)
-            results.append(result)
+        async def run(index: int, event: PerceivedEvent) -> V2ProcessingResult:
+            sender = (event.from_person or "").lower()
+            lock = sender_locks.setdefault(sender, asyncio.Lock())
+
+            # Sender lock first: queued same-sender events must not hold a slot
+            async with lock, semaphore:
+                if token_budget is not None and state["tokens_used"] >= token_budget:
+                    result = V2ProcessingResult(
+                        success=False,
+                        event_id=event.event_id,
+                        error="Token budget exhausted",
+                    )
+                else:
+                    state["in_flight"] += 1
+                    logger.debug(f"Processing event {index + 1}/{total}: {event.event_id}")
+                    try:
+                        result = await self.process_event(event, auto_apply=auto_apply)
+                    except Exception as e:
+                        logger.error(f"V2 batch processing failed for {event.event_id}: {e}")
+                        result = V2ProcessingResult(
+                            success=False, event_id=event.event_id, error=str(e)
+                        )
+                    finally:
+                        state["in_flight"] -= 1
+
+                    if result.multi_pass_result is not None:
+                        state["tokens_used"] += result.multi_pass_result.total_tokens
+
+                state["completed"] += 1
+                emit(
+                    ProcessingEventType.BATCH_PROGRESS,
+                    current=state["completed"],
+                    error=result.error,
+                    metadata={"event_id": event.event_id, "success": result.success},
+                )
+                return result
+
+        emit(ProcessingEventType.BATCH_STARTED, current=0)
+
+        # gather() preserves input order regardless of completion order
+        results = list(await asyncio.gather(*(run(i, e) for i, e in enumerate(events))))
 
         # Log summary
         successful = sum(1 for r in results if r.success)
         auto_applied = sum(1 for r in results if r.auto_applied)
         total_extractions = sum(r.extraction_count for r in results)
 
+        emit(
+            ProcessingEventType.BATCH_COMPLETED,
+            current=total,
+            metadata={"successful": successful, "auto_applied": auto_applied},
+        )
+
         logger.info(
             "Batch processing complete",
             extra={
-                "total": len(events),
+                "total": total,
                 "successful": successful,
                 "auto_applied": auto_applied,
                 "total_extractions": total_extractions,
+                "tokens_used": state["tokens_used"],
+                "max_concurrency": max_concurrency,
             },
         )
 
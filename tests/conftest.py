@@ -99,6 +99,28 @@ def tmp_data_dir(tmp_path: Path) -> Path:
     return data_dir
 
 
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_data_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Point the shared metrics store, queue storage and embedding cache at a
+    temporary data directory
+
+    Singletons are reset before and after each test, so nothing is written
+    to the project's data/ directory.
+    """
+    from src.integrations.storage import queue_storage
+    from src.monitoring import metrics_store
+    from src.passepartout import note_manager
+
+    monkeypatch.setattr(metrics_store, "DEFAULT_METRICS_STORE_PATH", tmp_data_dir / "metrics.db")
+    monkeypatch.setattr(queue_storage, "get_data_dir", lambda: tmp_data_dir)
+    monkeypatch.setattr(note_manager, "get_data_dir", lambda: tmp_data_dir)
+    monkeypatch.setattr(queue_storage, "_queue_storage_instance", None)
+    metrics_store.reset_metrics_store()
+    yield tmp_data_dir
+    metrics_store.reset_metrics_store()
+
+
 @pytest.fixture
 def tmp_templates_dir(tmp_path: Path) -> Path:
     """Create temporary templates directory"""
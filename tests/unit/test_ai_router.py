@@ -4,14 +4,18 @@ Unit Tests for AI Router
 Tests for AI routing, rate limiting, and email analysis.
 """
 
+import asyncio
 import json
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.core.config_manager import AIConfig
 from src.core.schemas import EmailAction, EmailCategory, EmailContent, EmailMetadata
+from src.sancho.circuit_breaker import CircuitBreakerOpenError
+from src.sancho.rate_limiter import TierLimits
 from src.sancho.router import AIModel, AIRouter, RateLimiter
 from src.utils import now_utc
 
@@ -79,6 +83,47 @@ class TestRateLimiter:
         assert usage["max_requests"] == 10
         assert usage["usage_percent"] == 20.0
 
+    def test_waits_exactly_for_refill(self):
+        """Test a waiter wakes when the bucket refills, not on a polling tick"""
+        limiter = RateLimiter(max_requests=4, window_seconds=1)
+        for _ in range(4):
+            limiter.acquire()
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=1) is True
+
+        assert time.monotonic() - start == pytest.approx(0.25, abs=0.1)
+
+    def test_tier_token_budgets(self):
+        """Test output tokens are reserved per tier and returned on reconcile"""
+        limiter = RateLimiter(
+            max_requests=100,
+            tier_limits={"sonnet": TierLimits(output_tokens_per_minute=1000)},
+        )
+
+        reservation = limiter.reserve("sonnet", input_tokens=100, output_tokens=800)
+        assert limiter.reserve("sonnet", output_tokens=800, timeout=0.1) is None
+        # Other tiers have their own budget
+        assert limiter.reserve("haiku", output_tokens=800, timeout=0.1) is not None
+
+        limiter.reconcile(reservation, input_tokens=90, output_tokens=50)
+        assert limiter.reserve("sonnet", output_tokens=800, timeout=0.1) is not None
+
+    def test_reconcile_wakes_waiter(self):
+        """Test tokens returned by reconcile wake a blocked reserve()"""
+        limiter = RateLimiter(
+            max_requests=100,
+            tier_limits={"haiku": TierLimits(input_tokens_per_minute=1000)},
+        )
+        reservation = limiter.reserve("haiku", input_tokens=900)
+        timer = threading.Timer(0.1, limiter.reconcile, (reservation, 100, 0))
+        timer.start()
+
+        start = time.monotonic()
+        assert limiter.reserve("haiku", input_tokens=800, timeout=5) is not None
+        assert time.monotonic() - start < 1
+        timer.join()
+
 
 class TestAIRouterInit:
     """Test AI router initialization"""
@@ -518,3 +563,171 @@ class TestContextInjection:
         # Check that the prompt contains the injected context
         assert "--- PROFILE ---" in prompt_sent
         assert "User is a developer" in prompt_sent
+
+
+@pytest.mark.asyncio
+class TestNativeAsyncPath:
+    """Test the native async provider path"""
+
+    def _message(self, text="ok"):
+        message = MagicMock()
+        message.content = [MagicMock(text=text)]
+        message.usage = MagicMock(
+            input_tokens=10,
+            output_tokens=5,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=7,
+        )
+        return message
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_call_with_cache_async_uses_async_client(
+        self, mock_anthropic, mock_async_anthropic, ai_config
+    ):
+        """Test cached calls go through the async client with a timeout"""
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=self._message("hello"))
+        mock_async_anthropic.return_value = client
+
+        router = AIRouter(ai_config)
+        text, usage = await router._call_claude_with_cache_async(
+            user_prompt="u", system_prompt="s", model=AIModel.CLAUDE_HAIKU
+        )
+
+        assert text == "hello"
+        assert usage["cache_read_input_tokens"] == 7
+        assert usage["total_tokens"] == 15
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["timeout"] == ai_config.request_timeout_seconds
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        mock_anthropic.return_value.messages.create.assert_not_called()
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_client_is_reused_within_loop(
+        self, mock_anthropic, mock_async_anthropic, ai_config
+    ):
+        """Test one pooled client serves concurrent calls"""
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=self._message())
+        mock_async_anthropic.return_value = client
+
+        router = AIRouter(ai_config)
+        await asyncio.gather(*[
+            router._call_claude_async("p", AIModel.CLAUDE_HAIKU) for _ in range(5)
+        ])
+
+        assert mock_async_anthropic.call_count == 1
+        assert client.messages.create.await_count == 5
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_calls_overlap_on_one_loop(
+        self, mock_anthropic, mock_async_anthropic, ai_config
+    ):
+        """Test in-flight calls do not serialize the event loop"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return self._message()
+
+        client = MagicMock()
+        client.messages.create = slow_create
+        mock_async_anthropic.return_value = client
+
+        router = AIRouter(ai_config)
+        await asyncio.gather(*[
+            router._call_claude_async("p", AIModel.CLAUDE_HAIKU) for _ in range(8)
+        ])
+
+        assert peak == 8
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_failures_open_circuit_breaker(
+        self, mock_anthropic, mock_async_anthropic, ai_config
+    ):
+        """Test async failures count towards the shared circuit breaker"""
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=Exception("boom"))
+        mock_async_anthropic.return_value = client
+
+        router = AIRouter(ai_config)
+        for _ in range(router.circuit_breaker.failure_threshold):
+            with pytest.raises(Exception, match="boom"):
+                await router._call_claude_async("p", AIModel.CLAUDE_HAIKU)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await router._call_claude_async("p", AIModel.CLAUDE_HAIKU)
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_cancellation_is_not_a_failure(
+        self, mock_anthropic, mock_async_anthropic, ai_config
+    ):
+        """Test cancelling a call aborts it without tripping the breaker"""
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        client = MagicMock()
+        client.messages.create = hang
+        mock_async_anthropic.return_value = client
+
+        router = AIRouter(ai_config)
+        task = asyncio.create_task(router._call_claude_async("p", AIModel.CLAUDE_HAIKU))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert router.circuit_breaker.failure_count == 0
+
+    async def test_rate_limiter_acquire_async_times_out(self):
+        """Test async acquire shares the window and honours timeout"""
+        limiter = RateLimiter(max_requests=1, window_seconds=10)
+
+        assert await limiter.acquire_async(timeout=0.1) is True
+        assert await limiter.acquire_async(timeout=0.1) is False
+
+    async def test_reserve_async_woken_by_reconcile(self):
+        """Test async waiters wake when another thread returns tokens"""
+        limiter = RateLimiter(
+            max_requests=100,
+            tier_limits={"opus": TierLimits(output_tokens_per_minute=1000)},
+        )
+        reservation = limiter.reserve("opus", output_tokens=1000)
+        timer = threading.Timer(0.1, limiter.reconcile, (reservation, 0, 100))
+        timer.start()
+
+        start = time.monotonic()
+        assert await limiter.reserve_async("opus", output_tokens=500, timeout=5) is not None
+        assert time.monotonic() - start < 1
+        timer.join()
+
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    async def test_calls_reconcile_reserved_tokens(self, mock_anthropic, mock_async_anthropic):
+        """Test calls reserve max_tokens and settle with the reported usage"""
+        config = AIConfig(
+            anthropic_api_key="test_api_key_12345",
+            model_rate_limits={"haiku": {"output_tokens_per_minute": 1000}},
+        )
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=self._message())
+        mock_async_anthropic.return_value = client
+        mock_anthropic.return_value.messages.create.return_value = self._message()
+
+        router = AIRouter(config)
+        await router._call_claude_async("p", AIModel.CLAUDE_HAIKU, max_tokens=800)
+        router._call_claude("p", AIModel.CLAUDE_HAIKU, max_tokens=800)
+
+        # Both calls reserved 800 output tokens but only used 5 each
+        tiers = router.get_rate_limit_status()["tiers"]
+        assert tiers["haiku"]["output_tokens_available"] >= 989
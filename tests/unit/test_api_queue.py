@@ -12,6 +12,8 @@ from fastapi.testclient import TestClient
 
 from src.frontin.api.app import create_app
 from src.frontin.api.deps import get_queue_service
+from src.frontin.api.services.queue_service import QueuePage
+from src.integrations.storage.queue_index import QueueChanges
 
 
 @pytest.fixture
@@ -48,7 +50,12 @@ def mock_queue_service() -> MagicMock:
     }
 
     # Mock async methods
-    service.list_items = AsyncMock(return_value=([service.sample_item], 1))
+    service.list_page = AsyncMock(
+        return_value=QueuePage(items=[service.sample_item], total=1, sync_token=7)
+    )
+    service.list_changes = AsyncMock(
+        return_value=QueueChanges(items=[service.sample_item], removed_ids=["gone"], seq=9)
+    )
     service.get_item = AsyncMock(return_value=service.sample_item)
     service.get_stats = AsyncMock(return_value={
         "total": 5,
@@ -104,8 +111,8 @@ class TestListQueueItems:
         response = client.get("/api/queue?status=approved")
 
         assert response.status_code == 200
-        mock_queue_service.list_items.assert_called_once()
-        call_kwargs = mock_queue_service.list_items.call_args[1]
+        mock_queue_service.list_page.assert_called_once()
+        call_kwargs = mock_queue_service.list_page.call_args[1]
         assert call_kwargs["status"] == "approved"
 
     def test_list_filters_by_account(self, client: TestClient, mock_queue_service: MagicMock) -> None:
@@ -113,11 +120,57 @@ class TestListQueueItems:
         response = client.get("/api/queue?account_id=work")
 
         assert response.status_code == 200
-        mock_queue_service.list_items.assert_called_once()
-        call_kwargs = mock_queue_service.list_items.call_args[1]
+        mock_queue_service.list_page.assert_called_once()
+        call_kwargs = mock_queue_service.list_page.call_args[1]
         assert call_kwargs["account_id"] == "work"
 
 
+    def test_list_follows_cursor(self, client: TestClient, mock_queue_service: MagicMock) -> None:
+        """Test cursor and sort are passed through and next_cursor returned"""
+        mock_queue_service.list_page.return_value = QueuePage(
+            items=[mock_queue_service.sample_item], total=3, next_cursor="next", sync_token=7
+        )
+
+        response = client.get("/api/queue?tab=history&cursor=abc&sort=resolved")
+
+        data = response.json()
+        assert data["next_cursor"] == "next"
+        assert data["has_more"] is True
+        assert data["sync_token"] == 7
+        call_kwargs = mock_queue_service.list_page.call_args[1]
+        assert call_kwargs["cursor"] == "abc"
+        assert call_kwargs["sort"] == "resolved"
+
+    def test_list_invalid_cursor(self, client: TestClient, mock_queue_service: MagicMock) -> None:
+        """Test a malformed cursor is a client error"""
+        mock_queue_service.list_page.side_effect = ValueError("Invalid queue cursor")
+
+        response = client.get("/api/queue?cursor=bad")
+
+        assert response.status_code == 400
+
+
+class TestListQueueChanges:
+    """Tests for GET /api/queue/changes endpoint"""
+
+    def test_changes_returns_delta(self, client: TestClient, mock_queue_service: MagicMock) -> None:
+        """Test changed items and removed IDs are returned with the next token"""
+        response = client.get("/api/queue/changes?since=7&tab=to_process")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [item["id"] for item in data["items"]] == ["test-queue-123"]
+        assert data["removed_ids"] == ["gone"]
+        assert data["sync_token"] == 9
+        assert mock_queue_service.list_changes.call_args[1]["tab"] == "to_process"
+
+    def test_changes_requires_since(self, client: TestClient) -> None:
+        """Test since is required"""
+        response = client.get("/api/queue/changes")
+
+        assert response.status_code == 422
+
+
 class TestGetQueueStats:
     """Tests for GET /api/queue/stats endpoint"""
 
@@ -14,6 +14,7 @@ from src.frontin.api.app import create_app
 from src.frontin.api.deps import get_cached_config, get_current_user
 from src.frontin.api.models.stats import StatsBySourceResponse, StatsOverviewResponse
 from src.frontin.api.services.stats_service import StatsService
+from src.monitoring.metrics_store import ITEMS_PROCESSED, MetricsStore
 
 
 @pytest.fixture
@@ -118,6 +119,15 @@ class TestStatsModels:
 class TestStatsService:
     """Tests for StatsService"""
 
+    @pytest.fixture
+    def metrics(self, tmp_path) -> MetricsStore:
+        """Metrics store with processed counts (100 emails, 50 Teams messages)"""
+        store = MetricsStore(tmp_path / "metrics.db")
+        store.increment(ITEMS_PROCESSED, 100, label="email")
+        store.increment(ITEMS_PROCESSED, 50, label="teams")
+        yield store
+        store.close()
+
     @pytest.fixture
     def mock_services(self) -> dict:
         """Create mock services"""
@@ -175,7 +185,9 @@ class TestStatsService:
         }
 
     @pytest.mark.asyncio
-    async def test_get_overview_aggregates_stats(self, mock_services: dict) -> None:
+    async def test_get_overview_aggregates_stats(
+        self, mock_services: dict, metrics: MetricsStore
+    ) -> None:
         """Test get_overview aggregates stats from all sources"""
         with (
             patch("src.frontin.api.services.stats_service.get_config") as mock_config,
@@ -217,7 +229,7 @@ class TestStatsService:
             }.get(key, default)
             mock_state.return_value = state
 
-            service = StatsService()
+            service = StatsService(metrics=metrics)
             overview = await service.get_overview()
 
             assert overview.email_processed == 100
@@ -232,7 +244,7 @@ class TestStatsService:
             assert overview.calendar_events_week == 10
 
     @pytest.mark.asyncio
-    async def test_get_overview_handles_service_errors(self) -> None:
+    async def test_get_overview_handles_service_errors(self, tmp_path) -> None:
         """Test get_overview handles service errors gracefully"""
         with (
             patch("src.frontin.api.services.stats_service.get_config") as mock_config,
@@ -281,7 +293,7 @@ class TestStatsService:
             )
             mock_notes_cls.return_value = mock_notes_service
 
-            service = StatsService()
+            service = StatsService(metrics=MetricsStore(tmp_path / "metrics.db"))
             overview = await service.get_overview()
 
             # Should return zeros instead of crashing
@@ -291,7 +303,7 @@ class TestStatsService:
 
     @pytest.mark.asyncio
     async def test_get_by_source_returns_all_sources(
-        self, mock_services: dict
+        self, mock_services: dict, metrics: MetricsStore
     ) -> None:
         """Test get_by_source returns stats for all sources"""
         with (
@@ -326,11 +338,15 @@ class TestStatsService:
             state.get.return_value = 0
             mock_state.return_value = state
 
-            service = StatsService()
+            metrics.increment(ITEMS_PROCESSED, 20, label="email")  # Earlier sessions
+            service = StatsService(metrics=metrics)
             by_source = await service.get_by_source()
 
             assert by_source.email is not None
-            assert by_source.email.emails_processed == 100
+            assert by_source.email.emails_processed == 100  # This session
+            assert by_source.email.emails_processed_total == 120
+            assert by_source.teams is not None
+            assert by_source.teams.messages_processed_total == 50
             assert by_source.teams is not None
             assert by_source.teams.total_chats == 20
             assert by_source.queue is not None
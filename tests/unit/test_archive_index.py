@@ -0,0 +1,166 @@
+"""
+Tests for the local archive index
+
+Coverage:
+- Upserts and removal
+- Ranked search with accent folding and snippets
+- Source, account and date filters
+- AND query with OR fallback, injection-safe MATCH expressions
+- Conversion of events and queue items
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations.storage.archive_index import (
+    ArchiveIndex,
+    ArchiveItem,
+    build_match_query,
+    item_from_event,
+    item_from_queue_item,
+)
+
+
+def _item(item_id, title, body="", source="email", day=5, account_id="work", sender=""):
+    return ArchiveItem(
+        source=source,
+        item_id=item_id,
+        title=title,
+        body=body,
+        timestamp=datetime(2026, 1, day, 10, 0, tzinfo=timezone.utc),
+        account_id=account_id,
+        sender=sender,
+        metadata={"ref": item_id},
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ArchiveIndex(tmp_path / "archive.db")
+    index.add_items(
+        [
+            _item("m1", "Réunion budget", "Ordre du jour : budget Alpha", day=3),
+            _item("m2", "Facture", "Relance budget fournisseur", day=5, account_id="perso"),
+            _item("m3", "Déjeuner", "Jeudi midi ?", day=7, sender="Marc <marc@acme.fr>"),
+            _item("t1", "Chat Alpha", "Le budget est validé", source="teams", day=6),
+        ]
+    )
+    yield index
+    index.close()
+
+
+class TestBuildMatchQuery:
+    """Test user input translation"""
+
+    def test_phrases_and_prefix(self):
+        assert build_match_query("budget alpha") == '"budget" AND "alpha"*'
+        assert build_match_query("budget alpha", any_term=True) == '"budget" OR "alpha"*'
+        assert build_match_query("marc@acme.fr") == '"marc acme fr"*'
+
+    def test_syntax_is_stripped(self):
+        assert build_match_query('" OR title:* NEAR(') == '"OR" AND "title" AND "NEAR"*'
+        assert build_match_query("*** ()") == ""
+
+
+class TestArchiveIndex:
+    """Test indexing and search"""
+
+    def test_ranked_search_with_accent_folding(self, index):
+        hits = index.search("reunion")
+
+        assert [h.item_id for h in hits] == ["m1"]
+        assert hits[0].title == "Réunion budget"
+        assert hits[0].metadata == {"ref": "m1"}
+        assert 0 < hits[0].score < 1
+
+    def test_title_outranks_body(self, index):
+        hits = index.search("budget", sources=["email"])
+
+        assert [h.item_id for h in hits] == ["m1", "m2"]
+
+    def test_snippet_highlight(self, index):
+        hit = index.search("fournisseur")[0]
+
+        assert "**fournisseur**" in hit.snippet
+
+    def test_filters(self, index):
+        assert {h.item_id for h in index.search("budget")} == {"m1", "m2", "t1"}
+        assert [h.item_id for h in index.search("budget", sources=["teams"])] == ["t1"]
+        assert [h.item_id for h in index.search("budget", account_id="perso")] == ["m2"]
+
+        hits = index.search(
+            "budget",
+            date_from=datetime(2026, 1, 4, tzinfo=timezone.utc),
+            date_to=datetime(2026, 1, 5, 23, 59, tzinfo=timezone.utc),
+        )
+        assert [h.item_id for h in hits] == ["m2"]
+
+    def test_prefix_and_sender(self, index):
+        assert [h.item_id for h in index.search("fourn")] == ["m2"]
+        assert [h.item_id for h in index.search("marc@acme.fr")] == ["m3"]
+
+    def test_or_fallback(self, index):
+        assert [h.item_id for h in index.search("reunion alpha")] == ["m1"]
+
+        hits = index.search("dejeuner facture")
+        assert {h.item_id for h in hits} == {"m2", "m3"}
+
+    def test_upsert_and_remove(self, index):
+        index.add_item(_item("m1", "Réunion annulée", "Plus de budget"))
+
+        assert index.count("email") == 3
+        assert index.search("reunion")[0].title == "Réunion annulée"
+        assert index.search("jour") == []
+
+        assert index.remove_item("email", "m1")
+        assert not index.remove_item("email", "m1")
+        assert index.search("reunion") == []
+        assert index.get_stats()["by_source"] == {"email": 2, "teams": 1}
+
+    def test_invalid_limit(self, index):
+        with pytest.raises(ValueError):
+            index.search("budget", limit=0)
+
+
+class TestConverters:
+    """Test archive item construction"""
+
+    def test_calendar_event_dated_by_start(self):
+        event = SimpleNamespace(
+            source=SimpleNamespace(value="calendar"),
+            source_id="evt-1",
+            title="Comité",
+            content="Revue",
+            from_person="Alice",
+            occurred_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            metadata={"start": "2026-01-08T14:00:00+00:00"},
+        )
+
+        item = item_from_event(event, account_id="work")
+
+        assert item.source == "calendar"
+        assert item.item_id == "evt-1"
+        assert item.timestamp == datetime(2026, 1, 8, 14, 0, tzinfo=timezone.utc)
+
+    def test_queue_item(self):
+        item = item_from_queue_item(
+            {
+                "id": "q-1",
+                "account_id": "work",
+                "status": "pending",
+                "metadata": {
+                    "subject": "Projet",
+                    "from_address": "jane@company.com",
+                    "from_name": "Jane",
+                    "date": "2026-01-05T10:00:00+00:00",
+                },
+                "content": {"preview": "Aperçu"},
+            }
+        )
+
+        assert item.item_id == "queue:q-1"
+        assert item.sender == "Jane <jane@company.com>"
+        assert item.metadata["queue_item_id"] == "q-1"
+        assert item_from_queue_item({"id": "q-2", "metadata": {}}) is None
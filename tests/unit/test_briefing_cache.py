@@ -0,0 +1,207 @@
+"""
+Tests for the briefing cache and pre-computation
+
+Coverage:
+- Morning and pre-meeting entries, expiry, degraded briefings not cached
+- Invalidation by source, generation guard against stale results
+- SOURCE_UPDATED events on the event bus invalidate the cache
+- BriefingService serves from the cache and pre-computes upcoming meetings
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.config_manager import BriefingConfig
+from src.core.events import EventSource, EventType, PerceivedEvent, UrgencyLevel
+from src.core.processing_events import EventBus, ProcessingEvent, ProcessingEventType
+from src.frontin.api.services.briefing_service import BriefingService
+from src.frontin.briefing.cache import BriefingCache
+from src.frontin.briefing.models import BriefingItem, MorningBriefing, PreMeetingBriefing
+
+
+def _event(event_id, minutes_from_now=60, attendee_count=3):
+    now = datetime.now(timezone.utc)
+    return PerceivedEvent(
+        event_id=f"calendar-{event_id}",
+        source=EventSource.CALENDAR,
+        source_id=event_id,
+        occurred_at=now,
+        received_at=now,
+        title=f"Meeting {event_id}",
+        content="",
+        event_type=EventType.INVITATION,
+        urgency=UrgencyLevel.MEDIUM,
+        entities=[],
+        topics=[],
+        keywords=[],
+        from_person="Organizer <org@example.com>",
+        to_people=[],
+        cc_people=[],
+        thread_id=None,
+        references=[],
+        in_reply_to=None,
+        has_attachments=False,
+        attachment_count=0,
+        attachment_types=[],
+        urls=[],
+        metadata={
+            "start": (now + timedelta(minutes=minutes_from_now)).isoformat(),
+            "attendee_count": attendee_count,
+        },
+        perception_confidence=0.9,
+        needs_clarification=False,
+        clarification_questions=[],
+    )
+
+
+def _morning(generated_at=None, events=(), degraded=()):
+    return MorningBriefing(
+        date=date.today(),
+        generated_at=generated_at or datetime.now(timezone.utc),
+        calendar_today=[
+            BriefingItem(event=e, priority_rank=i + 1, time_context="", action_summary=None)
+            for i, e in enumerate(events)
+        ],
+        degraded_sources=list(degraded),
+    )
+
+
+def _pre_meeting(event, degraded=()):
+    return PreMeetingBriefing(
+        event=event,
+        generated_at=datetime.now(timezone.utc),
+        minutes_until_start=0,
+        degraded_sources=list(degraded),
+    )
+
+
+class TestBriefingCache:
+    """Test cache entries and invalidation"""
+
+    def test_morning_entries(self):
+        cache = BriefingCache(max_age=timedelta(minutes=30))
+        briefing = _morning()
+
+        assert cache.put_morning(date.today(), 24, briefing)
+        assert cache.get_morning(date.today(), 24) is briefing
+        assert cache.get_morning(date.today(), 12) is None
+
+        stale = _morning(generated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        cache.put_morning(date.today(), 24, stale)
+        assert cache.get_morning(date.today(), 24) is None
+
+    def test_degraded_briefings_not_cached(self):
+        cache = BriefingCache()
+
+        assert not cache.put_morning(date.today(), 24, _morning(degraded=["teams"]))
+        assert not cache.put_pre_meeting("e1", _pre_meeting(_event("e1"), degraded=["email"]))
+        assert cache.get_stats()["morning"] == 0
+
+    def test_pre_meeting_minutes_refreshed(self):
+        cache = BriefingCache()
+        cache.put_pre_meeting("e1", _pre_meeting(_event("e1", minutes_from_now=45)))
+
+        cached = cache.get_pre_meeting("e1")
+
+        assert 43 <= cached.minutes_until_start <= 45
+
+    def test_calendar_invalidation_is_targeted(self):
+        cache = BriefingCache()
+        cache.put_morning(date.today(), 24, _morning())
+        cache.put_pre_meeting("e1", _pre_meeting(_event("e1")))
+        cache.put_pre_meeting("e2", _pre_meeting(_event("e2")))
+
+        cache.invalidate("calendar", ["e1"])
+
+        assert cache.get_morning(date.today(), 24) is None
+        assert cache.get_pre_meeting("e1") is None
+        assert cache.get_pre_meeting("e2") is not None
+
+        cache.invalidate("email", ["q-1"])
+        assert cache.get_pre_meeting("e2") is None
+
+    def test_generation_guard(self):
+        cache = BriefingCache()
+        generation = cache.generation
+
+        cache.invalidate("teams")
+
+        assert not cache.put_morning(date.today(), 24, _morning(), generation)
+        assert cache.put_morning(date.today(), 24, _morning(), cache.generation)
+
+    def test_source_updated_event_invalidates(self):
+        bus = EventBus()
+        cache = BriefingCache()
+        cache.subscribe(bus)
+        cache.put_morning(date.today(), 24, _morning())
+
+        bus.emit(
+            ProcessingEvent(
+                event_type=ProcessingEventType.SOURCE_UPDATED,
+                metadata={"source": "calendar", "item_ids": ["e9"]},
+            )
+        )
+
+        assert cache.get_morning(date.today(), 24) is None
+
+
+class TestBriefingServicePrecompute:
+    """Test cached reads and pre-computation"""
+
+    @pytest.fixture
+    def config(self):
+        config = MagicMock()
+        config.briefing = BriefingConfig(morning_hours_ahead=24, precompute_meetings=2)
+        return config
+
+    @pytest.mark.asyncio
+    async def test_morning_served_from_cache(self, config):
+        service = BriefingService(config=config, cache=BriefingCache())
+        generate = AsyncMock(return_value=_morning())
+
+        with patch(
+            "src.frontin.api.services.briefing_service.BriefingGenerator"
+        ) as generator_cls:
+            generator_cls.return_value.generate_morning_briefing = generate
+            first = await service.generate_morning_briefing(hours_ahead=24)
+            second = await service.generate_morning_briefing(hours_ahead=24)
+
+        assert first is second
+        generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_precompute_next_meetings(self, config):
+        cache = BriefingCache()
+        service = BriefingService(config=config, cache=cache)
+        events = [
+            _event("later", minutes_from_now=240),
+            _event("solo", minutes_from_now=30, attendee_count=1),
+            _event("next", minutes_from_now=60),
+            _event("past", minutes_from_now=-30),
+            _event("third", minutes_from_now=480),
+        ]
+
+        with patch(
+            "src.frontin.api.services.briefing_service.BriefingGenerator"
+        ) as generator_cls:
+            generator = generator_cls.return_value
+            generator.generate_morning_briefing = AsyncMock(return_value=_morning(events=events))
+            generator.generate_pre_meeting_briefing = AsyncMock(side_effect=_pre_meeting)
+
+            computed = await service.precompute()
+            assert computed == {"morning": 1, "pre_meeting": 2}
+            assert cache.get_pre_meeting("next") is not None
+            assert cache.get_pre_meeting("later") is not None
+            assert cache.get_pre_meeting("third") is None
+
+            # Nothing missing: nothing generated
+            assert await service.precompute() == {"morning": 0, "pre_meeting": 0}
+
+            # A calendar change only regenerates what it touched
+            cache.invalidate("calendar", ["next"])
+            assert await service.precompute() == {"morning": 1, "pre_meeting": 1}
+
+        briefing = await service.generate_pre_meeting_briefing("later")
+        assert briefing.event.source_id == "later"
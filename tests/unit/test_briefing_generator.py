@@ -4,14 +4,17 @@ Tests for Briefing Generator
 Tests the briefing generation system.
 """
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.core.config_manager import BriefingConfig
 from src.core.events import EventSource, EventType, PerceivedEvent, UrgencyLevel
-from src.frontin.briefing.generator import BriefingGenerator
+from src.frontin.briefing.generator import BriefingGenerator, DefaultBriefingDataProvider
 
 # Mock Data Provider
 
@@ -538,6 +541,150 @@ class TestPreMeetingBriefingGeneration:
         assert john.is_organizer is True
 
 
+@dataclass
+class SlowBriefingDataProvider(MockBriefingDataProvider):
+    """Mock provider with per-source delays and failures"""
+
+    delays: dict[str, float] = field(default_factory=dict)
+    failing: set[str] = field(default_factory=set)
+
+    async def _wait(self, source: str) -> None:
+        await asyncio.sleep(self.delays.get(source, 0))
+        if source in self.failing:
+            raise ConnectionError(f"{source} unreachable")
+
+    async def get_emails_since(self, since: datetime, limit: int = 50) -> list[PerceivedEvent]:
+        await self._wait("email")
+        return await super().get_emails_since(since, limit)
+
+    async def get_calendar_events(
+        self, hours_ahead: int, include_in_progress: bool = True
+    ) -> list[PerceivedEvent]:
+        await self._wait("calendar")
+        return await super().get_calendar_events(hours_ahead, include_in_progress)
+
+    async def get_teams_messages(self, since: datetime, limit: int = 50) -> list[PerceivedEvent]:
+        await self._wait("teams")
+        return await super().get_teams_messages(since, limit)
+
+    async def get_emails_with_people(
+        self, emails: list[str], days: int = 7
+    ) -> list[PerceivedEvent]:
+        await self._wait("email")
+        return await super().get_emails_with_people(emails, days)
+
+    async def get_teams_with_people(
+        self, emails: list[str], days: int = 7
+    ) -> list[PerceivedEvent]:
+        await self._wait("teams")
+        return await super().get_teams_with_people(emails, days)
+
+
+class TestSourceFanOut:
+    """Tests for concurrent, deadline-bounded source fetches"""
+
+    @pytest.fixture(autouse=True)
+    def no_local_stores(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Skip orphan questions and retouche lookups (local stores)"""
+        for loader in (
+            "_load_orphan_questions",
+            "_load_retouche_alerts",
+            "_load_pending_retouche_actions",
+        ):
+            monkeypatch.setattr(BriefingGenerator, loader, lambda self: [])
+
+    @pytest.mark.asyncio
+    async def test_sources_fetched_concurrently(self, briefing_config: BriefingConfig) -> None:
+        """Test that sources are fetched in parallel"""
+        provider = SlowBriefingDataProvider(
+            delays={"calendar": 0.2, "email": 0.2, "teams": 0.2},
+            email_events=[create_event("e1", EventSource.EMAIL, "Email")],
+        )
+        generator = BriefingGenerator(config=briefing_config, data_provider=provider)
+
+        start = time.monotonic()
+        briefing = await generator.generate_morning_briefing()
+
+        assert time.monotonic() - start < 0.5
+        assert briefing.total_items == 1
+        assert briefing.degraded_sources == []
+        assert not briefing.is_degraded
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_sources_degrade(self, briefing_config: BriefingConfig) -> None:
+        """Test that a late or failing source is left out, not waited for"""
+        config = briefing_config.model_copy(update={"source_timeout_seconds": 0.1})
+        provider = SlowBriefingDataProvider(
+            delays={"teams": 5.0},
+            failing={"email"},
+            calendar_events=[
+                create_event("cal-1", EventSource.CALENDAR, "Meeting", minutes_from_now=300)
+            ],
+        )
+        generator = BriefingGenerator(config=config, data_provider=provider)
+
+        start = time.monotonic()
+        briefing = await generator.generate_morning_briefing()
+
+        assert time.monotonic() - start < 1.0
+        assert sorted(briefing.degraded_sources) == ["email", "teams"]
+        assert len(briefing.calendar_today) == 1
+        assert briefing.to_dict()["degraded_sources"] == briefing.degraded_sources
+
+    @pytest.mark.asyncio
+    async def test_pre_meeting_partial_context(self, briefing_config: BriefingConfig) -> None:
+        """Test that pre-meeting context keeps the sources that answered"""
+        config = briefing_config.model_copy(update={"source_timeout_seconds": 0.1})
+        provider = SlowBriefingDataProvider(
+            delays={"teams": 5.0},
+            emails_with_people=[create_event("e1", EventSource.EMAIL, "Agenda")],
+        )
+        event = create_event(
+            "cal-1",
+            EventSource.CALENDAR,
+            "Review",
+            minutes_from_now=30,
+            metadata={"attendees": [{"name": "Jane", "email": "jane@example.com"}]},
+        )
+        generator = BriefingGenerator(config=config, data_provider=provider)
+
+        briefing = await generator.generate_pre_meeting_briefing(event)
+
+        assert briefing.degraded_sources == ["teams"]
+        assert len(briefing.recent_emails) == 1
+
+    @pytest.mark.asyncio
+    async def test_default_provider_calendar_failure_degrades(
+        self, briefing_config: BriefingConfig
+    ) -> None:
+        """Test that a calendar error in the default provider is reported as degraded"""
+        calendar = MagicMock()
+        calendar.get_briefing = AsyncMock(side_effect=ConnectionError("Graph unreachable"))
+        provider = DefaultBriefingDataProvider(_calendar_processor=calendar)
+        generator = BriefingGenerator(config=briefing_config, data_provider=provider)
+
+        briefing = await generator.generate_morning_briefing()
+
+        assert briefing.degraded_sources == ["calendar"]
+
+    @pytest.mark.asyncio
+    async def test_default_provider_calendar_not_configured(
+        self, briefing_config: BriefingConfig
+    ) -> None:
+        """Test that a disabled calendar yields no events and is not degraded"""
+        app_config = MagicMock()
+        app_config.calendar.enabled = False
+        provider = DefaultBriefingDataProvider()
+        generator = BriefingGenerator(config=briefing_config, data_provider=provider)
+
+        with patch("src.frontin.briefing.generator.get_config", return_value=app_config):
+            briefing = await generator.generate_morning_briefing()
+
+        assert briefing.degraded_sources == []
+        assert briefing.calendar_today == []
+        assert provider._calendar_processor is None
+
+
 class TestTimeContextFormatting:
     """Tests for time context formatting"""
 
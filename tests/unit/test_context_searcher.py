@@ -398,6 +398,27 @@ class TestContextSearcher:
         assert context.notes[0].title == "Marc Dupont"
         assert "Marc" in context.entity_profiles
 
+    @pytest.mark.asyncio
+    async def test_note_summary_uses_matching_passage(self):
+        """Note summary is the passage matching the entity, not the note opening"""
+        mock_nm = MagicMock()
+        mock_note = MagicMock()
+        mock_note.note_id = "note-123"
+        mock_note.title = "Marc Dupont"
+        mock_note.type = "note"
+        mock_note.content = "Long introduction..."
+        mock_note.modified_at = None
+        mock_note.tags = []
+        mock_note.metadata = {}
+        mock_nm.search_notes.return_value = [(mock_note, 0.9)]
+        mock_nm.get_note_snippet.return_value = "Sa fille Léa joue du violoncelle."
+
+        searcher = ContextSearcher(note_manager=mock_nm)
+        context = await searcher.search_for_entities(["Marc"])
+
+        assert context.notes[0].summary == "Sa fille Léa joue du violoncelle."
+        mock_nm.get_note_snippet.assert_called_once_with(mock_note, "Marc")
+
     @pytest.mark.asyncio
     async def test_search_with_cross_source_calendar(self):
         """Search calendar via cross-source engine"""
@@ -0,0 +1,110 @@
+"""
+Unit Tests for PersistentEmbeddingCache
+
+Tests the SQLite-backed embedding cache: round-trips, key separation,
+LRU eviction, cross-instance sharing and statistics.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.passepartout.embedding_cache import PersistentEmbeddingCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "embeddings.db"
+
+
+class TestPersistentEmbeddingCache:
+    """Test PersistentEmbeddingCache"""
+
+    def test_put_and_get_round_trip(self, db_path):
+        """Test stored vectors come back unchanged"""
+        cache = PersistentEmbeddingCache(db_path)
+        vector = np.random.rand(384).astype(np.float32)
+
+        cache.put_many("model", True, [("hash1", vector)])
+        found = cache.get_many("model", True, ["hash1", "hash2"])
+
+        assert list(found) == ["hash1"]
+        np.testing.assert_array_equal(found["hash1"], vector)
+        assert found["hash1"].flags.writeable
+
+    def test_keys_separate_model_and_normalize(self, db_path):
+        """Test the same text hash is cached per model and normalization"""
+        cache = PersistentEmbeddingCache(db_path)
+        cache.put_many("model-a", True, [("hash1", np.ones(4, dtype=np.float32))])
+
+        assert cache.get_many("model-a", False, ["hash1"]) == {}
+        assert cache.get_many("model-b", True, ["hash1"]) == {}
+
+    def test_shared_across_instances(self, db_path):
+        """Test a second instance (e.g. another process) sees stored vectors"""
+        writer = PersistentEmbeddingCache(db_path)
+        writer.put_many("model", True, [("hash1", np.ones(4, dtype=np.float32))])
+
+        reader = PersistentEmbeddingCache(db_path)
+
+        assert "hash1" in reader.get_many("model", True, ["hash1"])
+        assert reader.get_stats()["size"] == 1
+
+    def test_eviction_bounds_size(self, db_path):
+        """Test least recently used entries are evicted past max_entries"""
+        cache = PersistentEmbeddingCache(db_path, max_entries=10)
+        for i in range(11):
+            cache.put_many("model", True, [(f"hash{i}", np.full(4, i, dtype=np.float32))])
+
+        stats = cache.get_stats()
+        assert stats["size"] <= 10
+        assert stats["evictions"] >= 1
+        assert "hash10" in cache.get_many("model", True, ["hash10"])
+
+    def test_large_lookup_is_chunked(self, db_path):
+        """Test lookups beyond SQLite's parameter limit"""
+        cache = PersistentEmbeddingCache(db_path)
+        items = [(f"hash{i}", np.full(4, i, dtype=np.float32)) for i in range(1200)]
+        cache.put_many("model", True, items)
+
+        found = cache.get_many("model", True, [h for h, _ in items])
+
+        assert len(found) == 1200
+
+    def test_stats_track_hits_and_misses(self, db_path):
+        """Test hit/miss statistics"""
+        cache = PersistentEmbeddingCache(db_path)
+        cache.put_many("model", True, [("hash1", np.ones(4, dtype=np.float32))])
+
+        cache.get_many("model", True, ["hash1", "missing"])
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["writes"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_concurrent_writers(self, db_path):
+        """Test concurrent threads can write and read without errors"""
+        cache = PersistentEmbeddingCache(db_path)
+
+        def worker(n):
+            for i in range(20):
+                key = f"t{n}-{i}"
+                cache.put_many("model", True, [(key, np.full(4, i, dtype=np.float32))])
+                assert key in cache.get_many("model", True, [key])
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cache.get_stats()["errors"] == 0
+        assert cache.get_stats()["size"] == 80
+
+    def test_invalid_max_entries_raises(self, db_path):
+        """Test error on non-positive capacity"""
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            PersistentEmbeddingCache(db_path, max_entries=0)
@@ -298,6 +298,61 @@ class TestCacheManagement:
         assert stats["hit_rate"] == pytest.approx(1/3)
 
 
+class TestPersistentCache:
+    """Test the on-disk second-level cache"""
+
+    def _mock_model(self, mock_st):
+        mock_model = MagicMock()
+        mock_model.get_sentence_embedding_dimension.return_value = 384
+        mock_model.device = "cpu"
+        mock_model.encode.side_effect = lambda texts, **kwargs: (
+            np.random.rand(len(texts), 384).astype(np.float32)
+            if isinstance(texts, list)
+            else np.random.rand(384).astype(np.float32)
+        )
+        mock_st.return_value = mock_model
+        return mock_model
+
+    @patch('src.passepartout.embeddings.SentenceTransformer')
+    def test_embeddings_survive_restart(self, mock_st, tmp_path):
+        """Test a new generator reuses vectors encoded by a previous one"""
+        mock_model = self._mock_model(mock_st)
+        db_path = tmp_path / "embeddings.db"
+
+        first = EmbeddingGenerator(persistent_cache_path=db_path)
+        vector = first.embed_text("Hello world")
+        batch = first.embed_batch(["Text 1", "Text 2"])
+        assert mock_model.encode.call_count == 2
+
+        second = EmbeddingGenerator(persistent_cache_path=db_path)
+        np.testing.assert_array_equal(second.embed_text("Hello world"), vector)
+        np.testing.assert_array_equal(second.embed_batch(["Text 2", "Text 1"]), batch[::-1])
+
+        assert mock_model.encode.call_count == 2
+        stats = second.get_cache_stats()
+        assert stats["persistent"]["hits"] == 3
+
+    @patch('src.passepartout.embeddings.SentenceTransformer')
+    def test_normalize_flag_is_part_of_key(self, mock_st, tmp_path):
+        """Test raw and normalized embeddings are cached separately"""
+        mock_model = self._mock_model(mock_st)
+
+        embedder = EmbeddingGenerator(persistent_cache_path=tmp_path / "embeddings.db")
+        embedder.embed_text("Hello world", normalize=True)
+        embedder.embed_text("Hello world", normalize=False)
+
+        assert mock_model.encode.call_count == 2
+
+    @patch('src.passepartout.embeddings.SentenceTransformer')
+    def test_memory_only_by_default(self, mock_st):
+        """Test no persistent stats without a cache path"""
+        self._mock_model(mock_st)
+
+        embedder = EmbeddingGenerator()
+
+        assert "persistent" not in embedder.get_cache_stats()
+
+
 class TestUtilityMethods:
     """Test utility methods"""
 
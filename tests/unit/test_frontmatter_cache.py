@@ -0,0 +1,159 @@
+"""
+Tests for the frontmatter parse cache
+
+Coverage:
+- load_yaml matches yaml.safe_load
+- Hits keyed by (path, mtime_ns, size), JSON round-trip of dates
+- Persistence across instances, pruning
+- NoteManager and NoteJanitor reuse parses of unchanged files
+"""
+
+import os
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+import yaml
+
+from src.passepartout import frontmatter_cache
+from src.passepartout.frontmatter_cache import (
+    FRONTMATTER_CACHE_FILENAME,
+    FrontmatterCache,
+    load_yaml,
+)
+from src.passepartout.janitor import NoteJanitor
+from src.passepartout.note_manager import NoteManager
+
+FRONTMATTER = """title: Réunion Alpha
+created_at: 2025-03-04T10:30:00+01:00
+day: 2025-03-04
+tags: [projet, alpha]
+metadata:
+  pinned: true
+  score: 4.5
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = FrontmatterCache(tmp_path / "frontmatter.db")
+    yield cache
+    cache.close()
+
+
+class TestFrontmatterCache:
+    """Test FrontmatterCache"""
+
+    def test_load_yaml_matches_safe_load(self):
+        assert load_yaml(FRONTMATTER) == yaml.safe_load(FRONTMATTER)
+
+    def test_hit_round_trips_parsed_values(self, cache):
+        parsed = cache.parse("a.md", 1, 10, FRONTMATTER)
+
+        with patch.object(frontmatter_cache, "load_yaml", side_effect=AssertionError):
+            cached = cache.parse("a.md", 1, 10, FRONTMATTER)
+
+        assert cached == parsed == yaml.safe_load(FRONTMATTER)
+        assert isinstance(cached["created_at"], datetime)
+        assert isinstance(cached["day"], date) and not isinstance(cached["day"], datetime)
+        # Callers get their own copy to mutate
+        cached["metadata"]["path"] = "x"
+        assert "path" not in cache.get("a.md", 1, 10)["metadata"]
+
+    def test_changed_stat_misses(self, cache):
+        cache.parse("a.md", 1, 10, "title: Old")
+
+        assert cache.get("a.md", 2, 10) is None
+        assert cache.get("a.md", 1, 11) is None
+        assert cache.parse("a.md", 2, 10, "title: New") == {"title": "New"}
+
+    def test_unencodable_and_non_mapping_not_cached(self, cache):
+        assert cache.parse("a.md", 1, 1, "1: one") == {1: "one"}
+        assert cache.parse("b.md", 1, 1, "just text") == "just text"
+        assert cache.parse("c.md", 1, 1, "when: {$date: x}") == {"when": {"$date": "x"}}
+        assert len(cache) == 0
+
+    def test_invalid_yaml_raises(self, cache):
+        with pytest.raises(yaml.YAMLError):
+            cache.parse("a.md", 1, 1, "title: Corde : 22,2")
+
+    def test_persists_and_prunes(self, cache, tmp_path):
+        cache.parse("a.md", 1, 10, "title: A")
+        cache.parse("b.md", 1, 10, "title: B")
+        cache.flush()
+
+        reopened = FrontmatterCache(tmp_path / "frontmatter.db")
+        assert reopened.get("a.md", 1, 10) == {"title": "A"}
+        assert reopened.retain_only({"a.md"}) == 1
+        reopened.discard("a.md")
+        reopened.close()
+
+        assert len(FrontmatterCache(tmp_path / "frontmatter.db")) == 0
+
+
+class TestFrontmatterCacheIntegration:
+    """Test NoteManager and NoteJanitor through the shared cache"""
+
+    def _manager(self, notes_dir):
+        return NoteManager(
+            notes_dir=notes_dir,
+            vector_store=Mock(),
+            embedder=Mock(),
+            auto_index=False,
+            git_enabled=False,
+        )
+
+    def _warm(self, notes_dir):
+        """Read every note from disk once (a fresh manager has no note cache)"""
+        self._manager(notes_dir).get_all_notes()
+
+    def test_unchanged_notes_are_not_reparsed(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        note_id = self._manager(notes_dir).create_note("Alpha", "Budget", tags=["projet"])
+        self._warm(notes_dir)
+
+        restarted = self._manager(notes_dir)
+        with patch.object(frontmatter_cache, "load_yaml", side_effect=AssertionError):
+            notes = restarted.get_all_notes()
+            restarted._rebuild_metadata_index()
+
+        assert [(n.note_id, n.title, n.tags) for n in notes] == [(note_id, "Alpha", ["projet"])]
+        assert notes[0].created_at.tzinfo is not None
+
+    def test_edited_note_is_reparsed(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        note_id = self._manager(notes_dir).create_note("Alpha", "Budget")
+        self._warm(notes_dir)
+
+        # Same size, only the modification time tells the versions apart
+        path = notes_dir / f"{note_id}.md"
+        path.write_text(path.read_text().replace("title: Alpha", "title: Gamma"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert self._manager(notes_dir).get_note(note_id).title == "Gamma"
+
+    def test_janitor_skips_files_parsed_at_current_stat(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        self._manager(notes_dir).create_note("Alpha", "Budget")
+        self._warm(notes_dir)
+        (notes_dir / "broken.md").write_text("Pas de frontmatter\n")
+
+        janitor = NoteJanitor(notes_dir)
+        with patch.object(frontmatter_cache, "load_yaml", side_effect=AssertionError):
+            stats = janitor.clean_directory(dry_run=True)
+
+        assert stats == {"scanned": 2, "issues_found": 1, "repaired": 0, "errors": 0}
+        assert (notes_dir / FRONTMATTER_CACHE_FILENAME).exists()
+
+    def test_created_at_survives_cache(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        (notes_dir / "dated.md").write_text(
+            "---\ntitle: Daté\ncreated_at: 2025-01-02T03:04:05+00:00\n---\n\nCorps\n"
+        )
+        self._warm(notes_dir)
+
+        note = self._manager(notes_dir).get_note("dated")
+
+        assert note.created_at == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
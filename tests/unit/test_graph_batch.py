@@ -0,0 +1,196 @@
+"""
+Tests for Graph JSON batching against a local stub Graph server
+
+Coverage:
+- Requests packed into $batch calls of 20, sent concurrently
+- Per-request Retry-After honoured inside a batch
+- Per-request errors reported without failing the batch
+- TeamsClient.get_recent_messages fetches all chats through batches
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from src.integrations.microsoft import graph_client as graph_client_module
+from src.integrations.microsoft.graph_client import GraphClient, batch_url
+from src.integrations.microsoft.teams_client import TeamsClient
+
+# Stub latency, unaffected by the Retry-After sleep patch
+_stub_sleep = asyncio.sleep
+
+
+class StubGraph:
+    """Minimal Graph server: /me/chats and /$batch of chat message requests"""
+
+    def __init__(self, chat_count=0, latency=0.01):
+        self.chat_ids = [f"19:chat-{i}@thread.v2" for i in range(chat_count)]
+        self.latency = latency
+        self.throttle = {}  # Chat ID -> number of 429 answers before success
+        self.failing = set()
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.single_requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1.0")
+        if path == "/$batch":
+            return await self._batch(json.loads(request.content))
+        self.single_requests += 1
+        if path == "/me/chats":
+            return httpx.Response(
+                200, json={"value": [{"id": c, "chatType": "group"} for c in self.chat_ids]}
+            )
+        return httpx.Response(200, json=self._messages(path, dict(request.url.params)))
+
+    async def _batch(self, payload):
+        self.batch_sizes.append(len(payload["requests"]))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await _stub_sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        responses = []
+        for sub in payload["requests"]:
+            url = urlsplit(sub["url"])
+            chat_id = url.path.split("/")[3]
+            if self.throttle.get(chat_id):
+                self.throttle[chat_id] -= 1
+                responses.append(
+                    {"id": sub["id"], "status": 429, "headers": {"Retry-After": "2"}, "body": {}}
+                )
+            elif chat_id in self.failing:
+                responses.append(
+                    {
+                        "id": sub["id"],
+                        "status": 403,
+                        "body": {"error": {"code": "Forbidden", "message": "No access"}},
+                    }
+                )
+            else:
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                responses.append(
+                    {"id": sub["id"], "status": 200, "body": self._messages(url.path, params)}
+                )
+        return httpx.Response(200, json={"responses": responses})
+
+    @staticmethod
+    def _messages(path, params):
+        chat_id = path.split("/")[3]
+        top = int(params.get("$top", 50))
+        return {
+            "value": [
+                {
+                    "id": f"{chat_id}-m{i}",
+                    "createdDateTime": f"2026-01-05T10:{i:02d}:00Z",
+                    "from": {"user": {"id": "u1", "displayName": "Alice"}},
+                    "body": {"content": f"Message {i}"},
+                }
+                for i in range(min(top, 2))
+            ]
+        }
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record Retry-After waits instead of sleeping"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        await _stub_sleep(0)
+
+    monkeypatch.setattr(graph_client_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _graph(stub, **kwargs):
+    authenticator = MagicMock()
+    authenticator.get_token.return_value = "token"
+    graph = GraphClient(authenticator, **kwargs)
+    graph._client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+    return graph
+
+
+def _requests(stub):
+    return {c: (f"/me/chats/{c}/messages", {"$top": "10"}) for c in stub.chat_ids}
+
+
+class TestGetBatch:
+    """Test GraphClient.get_batch"""
+
+    def test_batch_url(self):
+        assert batch_url("/me/chats") == "/me/chats"
+        assert batch_url(
+            "/me/chats/1/messages", {"$top": "5", "$filter": "createdDateTime gt 2026-01-05"}
+        ) == "/me/chats/1/messages?$top=5&$filter=createdDateTime%20gt%202026-01-05"
+
+    @pytest.mark.asyncio
+    async def test_requests_packed_and_concurrent(self):
+        stub = StubGraph(chat_count=150)
+        graph = _graph(stub, max_concurrent_batches=4)
+
+        results = await graph.get_batch(_requests(stub))
+
+        assert set(results) == set(stub.chat_ids)
+        assert all(r.ok for r in results.values())
+        first = results[stub.chat_ids[42]].body["value"][0]
+        assert first["id"] == f"{stub.chat_ids[42]}-m0"
+        assert stub.batch_sizes == [20] * 7 + [10]
+        assert stub.max_in_flight == 4
+        assert stub.single_requests == 0
+        await graph.close()
+
+    @pytest.mark.asyncio
+    async def test_throttled_requests_retried_after_retry_after(self, sleeps):
+        stub = StubGraph(chat_count=3)
+        stub.throttle = {stub.chat_ids[0]: 1, stub.chat_ids[2]: 2}
+        graph = _graph(stub)
+
+        results = await graph.get_batch(_requests(stub))
+
+        assert all(r.ok for r in results.values())
+        assert stub.batch_sizes == [3, 2, 1]  # Only throttled requests are sent again
+        assert sleeps == [2.0, 2.0]
+        await graph.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_reported_per_request(self, sleeps):
+        stub = StubGraph(chat_count=2)
+        stub.failing = {stub.chat_ids[0]}
+        stub.throttle = {stub.chat_ids[1]: 5}
+        graph = _graph(stub, max_retries=2)
+
+        results = await graph.get_batch(_requests(stub))
+
+        forbidden = results[stub.chat_ids[0]]
+        assert forbidden.error.status_code == 403
+        assert forbidden.error.error_code == "Forbidden"
+        assert results[stub.chat_ids[1]].error.status_code == 429  # Retries exhausted
+        await graph.close()
+
+
+class TestTeamsBatchedFetch:
+    """Test TeamsClient.get_recent_messages over batches"""
+
+    @pytest.mark.asyncio
+    async def test_recent_messages_of_all_chats(self):
+        stub = StubGraph(chat_count=150, latency=0.02)
+        stub.failing = {stub.chat_ids[7]}
+        graph = _graph(stub)
+        client = TeamsClient(graph)
+
+        messages = await client.get_recent_messages(limit_per_chat=5)
+
+        assert len(messages) == 149 * 2
+        assert messages[0].chat is not None
+        assert stub.single_requests == 1  # /me/chats; 150 chats in 8 batched calls
+        assert len(stub.batch_sizes) == 8
+        await graph.close()
@@ -0,0 +1,387 @@
+"""
+Tests for Microsoft Graph delta sync and the local mirror
+
+Coverage:
+- GraphSyncStore: sync state, merges, tombstones, retention, range queries
+- GraphClient: delta links persisted across instances, expired link resync
+- CalendarClient: calendarView delta sync and mirror reads
+- TeamsClient: per-chat watermarks and mirror reads
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.integrations.microsoft.calendar_client import CalendarClient
+from src.integrations.microsoft.graph_client import BatchResult, GraphAPIError, GraphClient
+from src.integrations.microsoft.teams_client import MIRROR_MESSAGES, TeamsClient, message_times
+from src.integrations.storage.graph_sync_store import GraphSyncStore
+
+ACCOUNT = "tenant:client"
+
+
+def _event(event_id, start, hours=1, subject="Réunion", **extra):
+    end = start + timedelta(hours=hours)
+    return {
+        "id": event_id,
+        "subject": subject,
+        "start": {"dateTime": start.strftime("%Y-%m-%dT%H:%M:%S"), "timeZone": "UTC"},
+        "end": {"dateTime": end.strftime("%Y-%m-%dT%H:%M:%S"), "timeZone": "UTC"},
+        **extra,
+    }
+
+
+def _times(data):
+    start = datetime.fromisoformat(data["start"]["dateTime"]).replace(tzinfo=timezone.utc)
+    end = datetime.fromisoformat(data["end"]["dateTime"]).replace(tzinfo=timezone.utc)
+    return start, end
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = GraphSyncStore(tmp_path / "graph_sync.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def now():
+    return datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _graph(store, responses):
+    """GraphClient whose HTTP layer returns canned responses by URL"""
+    authenticator = MagicMock()
+    authenticator.config.tenant_id = "tenant"
+    authenticator.config.client_id = "client"
+    graph = GraphClient(authenticator, sync_store=store)
+    graph._request = AsyncMock(side_effect=lambda method, endpoint, **kw: responses[endpoint])
+    graph._request_url = AsyncMock(side_effect=lambda method, url, **kw: responses[url])
+    return graph
+
+
+class TestGraphSyncStore:
+    """Test sync state and mirror"""
+
+    def test_state(self, store):
+        assert store.get_state(ACCOUNT, "/me/calendarView") is None
+
+        store.set_state(ACCOUNT, "/me/calendarView?a", "link-1")
+        store.set_state(ACCOUNT, "/me/calendarView?a", "link-2")
+        store.set_state(ACCOUNT, "/me/calendarView?b", "link-3")
+        store.set_state("other", "/me/calendarView?a", "link-4")
+
+        assert store.get_state(ACCOUNT, "/me/calendarView?a") == "link-2"
+        assert store.clear_state(ACCOUNT, "/me/calendarView?", prefix=True) == 2
+        assert store.get_state("other", "/me/calendarView?a") == "link-4"
+
+    def test_merge_and_tombstones(self, store, now):
+        changes = store.apply_changes(ACCOUNT, "calendarView", [_event("e1", now)], _times)
+        assert changes.upserted == ["e1"]
+
+        # Partial update merged over the stored item; identical update is a no-op
+        store.apply_changes(ACCOUNT, "calendarView", [{"id": "e1", "subject": "Point"}], _times)
+        assert store.get_item(ACCOUNT, "calendarView", "e1")["start"] == _event("e1", now)["start"]
+        assert store.get_item(ACCOUNT, "calendarView", "e1")["subject"] == "Point"
+        changes = store.apply_changes(ACCOUNT, "calendarView", [{"id": "e1", "subject": "Point"}])
+        assert changes.total == 0
+
+        changes = store.apply_changes(
+            ACCOUNT, "calendarView", [{"id": "e1", "@removed": {"reason": "deleted"}}]
+        )
+        assert changes.deleted == ["e1"]
+        assert store.get_item(ACCOUNT, "calendarView", "e1") is None
+        assert store.get_stats()["resources"]["calendarView"]["tombstones"] == 1
+
+        # Re-created after deletion: not merged with the tombstone
+        store.apply_changes(ACCOUNT, "calendarView", [{"id": "e1", "subject": "Neuf"}])
+        assert store.get_item(ACCOUNT, "calendarView", "e1") == {"id": "e1", "subject": "Neuf"}
+
+    def test_removed_from_view_is_dropped(self, store, now):
+        store.apply_changes(ACCOUNT, "calendarView", [_event("e1", now), _event("e2", now)], _times)
+
+        changes = store.apply_changes(
+            ACCOUNT, "calendarView", [{"id": "e1", "@removed": {"reason": "changed"}}]
+        )
+        assert changes.dropped == ["e1"] and changes.deleted == []
+
+        changes = store.apply_changes(ACCOUNT, "calendarView", [], full=True)
+        assert changes.dropped == ["e2"]
+        assert store.list_items(ACCOUNT, "calendarView") == []
+
+    def test_purge_tombstones(self, store, now):
+        for account in (ACCOUNT, "other"):
+            store.apply_changes(account, "calendarView", [_event("e1", now)], _times)
+            store.apply_changes(account, "calendarView", [{"id": "e1", "@removed": {}}])
+
+        assert store.purge_tombstones(ACCOUNT, "calendarView") == 0  # Within retention
+        assert store.purge_tombstones(ACCOUNT, "calendarView", older_than_days=-1) == 1
+        assert store.get_stats()["resources"]["calendarView"]["tombstones"] == 1
+
+    def test_trim_container(self, store):
+        for chat_id in ("c1", "c2"):
+            store.apply_changes(
+                ACCOUNT,
+                MIRROR_MESSAGES,
+                [{"id": f"m{i}", "createdDateTime": f"2026-01-0{i}T10:00:00Z"} for i in (1, 2, 3)],
+                time_key=message_times,
+                container_id=chat_id,
+            )
+
+        assert store.trim_container(ACCOUNT, MIRROR_MESSAGES, "c1", keep=2) == 1
+        kept = store.list_items(ACCOUNT, MIRROR_MESSAGES, container_id="c1")
+        assert [m["id"] for m in kept] == ["m2", "m3"]
+        assert len(store.list_items(ACCOUNT, MIRROR_MESSAGES, container_id="c2")) == 3
+
+    def test_list_items_overlap(self, store, now):
+        store.apply_changes(
+            ACCOUNT,
+            "calendarView",
+            [
+                _event("early", now - timedelta(hours=3)),
+                _event("running", now - timedelta(hours=1), hours=2),
+                _event("later", now + timedelta(hours=5)),
+            ],
+            _times,
+        )
+
+        items = store.list_items(ACCOUNT, "calendarView", since=now, until=now + timedelta(hours=6))
+
+        assert [i["id"] for i in items] == ["running", "later"]
+        assert store.get_stats()["resources"]["calendarView"] == {"items": 3, "tombstones": 0}
+
+
+class TestGraphClientDelta:
+    """Test delta link persistence"""
+
+    @pytest.mark.asyncio
+    async def test_delta_link_survives_restart(self, store):
+        responses = {
+            "/me/calendarView/delta": {
+                "value": [{"id": "e1"}],
+                "@odata.nextLink": "next-1",
+            },
+            "next-1": {"value": [{"id": "e2"}], "@odata.deltaLink": "delta-1"},
+            "delta-1": {"value": [{"id": "e3"}], "@odata.deltaLink": "delta-2"},
+        }
+        graph = _graph(store, responses)
+
+        first = await graph.get_delta_changes("/me/calendarView", state_key="cal")
+        assert [i["id"] for i in first.items] == ["e1", "e2"]
+        assert first.full_sync
+
+        restarted = _graph(store, responses)
+        second = await restarted.get_delta_changes("/me/calendarView", state_key="cal")
+
+        assert [i["id"] for i in second.items] == ["e3"]
+        assert not second.full_sync
+        assert store.get_state(ACCOUNT, "cal") == "delta-2"
+        restarted._request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_delta_link_resyncs(self, store):
+        store.set_state(ACCOUNT, "/me/calendarView", "expired")
+        graph = _graph(
+            store,
+            {
+                "/me/calendarView/delta": {
+                    "value": [{"id": "e1"}],
+                    "@odata.deltaLink": "fresh",
+                },
+            },
+        )
+        graph._request_url.side_effect = GraphAPIError(
+            "Gone", status_code=410, error_code="syncStateNotFound"
+        )
+
+        items, delta_link = await graph.get_delta("/me/calendarView")
+
+        assert [i["id"] for i in items] == ["e1"]
+        assert delta_link == "fresh"
+        assert store.get_state(ACCOUNT, "/me/calendarView") == "fresh"
+
+
+class TestCalendarMirror:
+    """Test CalendarClient mirror reads"""
+
+    @pytest.fixture
+    def graph(self):
+        graph = MagicMock()
+        graph.account_id = ACCOUNT
+        graph.get = AsyncMock()
+        graph.get_all_pages = AsyncMock()
+        graph.delete = AsyncMock(return_value={})
+        return graph
+
+    @pytest.mark.asyncio
+    async def test_sync_and_local_reads(self, store, graph, now):
+        from src.integrations.microsoft.graph_client import DeltaResult
+
+        graph.get_delta_changes = AsyncMock(
+            return_value=DeltaResult(
+                items=[
+                    _event("e1", now + timedelta(hours=1)),
+                    _event("e2", now + timedelta(hours=3), isCancelled=True),
+                ],
+                delta_link="delta-1",
+                full_sync=True,
+            )
+        )
+        client = CalendarClient(graph, sync_store=store)
+
+        events = await client.get_events(days_ahead=1)
+        assert [e.event_id for e in events] == ["e1"]
+
+        upcoming = await client.get_upcoming_events(hours_ahead=6)
+        assert [e.event_id for e in upcoming] == ["e1", "e2"]
+        assert graph.get_delta_changes.await_count == 1  # Second read within the interval
+        graph.get_all_pages.assert_not_called()
+
+        assert (await client.get_event("e2")).subject == "Réunion"
+        graph.get.assert_not_called()
+
+        await client.delete_event("e1")
+        assert await client.get_events(days_ahead=1) == []
+
+    @pytest.mark.asyncio
+    async def test_deleted_event_reported(self, store, graph, now):
+        from src.integrations.microsoft.graph_client import DeltaResult
+
+        client = CalendarClient(graph, sync_store=store)
+        graph.get_delta_changes = AsyncMock(
+            return_value=DeltaResult([_event("e1", now)], "delta-1", full_sync=True)
+        )
+        await client.sync()
+        graph.get_delta_changes.return_value = DeltaResult(
+            [{"id": "e1", "@removed": {"reason": "deleted"}}], "delta-2", full_sync=False
+        )
+
+        changes = await client.sync(force=True)
+
+        assert changes.deleted == ["e1"]
+
+    @pytest.mark.asyncio
+    async def test_naive_range_and_limit(self, store, graph, now):
+        from src.integrations.microsoft.graph_client import DeltaResult
+
+        graph.get_delta_changes = AsyncMock(
+            return_value=DeltaResult(
+                [_event("e1", now + timedelta(hours=1)), _event("e2", now + timedelta(hours=3))],
+                "delta-1",
+                full_sync=True,
+            )
+        )
+        client = CalendarClient(graph, sync_store=store)
+        start = now.replace(tzinfo=None)  # e.g. an API date without offset
+
+        events = await client.get_calendar_view(start, start + timedelta(hours=6), limit=1)
+
+        assert [e.event_id for e in events] == ["e1"]
+        graph.get_all_pages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_out_of_window_reads_go_to_graph(self, store, graph):
+        graph.get.return_value = {"value": []}
+        graph.get_delta_changes = AsyncMock()
+        client = CalendarClient(graph, sync_store=store)
+
+        await client.get_events(days_ahead=120)
+
+        graph.get.assert_awaited_once()
+        graph.get_delta_changes.assert_not_called()
+
+
+class TestTeamsMirror:
+    """Test TeamsClient watermark sync"""
+
+    @pytest.fixture
+    def graph(self):
+        graph = MagicMock()
+        graph.account_id = ACCOUNT
+        graph.get = AsyncMock()
+        graph.get_all_pages = AsyncMock()
+        graph.get_next_pages = AsyncMock(return_value=[])
+        return graph
+
+    @staticmethod
+    def _message(message_id, created, **extra):
+        return {
+            "id": message_id,
+            "createdDateTime": created,
+            "lastModifiedDateTime": created,
+            "from": {"user": {"id": "u1", "displayName": "Alice"}},
+            "body": {"content": f"<p>Message {message_id}</p>"},
+            **extra,
+        }
+
+    @pytest.mark.asyncio
+    async def test_only_updated_chats_are_queried(self, store, graph):
+        chats = [
+            {"id": "c1", "chatType": "oneOnOne", "lastUpdatedDateTime": "2026-01-05T10:00:00Z"},
+            {"id": "c2", "chatType": "group", "lastUpdatedDateTime": "2026-01-05T09:00:00Z"},
+        ]
+        graph.get_all_pages.return_value = chats
+        graph.get_batch = AsyncMock(
+            return_value={
+                chat_id: BatchResult(
+                    200, {"value": [self._message(f"{chat_id}-m1", "2026-01-05T08:00:00Z")]}
+                )
+                for chat_id in ("c1", "c2")
+            }
+        )
+        client = TeamsClient(graph, sync_store=store)
+
+        changes = await client.sync()
+        assert sorted(changes.upserted) == ["c1", "c1-m1", "c2", "c2-m1"]
+
+        # Only c1 changed: one incremental query, filtered by its watermark
+        chats[0] = {**chats[0], "lastUpdatedDateTime": "2026-01-05T11:00:00Z"}
+        graph.get_batch.return_value = {
+            "c1": BatchResult(
+                200,
+                {
+                    "value": [self._message("c1-m2", "2026-01-05T10:59:00Z")],
+                    "@odata.nextLink": "page-2",
+                },
+            )
+        }
+        graph.get_next_pages.return_value = [
+            self._message("c1-m1", "2026-01-05T08:00:00Z", deletedDateTime="2026-01-05T11:00:00Z")
+        ]
+        changes = await client.sync(force=True)
+
+        requests = graph.get_batch.await_args.args[0]
+        assert list(requests) == ["c1"]
+        assert requests["c1"][1]["$filter"] == "lastModifiedDateTime gt 2026-01-05T08:00:00Z"
+        graph.get_next_pages.assert_awaited_once_with("page-2", max_pages=19)
+        assert changes.upserted == ["c1", "c1-m2"]
+        assert changes.deleted == ["c1-m1"]
+
+        messages = await client.get_messages("c1")
+        assert [m.message_id for m in messages] == ["c1-m2"]
+        assert store.get_item(ACCOUNT, MIRROR_MESSAGES, "c2-m1", container_id="c2") is not None
+
+    @pytest.mark.asyncio
+    async def test_messages_per_chat_are_bounded(self, store, graph):
+        graph.get_all_pages.return_value = [
+            {"id": "c1", "chatType": "oneOnOne", "lastUpdatedDateTime": "2026-01-05T10:00:00Z"}
+        ]
+        graph.get_batch = AsyncMock(
+            return_value={
+                "c1": BatchResult(
+                    200,
+                    {
+                        "value": [
+                            self._message("m2", "2026-01-05T09:00:00Z"),
+                            self._message("m1", "2026-01-05T08:00:00Z"),
+                        ]
+                    },
+                )
+            }
+        )
+        client = TeamsClient(graph, sync_store=store, messages_kept_per_chat=1)
+
+        await client.sync()
+
+        assert [m["id"] for m in store.list_items(ACCOUNT, MIRROR_MESSAGES)] == ["m2"]
@@ -0,0 +1,311 @@
+"""
+Unit Tests for IMAP incremental sync
+
+Tests the persisted folder sync state and IMAPClient's UIDVALIDITY /
+UIDNEXT / CONDSTORE based incremental polling against a fake server.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config_manager import EmailConfig
+from src.integrations.email.imap_client import IMAPClient, compact_uid_set
+from src.integrations.email.processed_tracker import ProcessedEmailTracker
+from src.integrations.email.sync_state import IMAPSyncStateStore, PendingMessage
+
+
+def parse_uid_set(uid_set: str, max_uid: int) -> set[int]:
+    """Expand an IMAP UID set ("1:3,7,9:*") into UIDs"""
+    uids: set[int] = set()
+    for part in uid_set.split(","):
+        if ":" in part:
+            start, end = part.split(":")
+            end_uid = max_uid if end == "*" else int(end)
+            low, high = sorted((int(start), end_uid))
+            uids.update(range(low, high + 1))
+        else:
+            uids.add(int(part))
+    return uids
+
+
+class FakeIMAPServer:
+    """Minimal single-folder IMAP server speaking imaplib's return shapes"""
+
+    def __init__(self, count: int = 0, uidvalidity: int = 1, condstore: bool = True):
+        self.uidvalidity = uidvalidity
+        self.condstore = condstore
+        self.modseq = 1
+        self.messages: dict[int, dict] = {}
+        self.uidnext = 1
+        self.calls: list[tuple] = []
+        for _ in range(count):
+            self.append()
+
+    def append(self, seen: bool = False) -> int:
+        uid = self.uidnext
+        self.uidnext += 1
+        self.modseq += 1
+        self.messages[uid] = {"seen": seen, "modseq": self.modseq}
+        return uid
+
+    def set_seen(self, uid: int, seen: bool = True) -> None:
+        self.modseq += 1
+        self.messages[uid].update(seen=seen, modseq=self.modseq)
+
+    def expunge(self, uid: int) -> None:
+        self.modseq += 1
+        del self.messages[uid]
+
+    # imaplib.IMAP4 surface
+
+    def select(self, folder, readonly=False):
+        return "OK", [str(len(self.messages)).encode()]
+
+    def response(self, code):
+        values = {"UIDVALIDITY": self.uidvalidity, "UIDNEXT": self.uidnext}
+        if self.condstore:
+            values["HIGHESTMODSEQ"] = self.modseq
+        value = values.get(code)
+        return code, [str(value).encode() if value is not None else None]
+
+    def uid(self, command, *args):
+        self.calls.append((command, *args))
+        max_uid = max(self.messages, default=0)
+        if command == "SEARCH":
+            criteria = args[-1]
+            if criteria.startswith("UID "):
+                wanted = parse_uid_set(criteria[4:], max_uid)
+                found = sorted(u for u in wanted if u in self.messages)
+            else:
+                found = sorted(self.messages)
+            return "OK", [" ".join(map(str, found)).encode()]
+
+        if command == "FETCH":
+            uid_set, query = args
+            uids = sorted(u for u in parse_uid_set(uid_set, max_uid) if u in self.messages)
+            response: list = []
+            for seq, uid in enumerate(uids, start=1):
+                message = self.messages[uid]
+                flags = b"(\\Seen)" if message["seen"] else b"()"
+                if "CHANGEDSINCE" in query:
+                    since = int(query.split("CHANGEDSINCE ")[1].rstrip(")"))
+                    if message["modseq"] <= since:
+                        continue
+                if "BODY.PEEK[]" in query:
+                    raw = (
+                        f"From: sender@example.com\r\nSubject: Mail {uid}\r\n"
+                        f"Message-ID: <m{uid}@example.com>\r\n\r\nBody {uid}\r\n"
+                    ).encode()
+                    response += [(f"{seq} (UID {uid} BODY[] {{{len(raw)}}}".encode(), raw), b")"]
+                elif "HEADER.FIELDS" in query:
+                    header = f"Message-ID: <m{uid}@example.com>\r\n\r\n".encode()
+                    response += [
+                        (
+                            f"{seq} (UID {uid} FLAGS ".encode()
+                            + flags
+                            + f" BODY[HEADER.FIELDS (MESSAGE-ID)] {{{len(header)}}}".encode(),
+                            header,
+                        ),
+                        b")",
+                    ]
+                else:
+                    response.append(f"{seq} (UID {uid} FLAGS ".encode() + flags + b")")
+            return "OK", response
+
+        return "OK", [None]
+
+    def fetch_queries(self) -> list[str]:
+        return [call[2] for call in self.calls if call[0] == "FETCH"]
+
+    def header_fetches(self) -> list[set[int]]:
+        max_uid = max(self.messages, default=0)
+        return [
+            parse_uid_set(call[1], max_uid)
+            for call in self.calls
+            if call[0] == "FETCH" and "HEADER.FIELDS" in call[2]
+        ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = IMAPSyncStateStore(str(tmp_path / "sync.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return ProcessedEmailTracker(str(tmp_path / "processed.db"))
+
+
+@pytest.fixture
+def client(store, tracker):
+    config = EmailConfig(
+        imap_host="imap.example.com",
+        imap_port=993,
+        imap_username="test@example.com",
+        imap_password="test_password",
+        inbox_folder="INBOX",
+        archive_folder="Archive",
+    )
+    client = IMAPClient(config)
+    with patch(
+        "src.integrations.email.imap_client.get_sync_state_store", return_value=store
+    ), patch("src.integrations.email.imap_client.get_processed_tracker", return_value=tracker):
+        yield client
+
+
+def connect(client: IMAPClient, server: FakeIMAPServer) -> FakeIMAPServer:
+    client._connection = server
+    client._condstore_enabled = server.condstore
+    return server
+
+
+def poll(client: IMAPClient, **kwargs) -> list[int]:
+    emails = client.fetch_emails(folder="INBOX", unprocessed_only=True, **kwargs)
+    return [metadata.id for metadata, _ in emails]
+
+
+class TestCompactUidSet:
+    """Tests for compact_uid_set"""
+
+    def test_ranges(self):
+        assert compact_uid_set([7, 1, 2, 3, 9, 10]) == "1:3,7,9:10"
+
+    def test_single_and_duplicates(self):
+        assert compact_uid_set([5, 5]) == "5"
+        assert compact_uid_set([]) == ""
+
+
+class TestIMAPSyncStateStore:
+    """Tests for the SQLite sync state store"""
+
+    def test_state_roundtrip(self, store):
+        assert store.get_state("acc", "INBOX") is None
+
+        state = store.reset_folder("acc", "INBOX", uidvalidity=42)
+        state.last_uid = 120
+        state.highest_modseq = 9000
+        store.save_state(state)
+
+        loaded = store.get_state("acc", "INBOX")
+        assert (loaded.uidvalidity, loaded.last_uid, loaded.highest_modseq) == (42, 120, 9000)
+        assert store.get_state("other", "INBOX") is None
+
+    def test_pending_lifecycle(self, store):
+        store.add_pending(
+            "acc", "INBOX", [PendingMessage(3, "m3"), PendingMessage(1, "m1", seen=True)]
+        )
+        store.update_seen("acc", "INBOX", {3: True})
+        store.remove_pending("acc", "INBOX", [1])
+
+        pending = store.get_pending("acc", "INBOX")
+        assert list(pending) == [3]
+        assert pending[3].seen is True
+
+    def test_reset_drops_pending(self, store):
+        store.add_pending("acc", "INBOX", [PendingMessage(1, "m1")])
+        store.reset_folder("acc", "INBOX", uidvalidity=2)
+        assert store.get_pending("acc", "INBOX") == {}
+
+    def test_clear_account(self, store):
+        store.reset_folder("a", "INBOX", 1)
+        store.reset_folder("b", "INBOX", 1)
+        store.clear("a")
+        assert store.get_state("a", "INBOX") is None
+        assert store.get_state("b", "INBOX") is not None
+
+
+class TestIncrementalSync:
+    """Tests for IMAPClient incremental polling"""
+
+    def test_first_sync_returns_unprocessed_oldest_first(self, client, tracker):
+        connect(client, FakeIMAPServer(count=5))
+        tracker.mark_processed("m2@example.com", client.account_id)
+
+        assert poll(client) == [1, 3, 4, 5]
+
+    def test_idle_poll_asks_for_nothing(self, client, tracker, store):
+        server = connect(client, FakeIMAPServer(count=3))
+        for uid in poll(client):
+            tracker.mark_processed(f"m{uid}@example.com", client.account_id)
+        server.calls.clear()
+
+        assert poll(client) == []
+        # UIDNEXT and HIGHESTMODSEQ unchanged: no SEARCH, no FETCH
+        assert server.calls == []
+        assert store.get_state(client.account_id, "INBOX").last_uid == 3
+
+    def test_only_new_uids_are_examined(self, client, tracker):
+        server = connect(client, FakeIMAPServer(count=50))
+        for uid in poll(client):
+            tracker.mark_processed(f"m{uid}@example.com", client.account_id)
+        server.calls.clear()
+
+        server.append()
+        server.append()
+        assert poll(client) == [51, 52]
+        assert ("SEARCH", "UID 51:*") in server.calls
+        assert server.header_fetches() == [{51, 52}]
+
+    def test_unfinished_emails_are_returned_again(self, client, tracker):
+        server = connect(client, FakeIMAPServer(count=3))
+        assert poll(client) == [1, 2, 3]
+        tracker.mark_processed("m1@example.com", client.account_id)
+        server.calls.clear()
+
+        assert poll(client) == [2, 3]
+        assert server.header_fetches() == []
+
+    def test_limit_stops_header_scan_early(self, client, store):
+        server = connect(client, FakeIMAPServer(count=250))
+
+        assert poll(client, limit=5) == [1, 2, 3, 4, 5]
+        assert len(server.header_fetches()) == 1
+        # Unexamined UIDs are left for the next poll
+        assert store.get_state(client.account_id, "INBOX").last_uid == 100
+
+    def test_uidvalidity_change_forces_full_resync(self, client, tracker, store):
+        connect(client, FakeIMAPServer(count=3))
+        for uid in poll(client):
+            tracker.mark_processed(f"m{uid}@example.com", client.account_id)
+
+        renumbered = connect(client, FakeIMAPServer(count=4, uidvalidity=2))
+        assert poll(client) == [4]
+        assert renumbered.header_fetches() == [{1, 2, 3, 4}]
+        assert store.get_state(client.account_id, "INBOX").uidvalidity == 2
+
+    def test_condstore_refreshes_only_changed_flags(self, client):
+        server = connect(client, FakeIMAPServer(count=3))
+        assert poll(client, unread_only=True) == [1, 2, 3]
+        server.calls.clear()
+
+        server.set_seen(2)
+        assert poll(client, unread_only=True) == [1, 3]
+        flag_queries = [q for q in server.fetch_queries() if q.startswith("(FLAGS)")]
+        assert flag_queries == ["(FLAGS) (CHANGEDSINCE 4)"]
+
+    def test_without_condstore_flags_are_refetched(self, client):
+        server = connect(client, FakeIMAPServer(count=3, condstore=False))
+        assert poll(client, unread_only=True) == [1, 2, 3]
+
+        server.set_seen(1)
+        assert poll(client, unread_only=True) == [2, 3]
+        assert "(FLAGS)" in server.fetch_queries()
+
+    def test_expunged_pending_uid_is_forgotten(self, client, store):
+        server = connect(client, FakeIMAPServer(count=3))
+        poll(client)
+
+        server.expunge(2)
+        assert poll(client) == [1, 3]
+        assert list(store.get_pending(client.account_id, "INBOX")) == [1, 3]
+
+    def test_falls_back_without_uidvalidity(self, client, store):
+        server = connect(client, FakeIMAPServer(count=2))
+        server.uidvalidity = None
+
+        assert poll(client) == [1, 2]
+        assert ("SEARCH", None, "ALL") in server.calls
+        assert store.get_state(client.account_id, "INBOX") is None
@@ -0,0 +1,247 @@
+"""
+Tests for the BM25 lexical note index
+
+Coverage:
+- Tokenization (accent folding, French stemming, compound identifiers)
+- BM25 ranking, incremental updates and persistence
+- NoteManager integration (lexical/hybrid search, lifecycle, reconciliation)
+- EntitySearcher content lookups through postings
+"""
+
+import re
+import zlib
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.passepartout.entity_search import EntitySearcher
+from src.passepartout.lexical_index import LexicalIndex, fold, stem_fr, tokenize
+from src.passepartout.note_manager import LEXICAL_INDEX_FILENAME, NoteManager
+from src.passepartout.vector_store import VectorStore
+
+DIMENSION = 384
+
+
+@pytest.fixture
+def embedder():
+    """Bag-of-words embedder: texts sharing words are close in L2"""
+
+    def embed(text):
+        vector = np.zeros(DIMENSION, dtype=np.float32)
+        for word in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(word.encode()) % DIMENSION] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    embedder = Mock()
+    embedder.model_name = "mock-bow"
+    embedder.get_dimension.return_value = DIMENSION
+    embedder.embed_text.side_effect = lambda text, normalize=False: embed(text)
+    embedder.embed_batch.side_effect = lambda texts, normalize=False: np.stack(
+        [embed(t) for t in texts]
+    )
+    return embedder
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical.db")
+    yield index
+    index.close()
+
+
+class TestTokenize:
+    """Test fold, stem_fr and tokenize"""
+
+    def test_fold_strips_accents(self):
+        assert fold("Élodie Réunion") == "elodie reunion"
+
+    def test_stem_plural_and_feminine(self):
+        assert stem_fr("reunions") == stem_fr("reunion")
+        assert stem_fr("journaux") == stem_fr("journal")
+        assert stem_fr("marc") == "marc"
+
+    def test_digits_kept_verbatim(self):
+        assert "fr76" in tokenize("IBAN FR76")
+        assert "3000" in tokenize("3000")
+
+    def test_compound_indexed_whole_and_by_part(self):
+        terms = tokenize("Ticket JIRA-1234 pour marc@acme.fr")
+        assert {"jira-1234", "jira", "1234", "marc@acme.fr", "marc", "acme"} <= set(terms)
+        assert "pour" not in terms
+
+
+class TestLexicalIndex:
+    """Test LexicalIndex"""
+
+    def test_exact_identifier_ranks_first(self, index):
+        index.add_documents(
+            [
+                ("iban", "Virement vers IBAN FR76 3000 6000 0112 3456"),
+                ("other", "Virement mensuel sans référence"),
+            ]
+        )
+        assert index.search("FR76 3000")[0][0] == "iban"
+
+    def test_accent_and_plural_insensitive(self, index):
+        index.add_document("a", "Réunion d'équipe")
+        assert [note_id for note_id, _ in index.search("reunions equipe")] == ["a"]
+
+    def test_rarer_term_scores_higher(self, index):
+        index.add_documents(
+            [("a", "projet alpha"), ("b", "projet beta"), ("c", "projet gamma")]
+        )
+        scores = dict(index.search("projet alpha"))
+        assert scores["a"] > scores["b"]
+
+    def test_require_all(self, index):
+        index.add_documents([("a", "Marc Dupont"), ("b", "Marc Martin")])
+        assert [note_id for note_id, _ in index.search("marc dupont", require_all=True)] == [
+            "a"
+        ]
+
+    def test_reindex_replaces_and_remove_drops(self, index):
+        index.add_document("a", "ancien texte")
+        index.add_document("a", "nouveau contenu")
+        assert index.search("ancien") == []
+        assert index.document_count() == 1
+
+        index.remove_document("a")
+        assert index.search("nouveau") == []
+        assert index.get_stats()["documents"] == 0
+
+    def test_term_frequencies(self, index):
+        index.add_documents(
+            [("a", "Marc Dupont. Marc Dupont encore."), ("b", "Marc seulement")]
+        )
+        assert index.term_frequencies("Marc Dupont") == {"a": 2}
+
+    def test_persists_across_instances(self, index, tmp_path):
+        index.add_document("a", "ACME contrat")
+        index.close()
+
+        reopened = LexicalIndex(tmp_path / "lexical.db")
+        assert reopened.document_ids() == {"a"}
+        assert reopened.search("acme")[0][0] == "a"
+        reopened.close()
+
+    def test_sees_documents_from_other_instances(self, index, tmp_path):
+        # Opened empty, like an API process started before the worker indexed
+        reader = LexicalIndex(tmp_path / "lexical.db")
+        index.add_documents([("a", "ACME contrat"), ("b", "Budget annuel")])
+
+        assert reader.search("acme")[0][0] == "a"
+        assert reader.get_stats()["documents"] == 2
+
+        index.remove_document("a")
+        assert reader.search("acme") == []
+        assert reader.document_count() == 1
+        reader.close()
+
+    def test_invalid_top_k(self, index):
+        with pytest.raises(ValueError):
+            index.search("x", top_k=0)
+
+
+class TestNoteManagerLexical:
+    """Test NoteManager lexical/hybrid search"""
+
+    def _manager(self, notes_dir, embedder, **kwargs):
+        return NoteManager(
+            notes_dir=notes_dir,
+            vector_store=VectorStore(dimension=DIMENSION, embedder=embedder),
+            embedder=embedder,
+            auto_index=True,
+            git_enabled=False,
+            **kwargs,
+        )
+
+    def test_lexical_and_hybrid_find_identifier(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        target = manager.create_note("Incident", "Suivi du ticket JIRA-4821 en cours")
+        for i in range(5):
+            manager.create_note(f"Ticket {i}", f"Suivi du ticket JIRA-{1000 + i}")
+
+        lexical = manager.search_notes("JIRA-4821", top_k=1, mode="lexical")
+        hybrid = manager.search_notes("JIRA-4821", top_k=1, mode="hybrid")
+
+        assert [note.note_id for note in lexical] == [target]
+        assert [note.note_id for note in hybrid] == [target]
+
+    def test_lexical_search_honours_filters(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        manager.create_note("A", "Contrat ACME", tags=["client"])
+        tagged = manager.create_note("B", "Contrat ACME", tags=["fournisseur"])
+
+        results = manager.search_notes("ACME", mode="lexical", tags=["fournisseur"])
+        assert [note.note_id for note in results] == [tagged]
+
+    def test_selective_filter_fills_top_k(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        # Better-ranked client notes push the supplier past the first BM25 depth
+        for i in range(120):
+            manager.create_note(f"Client {i}", "ACME ACME ACME", tags=["client"])
+        tagged = manager.create_note("Fournisseur", "Contrat ACME signé", tags=["fournisseur"])
+
+        results = manager.search_notes("ACME", top_k=1, mode="lexical", tags=["fournisseur"])
+        assert [note.note_id for note in results] == [tagged]
+
+    def test_unknown_mode(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        with pytest.raises(ValueError):
+            manager.search_notes("x", mode="fuzzy")
+
+    def test_update_and_delete_keep_index_in_sync(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        note_id = manager.create_note("Note", "mot ancien")
+
+        manager.update_note(note_id, content="mot nouveau")
+        assert manager.search_notes("ancien", mode="lexical") == []
+        assert manager.lexical_index.has_document(note_id)
+
+        manager.delete_note(note_id)
+        assert not manager.lexical_index.has_document(note_id)
+
+    def test_missing_lexical_index_is_reconciled(self, tmp_path, embedder):
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        (notes_dir / "marc.md").write_text("---\ntitle: Marc\n---\n\nIBAN FR76 3000\n")
+        self._manager(notes_dir, embedder, index_lexical=False)
+        assert not (notes_dir / LEXICAL_INDEX_FILENAME).exists()
+
+        upgraded = self._manager(notes_dir, embedder)
+
+        assert upgraded.lexical_index.has_document("marc")
+
+    def test_mock_vector_store_disables_lexical(self, tmp_path):
+        manager = NoteManager(
+            notes_dir=tmp_path / "notes",
+            vector_store=Mock(),
+            embedder=Mock(),
+            auto_index=False,
+            git_enabled=False,
+        )
+        assert manager.lexical_index is None
+
+
+class TestEntitySearcherPostings:
+    """Test EntitySearcher content search through the lexical index"""
+
+    def test_content_match_from_postings(self, tmp_path, embedder):
+        manager = NoteManager(
+            notes_dir=tmp_path / "notes",
+            vector_store=VectorStore(dimension=DIMENSION, embedder=embedder),
+            embedder=embedder,
+            auto_index=True,
+            git_enabled=False,
+        )
+        projet = manager.create_note("Projet Alpha", "Élodie Martin pilote le budget.")
+        manager.create_note("Autre", "Élodie seule, sans nom de famille.")
+        searcher = EntitySearcher(manager, search_content=True)
+        searcher._rebuild_title_cache()
+
+        results = searcher._search_in_content("Elodie Martin", "elodie martin", set(), 5)
+
+        assert [r.note.note_id for r in results] == [projet]
+        assert results[0].match_type == "content"
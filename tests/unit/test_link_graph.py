@@ -0,0 +1,124 @@
+"""
+Tests for the wikilink graph
+
+Coverage:
+- Resolution by title and alias (case, #heading suffixes, collisions)
+- Backlinks and broken links, kept current by set_note/remove_note
+- JSON persistence
+- NoteManager integration (note writes, restart, RetoucheReviewer-style lookups)
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.passepartout.link_graph import LinkGraph, link_key
+from src.passepartout.note_manager import LINK_GRAPH_FILENAME, NoteManager
+
+
+@pytest.fixture
+def graph():
+    graph = LinkGraph()
+    graph.set_note("marc", "Marc Dupont", aliases=["Marco"], links=["Acme", "Inconnu"])
+    graph.set_note("acme", "Acme", links=["marc dupont#Contact", "Marco"])
+    graph.set_note("projet", "Projet Orion", links=["Acme"])
+    return graph
+
+
+class TestLinkGraph:
+    """Test LinkGraph"""
+
+    def test_link_key(self):
+        assert link_key("  Marc   Dupont#Contact ") == "marc dupont"
+        assert link_key("Note^block") == "note"
+
+    def test_resolve(self, graph):
+        assert graph.resolve("MARC DUPONT") == "marc"
+        assert graph.resolve("Marco") == "marc"
+        assert graph.resolve("Acme#Historique") == "acme"
+        assert graph.resolve("Inconnu") is None
+
+    def test_title_wins_over_alias(self, graph):
+        graph.set_note("other", "Marco", links=[])
+        assert graph.resolve("marco") == "other"
+
+        graph.remove_note("other")
+        assert graph.resolve("marco") == "marc"
+
+    def test_backlinks_and_outgoing(self, graph):
+        assert graph.backlinks("acme") == ["marc", "projet"]
+        assert graph.backlinks("marc") == ["acme"]
+        assert graph.outgoing("marc") == [("Acme", "acme"), ("Inconnu", None)]
+
+    def test_broken_links_follow_changes(self, graph):
+        assert graph.broken_links() == {"marc": ["Inconnu"]}
+
+        graph.set_note("inconnu", "Inconnu")
+        assert graph.broken_links() == {}
+        assert graph.backlinks("inconnu") == ["marc"]
+
+        graph.remove_note("acme")
+        assert graph.broken_links("projet") == {"projet": ["Acme"]}
+
+    def test_rename_moves_backlinks(self, graph):
+        graph.set_note("acme", "Acme Corp", links=["marc dupont#Contact", "Marco"])
+        assert graph.backlinks("acme") == []
+        assert graph.broken_links("projet") == {"projet": ["Acme"]}
+
+    def test_save_and_load(self, graph, tmp_path):
+        path = tmp_path / "links.json"
+        graph.save(path)
+        assert not graph.dirty
+
+        loaded = LinkGraph()
+        assert loaded.load(path)
+        assert loaded.backlinks("acme") == ["marc", "projet"]
+        assert loaded.get_stats() == graph.get_stats()
+        assert not LinkGraph().load(tmp_path / "missing.json")
+
+
+class TestNoteManagerLinkGraph:
+    """Test NoteManager link graph integration"""
+
+    def _manager(self, notes_dir):
+        return NoteManager(
+            notes_dir=notes_dir,
+            vector_store=Mock(),
+            embedder=Mock(),
+            auto_index=False,
+            git_enabled=False,
+        )
+
+    def test_graph_follows_note_writes(self, tmp_path):
+        manager = self._manager(tmp_path / "notes")
+        acme = manager.create_note("Acme", "Client", metadata={"aliases": ["ACME SA"]})
+        marc = manager.create_note("Marc Dupont", "Travaille chez [[ACME SA]] et [[Orion]]")
+        manager.get_link_graph()
+
+        assert manager.resolve_wikilink("acme").note_id == acme
+        assert manager.get_backlinks(acme) == [marc]
+        assert manager.get_broken_links(marc) == ["Orion"]
+
+        orion = manager.create_note("Orion", "Projet")
+        assert manager.get_broken_links(marc) == []
+        assert manager.get_backlinks(orion) == [marc]
+
+        manager.update_note(marc, content="Plus de liens")
+        assert manager.get_backlinks(acme) == []
+
+        manager.delete_note(orion)
+        assert manager.resolve_wikilink("Orion") is None
+
+    def test_graph_persists_across_restarts(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        manager = self._manager(notes_dir)
+        acme = manager.create_note("Acme", "Client")
+        marc = manager.create_note("Marc", "Voir [[Acme]]")
+        manager.get_link_graph()
+        manager.update_note(marc, content="Voir [[Acme]] encore")
+        assert (notes_dir / LINK_GRAPH_FILENAME).exists()
+
+        restarted = self._manager(notes_dir)
+        restarted.get_all_notes = Mock(side_effect=AssertionError("graph not loaded"))
+
+        assert restarted.get_backlinks(acme) == [marc]
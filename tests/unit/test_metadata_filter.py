@@ -0,0 +1,79 @@
+"""
+Unit Tests for MetadataBitsetIndex
+
+Tests resolution of structured metadata filters to FAISS bitmaps.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.passepartout.metadata_filter import MetadataBitsetIndex, MetadataFilter
+
+
+def _selected_ids(bitmap: np.ndarray, id_bound: int) -> list[int]:
+    return np.flatnonzero(np.unpackbits(bitmap, bitorder="little")[:id_bound]).tolist()
+
+
+@pytest.fixture
+def index():
+    index = MetadataBitsetIndex()
+    index.add(0, {"tags": ["a", "b"], "type": "projet", "updated_at": "2025-01-10T00:00:00"})
+    index.add(1, {"tags": ["b"], "type": "personne", "updated_at": "2025-03-01T00:00:00"})
+    index.add(9, {"tags": ["c"], "type": "projet", "folder": "Work"})
+    return index
+
+
+class TestMetadataBitsetIndex:
+    """Test MetadataBitsetIndex"""
+
+    def test_values_of_one_field_are_ored(self, index):
+        """Test any listed value matches"""
+        bitmap = index.resolve(MetadataFilter(match={"tags": ["a", "c"]}), 10)
+
+        assert _selected_ids(bitmap, 10) == [0, 9]
+
+    def test_fields_are_anded(self, index):
+        """Test every condition must hold"""
+        bitmap = index.resolve(MetadataFilter(match={"tags": "b", "type": "projet"}), 10)
+
+        assert _selected_ids(bitmap, 10) == [0]
+
+    def test_date_range(self, index):
+        """Test date bounds are inclusive and undated documents drop out"""
+        bitmap = index.resolve(
+            MetadataFilter(date_from=datetime(2025, 2, 1), date_to=datetime(2025, 3, 1)), 10
+        )
+
+        assert _selected_ids(bitmap, 10) == [1]
+
+    def test_remove_clears_bits(self, index):
+        """Test removed documents no longer match"""
+        index.remove(0, {"tags": ["a", "b"], "type": "projet"})
+
+        bitmap = index.resolve(MetadataFilter(match={"tags": "b"}), 10)
+        assert _selected_ids(bitmap, 10) == [1]
+
+    def test_build_matches_incremental_adds(self, index):
+        """Test bulk build yields the same bitmaps as add()"""
+        bulk = MetadataBitsetIndex()
+        bulk.build([
+            (0, {"tags": ["a", "b"], "type": "projet", "updated_at": "2025-01-10T00:00:00"}),
+            (1, {"tags": ["b"], "type": "personne", "updated_at": "2025-03-01T00:00:00"}),
+            (9, {"tags": ["c"], "type": "projet", "folder": "Work"}),
+        ])
+
+        for metadata_filter in (
+            MetadataFilter(match={"tags": "b"}),
+            MetadataFilter(match={"folder": "Work"}),
+            MetadataFilter(date_from=datetime(2025, 1, 1)),
+        ):
+            np.testing.assert_array_equal(
+                bulk.resolve(metadata_filter, 10), index.resolve(metadata_filter, 10)
+            )
+
+    def test_unindexed_field_raises(self, index):
+        """Test filtering on a field that is not indexed is an error"""
+        with pytest.raises(ValueError, match="not indexed"):
+            index.resolve(MetadataFilter(match={"title": "x"}), 10)
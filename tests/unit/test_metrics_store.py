@@ -0,0 +1,232 @@
+"""
+Tests for the embedded metrics store and the stats built on it
+
+Coverage:
+- Counters consolidated into minute, hour and day buckets, zero-filled series
+- Histograms: merges across flushes, approximate quantiles
+- Retention drops fine buckets while coarser ones keep the history
+- Background flushing, request metrics middleware
+- StatsService trends and processed counts read from the store
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.frontin.api.middleware.metrics import UNMATCHED_ROUTE, RequestMetricsMiddleware
+from src.frontin.api.services.stats_service import StatsService
+from src.monitoring.metrics_store import (
+    API_REQUEST_SECONDS,
+    ITEMS_PROCESSED,
+    NOTES_REVIEWED,
+    HistogramSummary,
+    MetricsStore,
+)
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    store = MetricsStore(tmp_path / "metrics.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def day():
+    """Midnight UTC, two days ago"""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=2)
+
+
+class TestCounters:
+    """Test counter recording and reads"""
+
+    def test_buckets_at_every_resolution(self, metrics, day):
+        metrics.increment(ITEMS_PROCESSED, label="email", at=day + timedelta(minutes=1))
+        metrics.increment(
+            ITEMS_PROCESSED, 2, label="email", at=day + timedelta(minutes=1, seconds=30)
+        )
+        metrics.increment(ITEMS_PROCESSED, label="teams", at=day + timedelta(hours=3))
+        assert metrics.flush() == 2  # Two pending minute buckets
+
+        minutes = metrics.counter_series(
+            ITEMS_PROCESSED, "minute", day, day + timedelta(minutes=2), label="email"
+        )
+        assert [p.value for p in minutes] == [0, 3, 0]
+        assert minutes[1].start == day + timedelta(minutes=1)
+
+        hours = metrics.counter_series(ITEMS_PROCESSED, "hour", day, day + timedelta(hours=3))
+        assert [p.value for p in hours] == [3, 0, 0, 1]
+
+        days = metrics.counter_series(ITEMS_PROCESSED, "day", day, day + timedelta(days=2))
+        assert [p.value for p in days] == [4, 0, 0]
+
+    def test_totals_and_unflushed_values(self, metrics, day):
+        metrics.increment(ITEMS_PROCESSED, label="email", at=day)
+        metrics.flush()
+        metrics.increment(ITEMS_PROCESSED, label="email", at=day + timedelta(days=1))
+        metrics.increment(ITEMS_PROCESSED, 5, label="teams", at=day + timedelta(days=1))
+
+        # Reads include values still pending in memory
+        assert metrics.counter_totals_by_label(ITEMS_PROCESSED) == {"email": 2, "teams": 5}
+        assert metrics.counter_total(ITEMS_PROCESSED, label="email") == 2
+        assert metrics.counter_total(ITEMS_PROCESSED, since=day + timedelta(days=1)) == 6
+        assert metrics.counter_total(NOTES_REVIEWED) == 0
+
+    def test_unknown_resolution(self, metrics, day):
+        with pytest.raises(ValueError):
+            metrics.counter_series(ITEMS_PROCESSED, "week", day, day)
+
+
+class TestHistograms:
+    """Test histogram recording and summaries"""
+
+    def test_summary_merged_across_flushes(self, metrics, day):
+        for value in (0.02, 0.03, 0.04):
+            metrics.observe(API_REQUEST_SECONDS, value, label="GET /api/queue", at=day)
+        metrics.flush()
+        metrics.observe(API_REQUEST_SECONDS, 3.0, label="GET /api/queue", at=day)
+        metrics.observe(API_REQUEST_SECONDS, 0.2, label="GET /api/stats", at=day)
+
+        summary = metrics.histogram_summary(API_REQUEST_SECONDS, "day", label="GET /api/queue")
+
+        assert summary.count == 4
+        assert summary.min == 0.02 and summary.max == 3.0
+        assert summary.mean == pytest.approx(3.09 / 4)
+        assert metrics.histogram_summary(API_REQUEST_SECONDS, "minute").count == 5
+
+    def test_quantiles(self):
+        summary = HistogramSummary()
+        for _ in range(95):
+            summary.add(0.004)
+        for _ in range(5):
+            summary.add(90.0)
+
+        assert summary.quantile(0.5) == 0.005  # Upper bound of the bin
+        assert summary.quantile(0.99) == 90.0  # Overflow bin: observed maximum
+        assert HistogramSummary().quantile(0.5) is None
+
+        small = HistogramSummary()
+        small.add(0.004)
+        assert small.quantile(0.95) == 0.004  # Capped by the observed maximum
+
+
+    def test_concurrent_flush_between_read_and_write(self, tmp_path, day, monkeypatch):
+        # Two stores on one database, like the API and worker processes
+        first = MetricsStore(tmp_path / "shared.db")
+        second = MetricsStore(tmp_path / "shared.db")
+        first.observe(API_REQUEST_SECONDS, 0.1, at=day)
+        first.flush()
+        first.observe(API_REQUEST_SECONDS, 0.1, at=day)
+        second.observe(API_REQUEST_SECONDS, 0.1, at=day)
+
+        # The other process flushes after first read the stored histogram
+        other = threading.Thread(target=second.flush)
+        read_row = MetricsStore._histogram_from_row
+
+        def read_then_interleave(row):
+            if other.ident is None:  # Not started yet
+                other.start()
+                other.join(timeout=0.5)  # Blocked until first commits
+            return read_row(row)
+
+        monkeypatch.setattr(first, "_histogram_from_row", read_then_interleave)
+        first.flush()
+        other.join()
+
+        assert second.histogram_summary(API_REQUEST_SECONDS, "day").count == 3
+        first.close()
+        second.close()
+
+
+class TestRetention:
+    """Test compaction"""
+
+    def test_coarse_buckets_keep_history(self, metrics):
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(days=120)
+        metrics.increment(ITEMS_PROCESSED, label="email", at=old)
+        metrics.increment(ITEMS_PROCESSED, label="email", at=now)
+        metrics.observe(API_REQUEST_SECONDS, 0.1, at=old)
+
+        metrics.flush()
+        # minute, hour and histogram minute and hour buckets of the old event
+        assert metrics.compact(now) == 4
+
+        assert metrics.counter_total(ITEMS_PROCESSED, since=old, resolution="hour") == 1
+        assert metrics.counter_total(ITEMS_PROCESSED, since=old) == 2
+        assert metrics.histogram_summary(API_REQUEST_SECONDS, "day").count == 1
+        assert metrics.get_stats()["buckets"] == {"minute": 1, "hour": 1, "day": 3}
+
+
+class TestBackgroundFlush:
+    """Test the flush thread"""
+
+    def test_flushed_by_thread_and_on_stop(self, metrics):
+        metrics.start(flush_interval=0.01)
+        metrics.increment(NOTES_REVIEWED)
+        metrics.stop()
+
+        assert not metrics.is_running
+        assert metrics.get_stats()["pending"] == 0
+        assert metrics.get_stats()["buckets"]["day"] == 1
+
+
+class TestRequestMetricsMiddleware:
+    """Test request timing by route template"""
+
+    def test_requests_labelled_by_route(self, metrics):
+        app = FastAPI()
+        app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+
+        @app.get("/api/items/{item_id}")
+        async def get_item(item_id: str) -> dict:
+            return {"id": item_id}
+
+        client = TestClient(app)
+        client.get("/api/items/1")
+        client.get("/api/items/2")
+        client.get("/missing")
+
+        by_route = metrics.histogram_summary(
+            API_REQUEST_SECONDS, "minute", label="GET /api/items/{item_id}"
+        )
+        assert by_route.count == 2
+        assert metrics.histogram_summary(
+            API_REQUEST_SECONDS, "minute", label=UNMATCHED_ROUTE
+        ).count == 1
+
+
+class TestStatsServiceMetrics:
+    """Test stats read from the metrics store"""
+
+    @pytest.mark.asyncio
+    async def test_trends_from_daily_buckets(self, metrics):
+        today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+        metrics.increment(ITEMS_PROCESSED, 4, label="email", at=today)
+        metrics.increment(ITEMS_PROCESSED, 2, label="email", at=today - timedelta(days=6))
+        metrics.increment(ITEMS_PROCESSED, 9, label="email", at=today - timedelta(days=7))
+        metrics.increment(ITEMS_PROCESSED, 3, label="teams", at=today - timedelta(days=1))
+        metrics.increment(NOTES_REVIEWED, at=today)
+
+        trends = await StatsService(metrics=metrics).get_trends("7d")
+
+        by_source = {t.source: t for t in trends.trends}
+        email = by_source["email"]
+        assert [p.value for p in email.data] == [2, 0, 0, 0, 0, 0, 4]
+        assert email.data[-1].date == today.date().isoformat() == trends.end_date
+        assert email.total == 6
+        assert by_source["teams"].total == 3
+        assert by_source["notes"].total == 1
+        assert trends.total_processed == 10
+
+    @pytest.mark.asyncio
+    async def test_processed_counts_from_store(self, metrics):
+        metrics.increment(ITEMS_PROCESSED, 7, label="email")
+
+        overview = await StatsService(metrics=metrics).get_overview()
+
+        assert overview.email_processed == 7
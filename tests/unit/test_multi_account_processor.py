@@ -0,0 +1,194 @@
+"""
+Tests for MultiAccountProcessor
+
+Covers sequential and parallel account processing, failure isolation and
+result aggregation.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.config_manager import EmailAccountConfig
+from src.core.multi_account_processor import MultiAccountProcessor
+from src.core.state_manager import StateManager
+
+
+def make_account(account_id: str, enabled: bool = True) -> EmailAccountConfig:
+    """Build a minimal account configuration"""
+    return EmailAccountConfig(
+        account_id=account_id,
+        account_name=f"Account {account_id}",
+        enabled=enabled,
+        imap_host="imap.example.com",
+        imap_username=f"{account_id}@example.com",
+        imap_password="test-password",
+    )
+
+
+def fake_results(account: EmailAccountConfig, processed: int) -> dict:
+    """Account results in the shape returned by _process_single_account"""
+    return {
+        "account_id": account.account_id,
+        "account_name": account.account_name,
+        "emails": [],
+        "stats": {
+            "emails_processed": processed,
+            "emails_auto_executed": 1,
+            "emails_queued": processed - 1,
+        },
+    }
+
+
+@pytest.fixture
+def accounts():
+    return [make_account("a"), make_account("b"), make_account("c"), make_account("off", False)]
+
+
+@pytest.fixture
+def processor(accounts):
+    with patch("src.core.multi_account_processor.get_event_bus") as mock_bus, patch(
+        "src.core.multi_account_processor.get_state_manager", return_value=StateManager()
+    ):
+        mock_bus.return_value = MagicMock()
+        yield MultiAccountProcessor(accounts)
+
+
+@pytest.fixture
+def mock_config():
+    config = MagicMock()
+    config.ai.rate_limit_per_minute = 40
+    with patch("src.core.multi_account_processor.get_config", return_value=config):
+        yield config
+
+
+class TestProcessAllAccounts:
+    """Tests for process_all_accounts"""
+
+    def test_sequential_aggregation(self, processor):
+        """Enabled accounts are processed and their stats summed"""
+        processed = {"a": 3, "b": 5, "c": 2}
+
+        def single(account, **kwargs):
+            return fake_results(account, processed[account.account_id])
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            results = processor.process_all_accounts()
+
+        assert results["total_accounts"] == 3
+        assert results["total_emails"] == 10
+        assert results["total_auto_executed"] == 3
+        assert results["total_queued"] == 7
+        assert results["total_errors"] == 0
+        assert list(results["accounts"]) == ["a", "b", "c"]
+
+    def test_parallel_aggregation_order(self, accounts, processor, mock_config):
+        """Parallel mode sums per-account stats in configuration order"""
+        processed = {"a": 3, "b": 5, "c": 2}
+
+        def single(account, **kwargs):
+            # Slowest account first, to finish out of order
+            time.sleep({"a": 0.05, "b": 0.02, "c": 0.0}[account.account_id])
+            return fake_results(account, processed[account.account_id])
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            results = processor.process_all_accounts(parallel=True)
+
+        assert results["total_accounts"] == 3
+        assert results["total_emails"] == 10
+        assert results["total_queued"] == 7
+        assert list(results["accounts"]) == ["a", "b", "c"]
+
+    def test_parallel_runs_accounts_concurrently(self, processor, mock_config):
+        """Accounts overlap in parallel mode"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def single(account, **kwargs):
+            barrier.wait()  # Deadlocks (times out) if accounts run one by one
+            return fake_results(account, 1)
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            results = processor.process_all_accounts(parallel=True)
+
+        assert results["total_errors"] == 0
+        assert results["total_accounts"] == 3
+
+    def test_parallel_failure_isolated(self, processor, mock_config):
+        """A failing account does not affect the others"""
+
+        def single(account, **kwargs):
+            if account.account_id == "b":
+                raise ConnectionError("IMAP down")
+            return fake_results(account, 2)
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            results = processor.process_all_accounts(parallel=True)
+
+        assert results["total_accounts"] == 2
+        assert results["total_errors"] == 1
+        assert results["total_emails"] == 4
+        assert isinstance(results["errors"]["b"][0], ConnectionError)
+
+    def test_parallel_private_state_and_rate_share(self, processor, mock_config):
+        """Workers get their own state and an equal share of the rate limit"""
+        seen = {}
+
+        def single(account, state=None, rate_limiter=None, **kwargs):
+            seen[account.account_id] = (state, rate_limiter)
+            state.increment("emails_processed", 2)
+            return fake_results(account, 2)
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            processor.process_all_accounts(parallel=True)
+
+        states = {id(state) for state, _ in seen.values()}
+        assert len(states) == 3
+        assert all(limiter.max_requests == 13 for _, limiter in seen.values())
+        # Worker counters are folded into the global state
+        assert processor.state.get("emails_processed") == 6
+
+    def test_parallel_shares_processed_ids_and_entities(self, processor, mock_config):
+        """Workers see earlier processed IDs and their own are merged back"""
+        processor.state.mark_processed("msg-old")
+        processor.state.cache_entity("sender:old", {"name": "Old"})
+        seen = {}
+
+        def single(account, state=None, **kwargs):
+            seen[account.account_id] = state.is_processed("msg-old")
+            state.mark_processed(f"msg-{account.account_id}")
+            state.cache_entity(f"sender:{account.account_id}", {"name": account.account_id})
+            return fake_results(account, 1)
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            processor.process_all_accounts(parallel=True)
+
+        assert seen == {"a": True, "b": True, "c": True}
+        assert processor.state.get_processed_ids() == {"msg-old", "msg-a", "msg-b", "msg-c"}
+        assert processor.state.get_cached_entity("sender:b") == {"name": "b"}
+        assert processor.state.get_cached_entity("sender:old") == {"name": "Old"}
+
+    def test_parallel_respects_max_workers(self, processor, mock_config):
+        """max_workers caps concurrency and sizes the rate share"""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        shares = []
+
+        def single(account, rate_limiter=None, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                shares.append(rate_limiter.max_requests)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return fake_results(account, 1)
+
+        with patch.object(processor, "_process_single_account", side_effect=single):
+            processor.process_all_accounts(parallel=True, max_workers=2)
+
+        assert peak <= 2
+        assert shares == [20, 20, 20]
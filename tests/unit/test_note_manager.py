@@ -12,10 +12,12 @@ Coverage:
 
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from src.core.events import Entity
 from src.passepartout.note_manager import NoteManager
+from src.passepartout.vector_store import VectorStore
 
 
 class TestNoteManagerInit:
@@ -291,7 +293,7 @@ class TestSearchNotes:
         embedder = Mock()
 
         # Mock search to return doc IDs
-        def mock_search(query, top_k, filter_fn=None):
+        def mock_search(query, top_k, filter_fn=None, metadata_filter=None):
             # Return mock results based on query
             if "python" in query.lower():
                 return [
@@ -330,8 +332,9 @@ class TestSearchNotes:
             tags=["python"]
         )
 
-        # Should call with filter_fn
-        manager_with_notes.vector_store.search.assert_called()
+        # Tags are passed as a pre-filter
+        metadata_filter = manager_with_notes.vector_store.search.call_args.kwargs["metadata_filter"]
+        assert metadata_filter.match == {"tags": ["python"]}
 
 
 class TestGetNotesbyEntity:
@@ -688,3 +691,111 @@ class TestTrashFunctionality:
         summary_ids = [s["note_id"] for s in summaries]
         assert note1_id in summary_ids
         assert note2_id not in summary_ids
+
+
+class TestIncrementalIndexSync:
+    """Test incremental vector index sync"""
+
+    @pytest.fixture
+    def embedder(self):
+        def embed(text):
+            rng = np.random.default_rng(abs(hash(text)) % (2**32))
+            return rng.random(384).astype(np.float32)
+
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedder.get_dimension.return_value = 384
+        embedder.embedded_texts = []
+
+        def embed_text(text, normalize=False):
+            embedder.embedded_texts.append(text)
+            return embed(text)
+
+        def embed_batch(texts, normalize=False):
+            embedder.embedded_texts.extend(texts)
+            return np.stack([embed(t) for t in texts])
+
+        embedder.embed_text.side_effect = embed_text
+        embedder.embed_batch.side_effect = embed_batch
+        return embedder
+
+    @pytest.fixture
+    def notes_dir(self, tmp_path):
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        for i in range(3):
+            (notes_dir / f"note-{i}.md").write_text(
+                f"---\ntitle: Note {i}\ntags: [t{i}]\n---\n\nContent {i}\n"
+            )
+        return notes_dir
+
+    def _manager(self, notes_dir, embedder):
+        return NoteManager(
+            notes_dir=notes_dir,
+            vector_store=VectorStore(dimension=384, embedder=embedder),
+            embedder=embedder,
+            auto_index=True,
+            git_enabled=False,
+        )
+
+    def test_restart_reembeds_nothing_when_unchanged(self, notes_dir, embedder):
+        """Test a restart on an unchanged vault does not embed anything"""
+        self._manager(notes_dir, embedder)
+        assert len(embedder.embedded_texts) == 3
+
+        embedder.embedded_texts.clear()
+        manager = self._manager(notes_dir, embedder)
+
+        assert embedder.embedded_texts == []
+        assert manager.vector_store.get_stats()["active_docs"] == 3
+
+    def test_sync_embeds_only_changed_notes(self, notes_dir, embedder):
+        """Test added, edited and deleted files are reconciled"""
+        manager = self._manager(notes_dir, embedder)
+        embedder.embedded_texts.clear()
+
+        (notes_dir / "note-0.md").write_text(
+            "---\ntitle: Note 0\ntags: [t0]\n---\n\nEdited content\n"
+        )
+        (notes_dir / "note-1.md").unlink()
+        (notes_dir / "note-3.md").write_text("---\ntitle: Note 3\n---\n\nNew note\n")
+        # Tag-only change: metadata refreshed without re-embedding
+        (notes_dir / "note-2.md").write_text(
+            "---\ntitle: Note 2\ntags: [changed]\n---\n\nContent 2\n"
+        )
+
+        stats = manager.sync_index()
+
+        assert stats == {"added": 1, "updated": 1, "removed": 1, "unchanged": 1}
+        assert sorted(embedder.embedded_texts) == [
+            "Note 0\n\nEdited content",
+            "Note 3\n\nNew note",
+        ]
+        assert manager.vector_store.get_document("note-1") is None
+        assert manager.vector_store.get_document("note-2")["metadata"]["tags"] == ["changed"]
+
+    def test_crash_before_save_keeps_index(self, notes_dir, embedder):
+        """Test notes created after the last snapshot survive a crash"""
+        manager = self._manager(notes_dir, embedder)
+        note_id = manager.create_note("Fresh", "Written just before the crash")
+        # No _save_index() - simulate crash
+
+        embedder.embedded_texts.clear()
+        restarted = self._manager(notes_dir, embedder)
+
+        assert embedder.embedded_texts == []
+        assert restarted.vector_store.get_document(note_id) is not None
+
+
+    def test_search_notes_prefilters_on_folder_and_tags(self, notes_dir, embedder):
+        """Test structured filters restrict results before scoring"""
+        manager = self._manager(notes_dir, embedder)
+        manager.create_note("Work note", "Quarterly plan", subfolder="Work")
+        budget_id = manager.create_note("Other work note", "Budget", tags=["t1"], subfolder="Work")
+
+        # note-1 also has tag t1 but lives at the root
+        results = manager.search_notes("plan", top_k=10, folder="Work", tags=["t1"])
+        assert [note.note_id for note in results] == [budget_id]
+
+        results = manager.search_notes("plan", top_k=10, folder="Work")
+        assert len(results) == 2
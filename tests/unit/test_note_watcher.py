@@ -0,0 +1,192 @@
+"""
+Tests for the notes filesystem watcher
+
+Coverage:
+- NoteManager.sync_files: external creates, edits, moves and deletes,
+  of notes and of whole folders
+- No events for writes made through NoteManager
+- NoteWatcher change feed and NoteMetadataStore sync
+- Polling backend end to end
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.passepartout.note_manager import NoteManager
+from src.passepartout.note_metadata import NoteMetadataStore
+from src.passepartout.note_watcher import NoteChange, NoteWatcher
+from src.passepartout.vector_store import VectorStore
+
+DIMENSION = 8
+
+NOTE = "---\ntitle: {title}\n---\n\n{content}\n"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    embedder = Mock()
+    embedder.model_name = "mock"
+    embedder.get_dimension.return_value = DIMENSION
+    embedder.embed_text.side_effect = lambda text, normalize=False: np.ones(
+        DIMENSION, dtype=np.float32
+    )
+    embedder.embed_batch.side_effect = lambda texts, normalize=False: np.ones(
+        (len(texts), DIMENSION), dtype=np.float32
+    )
+    return NoteManager(
+        notes_dir=tmp_path / "notes",
+        vector_store=VectorStore(dimension=DIMENSION, embedder=embedder),
+        embedder=embedder,
+        auto_index=True,
+        git_enabled=False,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return NoteMetadataStore(tmp_path / "meta.db")
+
+
+def _write(path, title, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(NOTE.format(title=title, content=content), encoding="utf-8")
+
+
+class TestSyncFiles:
+    """Test NoteManager.sync_files"""
+
+    def test_external_create_edit_delete(self, manager):
+        path = manager.notes_dir / "externe.md"
+
+        _write(path, "Externe", "Écrit dans Obsidian")
+        assert manager.sync_files([path]) == {"externe": "created"}
+        assert manager.vector_store.get_document("externe") is not None
+
+        _write(path, "Externe", "Modifié dans Obsidian, plus long")
+        assert manager.sync_files([path]) == {"externe": "modified"}
+        assert "plus long" in manager.get_note("externe").content
+
+        path.unlink()
+        assert manager.sync_files([path]) == {"externe": "deleted"}
+        assert manager.vector_store.get_document("externe") is None
+        assert manager.get_note("externe") is None
+
+    def test_own_writes_are_not_reported(self, manager):
+        note_id = manager.create_note("Interne", "Écrit par Scapin")
+        path = manager.notes_dir / manager.get_relative_path(note_id)
+
+        assert manager.sync_files([path]) == {}
+
+    def test_move_is_a_modification(self, manager):
+        path = manager.notes_dir / "deplacee.md"
+        _write(path, "Déplacée", "Contenu")
+        manager.sync_files([path])
+
+        target = manager.notes_dir / "Projets" / "deplacee.md"
+        target.parent.mkdir()
+        path.rename(target)
+
+        assert manager.sync_files([path, target]) == {"deplacee": "modified"}
+        assert manager.get_relative_path("deplacee") == "Projets/deplacee.md"
+
+    def test_folder_paths_cover_their_notes(self, manager):
+        _write(manager.notes_dir / "Projets" / "alpha.md", "Alpha", "Contenu")
+        _write(manager.notes_dir / "Projets" / "Sous" / "beta.md", "Beta", "Contenu")
+        assert manager.sync_files([manager.notes_dir / "Projets"]) == {
+            "alpha": "created",
+            "beta": "created",
+        }
+
+        outside = manager.notes_dir.parent / "Projets"
+        (manager.notes_dir / "Projets").rename(outside)
+
+        assert manager.sync_files([manager.notes_dir / "Projets"]) == {
+            "alpha": "deleted",
+            "beta": "deleted",
+        }
+
+    def test_unknown_paths_are_ignored(self, manager):
+        assert manager.sync_files([manager.notes_dir / "absente.md"]) == {}
+        assert manager.sync_files([manager.notes_dir / "image.png"]) == {}
+
+
+class TestNoteWatcher:
+    """Test NoteWatcher change feed"""
+
+    def test_process_paths_publishes_changes(self, manager, store):
+        watcher = NoteWatcher(manager, metadata_store=store)
+        received: list[NoteChange] = []
+        watcher.subscribe(received.extend)
+        path = manager.notes_dir / "externe.md"
+
+        _write(path, "Externe", "Contenu")
+        changes = watcher.process_paths([path])
+
+        assert [(c.note_id, c.kind, c.path) for c in changes] == [
+            ("externe", "created", "externe.md")
+        ]
+        assert received == changes
+        assert store.get("externe") is not None
+
+        path.unlink()
+        watcher.process_paths([path])
+        assert received[-1].kind == "deleted"
+        assert store.get("externe") is None
+
+    def test_folder_move_updates_its_notes(self, manager):
+        """Native backends report a moved folder, not the notes inside it"""
+        watcher = NoteWatcher(manager)
+        _write(manager.notes_dir / "Projets" / "alpha.md", "Alpha", "Contenu")
+        _write(manager.notes_dir / "Projets" / "Sous" / "beta.md", "Beta", "Contenu")
+        watcher.process_paths([manager.notes_dir / "Projets"])
+
+        (manager.notes_dir / "Projets").rename(manager.notes_dir / "Archives")
+        changes = watcher.process_paths(
+            [manager.notes_dir / "Projets", manager.notes_dir / "Archives"]
+        )
+
+        assert sorted((c.note_id, c.kind, c.path) for c in changes) == [
+            ("alpha", "modified", "Archives/alpha.md"),
+            ("beta", "modified", "Archives/Sous/beta.md"),
+        ]
+        assert manager.get_note("beta") is not None
+
+    def test_failing_subscriber_does_not_stop_feed(self, manager):
+        watcher = NoteWatcher(manager)
+        received: list[NoteChange] = []
+        watcher.subscribe(Mock(side_effect=RuntimeError("boom")))
+        watcher.subscribe(received.extend)
+
+        _write(manager.notes_dir / "externe.md", "Externe", "Contenu")
+        watcher.process_paths(["externe.md"])
+
+        assert [c.note_id for c in received] == ["externe"]
+        assert watcher.get_stats()["errors"] == 1
+
+    def test_polling_backend(self, manager):
+        watcher = NoteWatcher(
+            manager, debounce_seconds=0.05, poll_interval_seconds=0.05, use_native=False
+        )
+        done = threading.Event()
+        received: list[NoteChange] = []
+
+        def on_changes(changes):
+            received.extend(changes)
+            done.set()
+
+        watcher.subscribe(on_changes)
+        watcher.start()
+        try:
+            time.sleep(0.1)  # Let the first snapshot be taken
+            _write(manager.notes_dir / "Projets" / "sonde.md", "Sonde", "Contenu")
+            assert done.wait(5.0)
+        finally:
+            watcher.stop()
+
+        assert [(c.note_id, c.kind) for c in received] == [("sonde", "created")]
+        assert watcher.get_stats()["backend"] == "polling"
+        assert not watcher.is_running
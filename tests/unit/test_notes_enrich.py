@@ -213,10 +213,10 @@ class TestEnrichNote:
         enrichment_result = MockEnrichmentResult()
 
         mock_note_manager.get_note.return_value = note
-        # First search for Alice, then Bob
-        mock_note_manager.search_notes.side_effect = [
-            [(linked_note, 0.9)],  # Alice found
-            [],  # Bob not found
+        # First resolve Alice, then Bob
+        mock_note_manager.resolve_wikilink.side_effect = [
+            linked_note,  # Alice found
+            None,  # Bob not found
         ]
 
         mock_store = MagicMock()
@@ -242,8 +242,9 @@ class TestEnrichNote:
             )
 
         assert result is not None
-        # Verify search was called for each wikilink
-        assert mock_note_manager.search_notes.call_count == 2
+        # Verify each wikilink was resolved through the link graph
+        assert mock_note_manager.resolve_wikilink.call_count == 2
+        mock_note_manager.search_notes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_enrich_web_search_requires_metadata_flag(
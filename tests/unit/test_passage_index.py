@@ -0,0 +1,265 @@
+"""
+Tests for the passage-level note index
+
+Coverage:
+- Heading/paragraph splitting with overlap
+- Query-specific snippets
+- Passage search aggregated per note
+- NoteManager integration (search recall, snippets, lifecycle, persistence)
+"""
+
+import re
+import zlib
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.passepartout.metadata_filter import MetadataFilter
+from src.passepartout.note_manager import PASSAGE_INDEX_DIRNAME, NoteManager
+from src.passepartout.passage_index import PassageIndex, extract_snippet, split_passages
+from src.passepartout.vector_store import VectorStore
+
+DIMENSION = 384
+
+
+@pytest.fixture
+def embedder():
+    """Bag-of-words embedder: texts sharing words are close in L2"""
+
+    def embed(text):
+        vector = np.zeros(DIMENSION, dtype=np.float32)
+        for word in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(word.encode()) % DIMENSION] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    embedder = Mock()
+    embedder.model_name = "mock-bow"
+    embedder.get_dimension.return_value = DIMENSION
+    embedder.embedded_texts = []
+
+    def embed_text(text, normalize=False):
+        embedder.embedded_texts.append(text)
+        return embed(text)
+
+    def embed_batch(texts, normalize=False):
+        embedder.embedded_texts.extend(texts)
+        return np.stack([embed(t) for t in texts])
+
+    embedder.embed_text.side_effect = embed_text
+    embedder.embed_batch.side_effect = embed_batch
+    return embedder
+
+
+def filler(topic: str, paragraphs: int) -> str:
+    """Paragraphs of unrelated text"""
+    return "\n\n".join(
+        f"Paragraph {i} about {topic} with routine details and ordinary remarks "
+        f"that repeat the same general information for padding purposes."
+        for i in range(paragraphs)
+    )
+
+
+LONG_PERSON_NOTE = (
+    "Marc est Tech Lead chez Acme.\n\n"
+    + filler("meetings", 12)
+    + "\n\n## Famille\n\n"
+    + filler("weekends", 4)
+    + "\n\nSa fille Léa joue du violoncelle au conservatoire."
+)
+
+
+class TestSplitPassages:
+    """Test split_passages"""
+
+    def test_short_content_single_passage(self):
+        passages = split_passages("One paragraph.\n\nAnother one.")
+        assert len(passages) == 1
+        assert passages[0].heading == ""
+        assert passages[0].text == "One paragraph.\n\nAnother one."
+
+    def test_heading_path(self):
+        content = "Intro\n\n# Projet\n\nScope\n\n## Budget\n\n40k\n\n# Équipe\n\nMarc"
+        passages = split_passages(content)
+        assert [(p.heading, p.text) for p in passages] == [
+            ("", "Intro"),
+            ("Projet", "Scope"),
+            ("Projet > Budget", "40k"),
+            ("Équipe", "Marc"),
+        ]
+
+    def test_headings_inside_code_fences_ignored(self):
+        content = "Before\n\n```\n# not a heading\n```\n\nAfter"
+        passages = split_passages(content)
+        assert len(passages) == 1
+        assert "# not a heading" in passages[0].text
+
+    def test_packing_respects_max_chars_and_overlaps(self):
+        content = "\n\n".join(f"Sentence number {i} is here." for i in range(40))
+        passages = split_passages(content, max_chars=200, overlap_chars=40)
+
+        assert len(passages) > 1
+        for previous, current in zip(passages, passages[1:]):
+            # Each passage restarts with the tail of the previous one
+            assert current.text[:20] in previous.text[-40:]
+        # Every paragraph is in some passage
+        joined = " ".join(p.text for p in passages)
+        assert all(f"Sentence number {i} " in joined for i in range(40))
+
+    def test_long_paragraph_is_split(self):
+        content = " ".join(f"Word{i}." for i in range(400))
+        passages = split_passages(content, max_chars=300, overlap_chars=0)
+        assert len(passages) > 1
+        assert all(len(p.text) <= 300 for p in passages)
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            split_passages("x", max_chars=0)
+        with pytest.raises(ValueError):
+            split_passages("x", max_chars=100, overlap_chars=100)
+
+
+class TestExtractSnippet:
+    """Test extract_snippet"""
+
+    def test_short_text_unchanged(self):
+        assert extract_snippet("Short text.", "anything") == "Short text."
+
+    def test_starts_at_most_relevant_sentence(self):
+        text = filler("meetings", 3) + " Budget validé à 40k pour le projet Alpha. " + filler(
+            "travel", 3
+        )
+        snippet = extract_snippet(text, "budget projet Alpha", max_chars=120)
+        assert snippet.startswith("Budget validé à 40k")
+        assert len(snippet) <= 120
+
+
+class TestPassageIndex:
+    """Test PassageIndex"""
+
+    @pytest.fixture
+    def index(self, embedder):
+        return PassageIndex(dimension=DIMENSION, embedder=embedder)
+
+    def test_short_notes_get_no_passages(self, index):
+        assert index.index_note("short", "Title", "Just a line") == 0
+        assert not index.has_passages("short")
+
+    def test_search_returns_best_passage_per_note(self, index):
+        index.index_note("marc", "Marc Dupont", LONG_PERSON_NOTE, {"type": "personne"})
+        index.index_note("other", "Autre", filler("violins", 15), {"type": "concept"})
+
+        matches = index.search("fille Léa violoncelle conservatoire", top_k=5)
+
+        assert [m.note_id for m in matches][0] == "marc"
+        assert len({m.note_id for m in matches}) == len(matches)
+        assert "violoncelle" in matches[0].text
+        assert matches[0].heading == "Famille"
+
+    def test_metadata_filter_and_best_passage(self, index):
+        index.index_note("marc", "Marc Dupont", LONG_PERSON_NOTE, {"type": "personne"})
+        index.index_note("other", "Autre", LONG_PERSON_NOTE, {"type": "concept"})
+
+        matches = index.search(
+            "violoncelle", top_k=5, metadata_filter=MetadataFilter(match={"type": "concept"})
+        )
+        assert [m.note_id for m in matches] == ["other"]
+        assert index.best_passage("marc", "violoncelle").note_id == "marc"
+
+    def test_reindex_replaces_and_remove_drops(self, index):
+        index.index_note("marc", "Marc", LONG_PERSON_NOTE)
+        first = index.get_stats()["passages"]
+        index.index_note("marc", "Marc", LONG_PERSON_NOTE + "\n\n" + filler("extra", 10))
+        assert index.get_stats()["passages"] > first
+        assert index.get_stats()["notes"] == 1
+
+        assert index.remove_note("marc") > 0
+        assert index.search("violoncelle") == []
+
+    def test_save_load_restores_mapping(self, index, embedder, tmp_path):
+        index.index_note("marc", "Marc", LONG_PERSON_NOTE)
+        index.save(tmp_path / "passages")
+
+        loaded = PassageIndex(dimension=DIMENSION, embedder=embedder)
+        loaded.load(tmp_path / "passages")
+
+        assert loaded.get_stats() == index.get_stats()
+        assert loaded.best_passage("marc", "violoncelle") is not None
+
+
+class TestNoteManagerPassages:
+    """Test NoteManager passage integration"""
+
+    def _manager(self, notes_dir, embedder, **kwargs):
+        return NoteManager(
+            notes_dir=notes_dir,
+            vector_store=VectorStore(dimension=DIMENSION, embedder=embedder),
+            embedder=embedder,
+            auto_index=True,
+            git_enabled=False,
+            **kwargs,
+        )
+
+    def test_search_finds_fact_deep_in_long_note(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        marc_id = manager.create_note("Marc Dupont", LONG_PERSON_NOTE)
+        for i in range(5):
+            manager.create_note(f"Note {i}", f"Conservatoire schedule item {i}")
+
+        results = manager.search_notes("fille Léa violoncelle", top_k=1)
+
+        assert [note.note_id for note in results] == [marc_id]
+        snippet = manager.get_note_snippet(marc_id, "fille Léa violoncelle")
+        assert "violoncelle" in snippet
+        assert len(snippet) <= 200
+
+    def test_snippet_of_short_note_is_its_text(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        note_id = manager.create_note("Short", "Just one line")
+        assert manager.get_note_snippet(note_id, "line") == "Just one line"
+        assert manager.get_note_snippet("missing", "line") == ""
+
+    def test_delete_removes_passages(self, tmp_path, embedder):
+        manager = self._manager(tmp_path / "notes", embedder)
+        note_id = manager.create_note("Marc Dupont", LONG_PERSON_NOTE)
+        assert manager.passage_index.has_passages(note_id)
+
+        manager.delete_note(note_id)
+        assert not manager.passage_index.has_passages(note_id)
+
+    def test_restart_loads_passages_without_reembedding(self, tmp_path, embedder):
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        (notes_dir / "marc.md").write_text(f"---\ntitle: Marc\n---\n\n{LONG_PERSON_NOTE}\n")
+        first = self._manager(notes_dir, embedder)
+        passages = first.passage_index.get_stats()["passages"]
+        assert passages > 1
+
+        embedder.embedded_texts.clear()
+        restarted = self._manager(notes_dir, embedder)
+
+        assert embedder.embedded_texts == []
+        assert restarted.passage_index.get_stats()["passages"] == passages
+
+    def test_index_without_passages_is_backfilled(self, tmp_path, embedder):
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        (notes_dir / "marc.md").write_text(f"---\ntitle: Marc\n---\n\n{LONG_PERSON_NOTE}\n")
+        self._manager(notes_dir, embedder, index_passages=False)
+        assert not (notes_dir / ".scapin_index" / PASSAGE_INDEX_DIRNAME).exists()
+
+        upgraded = self._manager(notes_dir, embedder)
+
+        assert upgraded.passage_index.has_passages("marc")
+        assert (notes_dir / ".scapin_index" / PASSAGE_INDEX_DIRNAME).exists()
+
+    def test_mock_vector_store_disables_passages(self, tmp_path):
+        manager = NoteManager(
+            notes_dir=tmp_path / "notes",
+            vector_store=Mock(),
+            embedder=Mock(),
+            auto_index=False,
+            git_enabled=False,
+        )
+        assert manager.passage_index is None
@@ -6,6 +6,7 @@ Tests the JSON-based queue storage system for manual review.
 
 import json
 import shutil
+import sqlite3
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +14,7 @@ from pathlib import Path
 import pytest
 
 from src.core.schemas import EmailAction, EmailAnalysis, EmailCategory, EmailMetadata
+from src.integrations.storage.queue_index import QUEUE_INDEX_FILENAME
 from src.integrations.storage.queue_storage import QueueStorage, get_queue_storage
 
 
@@ -103,13 +105,12 @@ class TestQueueStorageInit:
         assert queue_dir.exists()
         assert queue_dir.is_dir()
 
-    def test_init_default_directory(self):
+    def test_init_default_directory(self, isolated_stores):
         """Test initialization with default directory (absolute path)"""
-        from src.utils import get_data_dir
         storage = QueueStorage()
 
         # Should use absolute path from get_data_dir()
-        assert storage.queue_dir == get_data_dir() / "queue"
+        assert storage.queue_dir == isolated_stores / "queue"
         assert storage.queue_dir.is_absolute()
 
 
@@ -657,3 +658,208 @@ class TestQueueStorageSingleton:
 
         # All instances should be the same
         assert all(inst is instances[0] for inst in instances)
+
+
+class TestQueueIndex:
+    """Test the SQLite secondary index behind QueueStorage queries"""
+
+    @staticmethod
+    def _write_legacy_file(queue_dir: Path, item_id: str, queued_at: str, **fields) -> None:
+        item = {
+            "id": item_id,
+            "account_id": "personal",
+            "queued_at": queued_at,
+            "status": "pending",
+            "metadata": {"subject": "Legacy", "message_id": f"<{item_id}@example.com>"},
+            "analysis": {"action": "archive", "confidence": 70},
+            **fields,
+        }
+        with open(queue_dir / f"{item_id}.json", "w", encoding="utf-8") as f:
+            json.dump(item, f)
+
+    def test_existing_files_migrated_on_init(self, temp_queue_dir):
+        """Files from the per-file layout are indexed on first start"""
+        self._write_legacy_file(temp_queue_dir, "a", "2025-01-01T10:00:00+00:00")
+        self._write_legacy_file(temp_queue_dir, "b", "2025-01-02T10:00:00+00:00")
+
+        storage = QueueStorage(queue_dir=temp_queue_dir)
+
+        assert [i["id"] for i in storage.load_queue()] == ["a", "b"]
+        assert storage.get_queue_size() == 2
+        assert storage.is_email_known("<B@example.com>")
+        assert storage.get_stats()["by_state"] == {"awaiting_review": 2}
+
+    def test_reconcile_picks_up_external_changes(self, temp_queue_dir):
+        """Restart re-indexes changed files and drops deleted ones"""
+        self._write_legacy_file(temp_queue_dir, "a", "2025-01-01T10:00:00+00:00")
+        self._write_legacy_file(temp_queue_dir, "b", "2025-01-02T10:00:00+00:00")
+        QueueStorage(queue_dir=temp_queue_dir)
+
+        (temp_queue_dir / "a.json").unlink()
+        self._write_legacy_file(
+            temp_queue_dir, "b", "2025-01-02T10:00:00+00:00", status="approved"
+        )
+        storage = QueueStorage(queue_dir=temp_queue_dir)
+
+        assert storage.get_queue_size(status="pending") == 0
+        assert [i["id"] for i in storage.load_queue(status="approved")] == ["b"]
+
+    def test_writes_keep_index_in_sync(self, queue_storage, sample_analysis):
+        """save/update/remove are reflected by indexed queries"""
+        item_id = queue_storage.save_item(
+            create_metadata_with_unique_id(1), sample_analysis, "Preview", account_id="work"
+        )
+        assert queue_storage.count_items(state="awaiting_review", account_id="work") == 1
+
+        queue_storage.update_item(item_id, {"status": "approved", "state": "processed"})
+        assert queue_storage.count_items(state="awaiting_review") == 0
+        assert queue_storage.count_items(tab="history") == 1
+
+        queue_storage.remove_item(item_id)
+        assert queue_storage.get_stats()["total"] == 0
+
+    def test_list_page_cursor(self, queue_storage, sample_analysis):
+        """Pages follow queued_at order without gaps or duplicates"""
+        ids = [
+            queue_storage.save_item(
+                create_metadata_with_unique_id(i), sample_analysis, "Preview"
+            )
+            for i in range(7)
+        ]
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            items, cursor = queue_storage.list_page(tab="to_process", limit=3, cursor=cursor)
+            seen.extend(item["id"] for item in items)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert sorted(seen) == sorted(ids)
+        assert len(seen) == len(set(seen))
+
+    def test_list_page_invalid_arguments(self, queue_storage):
+        """Bad limit or cursor raises ValueError"""
+        with pytest.raises(ValueError, match="limit"):
+            queue_storage.list_page(limit=0)
+        with pytest.raises(ValueError, match="cursor"):
+            queue_storage.list_page(cursor="not-a-cursor")
+
+    def test_list_page_sort_orders(self, temp_queue_dir):
+        """History pages are newest-reviewed first, errors newest-failed first"""
+        for item_id, queued_at, resolved_at in (
+            ("old-review", "2025-01-01T10:00:00+00:00", "2025-01-05T10:00:00+00:00"),
+            ("new-review", "2025-01-02T10:00:00+00:00", "2025-01-09T10:00:00+00:00"),
+            ("mid-review", "2025-01-03T10:00:00+00:00", "2025-01-07T10:00:00+00:00"),
+        ):
+            self._write_legacy_file(
+                temp_queue_dir, item_id, queued_at, status="approved", state="processed",
+                resolution={"type": "manual_approved", "resolved_at": resolved_at},
+            )
+        for item_id, occurred_at in (
+            ("err-1", "2025-02-01T10:00:00+00:00"),
+            ("err-2", "2025-02-03T10:00:00+00:00"),
+        ):
+            self._write_legacy_file(
+                temp_queue_dir, item_id, "2025-01-01T09:00:00+00:00", state="error",
+                error={"type": "analysis_failed", "occurred_at": occurred_at},
+            )
+        storage = QueueStorage(queue_dir=temp_queue_dir)
+
+        first, cursor = storage.list_page(tab="history", limit=2)
+        rest, end = storage.list_page(tab="history", limit=2, cursor=cursor)
+        assert [i["id"] for i in first + rest] == ["new-review", "mid-review", "old-review"]
+        assert end is None
+
+        errors, _ = storage.list_page(state="error")
+        assert [i["id"] for i in errors] == ["err-2", "err-1"]
+
+        # Explicit sort and offset paging
+        oldest, _ = storage.list_page(tab="history", sort="queued", limit=1, offset=1)
+        assert [i["id"] for i in oldest] == ["new-review"]
+        assert storage.count_items(tab="history") == 3
+        with pytest.raises(ValueError, match="sort"):
+            storage.list_page(sort="subject")
+        # A cursor only continues the sort order it was issued for
+        with pytest.raises(ValueError, match="sort order"):
+            storage.list_page(tab="history", sort="queued", limit=2, cursor=cursor)
+
+    def test_list_changes(self, queue_storage, sample_analysis):
+        """Changes since a sequence number: new items in, moved/removed items out"""
+        moved, removed, kept = (
+            queue_storage.save_item(create_metadata_with_unique_id(i), sample_analysis, "Preview")
+            for i in range(3)
+        )
+        since = queue_storage.change_seq()
+        assert queue_storage.list_changes(since, tab="to_process").items == []
+
+        queue_storage.update_item(moved, {"status": "approved", "state": "processed"})
+        queue_storage.remove_item(removed)
+        added = queue_storage.save_item(
+            create_metadata_with_unique_id(9), sample_analysis, "Preview"
+        )
+
+        changes = queue_storage.list_changes(since, tab="to_process")
+        assert [i["id"] for i in changes.items] == [added]
+        assert changes.removed_ids == [moved, removed]
+        assert kept not in changes.removed_ids
+        assert changes.seq == queue_storage.change_seq()
+
+        history = queue_storage.list_changes(since, tab="history", limit=1)
+        assert [i["id"] for i in history.items] == [moved]
+        assert history.has_more
+
+    def test_index_rebuilt_after_schema_change(self, temp_queue_dir):
+        """An index from an older schema version is rebuilt from the files"""
+        self._write_legacy_file(temp_queue_dir, "a", "2025-01-01T10:00:00+00:00")
+        QueueStorage(queue_dir=temp_queue_dir)._index.close()
+        conn = sqlite3.connect(temp_queue_dir / QUEUE_INDEX_FILENAME)
+        conn.execute("PRAGMA user_version = 1")
+        conn.close()
+
+        storage = QueueStorage(queue_dir=temp_queue_dir)
+
+        assert [i["id"] for i in storage.list_page(tab="to_process")[0]] == ["a"]
+
+    def test_snooze_queries(self, queue_storage, sample_analysis):
+        """Snoozed items are listed by expiry and expired ones detected"""
+        first = queue_storage.save_item(
+            create_metadata_with_unique_id(1), sample_analysis, "Preview"
+        )
+        second = queue_storage.save_item(
+            create_metadata_with_unique_id(2), sample_analysis, "Preview"
+        )
+        queue_storage.set_snooze(second, datetime(2020, 1, 1, tzinfo=timezone.utc))
+        queue_storage.set_snooze(first, datetime(2099, 1, 1, tzinfo=timezone.utc))
+
+        assert [i["id"] for i in queue_storage.get_snoozed_items()] == [second, first]
+        assert [i["id"] for i in queue_storage.get_expired_snoozes()] == [second]
+        assert queue_storage.load_queue_by_state(tab="to_process") == []
+
+    def test_clear_queue_uses_index(self, queue_storage, sample_analysis):
+        """clear_queue deletes matching files and index rows"""
+        for i in range(3):
+            queue_storage.save_item(
+                create_metadata_with_unique_id(i), sample_analysis, "Preview", account_id="a"
+            )
+        queue_storage.save_item(
+            create_metadata_with_unique_id(9), sample_analysis, "Preview", account_id="b"
+        )
+
+        assert queue_storage.clear_queue(account_id="a") == 3
+        assert queue_storage.get_stats()["by_account"] == {"b": 1}
+        assert len(list(queue_storage.queue_dir.glob("[!.]*.json"))) == 1
+
+    def test_stats_cache_sees_other_instances(self, temp_queue_dir, sample_analysis):
+        """Cached stats are invalidated by writes from another process/instance"""
+        reader = QueueStorage(queue_dir=temp_queue_dir)
+        writer = QueueStorage(queue_dir=temp_queue_dir)
+        assert reader.get_stats()["total"] == 0
+
+        writer.save_item(create_metadata_with_unique_id(1), sample_analysis, "Preview")
+
+        assert reader.get_stats()["total"] == 1
+        assert reader.get_stats()["by_tab"] == {"to_process": 1}
@@ -24,6 +24,7 @@ def mock_note_manager():
     """Create a mock NoteManager"""
     manager = MagicMock()
     manager.notes_dir = "/test/notes"
+    manager.resolve_wikilink.return_value = None
     return manager
 
 
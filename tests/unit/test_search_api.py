@@ -30,8 +30,8 @@ from src.frontin.api.models.search import (
 from src.frontin.api.services.search_service import (
     SearchService,
     _highlight_matches,
-    _text_match_score,
 )
+from src.integrations.storage.archive_index import ArchiveIndex, ArchiveItem
 
 # =============================================================================
 # Model Tests
@@ -206,39 +206,6 @@ class TestHelperFunctions:
         result = _highlight_matches(text, "test")
         assert len(result) <= 210  # 200 + "..."
 
-    def test_text_match_score_exact(self):
-        """Test text match score with exact match"""
-        score = _text_match_score("Meeting with John tomorrow", "meeting")
-        assert score > 0
-
-    def test_text_match_score_phrase(self):
-        """Test text match score with phrase"""
-        score = _text_match_score("Meeting with John tomorrow", "meeting with john")
-        assert score > 0.5  # Multiple words matching + phrase bonus
-
-    def test_text_match_score_no_match(self):
-        """Test text match score with no match"""
-        score = _text_match_score("Meeting with John", "zebra")
-        assert score == 0.0
-
-    def test_text_match_score_empty_text(self):
-        """Test text match score with empty text"""
-        score = _text_match_score("", "test")
-        assert score == 0.0
-
-    def test_text_match_score_empty_query(self):
-        """Test text match score with empty query"""
-        score = _text_match_score("Some text", "")
-        assert score == 0.0
-
-    def test_text_match_score_start_bonus(self):
-        """Test text match score with match at beginning"""
-        # Use longer text so the bonus makes a difference
-        score_start = _text_match_score("meeting with team tomorrow", "meeting")
-        score_middle = _text_match_score("tomorrow we have a meeting", "meeting")
-        # Both should have high scores, but start should be slightly higher due to bonus
-        assert score_start >= score_middle  # Start bonus (or equal if both match well)
-
 
 # =============================================================================
 # Service Tests
@@ -366,6 +333,7 @@ class TestSearchService:
         from src.integrations.storage.queue_storage import QueueStorage
 
         service._queue_storage = QueueStorage(queue_dir=temp_queue_dir)
+        service._archive_index = ArchiveIndex(temp_queue_dir.parent / "archive.db")
 
         results = await service._search_emails("meeting", 10, None, None)
 
@@ -379,6 +347,7 @@ class TestSearchService:
         from src.integrations.storage.queue_storage import QueueStorage
 
         service._queue_storage = QueueStorage(queue_dir=temp_queue_dir)
+        service._archive_index = ArchiveIndex(temp_queue_dir.parent / "archive.db")
 
         results = await service._search_emails("project", 10, None, None)
 
@@ -386,16 +355,76 @@ class TestSearchService:
         assert len(results) == 2
 
     @pytest.mark.asyncio
-    async def test_search_calendar_not_implemented(self, service):
-        """Test calendar search returns empty (not implemented)"""
+    async def test_search_emails_live_status_and_snippet(self, service, temp_queue_dir):
+        """Test email hits carry the live queue status and a highlighted excerpt"""
+        from src.integrations.storage.queue_storage import QueueStorage
+
+        service._queue_storage = QueueStorage(queue_dir=temp_queue_dir)
+        service._archive_index = ArchiveIndex(temp_queue_dir.parent / "archive.db")
+        service._get_archive_index()  # Backfill from the queue
+        service._queue_storage.update_item("item-2", {"status": "approved"})
+
+        results = await service._search_emails("quarterly", 10, None, None)
+
+        assert [r.id for r in results] == ["item-2"]
+        assert results[0].status == "approved"
+        assert "**quarterly**" in results[0].excerpt
+
+    @pytest.mark.asyncio
+    async def test_search_calendar_empty_archive(self, service, tmp_path):
+        """Test calendar search returns empty when nothing is archived"""
+        service._archive_index = ArchiveIndex(tmp_path / "archive.db")
         results = await service._search_calendar("test", 10, None, None)
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_search_teams_not_implemented(self, service):
-        """Test teams search returns empty (not implemented)"""
-        results = await service._search_teams("test", 10, None, None)
-        assert results == []
+    async def test_search_calendar_archived_events(self, service, tmp_path):
+        """Test calendar search reads archived events"""
+        service._archive_index = ArchiveIndex(tmp_path / "archive.db")
+        service._archive_index.add_item(
+            ArchiveItem(
+                source="calendar",
+                item_id="evt-1",
+                title="Comité de pilotage",
+                body="Revue budget Q1",
+                timestamp=datetime(2026, 1, 8, 14, 0, tzinfo=timezone.utc),
+                sender="Alice <alice@example.com>",
+                metadata={
+                    "event_id": "evt-1",
+                    "start": "2026-01-08T14:00:00+00:00",
+                    "end": "2026-01-08T15:00:00+00:00",
+                    "location": "Salle B",
+                },
+            )
+        )
+
+        results = await service._search_calendar("comite", 10, None, None)
+
+        assert len(results) == 1
+        assert results[0].id == "evt-1"
+        assert results[0].location == "Salle B"
+        assert results[0].end == datetime(2026, 1, 8, 15, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_search_teams_archived_messages(self, service, tmp_path):
+        """Test Teams search reads archived messages"""
+        service._archive_index = ArchiveIndex(tmp_path / "archive.db")
+        service._archive_index.add_item(
+            ArchiveItem(
+                source="teams",
+                item_id="msg-1",
+                title="Chat Projet Alpha",
+                body="Le déploiement est prévu jeudi",
+                timestamp=datetime(2026, 1, 6, 9, 0, tzinfo=timezone.utc),
+                sender="Bob <bob@example.com>",
+                metadata={"message_id": "msg-1", "chat_id": "chat-1", "sender_name": "Bob"},
+            )
+        )
+
+        assert await service._search_teams("test", 10, None, None) == []
+        results = await service._search_teams("deploiement", 10, None, None)
+
+        assert [(r.id, r.chat_id, r.sender) for r in results] == [("msg-1", "chat-1", "Bob")]
 
     @pytest.mark.asyncio
     async def test_global_search(self, service, temp_queue_dir):
@@ -403,6 +432,7 @@ class TestSearchService:
         from src.integrations.storage.queue_storage import QueueStorage
 
         service._queue_storage = QueueStorage(queue_dir=temp_queue_dir)
+        service._archive_index = ArchiveIndex(temp_queue_dir.parent / "archive.db")
 
         # Mock notes to return empty
         mock_manager = MagicMock()
@@ -0,0 +1,199 @@
+"""
+Tests for Sganarelle PatternStore indexing and journal persistence
+
+Coverage:
+- sender_domain and keywords conditions
+- Index lookups return the same matches as a full scan
+- Journal appends instead of snapshot rewrites, replay and compaction
+- Truncated journal lines are skipped
+"""
+
+import dataclasses
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.events.universal_event import EventType, now_utc
+from src.sganarelle import pattern_store as pattern_store_module
+from src.sganarelle.pattern_store import PatternStore, create_pattern_from_execution
+from src.sganarelle.types import Pattern, PatternType, sender_domain
+
+
+def _pattern(pattern_id, conditions, occurrences=10):
+    return Pattern(
+        pattern_id=pattern_id,
+        pattern_type=PatternType.CONTEXT_TRIGGER,
+        conditions=conditions,
+        suggested_actions=["archive"],
+        confidence=0.8,
+        success_rate=0.9,
+        occurrences=occurrences,
+        last_seen=now_utc(),
+        created_at=now_utc()
+    )
+
+
+@pytest.fixture
+def patterns():
+    return [
+        _pattern("by_domain", {"sender_domain": "Example.com"}),
+        _pattern("by_other_domain", {"sender_domain": "other.org"}),
+        _pattern("by_keywords", {"keywords": ["Test", "unit"]}),
+        _pattern("by_missing_keyword", {"keywords": ["test", "absent"]}),
+        _pattern("by_type", {"event_type": "information"}),
+        _pattern("by_other_type", {"event_type": "request"}),
+        _pattern("by_context", {"context": {"time_of_day": "morning"}}),
+        _pattern("unconditional", {}),
+    ]
+
+
+class TestPatternConditions:
+    """Test sender_domain and keywords conditions"""
+
+    def test_sender_domain(self):
+        assert sender_domain("tester@Example.com") == "example.com"
+        assert sender_domain("Jean Dupont <jean@mail.example.fr>") == "mail.example.fr"
+        assert sender_domain("Jean Dupont") == ""
+
+    def test_matches(self, simple_event, patterns):
+        matched = {p.pattern_id for p in patterns if p.matches(simple_event, {})}
+
+        assert matched == {"by_domain", "by_keywords", "by_type", "unconditional"}
+
+
+class TestPatternIndex:
+    """Test indexed find_matching_patterns"""
+
+    def test_same_matches_as_full_scan(self, simple_event, patterns):
+        store = PatternStore()
+        for pattern in patterns:
+            store.add_pattern(pattern)
+        context = {"time_of_day": "morning"}
+
+        found = {p.pattern_id for p in store.find_matching_patterns(simple_event, context)}
+
+        assert found == {p.pattern_id for p in patterns if p.matches(simple_event, context)}
+        assert "by_context" in found
+
+    def test_only_candidates_are_evaluated(self, simple_event, patterns, monkeypatch):
+        store = PatternStore()
+        for pattern in patterns:
+            store.add_pattern(pattern)
+        evaluated = []
+        original = Pattern.matches
+
+        def spy(pattern, event, context):
+            evaluated.append(pattern.pattern_id)
+            return original(pattern, event, context)
+
+        monkeypatch.setattr(Pattern, "matches", spy)
+        store.find_matching_patterns(simple_event, {})
+
+        assert "by_other_domain" not in evaluated
+        assert "by_other_type" not in evaluated
+        assert "by_missing_keyword" not in evaluated  # Indexed under "absent"
+        assert len(evaluated) < len(patterns)
+
+    def test_learned_patterns_indexed_by_event_type(self, simple_event, monkeypatch):
+        store = PatternStore(min_occurrences=1)
+        actions = [Mock(action_type="archive")]
+        for event_type in EventType:
+            event = dataclasses.replace(simple_event, event_type=event_type)
+            store.add_pattern(create_pattern_from_execution(event, actions, {}, success=True))
+        evaluated = []
+        original = Pattern.matches
+
+        def spy(pattern, event, context):
+            evaluated.append(pattern.conditions["event_type"])
+            return original(pattern, event, context)
+
+        monkeypatch.setattr(Pattern, "matches", spy)
+        found = store.find_matching_patterns(simple_event, {})
+
+        assert evaluated == [simple_event.event_type.value]
+        assert [p.conditions["event_type"] for p in found] == [simple_event.event_type.value]
+
+    def test_index_follows_prune_and_clear(self, simple_event):
+        store = PatternStore(max_age_days=30)
+        old = dataclasses.replace(
+            _pattern("old", {"event_type": "information"}),
+            last_seen=now_utc().replace(year=2000)
+        )
+        store.add_pattern(old)
+        store.add_pattern(_pattern("recent", {"event_type": "information"}))
+
+        assert store.prune_old_patterns() == 1
+        assert [p.pattern_id for p in store.find_matching_patterns(simple_event)] == ["recent"]
+
+        store.clear()
+        assert store.find_matching_patterns(simple_event) == []
+
+    def test_other_event_type(self, simple_event, patterns):
+        store = PatternStore()
+        for pattern in patterns:
+            store.add_pattern(pattern)
+        event = dataclasses.replace(
+            simple_event, event_type=EventType.REQUEST, from_person="x@other.org", keywords=[]
+        )
+
+        found = {p.pattern_id for p in store.find_matching_patterns(event)}
+
+        assert found == {"by_other_domain", "by_other_type", "unconditional"}
+
+
+class TestPatternJournal:
+    """Test append-only persistence"""
+
+    def test_updates_append_to_journal(self, tmp_path):
+        path = tmp_path / "patterns.json"
+        store = PatternStore(storage_path=path)
+        store.add_pattern(_pattern("a", {"event_type": "information"}))
+        for _ in range(3):
+            store.update_pattern("a", success=True)
+
+        journal = tmp_path / "patterns.log.jsonl"
+        assert not path.exists()
+        assert len(journal.read_text().splitlines()) == 4
+
+        reloaded = PatternStore(storage_path=path)
+        assert reloaded.get_pattern("a").occurrences == 13
+
+    def test_save_compacts_journal(self, tmp_path):
+        path = tmp_path / "patterns.json"
+        store = PatternStore(storage_path=path)
+        store.add_pattern(_pattern("a", {}))
+        store.add_pattern(_pattern("b", {}))
+        store.clear()
+        store.add_pattern(_pattern("c", {}))
+
+        store.save()
+
+        assert not (tmp_path / "patterns.log.jsonl").exists()
+        data = json.loads(path.read_text())
+        assert [p["pattern_id"] for p in data["patterns"]] == ["c"]
+        assert [p.pattern_id for p in PatternStore(storage_path=path).get_all_patterns()] == ["c"]
+
+    def test_automatic_compaction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pattern_store_module, "PATTERN_LOG_COMPACTION_MIN_ENTRIES", 5)
+        path = tmp_path / "patterns.json"
+        store = PatternStore(storage_path=path)
+        store.add_pattern(_pattern("a", {}))
+        for _ in range(5):
+            store.update_pattern("a", success=False)
+
+        assert path.exists()
+        assert not (tmp_path / "patterns.log.jsonl").exists()
+        assert PatternStore(storage_path=path).get_pattern("a").occurrences == 15
+
+    def test_truncated_last_line_is_skipped(self, tmp_path):
+        path = tmp_path / "patterns.json"
+        store = PatternStore(storage_path=path)
+        store.add_pattern(_pattern("a", {}))
+        journal = tmp_path / "patterns.log.jsonl"
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "pattern": {"pattern_id": "b"')
+
+        reloaded = PatternStore(storage_path=path)
+
+        assert [p.pattern_id for p in reloaded.get_all_patterns()] == ["a"]
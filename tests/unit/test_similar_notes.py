@@ -0,0 +1,161 @@
+"""
+Tests for "more like this" search and near-duplicate detection
+
+Coverage:
+- VectorStore.search_by_vector / search_by_id (no query embedding)
+- VectorStore.find_near_duplicates (blocked all-pairs similarity)
+- NoteManager wrappers and RetoucheReviewer merge candidates
+"""
+
+import re
+import zlib
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.passepartout.metadata_filter import MetadataFilter
+from src.passepartout.note_manager import NoteManager
+from src.passepartout.note_metadata import NoteMetadataStore
+from src.passepartout.note_scheduler import NoteScheduler
+from src.passepartout.note_types import NoteType
+from src.passepartout.retouche_reviewer import RetoucheReviewer
+from src.passepartout.vector_store import VectorStore
+
+DIMENSION = 384
+
+
+@pytest.fixture
+def embedder():
+    """Bag-of-words embedder: texts sharing words are close"""
+
+    def embed(text):
+        vector = np.zeros(DIMENSION, dtype=np.float32)
+        for word in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(word.encode()) % DIMENSION] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    embedder = Mock()
+    embedder.model_name = "mock-bow"
+    embedder.get_dimension.return_value = DIMENSION
+    embedder.embed_text.side_effect = lambda text, normalize=False: embed(text)
+    embedder.embed_batch.side_effect = lambda texts, normalize=False: np.stack(
+        [embed(t) for t in texts]
+    )
+    return embedder
+
+
+@pytest.fixture
+def store(embedder):
+    store = VectorStore(dimension=DIMENSION, embedder=embedder)
+    store.add("budget", "budget annuel du projet alpha", metadata={"tags": ["projet"]})
+    store.add("budget-copy", "budget annuel du projet alpha copie", metadata={"tags": ["archive"]})
+    store.add("recette", "recette de la tarte aux pommes", metadata={"tags": ["cuisine"]})
+    store.add("planning", "planning du projet alpha", metadata={"tags": ["projet"]})
+    embedder.embed_text.reset_mock()
+    return store
+
+
+class TestVectorStoreSimilarity:
+    """Test search_by_vector, search_by_id and find_near_duplicates"""
+
+    def test_search_by_vector_matches_search(self, store, embedder):
+        vector = embedder.embed_text("projet alpha")
+        by_text = store.search("projet alpha", top_k=3)
+
+        assert store.search_by_vector(vector, top_k=3) == by_text
+
+    def test_search_by_id_reuses_stored_embedding(self, store, embedder):
+        results = store.search_by_id("budget", top_k=2)
+
+        assert [doc_id for doc_id, _, _ in results] == ["budget-copy", "planning"]
+        embedder.embed_text.assert_not_called()
+
+    def test_search_by_id_filter_and_unknown(self, store):
+        metadata_filter = MetadataFilter(match={"tags": ["projet"]})
+        results = store.search_by_id("budget", top_k=3, metadata_filter=metadata_filter)
+
+        assert [doc_id for doc_id, _, _ in results] == ["planning"]
+        assert store.search_by_id("missing") == []
+
+    def test_search_by_vector_validates(self, store):
+        with pytest.raises(ValueError):
+            store.search_by_vector(np.zeros(3, dtype=np.float32))
+        with pytest.raises(ValueError):
+            store.search_by_id("budget", top_k=0)
+
+    def test_find_near_duplicates(self, store, embedder):
+        pairs = store.find_near_duplicates(min_similarity=0.9, block_size=2)
+
+        assert [(a, b) for a, b, _ in pairs] == [("budget", "budget-copy")]
+        cosine = embedder.embed_text("budget annuel du projet alpha") @ embedder.embed_text(
+            "budget annuel du projet alpha copie"
+        )
+        assert pairs[0][2] == pytest.approx(cosine, rel=1e-5)
+
+    def test_find_near_duplicates_matches_brute_force(self, store):
+        store.remove("planning")
+        names = sorted(store.doc_id_to_index_id)
+        vectors = {name: store.get_embedding(name) for name in names}
+        expected = set()
+        for i, a in enumerate(names):
+            for b in names[i + 1 :]:
+                norms = np.linalg.norm(vectors[a]) * np.linalg.norm(vectors[b])
+                cosine = vectors[a] @ vectors[b] / norms
+                if cosine >= 0.2:
+                    expected.add((a, b))
+
+        pairs = store.find_near_duplicates(min_similarity=0.2, block_size=1)
+
+        assert {(a, b) for a, b, _ in pairs} == expected
+
+    def test_find_near_duplicates_restricted(self, store):
+        assert store.find_near_duplicates(0.9, doc_ids=["recette"]) == []
+        assert store.find_near_duplicates(0.9, doc_ids=["budget-copy"])[0][:2] == (
+            "budget",
+            "budget-copy",
+        )
+        projet = MetadataFilter(match={"tags": ["projet"]})
+        assert store.find_near_duplicates(0.9, metadata_filter=projet) == []
+
+
+class TestNoteManagerSimilarity:
+    """Test NoteManager search_by_id and duplicate detection"""
+
+    @pytest.fixture
+    def manager(self, tmp_path, embedder):
+        return NoteManager(
+            notes_dir=tmp_path / "notes",
+            vector_store=VectorStore(dimension=DIMENSION, embedder=embedder),
+            embedder=embedder,
+            auto_index=True,
+            git_enabled=False,
+        )
+
+    def test_search_by_id(self, manager, embedder):
+        alpha = manager.create_note("Projet Alpha", "Budget et planning du projet alpha")
+        beta = manager.create_note("Projet Alpha bis", "Budget et planning du projet alpha")
+        manager.create_note("Recette", "Tarte aux pommes")
+        embedder.embed_text.reset_mock()
+
+        results = manager.search_by_id(alpha, top_k=1, return_scores=True)
+
+        assert [note.note_id for note, _ in results] == [beta]
+        embedder.embed_text.assert_not_called()
+
+    def test_detect_duplicates_flags_follower(self, manager, tmp_path):
+        original = manager.create_note("Contrat ACME", "Contrat cadre signé avec ACME en mars")
+        copy = manager.create_note("Contrat ACME copie", "Contrat cadre signé avec ACME en mars")
+        manager.create_note("Recette", "Tarte aux pommes")
+        store = NoteMetadataStore(tmp_path / "meta.db")
+        for note_id in (original, copy):
+            store.create_for_note(note_id, NoteType.AUTRE, "")
+        reviewer = RetoucheReviewer(
+            note_manager=manager, metadata_store=store, scheduler=NoteScheduler(store)
+        )
+
+        assert reviewer.detect_duplicates(min_similarity=0.8) == 1
+        assert [m.note_id for m in store.get_merge_candidates(original)] == [copy]
+        # Already flagged notes are not flagged again
+        assert reviewer.detect_duplicates(min_similarity=0.8) == 0
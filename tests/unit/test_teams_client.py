@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.integrations.microsoft.graph_client import BatchResult
 from src.integrations.microsoft.models import TeamsChatType, TeamsMessageImportance
 from src.integrations.microsoft.teams_client import TeamsClient
 
@@ -23,6 +24,15 @@ class TestTeamsClient:
         mock.get = AsyncMock()
         mock.post = AsyncMock()
         mock.get_all_pages = AsyncMock()
+
+        async def get_batch(requests):
+            # Batched GETs answered one by one by the mocked get()
+            return {
+                key: BatchResult(200, await mock.get(endpoint, params=params))
+                for key, (endpoint, params) in requests.items()
+            }
+
+        mock.get_batch = AsyncMock(side_effect=get_batch)
         return mock
 
     @pytest.fixture
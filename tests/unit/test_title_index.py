@@ -0,0 +1,154 @@
+"""
+Tests for the fuzzy title index
+
+Coverage:
+- Name normalization and title parsing
+- Exact/fuzzy/partial matching, identical to a full SequenceMatcher scan
+- Incremental add/update/remove and aliases
+- NoteManager and EntitySearcher integration
+"""
+
+import random
+from difflib import SequenceMatcher
+from unittest.mock import Mock
+
+import pytest
+
+from src.passepartout.entity_search import PARTIAL_MATCH_SCORE, EntitySearcher
+from src.passepartout.note_manager import NoteManager
+from src.passepartout.title_index import (
+    TitleIndex,
+    extract_name_from_title,
+    normalize_name,
+)
+
+THRESHOLD = 0.70
+
+
+def scan(titles: list[str], name: str) -> list[tuple[str, str, float]]:
+    """Reference: compare the name to every title like EntitySearcher used to"""
+    query = normalize_name(name)
+    matches = []
+    for i, title in enumerate(titles):
+        full = normalize_name(title)
+        if full == query:
+            matches.append((str(i), "exact", 1.0))
+            continue
+        score = SequenceMatcher(None, query, normalize_name(extract_name_from_title(full))).ratio()
+        if score >= THRESHOLD:
+            matches.append((str(i), "fuzzy", score))
+        elif query in full:
+            matches.append((str(i), "partial", PARTIAL_MATCH_SCORE))
+    return sorted(matches, key=lambda m: (-m[2], int(m[0])))
+
+
+class TestNormalization:
+    """Test normalize_name and extract_name_from_title"""
+
+    def test_normalize(self):
+        assert normalize_name("  Élodie NÀUTIL ") == "elodie nautil"
+        assert normalize_name("Mme Dupont") == "dupont"
+
+    def test_extract_name(self):
+        assert extract_name_from_title("Marc Dupont - Tech Lead") == "Marc Dupont"
+        assert extract_name_from_title("Projet Alpha (2024)") == "Projet Alpha"
+
+
+class TestTitleIndex:
+    """Test TitleIndex"""
+
+    @pytest.fixture
+    def titles(self):
+        rng = random.Random(7)
+        titles = [
+            "Marc Dupont",
+            "Marc Dupont - Tech Lead",
+            "Projet Alpha (2024)",
+            "Banque Nàutil",
+            "M. Jean Martin",
+        ]
+        for _ in range(300):
+            titles.append(
+                " ".join(
+                    "".join(rng.choices("abcdeilmnorstu", k=rng.randint(3, 8)))
+                    for _ in range(rng.randint(1, 3))
+                )
+            )
+        return titles
+
+    @pytest.fixture
+    def index(self, titles):
+        index = TitleIndex()
+        for i, title in enumerate(titles):
+            index.add_note(str(i), title)
+        return index
+
+    def test_same_results_as_full_scan(self, index, titles):
+        rng = random.Random(11)
+        queries = ["Marc Dupont", "M. Dupont", "dupont", "Nautil", "alpha", "x"]
+        queries += [title[:-1] for title in titles[5:100]]
+        queries += ["".join(rng.choices("abcdeilmnorstu", k=rng.randint(2, 9))) for _ in range(100)]
+
+        for query in queries:
+            matches = index.search(query, THRESHOLD, PARTIAL_MATCH_SCORE)
+            assert [(m.note_id, m.match_type, m.score) for m in matches] == scan(titles, query)
+
+    def test_update_and_remove(self, index):
+        index.add_note("0", "Marc Durand")
+        assert index.search("Marc Dupont", THRESHOLD, PARTIAL_MATCH_SCORE)[0].note_id == "1"
+
+        index.remove_note("1")
+        assert "1" not in index
+        matches = index.search("Marc Dupont", THRESHOLD, PARTIAL_MATCH_SCORE)
+        assert "1" not in {m.note_id for m in matches}
+
+    def test_alias_matches(self):
+        index = TitleIndex()
+        index.add_note("acme", "Acme Corporation", aliases=["ACME", "Acmé SA"])
+
+        matches = index.search("acme sa", THRESHOLD, PARTIAL_MATCH_SCORE)
+
+        assert [(m.note_id, m.match_type) for m in matches] == [("acme", "exact")]
+        assert index.get_stats()["names"] == 3
+
+
+class TestNoteManagerTitleIndex:
+    """Test NoteManager.get_title_index and EntitySearcher integration"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return NoteManager(
+            notes_dir=tmp_path / "notes",
+            vector_store=Mock(),
+            embedder=Mock(),
+            auto_index=False,
+            git_enabled=False,
+        )
+
+    def test_index_follows_note_changes(self, manager):
+        marc = manager.create_note("Marc Dupont", "Tech Lead")
+        index = manager.get_title_index()
+        assert marc in index
+
+        other = manager.create_note("Projet Orion", "Migration", metadata={"aliases": ["Orion"]})
+        assert index.search("orion", THRESHOLD, PARTIAL_MATCH_SCORE)[0].note_id == other
+
+        manager.update_note(marc, title="Marc Durand")
+        assert index.search("marc durand", THRESHOLD, PARTIAL_MATCH_SCORE)[0].match_type == "exact"
+
+        manager.delete_note(marc)
+        assert marc not in index
+        assert manager.get_title_index() is index
+
+    def test_entity_searcher_uses_index(self, manager):
+        marc = manager.create_note("Marc Dupont - Tech Lead", "Expert Python")
+        manager.create_note("Projet Alpha", "Budget")
+        manager.get_title_index()
+        # Searches must not go back to reading every note
+        manager.get_all_notes = Mock(side_effect=AssertionError("full scan"))
+        searcher = EntitySearcher(manager, scapin_config=Mock(), search_content=False)
+
+        results = searcher.search_entities(["M. Dupont"])
+
+        assert [r.note.note_id for r in results] == [marc]
+        assert results[0].match_type in ("fuzzy", "partial")
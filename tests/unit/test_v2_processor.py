@@ -4,11 +4,13 @@ Tests for V2EmailProcessor — Workflow v2.1 Integration
 Ce module teste l'intégration complète du pipeline v2.1.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.core.config_manager import WorkflowV2Config
+from src.core.processing_events import ProcessingEventType
 from src.core.models.v2_models import (
     AnalysisResult,
     EmailAction,
@@ -405,6 +407,164 @@ class TestProcessBatch:
             assert results[1].success is False
 
 
+class TestConcurrentBatch:
+    """Tests for bounded-parallel process_batch"""
+
+    @staticmethod
+    def _make_processor(mock_config, mock_ai_router, mock_note_manager):
+        with patch("src.trivelin.v2_processor.ContextEngine"):
+            return V2EmailProcessor(
+                config=mock_config,
+                ai_router=mock_ai_router,
+                note_manager=mock_note_manager,
+            )
+
+    @staticmethod
+    def _make_event(event_id, sender):
+        event = MagicMock()
+        event.event_id = event_id
+        event.from_person = sender
+        return event
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_and_order_preserved(
+        self, mock_config, mock_ai_router, mock_note_manager
+    ):
+        """At most max_concurrency events run at once; results keep input order"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+        events = [self._make_event(f"evt_{i}", f"sender{i}@example.com") for i in range(8)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_process(event, auto_apply=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later events finish first
+            await asyncio.sleep(0.001 * (10 - int(event.event_id.split("_")[1])))
+            in_flight -= 1
+            return V2ProcessingResult(success=True, event_id=event.event_id)
+
+        processor.process_event = fake_process
+
+        results = await processor.process_batch(events, max_concurrency=3, event_bus=MagicMock())
+
+        assert peak == 3
+        assert [r.event_id for r in results] == [e.event_id for e in events]
+
+    @pytest.mark.asyncio
+    async def test_same_sender_serialized(self, mock_config, mock_ai_router, mock_note_manager):
+        """Events from one sender never overlap and run in input order"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+        events = [
+            self._make_event("a1", "alice@example.com"),
+            self._make_event("b1", "bob@example.com"),
+            self._make_event("a2", "Alice@example.com"),
+            self._make_event("a3", "alice@example.com"),
+        ]
+        active: set[str] = set()
+        started: list[str] = []
+
+        async def fake_process(event, auto_apply=True):
+            sender = event.from_person.lower()
+            assert sender not in active
+            active.add(sender)
+            started.append(event.event_id)
+            await asyncio.sleep(0.002)
+            active.discard(sender)
+            return V2ProcessingResult(success=True, event_id=event.event_id)
+
+        processor.process_event = fake_process
+
+        results = await processor.process_batch(events, max_concurrency=4, event_bus=MagicMock())
+
+        assert all(r.success for r in results)
+        alice_order = [e for e in started if e.startswith("a")]
+        assert alice_order == ["a1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_token_budget_skips_remaining(
+        self, mock_config, mock_ai_router, mock_note_manager
+    ):
+        """Events not started once the budget is spent are returned as failures"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+        events = [self._make_event(f"evt_{i}", "same@example.com") for i in range(3)]
+
+        async def fake_process(event, auto_apply=True):
+            return V2ProcessingResult(
+                success=True,
+                event_id=event.event_id,
+                multi_pass_result=MagicMock(total_tokens=600),
+            )
+
+        processor.process_event = fake_process
+
+        results = await processor.process_batch(
+            events, token_budget=1000, event_bus=MagicMock()
+        )
+
+        assert [r.success for r in results] == [True, True, False]
+        assert results[2].error == "Token budget exhausted"
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_failure_result(
+        self, mock_config, mock_ai_router, mock_note_manager
+    ):
+        """An unexpected exception fails only its own event"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+        events = [self._make_event("ok", "a@example.com"), self._make_event("boom", "b@x.com")]
+
+        async def fake_process(event, auto_apply=True):
+            if event.event_id == "boom":
+                raise RuntimeError("unexpected")
+            return V2ProcessingResult(success=True, event_id=event.event_id)
+
+        processor.process_event = fake_process
+
+        results = await processor.process_batch(events, event_bus=MagicMock())
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error == "unexpected"
+
+    @pytest.mark.asyncio
+    async def test_progress_events_emitted(self, mock_config, mock_ai_router, mock_note_manager):
+        """BATCH_STARTED, one BATCH_PROGRESS per event, then BATCH_COMPLETED"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+        events = [self._make_event(f"evt_{i}", f"s{i}@example.com") for i in range(3)]
+        processor.process_event = AsyncMock(
+            side_effect=lambda event, auto_apply=True: V2ProcessingResult(
+                success=True, event_id=event.event_id
+            )
+        )
+        bus = MagicMock()
+
+        await processor.process_batch(events, event_bus=bus)
+
+        emitted = [call.args[0] for call in bus.emit.call_args_list]
+        types = [e.event_type for e in emitted]
+        assert types[0] == ProcessingEventType.BATCH_STARTED
+        assert types[-1] == ProcessingEventType.BATCH_COMPLETED
+        progress = [e for e in emitted if e.event_type == ProcessingEventType.BATCH_PROGRESS]
+        assert [e.current for e in progress] == [1, 2, 3]
+        assert all(e.total == 3 for e in emitted)
+        assert emitted[-1].metadata["successful"] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, mock_config, mock_ai_router, mock_note_manager):
+        """max_concurrency below 1 is rejected"""
+        processor = self._make_processor(mock_config, mock_ai_router, mock_note_manager)
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await processor.process_batch([], max_concurrency=0)
+
+    def test_config_defaults(self):
+        """Batch settings have safe defaults"""
+        config = WorkflowV2Config()
+        assert config.batch_concurrency == 4
+        assert config.batch_token_budget is None
+
+
 # ============================================================================
 # Context Retrieval Tests
 # ============================================================================
@@ -11,12 +11,15 @@ Coverage:
 - Thread safety
 """
 
+import hashlib
+import json
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
 
+from src.passepartout.metadata_filter import MetadataFilter
 from src.passepartout.vector_store import VectorStore
 
 
@@ -274,6 +277,139 @@ class TestPersistence:
         assert doc1["text"] == "Test document 1"
         assert doc1["metadata"]["meta"] == "data1"
 
+    def test_save_writes_binary_layout(self, tmp_path):
+        """Test embeddings are stored as a float32 matrix, not JSON lists"""
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedder.embed_batch.return_value = np.random.rand(3, 384).astype(np.float32)
+
+        store = VectorStore(dimension=384, embedder=embedder)
+        store.add_batch([("a", "Text A", None), ("b", "Text B", None), ("c", "Text C", None)])
+        store.remove("b")
+
+        save_path = tmp_path / "vector_store"
+        store.save(save_path)
+
+        matrix = np.load(save_path / "embeddings.npy")
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (3, 384)
+        np.testing.assert_array_equal(matrix[2], store.id_to_doc[2]["embedding"])
+
+        metadata = json.loads((save_path / "metadata.json").read_text())
+        assert metadata["format_version"] == 2
+        assert all("embedding" not in doc for doc in metadata["documents"])
+
+        checksums = (save_path / "metadata.sha256").read_text()
+        assert "metadata.json" in checksums
+        assert "embeddings.npy" in checksums
+        assert "index.faiss" in checksums
+
+    def test_load_memory_maps_embeddings(self, tmp_path):
+        """Test loaded embeddings are row views of a memory-mapped matrix"""
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedding = np.random.rand(384).astype(np.float32)
+        embedder.embed_text.return_value = embedding
+
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Text 1")
+        store1.save(tmp_path)
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        store2.load(tmp_path)
+
+        loaded = store2.get_document("doc1")["embedding"]
+        assert isinstance(loaded.base, np.memmap) or isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, embedding)
+
+        # Re-saving over the mapped files must not corrupt them
+        store2.add("doc2", "Text 2")
+        store2.save(tmp_path)
+        store3 = VectorStore(dimension=384, embedder=embedder, mmap_embeddings=False)
+        store3.load(tmp_path)
+        assert store3.get_stats()["active_docs"] == 2
+
+    def test_load_detects_corrupted_embeddings(self, tmp_path):
+        """Test tampering with embeddings.npy fails the integrity check"""
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedder.embed_text.return_value = np.random.rand(384).astype(np.float32)
+
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Text 1")
+        store1.save(tmp_path)
+
+        with open(tmp_path / "embeddings.npy", "r+b") as f:
+            f.seek(-4, 2)
+            f.write(b"\xff\xff\xff\xff")
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        with pytest.raises(OSError, match="Integrity check failed"):
+            store2.load(tmp_path)
+
+    def test_load_rejects_interrupted_save(self, tmp_path):
+        """Test a save that crashed after replacing index.faiss is not loaded"""
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedder.embed_text.return_value = np.random.rand(384).astype(np.float32)
+
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Text 1")
+        store1.save(tmp_path)
+        store1.add("doc2", "Text 2")
+        with patch(
+            "src.passepartout.vector_store._atomic_write_bytes",
+            side_effect=OSError("disk full"),
+        ), pytest.raises(OSError, match="Save failed"):
+            store1.save(tmp_path)
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        with pytest.raises(OSError, match="Integrity check failed for index.faiss"):
+            store2.load(tmp_path)
+
+    def test_load_migrates_legacy_json_layout(self, tmp_path):
+        """Test a store saved with inlined JSON embeddings is migrated"""
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedding = np.random.rand(384).astype(np.float32)
+        embedder.embed_text.return_value = embedding
+
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Legacy text", {"meta": "data"})
+        store1.save(tmp_path)
+        (tmp_path / "embeddings.npy").unlink()
+
+        legacy = {
+            "id_to_doc": {
+                "0": {
+                    "doc_id": "doc1",
+                    "text": "Legacy text",
+                    "metadata": {"meta": "data"},
+                    "_deleted": False,
+                    "embedding": embedding.tolist(),
+                }
+            },
+            "doc_id_to_index_id": {"doc1": 0},
+            "next_index_id": 1,
+            "dimension": 384,
+            "metric": "L2",
+        }
+        (tmp_path / "metadata.json").write_text(json.dumps(legacy, indent=2))
+        (tmp_path / "metadata.sha256").write_text(
+            hashlib.sha256(json.dumps(legacy, sort_keys=True).encode()).hexdigest()
+        )
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        store2.load(tmp_path)
+
+        doc = store2.get_document("doc1")
+        assert doc["metadata"]["meta"] == "data"
+        np.testing.assert_allclose(doc["embedding"], embedding)
+
+        # Migrated on disk
+        assert (tmp_path / "embeddings.npy").exists()
+        assert json.loads((tmp_path / "metadata.json").read_text())["format_version"] == 2
+
     def test_load_nonexistent_raises(self):
         """Test loading from nonexistent path raises error"""
         embedder = Mock()
@@ -465,3 +601,338 @@ class TestSearchBatch:
         store_with_docs.embedder.embed_batch.assert_called_once()
         call_args = store_with_docs.embedder.embed_batch.call_args
         assert len(call_args[0][0]) == 3  # 3 queries
+
+
+class TestJournal:
+    """Test the append-only mutation journal"""
+
+    @pytest.fixture
+    def embedder(self):
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        embedder.embed_text.side_effect = lambda text, normalize=False: np.random.rand(
+            384
+        ).astype(np.float32)
+        embedder.embed_batch.side_effect = lambda texts, normalize=False: np.random.rand(
+            len(texts), 384
+        ).astype(np.float32)
+        return embedder
+
+    def test_no_journal_before_first_save(self, embedder, tmp_path):
+        """Test mutations are not journaled until the store is persisted"""
+        store = VectorStore(dimension=384, embedder=embedder)
+        store.add("doc1", "Text 1")
+
+        assert store.journal_size == 0
+        store.save(tmp_path)
+        assert not (tmp_path / "journal.jsonl").exists()
+
+    def test_mutations_after_save_survive_crash(self, embedder, tmp_path):
+        """Test a crash between add_batch and save does not lose documents"""
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Text 1", {"n": 1})
+        store1.save(tmp_path)
+
+        store1.add_batch([("doc2", "Text 2", {"n": 2}), ("doc3", "Text 3", {"n": 3})])
+        store1.remove("doc1")
+        store1.update_metadata("doc2", {"n": 20})
+        assert store1.journal_size == 4
+        # No save() - simulate crash
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        store2.load(tmp_path)
+
+        assert store2.get_document("doc1") is None
+        assert store2.get_document("doc2")["metadata"] == {"n": 20}
+        np.testing.assert_array_equal(
+            store2.get_document("doc3")["embedding"],
+            store1.get_document("doc3")["embedding"],
+        )
+        assert store2.get_stats()["active_docs"] == 2
+        assert store2.journal_size == 4
+
+        # Replayed documents are searchable
+        embedder.embed_text.side_effect = None
+        embedder.embed_text.return_value = store1.get_document("doc3")["embedding"]
+        results = store2.search("anything", top_k=1)
+        assert results[0][0] == "doc3"
+
+    def test_save_truncates_journal(self, embedder, tmp_path):
+        """Test a snapshot absorbs the journal"""
+        store = VectorStore(dimension=384, embedder=embedder)
+        store.add("doc1", "Text 1")
+        store.save(tmp_path)
+        store.add("doc2", "Text 2")
+        assert (tmp_path / "journal.jsonl").exists()
+
+        store.save(tmp_path)
+
+        assert not (tmp_path / "journal.jsonl").exists()
+        assert store.journal_size == 0
+
+    def test_torn_journal_record_is_ignored(self, embedder, tmp_path):
+        """Test a partially written last record does not break loading"""
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.add("doc1", "Text 1")
+        store1.save(tmp_path)
+        store1.add("doc2", "Text 2")
+
+        with open(tmp_path / "journal.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "doc_id": "doc3", "te')
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        store2.load(tmp_path)
+
+        assert store2.get_document("doc2") is not None
+        assert store2.get_document("doc3") is None
+
+    def test_replay_is_idempotent(self, embedder, tmp_path):
+        """Test replaying records already in the snapshot yields the same state"""
+        store1 = VectorStore(dimension=384, embedder=embedder)
+        store1.save(tmp_path)
+        store1.add("doc1", "Text 1")
+        journal = (tmp_path / "journal.jsonl").read_text()
+
+        # Snapshot now contains doc1, then the old journal reappears
+        store1.save(tmp_path)
+        (tmp_path / "journal.jsonl").write_text(journal)
+
+        store2 = VectorStore(dimension=384, embedder=embedder)
+        store2.load(tmp_path)
+
+        assert store2.get_stats()["active_docs"] == 1
+
+
+
+class TestAnnIndex:
+    """Test the IVF/HNSW index modes and ID-mapped removal"""
+
+    @pytest.fixture
+    def embedder(self):
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        rng = np.random.default_rng(0)
+        embedder.embed_text.side_effect = lambda text, normalize=False: rng.random(
+            32
+        ).astype(np.float32)
+        embedder.embed_batch.side_effect = lambda texts, normalize=False: rng.random(
+            (len(texts), 32)
+        ).astype(np.float32)
+        return embedder
+
+    def _populate(self, store, count):
+        store.add_batch([(f"doc{i}", f"Text {i}", {"n": i}) for i in range(count)])
+
+    def test_invalid_index_type_raises(self, embedder):
+        """Test error on unknown index type"""
+        with pytest.raises(ValueError, match="Unsupported index type"):
+            VectorStore(dimension=32, embedder=embedder, index_type="lsh")
+
+    def test_flat_remove_drops_vector_from_index(self, embedder):
+        """Test removed documents no longer occupy the FAISS index"""
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 5)
+
+        store.remove("doc2")
+
+        assert store.index.ntotal == 4
+        assert store.get_stats()["tombstones"] == 0
+
+    @pytest.mark.parametrize("index_type", ["ivf", "hnsw"])
+    def test_ann_index_trains_past_threshold(self, embedder, index_type):
+        """Test the store stays exact below the threshold and switches above it"""
+        store = VectorStore(
+            dimension=32, embedder=embedder, index_type=index_type, ann_threshold=100
+        )
+        self._populate(store, 99)
+        assert store.get_stats()["ann_active"] is False
+
+        store.add("doc99", "Text 99")
+
+        stats = store.get_stats()
+        assert stats["ann_active"] is True
+        assert stats["index_type"] == index_type
+        assert stats["index_size"] == 100
+        assert 0.0 <= stats["ann_recall"] <= 1.0
+
+        # A stored vector finds itself
+        embedder.embed_text.side_effect = None
+        embedder.embed_text.return_value = store.get_document("doc7")["embedding"]
+        results = store.search("anything", top_k=1)
+        assert results[0][0] == "doc7"
+
+    def test_hnsw_removal_uses_tombstones_and_rebuilds(self, embedder):
+        """Test HNSW removals are skipped at search time and compacted in bulk"""
+        store = VectorStore(
+            dimension=32, embedder=embedder, index_type="hnsw", ann_threshold=50
+        )
+        self._populate(store, 60)
+
+        store.remove("doc0")
+        assert store.get_stats()["tombstones"] == 1
+        assert store.index.ntotal == 60
+
+        embedder.embed_text.side_effect = None
+        embedder.embed_text.return_value = store.id_to_doc[0]["embedding"]
+        results = store.search("anything", top_k=5)
+        assert "doc0" not in [doc_id for doc_id, _, _ in results]
+
+        for i in range(1, 12):
+            store.remove(f"doc{i}")
+
+        # 20% tombstones triggers a rebuild
+        stats = store.get_stats()
+        assert stats["tombstones"] == 0
+        assert stats["index_size"] == 48
+        assert stats["deleted_docs"] == 0
+
+    def test_ann_index_survives_save_and_load(self, embedder, tmp_path):
+        """Test a persisted ANN index is reused on load"""
+        store1 = VectorStore(
+            dimension=32, embedder=embedder, index_type="ivf", ann_threshold=100
+        )
+        self._populate(store1, 120)
+        store1.save(tmp_path)
+
+        store2 = VectorStore(
+            dimension=32, embedder=embedder, index_type="ivf", ann_threshold=100
+        )
+        store2.load(tmp_path)
+
+        assert store2.get_stats()["ann_active"] is True
+        assert store2.index.ntotal == 120
+
+    def test_load_rebuilds_index_for_other_index_type(self, embedder, tmp_path):
+        """Test switching index_type rebuilds the loaded index"""
+        store1 = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store1, 120)
+        store1.save(tmp_path)
+
+        store2 = VectorStore(
+            dimension=32, embedder=embedder, index_type="hnsw", ann_threshold=100
+        )
+        store2.load(tmp_path)
+
+        assert store2.get_stats()["ann_active"] is True
+
+    def test_stats_report_search_latency(self, embedder):
+        """Test search latency percentiles are tracked"""
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 10)
+
+        for _ in range(5):
+            store.search("query", top_k=3)
+
+        latency = store.get_stats()["search_latency_ms"]
+        assert latency["samples"] == 5
+        assert latency["p50"] <= latency["p95"]
+
+
+class TestMetadataPreFilter:
+    """Test structured metadata filters applied before scoring"""
+
+    @pytest.fixture
+    def embedder(self):
+        embedder = Mock()
+        embedder.model_name = "mock-model"
+        rng = np.random.default_rng(1)
+        embedder.embed_text.side_effect = lambda text, normalize=False: rng.random(
+            32
+        ).astype(np.float32)
+        embedder.embed_batch.side_effect = lambda texts, normalize=False: rng.random(
+            (len(texts), 32)
+        ).astype(np.float32)
+        return embedder
+
+    def _populate(self, store, count, rare_every=50):
+        store.add_batch([
+            (f"doc{i}", f"Text {i}", {"tags": ["rare"] if i % rare_every == 0 else ["common"]})
+            for i in range(count)
+        ])
+
+    def test_selective_filter_returns_full_top_k(self, embedder):
+        """Test a filter matching few documents still fills top_k"""
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 500)
+
+        results = store.search(
+            "query", top_k=10, metadata_filter=MetadataFilter(match={"tags": ["rare"]})
+        )
+
+        assert len(results) == 10
+        assert all(metadata["tags"] == ["rare"] for _, _, metadata in results)
+
+    def test_selector_sized_in_bytes(self, embedder):
+        """Test IDSelectorBitmap gets the bitmap length in bytes, not IDs"""
+        import faiss
+
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 100)
+
+        with patch.object(
+            faiss, "IDSelectorBitmap", wraps=faiss.IDSelectorBitmap
+        ) as selector:
+            results = store.search(
+                "query", top_k=10, metadata_filter=MetadataFilter(match={"tags": ["rare"]})
+            )
+
+        assert selector.call_args.args[0] == (100 + 7) // 8
+        assert {doc_id for doc_id, _, _ in results} == {"doc0", "doc50"}
+
+    def test_filter_tracks_removal_and_metadata_updates(self, embedder):
+        """Test the bitset index follows remove() and update_metadata()"""
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 100)
+        rare = MetadataFilter(match={"tags": ["rare"]})
+
+        store.remove("doc0")
+        store.update_metadata("doc1", {"tags": ["rare"]})
+
+        doc_ids = {doc_id for doc_id, _, _ in store.search("query", top_k=10, metadata_filter=rare)}
+        assert doc_ids == {"doc1", "doc50"}
+
+        store.rebuild()
+        doc_ids = {doc_id for doc_id, _, _ in store.search("query", top_k=10, metadata_filter=rare)}
+        assert doc_ids == {"doc1", "doc50"}
+
+    def test_filter_with_no_match_returns_empty(self, embedder):
+        """Test a filter nothing matches"""
+        store = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store, 20)
+
+        results = store.search_batch(
+            ["q1", "q2"], top_k=5, metadata_filter=MetadataFilter(match={"tags": ["none"]})
+        )
+
+        assert results == [[], []]
+
+    @pytest.mark.parametrize("index_type", ["ivf", "hnsw"])
+    def test_filter_on_ann_index(self, embedder, index_type):
+        """Test pre-filtering through ANN indexes"""
+        store = VectorStore(
+            dimension=32, embedder=embedder, index_type=index_type, ann_threshold=100
+        )
+        self._populate(store, 400)
+        assert store.get_stats()["ann_active"] is True
+
+        results = store.search(
+            "query", top_k=8, metadata_filter=MetadataFilter(match={"tags": ["rare"]})
+        )
+
+        assert sorted(doc_id for doc_id, _, _ in results) == sorted(
+            f"doc{i}" for i in range(0, 400, 50)
+        )
+
+    def test_filter_survives_save_and_load(self, embedder, tmp_path):
+        """Test the bitset index is rebuilt on load"""
+        store1 = VectorStore(dimension=32, embedder=embedder)
+        self._populate(store1, 100)
+        store1.save(tmp_path)
+
+        store2 = VectorStore(dimension=32, embedder=embedder)
+        store2.load(tmp_path)
+
+        results = store2.search(
+            "query", top_k=10, metadata_filter=MetadataFilter(match={"tags": ["rare"]})
+        )
+        assert {doc_id for doc_id, _, _ in results} == {"doc0", "doc50"}
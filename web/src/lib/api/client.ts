@@ -103,6 +103,7 @@ interface StatsOverview {
 
 interface EmailStats {
 	emails_processed: number;
+	emails_processed_total: number | null;
 	emails_auto_executed: number;
 	emails_archived: number;
 	emails_deleted: number;
@@ -117,6 +118,7 @@ interface TeamsStats {
 	total_chats: number;
 	unread_chats: number;
 	messages_processed: number;
+	messages_processed_total: number | null;
 	messages_flagged: number;
 	last_poll: string | null;
 }